@@ -0,0 +1,6 @@
+"""
+Benchmarks and local stand-ins for Unreal Copilot.
+
+Run from `Content/Python`:
+    python -m benchmarks.bench_http_client
+"""
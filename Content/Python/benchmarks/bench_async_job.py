@@ -0,0 +1,63 @@
+"""
+Async job retrieval benchmark (`UEPluginClient.get_with_async`).
+
+Fetches a large Blueprint graph through the async job protocol and compares the legacy
+settings (64 KB sequential chunks) with parallel, larger chunks. Per-request latency on the
+stand-in server simulates the editor's game-thread round-trip.
+
+Usage:
+    python -m benchmarks.bench_async_job --graph-nodes 20000 --latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from unreal_copilot.ue_client.http_client import UEPluginClient
+
+from .stub_ue_server import start_stub_server
+
+# name -> get_with_async keyword overrides
+PROFILES: dict[str, dict] = {
+    "sequential-64k": {"chunk_size": 65536, "max_parallel_chunks": 1},
+    "sequential-256k": {"chunk_size": 262144, "max_parallel_chunks": 1},
+    "parallel-64k-x4": {"chunk_size": 65536, "max_parallel_chunks": 4},
+    "parallel-256k-x4": {"chunk_size": 262144, "max_parallel_chunks": 4},
+}
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = start_stub_server(graph_nodes=args.graph_nodes, latency_s=args.latency_ms / 1000.0)
+    client = UEPluginClient(server.url)
+    try:
+        print(f"graph_nodes={args.graph_nodes} latency={args.latency_ms}ms rounds={args.rounds}")
+        print(f"{'profile':<20}{'ms/fetch':>10}{'requests':>10}{'chars':>12}")
+        for name, overrides in PROFILES.items():
+            server.reset_counts()
+            start = time.perf_counter()
+            result: dict = {}
+            for _ in range(args.rounds):
+                result = await client.get_with_async(
+                    "/blueprint/graph", {"bp_path": "/Game/Synthetic/Asset_0"}, **overrides
+                )
+            elapsed_ms = (time.perf_counter() - start) * 1000.0 / args.rounds
+            requests = server.total_requests() / args.rounds
+            chars = len(str(result.get("nodes", "")))
+            print(f"{name:<20}{elapsed_ms:>10.1f}{requests:>10.1f}{chars:>12}")
+    finally:
+        await client.close()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Async job chunk retrieval benchmark")
+    parser.add_argument("--graph-nodes", type=int, default=20000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
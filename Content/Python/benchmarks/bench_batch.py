@@ -0,0 +1,67 @@
+"""
+Batch endpoint benchmark (`UEPluginClient.batch`).
+
+Looks up references and referencers of N assets one GET at a time, then through a single
+`/batch` round-trip, and reports wall time plus client/server request counts. Per-request
+latency on the stand-in server simulates the editor's game-thread round-trip.
+
+Usage:
+    python -m benchmarks.bench_batch --assets 50 --latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from unreal_copilot.ue_client.http_client import UEPluginClient
+
+from .stub_ue_server import start_stub_server
+
+
+def _requests(asset_count: int) -> list[tuple[str, dict]]:
+    paths = [f"/Game/Synthetic/Asset_{i}" for i in range(asset_count)]
+    return [
+        (endpoint, {"asset_path": path})
+        for path in paths
+        for endpoint in ("/asset/references", "/asset/referencers")
+    ]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = start_stub_server(asset_count=max(args.assets, 2), latency_s=args.latency_ms / 1000.0)
+    client = UEPluginClient(server.url)
+    requests = _requests(args.assets)
+    try:
+        print(f"assets={args.assets} latency={args.latency_ms}ms lookups={len(requests)}")
+        print(f"{'mode':<14}{'ms':>10}{'round-trips':>13}{'server reqs':>13}")
+        for mode in ("sequential", "concurrent", "batch"):
+            client.invalidate_cache()
+            server.reset_counts()
+            before = client.get_stats()["round_trips"]
+            start = time.perf_counter()
+            if mode == "sequential":
+                for path, params in requests:
+                    await client.get(path, params)
+            elif mode == "concurrent":
+                await asyncio.gather(*(client.get(path, params) for path, params in requests))
+            else:
+                await client.batch(requests)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            round_trips = client.get_stats()["round_trips"] - before
+            print(f"{mode:<14}{elapsed_ms:>10.1f}{round_trips:>13}{server.total_requests():>13}")
+    finally:
+        await client.close()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batch endpoint benchmark")
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Caller lookup benchmark: text search vs the call graph.
+
+On a synthetic C++ tree, finds the callers of `Method1` up to `--depth` hops:
+- search: what a caller had to do before, one `search_code` regex per hop for
+  `->Name(` / `::Name(` (the enclosing function of each hit, needed for the next hop,
+  is not looked up; the synthetic call pattern stands in for it, so this is a lower
+  bound)
+- graph (cold): first `get_call_graph` on an indexed tree (parses every .cpp file)
+- graph (warm): the same query again
+- graph (touch): after rewriting one .cpp file (only that file is parsed again)
+
+Usage:
+    python -m benchmarks.bench_call_graph --classes 4000 --depth 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import CppAnalyzer, set_analyzer
+
+from .synthetic_cpp import generate_cpp_tree
+
+FUNCTION = "Method1"
+
+
+async def _search(analyzer: CppAnalyzer, depth: int) -> int:
+    """Callers by repeated text search; every hop searches for all callees at once."""
+    names = {FUNCTION}
+    found = 0
+    for _ in range(depth):
+        alternatives = "|".join(sorted(names))
+        result = await analyzer.search_code(
+            rf"(->|\.|::)\s*({alternatives})\s*\(", max_results=100000
+        )
+        found += result["count"]
+        # Without an AST, the enclosing function of a hit is unknown; synthetic methods
+        # call their successor, so the previous method name stands in for it.
+        names = {f"Method{(int(n[6:]) - 1) % 4}" for n in names}
+    return found
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        source = generate_cpp_tree(root, args.classes)
+        get_config().add_source_path(str(source))
+        analyzer = CppAnalyzer()
+        set_analyzer(analyzer)
+        await analyzer.build_index()
+        print(f"classes={args.classes} files={args.classes * 2} depth={args.depth}")
+        print(f"{'mode':<14}{'ms':>10}{'sites':>9}")
+
+        start = time.perf_counter()
+        count = await _search(analyzer, args.depth)
+        print(f"{'search':<14}{(time.perf_counter() - start) * 1000.0:>10.1f}{count:>9}")
+
+        async def query(mode: str) -> None:
+            start = time.perf_counter()
+            result = await analyzer.get_call_graph(
+                FUNCTION, depth=args.depth, max_results=args.max_results
+            )
+            elapsed = (time.perf_counter() - start) * 1000.0
+            print(f"{mode:<14}{elapsed:>10.1f}{result['caller_count']:>9}")
+
+        await query("graph (cold)")
+        await query("graph (warm)")
+        touched = next(Path(source).rglob("Synth1.cpp"))
+        touched.write_text(touched.read_text("utf-8") + "\n", "utf-8")
+        analyzer._reference_index.invalidate(str(touched))
+        await query("graph (touch)")
+        print(analyzer.get_stats()["call_graph"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Caller lookup benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--max-results", type=int, default=100000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
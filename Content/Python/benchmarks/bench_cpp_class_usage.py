@@ -0,0 +1,82 @@
+"""
+find_cpp_class_usage benchmark: sequential regex scan vs concurrent index-backed lookup.
+
+Generates a synthetic C++ tree, registers it as project source and queries several classes:
+- sequential: editor `/analysis/cpp-class-usage`, then a `\\bName\\b` regex scan of every
+  file in scope (the previous find_references)
+- concurrent: the `find_cpp_class_usage` tool (editor call and reference-index lookup run
+  concurrently), cold (index built on first call) and warm
+
+Usage:
+    python -m benchmarks.bench_cpp_class_usage --classes 2000 --queries 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import tempfile
+import time
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import get_analyzer
+from unreal_copilot.tools.cross_domain import find_cpp_class_usage
+from unreal_copilot.ue_client import ResponseCache
+from unreal_copilot.ue_client.http_client import UEPluginClient, set_client
+
+from .stub_ue_server import start_stub_server
+from .synthetic_cpp import class_name, generate_cpp_tree
+
+
+async def _sequential(client: UEPluginClient, cls: str) -> int:
+    await client.get("/analysis/cpp-class-usage", {"class": cls})
+    result = await get_analyzer().search_code(rf"\b{re.escape(cls)}\b", max_results=500)
+    return int(result["count"])
+
+
+async def _concurrent(cls: str) -> int:
+    result = await find_cpp_class_usage(cls)
+    return int(result.get("cpp_reference_count", 0))
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = start_stub_server(asset_count=args.assets, latency_s=args.latency_ms / 1000.0)
+    client = UEPluginClient(server.url, cache=ResponseCache(ttl_s=0.0))
+    set_client(client)
+    classes = [class_name((i * 37) % args.classes) for i in range(args.queries)]
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            get_config().add_source_path(generate_cpp_tree(root, args.classes))
+            print(
+                f"classes={args.classes} files={args.classes * 2} queries={args.queries} "
+                f"latency={args.latency_ms}ms"
+            )
+            print(f"{'mode':<18}{'ms':>10}{'refs':>10}")
+            for mode in ("sequential", "concurrent-cold", "concurrent-warm"):
+                refs = 0
+                start = time.perf_counter()
+                for cls in classes:
+                    if mode == "sequential":
+                        refs += await _sequential(client, cls)
+                    else:
+                        refs += await _concurrent(cls)
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                print(f"{mode:<18}{elapsed_ms:>10.1f}{refs:>10}")
+            print(f"index: {get_analyzer().get_stats()['reference_index']}")
+    finally:
+        await client.close()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="find_cpp_class_usage benchmark")
+    parser.add_argument("--classes", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--assets", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Deadline benchmark: cold queries on a large tree with and without a time budget.
+
+On a synthetic C++ tree, each unified tool call runs on a fresh analyzer (so the first
+query has to index or scan everything) with no limit and with `--budget` seconds:
+- search (regex): scan of every file
+- search (ranked) / get_references: reference index build, then lookups
+With a budget, each call should return shortly after it with `timed_out` set, and the
+next call (no budget) continues the index from where the cut-off call left it.
+
+Usage:
+    python -m benchmarks.bench_deadline --classes 4000 --budget 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import CppAnalyzer, set_analyzer
+from unreal_copilot.tools import unified
+
+from .synthetic_cpp import generate_cpp_tree
+
+CALLS = {
+    "search regex": lambda t: unified.search(
+        r"USynth\d+::Method2\(", domain="cpp", max_results=100_000, timeout_s=t
+    ),
+    "search ranked": lambda t: unified.search(
+        "USynth7 Method2", domain="cpp", query_mode="ranked", timeout_s=t
+    ),
+    "references": lambda t: unified.get_references("NewObject", domain="cpp", timeout_s=t),
+}
+
+
+async def _timed(call, timeout_s: float) -> tuple[float, dict]:
+    start = time.perf_counter()
+    result = await call(timeout_s)
+    return (time.perf_counter() - start) * 1000.0, result
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        get_config().add_source_path(generate_cpp_tree(root, args.classes))
+        print(f"classes={args.classes} files={args.classes * 2} budget={args.budget}s")
+        print(f"{'call':<15}{'budget':>8}{'ms':>10}{'timed_out':>11}{'then ms':>10}")
+        for name, call in CALLS.items():
+            for budget in (0.0, args.budget):
+                set_analyzer(CppAnalyzer())
+                elapsed, result = await _timed(call, budget)
+                # The next call picks up the partially built index
+                after, _ = await _timed(call, 0.0)
+                label = f"{budget:g}s" if budget else "none"
+                print(
+                    f"{name:<15}{label:>8}{elapsed:>10.1f}"
+                    f"{str(result.get('timed_out')):>11}{after:>10.1f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deadline benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    parser.add_argument("--budget", type=float, default=0.5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Engine index pack benchmark: indexing the engine vs importing a prebuilt pack.
+
+Generates a synthetic tree as `<root>/Engine/Source` (with a Build.version), then:
+- index: first engine-scope `find_references` on a fresh analyzer (tokenizes every file)
+- export: `export_engine_pack` (hashes every file and writes the pack)
+- import (hash/size): first engine-scope query on a fresh analyzer with ENGINE_INDEX_PACK
+  set, verifying file contents or only sizes; one file is edited (same size) first:
+  the hash run leaves it out and re-tokenizes it, the size run cannot tell
+
+Usage:
+    python -m benchmarks.bench_engine_pack --classes 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from unreal_copilot.config import SourceType, get_config
+from unreal_copilot.cpp_analyzer import CppAnalyzer, set_analyzer
+
+from .synthetic_cpp import generate_cpp_tree
+
+BUILD_VERSION = {"MajorVersion": 5, "MinorVersion": 4, "PatchVersion": 4, "Changelist": 1}
+
+
+async def _first_query(mode: str) -> None:
+    analyzer = CppAnalyzer()
+    set_analyzer(analyzer)
+    start = time.perf_counter()
+    refs = await analyzer.find_references("FString", scope="engine", max_results=10)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    stats = analyzer.get_stats()["reference_index"]
+    print(
+        f"{mode:<14}{elapsed:>10.1f}{stats['restored_files']:>10}"
+        f"{stats['files_indexed']:>11}{refs['total_count']:>8}"
+    )
+    pack = analyzer.get_stats()["engine_pack"]
+    if pack:
+        print(f"  imported={pack['imported']} changed={pack['changed']} missing={pack['missing']}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        engine = Path(root) / "Engine"
+        source = generate_cpp_tree(engine, args.classes)
+        (engine / "Build").mkdir()
+        (engine / "Build" / "Build.version").write_text(json.dumps(BUILD_VERSION), "utf-8")
+        config = get_config()
+        config.add_source_path(source, source_type=SourceType.ENGINE_SOURCE)
+        pack = os.path.join(root, "Packs", "Engine-5.4.4.ucpack")
+        print(f"classes={args.classes} files={args.classes * 2}")
+        print(f"{'mode':<14}{'ms':>10}{'restored':>10}{'tokenized':>11}{'refs':>8}")
+
+        await _first_query("index")
+        start = time.perf_counter()
+        info = await CppAnalyzer().export_engine_pack(pack)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"{'export':<14}{elapsed:>10.1f}{info['files']:>10}")
+        print(f"  pack: {os.path.getsize(pack) / 1024 / 1024:.1f} MiB, {info['roots']}")
+
+        config.engine_index_pack = pack
+        edited = next(source.rglob("Synth1.cpp"))
+        edited.write_text(edited.read_text("utf-8").replace("Count", "Total"), "utf-8")
+        await _first_query("import (hash)")
+        original = get_config().engine_index_pack
+        get_config().engine_index_pack = ""
+        analyzer = CppAnalyzer()
+        set_analyzer(analyzer)
+        start = time.perf_counter()
+        summary = await analyzer.import_engine_pack(original, verify="size")
+        await analyzer.find_references("FString", scope="engine", max_results=10)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"{'import (size)':<14}{elapsed:>10.1f}{summary['restored']:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Engine index pack benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
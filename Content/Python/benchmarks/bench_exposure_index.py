@@ -0,0 +1,86 @@
+"""
+Blueprint exposure query benchmark: per-file pattern scan vs the exposure index.
+
+On a synthetic C++ tree, answers "BlueprintCallable functions of module SynthMod3" two ways:
+- scan: read every header and run `detect_ue_pattern` on it (what a caller had to do
+  with the per-file `detect_ue_patterns` tool), then filter
+- index: `query_exposure(specifier=..., module=...)`; the first call builds the index,
+  later calls are set intersections. After one header is edited, the next query
+  re-indexes just that file.
+
+Usage:
+    python -m benchmarks.bench_exposure_index --classes 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import detect_ue_pattern, get_analyzer
+
+from .synthetic_cpp import generate_cpp_tree
+
+MODULE = "SynthMod3"
+SPECIFIER = "BlueprintCallable"
+
+
+def _scan(root: str) -> int:
+    count = 0
+    for header in Path(root).rglob("*.h"):
+        if f"{os.sep}{MODULE}{os.sep}" not in str(header):
+            continue
+        content = header.read_text(encoding="utf-8", errors="ignore")
+        for pattern in detect_ue_pattern(content, str(header)):
+            names = {s.split("=")[0].strip() for s in pattern["specifiers"]}
+            if pattern["pattern_type"] == "UFUNCTION" and SPECIFIER in names:
+                count += 1
+    return count
+
+
+async def _query() -> int:
+    result = await get_analyzer().query_exposure(specifier=SPECIFIER, module=MODULE)
+    return int(result["total_count"])
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    # Re-walk on every query so the edit below is picked up immediately.
+    get_config().index_refresh_s = 0.0
+    with tempfile.TemporaryDirectory() as root:
+        source = generate_cpp_tree(root, args.classes)
+        get_config().add_source_path(source)
+        print(f"classes={args.classes} files={args.classes * 2}")
+        print(f"{'mode':<16}{'ms':>10}{'matches':>10}")
+
+        start = time.perf_counter()
+        count = _scan(source)
+        print(f"{'scan':<16}{(time.perf_counter() - start) * 1000.0:>10.1f}{count:>10}")
+
+        for mode in ("index (cold)", "index (warm)"):
+            start = time.perf_counter()
+            count = await _query()
+            print(f"{mode:<16}{(time.perf_counter() - start) * 1000.0:>10.1f}{count:>10}")
+
+        header = next(Path(source).rglob(f"{MODULE}/Public/*.h"))
+        content = header.read_text(encoding="utf-8")
+        header.write_text(content.replace("BlueprintPure", "BlueprintCallable"), encoding="utf-8")
+        os.utime(header, (time.time() + 5, time.time() + 5))
+        start = time.perf_counter()
+        count = await _query()
+        print(f"{'index (edited)':<16}{(time.perf_counter() - start) * 1000.0:>10.1f}{count:>10}")
+        print(get_analyzer().get_stats()["exposure_index"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Blueprint exposure index benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Throughput and latency benchmark for UEPluginClient.
+
+Fires bursts of small GET requests through the client and reports requests/second plus
+p50/p99 latency for several connection-pool profiles. Uses the local stand-in server unless
+`--url` points at a running editor.
+
+Usage:
+    python -m benchmarks.bench_http_client --requests 2000 --concurrency 32
+    python -m benchmarks.bench_http_client --url http://localhost:8080
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from unreal_copilot.ue_client.http_client import UEPluginClient
+
+from .stub_ue_server import start_stub_server
+
+# name -> UEPluginClient keyword overrides
+PROFILES: dict[str, dict] = {
+    "no-keepalive": {"max_keepalive_connections": 0},
+    "pool-4": {"max_connections": 4, "max_keepalive_connections": 4},
+    "pool-16": {"max_connections": 16, "max_keepalive_connections": 16},
+    "pool-64": {"max_connections": 64, "max_keepalive_connections": 64},
+}
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+async def run_profile(
+    url: str, overrides: dict, *, requests: int, concurrency: int, asset_count: int
+) -> dict:
+    """Run one burst and return throughput/latency figures."""
+    client = UEPluginClient(url, **overrides)
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with sem:
+            t0 = time.perf_counter()
+            await client.get(
+                "/asset/metadata", {"asset_path": f"/Game/Synthetic/Asset_{i % asset_count}"}
+            )
+            latencies.append(time.perf_counter() - t0)
+
+    try:
+        # Warm-up establishes the pool so the measurement reflects steady state.
+        await asyncio.gather(*(one(i) for i in range(min(concurrency, requests))))
+        latencies.clear()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+
+    return {
+        "rps": requests / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000.0,
+        "p99_ms": _percentile(latencies, 99.0) * 1000.0,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = None
+    url = args.url
+    if not url:
+        server = start_stub_server(asset_count=args.assets, latency_s=args.latency_ms / 1000.0)
+        url = server.url
+
+    print(f"target={url} requests={args.requests} concurrency={args.concurrency}")
+    print(f"{'profile':<14}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    try:
+        for name, overrides in PROFILES.items():
+            result = await run_profile(
+                url,
+                overrides,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                asset_count=args.assets,
+            )
+            print(
+                f"{name:<14}{result['rps']:>10.0f}"
+                f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            )
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="UEPluginClient throughput benchmark")
+    parser.add_argument("--url", default="", help="Editor URL (default: local stub server)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--assets", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Go-to-implementation benchmark: text search vs the definition index.
+
+On a synthetic C++ tree, finds the out-of-line definition of `USynth<i>::Method1` for a
+sample of classes:
+- search: `search_code` with a `\\bUSynth<i>::Method1\\s*\\(` regex (what a caller had to
+  do before), stopping at the first match
+- index: `find_implementation` without snippets (definition index lookup plus the
+  declaration from the class analysis) and with snippets (also parses the .cpp for the
+  body range)
+
+The first `find_implementation` call builds the reference index and is reported apart.
+
+Usage:
+    python -m benchmarks.bench_implementation_lookup --classes 4000 --lookups 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import get_analyzer
+
+from .synthetic_cpp import class_name, generate_cpp_tree
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    analyzer = get_analyzer()
+    with tempfile.TemporaryDirectory() as root:
+        source = generate_cpp_tree(root, args.classes)
+        get_config().add_source_path(source)
+        step = max(1, args.classes // args.lookups)
+        names = [f"{class_name(i)}::Method1" for i in range(0, args.classes, step)]
+        print(f"classes={args.classes} files={args.classes * 2} lookups={len(names)}")
+        print(f"{'mode':<18}{'ms/lookup':>10}{'found':>8}")
+
+        start = time.perf_counter()
+        found = 0
+        for name in names[: args.search_lookups]:
+            result = await analyzer.search_code(rf"\b{name}\s*\(", max_results=1)
+            found += bool(result["count"])
+        elapsed = (time.perf_counter() - start) * 1000.0 / args.search_lookups
+        print(f"{'search':<18}{elapsed:>10.1f}{found:>8}")
+
+        start = time.perf_counter()
+        await analyzer.find_implementation(names[0], include_snippet=False)
+        print(f"{'index (build)':<18}{(time.perf_counter() - start) * 1000.0:>10.1f}")
+
+        for mode, snippet in (("index", False), ("index + snippet", True)):
+            found = 0
+            start = time.perf_counter()
+            for name in names:
+                result = await analyzer.find_implementation(name, include_snippet=snippet)
+                found += all(d["declaration"] for d in result["definitions"])
+            elapsed = (time.perf_counter() - start) * 1000.0 / len(names)
+            print(f"{mode:<18}{elapsed:>10.2f}{found:>8}")
+        print(analyzer.get_stats()["definition_index"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Go-to-implementation benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    parser.add_argument("--lookups", type=int, default=50)
+    parser.add_argument("--search-lookups", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
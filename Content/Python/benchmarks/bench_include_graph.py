@@ -0,0 +1,88 @@
+"""
+Include impact benchmark: recursive include search vs the include graph.
+
+On a synthetic C++ tree, answers "which files transitively include Synth0.h":
+- search: breadth-first, one regex pass over every file per level, matching
+  `#include ".../<name>"` for all files found in the previous level (already batched;
+  a per-file search would be far slower)
+- index: `build_index` on a fresh analyzer (tokenizing also records `#include` lines)
+- graph (cold): first `get_include_graph` (resolves includes, condenses the graph,
+  computes reachability)
+- graph (warm): the same query again, and a query for another header (bitsets of shared
+  includers are reused)
+
+Usage:
+    python -m benchmarks.bench_include_graph --classes 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import CppAnalyzer, set_analyzer
+
+from .synthetic_cpp import generate_cpp_tree
+
+def _search(source: str, header: str) -> int:
+    files = sorted(str(p) for p in Path(source).rglob("*") if p.suffix in (".h", ".cpp"))
+    found: set[str] = set()
+    frontier = {os.path.basename(header)}
+    while frontier:
+        names = "|".join(re.escape(name) for name in sorted(frontier))
+        pattern = re.compile(rf'^\s*#\s*include\s*"(?:[^"]*/)?(?:{names})"', re.MULTILINE)
+        level = set()
+        for path in files:
+            if path in found:
+                continue
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                if pattern.search(f.read()):
+                    level.add(path)
+        found |= level
+        frontier = {os.path.basename(p) for p in level if p.endswith(".h")}
+    return len(found)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        source = str(generate_cpp_tree(root, args.classes))
+        get_config().add_source_path(source)
+        print(f"classes={args.classes} files={args.classes * 2}")
+        print(f"{'mode':<16}{'ms':>10}{'includers':>11}")
+
+        start = time.perf_counter()
+        count = _search(source, "Synth0.h")
+        print(f"{'search':<16}{(time.perf_counter() - start) * 1000.0:>10.1f}{count:>11}")
+
+        analyzer = CppAnalyzer()
+        set_analyzer(analyzer)
+        start = time.perf_counter()
+        await analyzer.build_index()
+        print(f"{'index':<16}{(time.perf_counter() - start) * 1000.0:>10.1f}")
+        for mode, header in (
+            ("graph (cold)", "Synth0.h"),
+            ("graph (warm)", "Synth0.h"),
+            ("graph (other)", f"Synth{args.classes // 2}.h"),
+        ):
+            start = time.perf_counter()
+            result = await analyzer.get_include_graph(header, direction="incoming")
+            elapsed = (time.perf_counter() - start) * 1000.0
+            print(f"{mode:<16}{elapsed:>10.1f}{result['includer_count']:>11}")
+        print(analyzer.get_stats()["include_graph"])
+        print(result["impact"]["translation_units"], "translation units affected")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Include impact benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
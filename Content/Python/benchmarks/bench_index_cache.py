@@ -0,0 +1,75 @@
+"""
+Cold start benchmark: tokenizing every file vs restoring the binary index cache.
+
+On a synthetic C++ tree, with ANALYZER_INDEX_CACHE pointing into a temp directory:
+- build: `build_index` on a fresh analyzer (tokenizes every file, then writes the cache)
+- restore: `find_references` on another fresh analyzer (loads the cache, then the first
+  refresh only stats the files)
+- save/load: the cache file alone (`save_records` / `load_records`)
+
+Usage:
+    python -m benchmarks.bench_index_cache --classes 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import CppAnalyzer, set_analyzer
+from unreal_copilot.cpp_analyzer.serialization import gc_paused, load_records, save_records
+
+from .synthetic_cpp import generate_cpp_tree
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        source = generate_cpp_tree(root, args.classes)
+        config = get_config()
+        config.add_source_path(str(source))
+        config.index_cache = os.path.join(root, "Intermediate", "CppIndex.bin")
+        print(f"classes={args.classes} files={args.classes * 2}")
+        print(f"{'mode':<10}{'ms':>10}{'files':>8}")
+
+        analyzer = CppAnalyzer()
+        set_analyzer(analyzer)
+        start = time.perf_counter()
+        built = await analyzer.build_index()
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"{'build':<10}{elapsed:>10.1f}{built['files_indexed']:>8}")
+
+        analyzer = CppAnalyzer()
+        set_analyzer(analyzer)
+        start = time.perf_counter()
+        refs = await analyzer.find_references("FString", max_results=10)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        stats = analyzer.get_stats()["reference_index"]
+        print(f"{'restore':<10}{elapsed:>10.1f}{stats['restored_files']:>8}")
+        print(f"  references={refs['total_count']} re-tokenized={stats['files_indexed']}")
+
+        records = await asyncio.to_thread(
+            lambda: list(analyzer._reference_index._files.values())
+        )
+        start = time.perf_counter()
+        save_records(records, config.index_cache)
+        print(f"{'save':<10}{(time.perf_counter() - start) * 1000.0:>10.1f}{len(records):>8}")
+        start = time.perf_counter()
+        with gc_paused():
+            loaded = load_records(config.index_cache)
+        print(f"{'load':<10}{(time.perf_counter() - start) * 1000.0:>10.1f}{len(loaded):>8}")
+        size = os.path.getsize(config.index_cache) / 1024
+        print(f"cache size: {size / 1024:.1f} MiB ({size / len(loaded):.1f} KiB/file)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index cache cold start benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+UE macro blanking benchmark: tree-sitter parse quality and time with and without the pre-pass.
+
+Parses every file of a synthetic UE tree (UCLASS/UPROPERTY/UFUNCTION, GENERATED_BODY,
+`*_API` export macros) as-is and after `blank_ue_macros`, and reports:
+- parse time (the blanked run includes the pre-pass, also shown on its own)
+- ERROR and MISSING node counts, and total node count
+- class definitions found by the analyzer's CLASS query
+
+Usage:
+    python -m benchmarks.bench_macro_blanking --classes 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import tree_sitter_cpp as tscpp
+from tree_sitter import Language, Parser, Query, QueryCursor
+
+from unreal_copilot.cpp_analyzer.preprocess import blank_ue_macros
+from unreal_copilot.cpp_analyzer.queries import QUERY_PATTERNS
+
+from .synthetic_cpp import generate_cpp_tree
+
+
+def _count_nodes(tree) -> tuple[int, int, int]:
+    """(nodes, ERROR nodes, MISSING nodes)"""
+    nodes = errors = missing = 0
+    cursor = tree.walk()
+    while True:
+        node = cursor.node
+        nodes += 1
+        if node.type == "ERROR":
+            errors += 1
+        elif node.is_missing:
+            missing += 1
+        if cursor.goto_first_child() or cursor.goto_next_sibling():
+            continue
+        while cursor.goto_parent():
+            if cursor.goto_next_sibling():
+                break
+        else:
+            return nodes, errors, missing
+
+
+def main() -> None:
+    parser_args = argparse.ArgumentParser(description="UE macro blanking benchmark")
+    parser_args.add_argument("--classes", type=int, default=1000)
+    args = parser_args.parse_args()
+
+    language = Language(tscpp.language())
+    parser = Parser(language)
+    class_query = Query(language, QUERY_PATTERNS["CLASS"])
+
+    with tempfile.TemporaryDirectory() as root:
+        source = generate_cpp_tree(root, args.classes)
+        paths = sorted(p for p in Path(source).rglob("*") if p.suffix in (".h", ".cpp"))
+        files = [p.read_bytes() for p in paths]
+
+    start = time.perf_counter()
+    blanked = [blank_ue_macros(data) for data in files]
+    prepass_ms = (time.perf_counter() - start) * 1000.0
+    total_kib = sum(map(len, files)) / 1024
+
+    print(f"files={len(files)} size={total_kib:.0f}KiB pre-pass={prepass_ms:.1f}ms")
+    print(f"{'mode':<10}{'parse ms':>10}{'nodes':>10}{'ERROR':>8}{'MISSING':>9}{'classes':>9}")
+    for mode, inputs, extra_ms in (("raw", files, 0.0), ("blanked", blanked, prepass_ms)):
+        start = time.perf_counter()
+        trees = [parser.parse(data) for data in inputs]
+        parse_ms = (time.perf_counter() - start) * 1000.0 + extra_ms
+        nodes = errors = missing = classes = 0
+        for tree in trees:
+            n, e, m = _count_nodes(tree)
+            nodes, errors, missing = nodes + n, errors + e, missing + m
+            for _, captured in QueryCursor(class_query).matches(tree.root_node):
+                classes += bool(captured.get("class_body"))
+        print(f"{mode:<10}{parse_ms:>10.1f}{nodes:>10}{errors:>8}{missing:>9}{classes:>9}")
+
+
+if __name__ == "__main__":
+    main()
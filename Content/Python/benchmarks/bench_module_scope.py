@@ -0,0 +1,79 @@
+"""
+Module-restricted search benchmark: whole scope vs one UE module.
+
+On a synthetic C++ tree (`--modules` modules, each with a Build.cs), looks up a common
+identifier (`FString`, on every method line) with `find_references` and ranks lines with
+`search_code(query_mode="ranked")`, for the whole project and restricted to one module:
+- cold: fresh analyzer; the whole-scope query indexes every file, the module query only
+  walks and tokenizes that module's directory
+- warm: index built; the module query only visits that module's index partition
+
+Also prints the discovered module map and the dependency order used by `build_index`.
+
+Usage:
+    python -m benchmarks.bench_module_scope --classes 4000 --modules 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import CppAnalyzer, set_analyzer
+
+from .synthetic_cpp import generate_cpp_tree
+
+MODULE = "SynthMod3"
+IDENTIFIER = "FString"
+QUERY = "Method Label"
+
+
+async def _run(analyzer: CppAnalyzer, module: str | None) -> tuple[float, int, float, int]:
+    start = time.perf_counter()
+    refs = await analyzer.find_references(IDENTIFIER, max_results=50, module=module)
+    refs_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    ranked = await analyzer.search_code(
+        QUERY, max_results=50, query_mode="ranked", module=module
+    )
+    ranked_ms = (time.perf_counter() - start) * 1000.0
+    return refs_ms, int(refs["total_count"]), ranked_ms, int(ranked["count"])
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        source = generate_cpp_tree(root, args.classes, args.modules)
+        get_config().add_source_path(source)
+        print(f"classes={args.classes} files={args.classes * 2} modules={args.modules}")
+        print(f"{'query':<18}{'refs ms':>10}{'refs':>8}{'ranked ms':>11}{'lines':>7}")
+        for label, module in (("scope", None), ("module", MODULE)):
+            analyzer = CppAnalyzer()
+            set_analyzer(analyzer)
+            for state in ("cold", "warm"):
+                refs_ms, refs, ranked_ms, lines = await _run(analyzer, module)
+                row = f"{label} ({state})"
+                print(f"{row:<18}{refs_ms:>10.1f}{refs:>8}{ranked_ms:>11.1f}{lines:>7}")
+            print(f"  index: {analyzer.get_stats()['reference_index']}")
+
+        modules = await analyzer.get_modules(module=MODULE)
+        print(f"{MODULE} depends on {len(modules['dependencies'])} modules")
+        start = time.perf_counter()
+        built = await CppAnalyzer().build_index()
+        print(
+            f"build_index: {(time.perf_counter() - start) * 1000.0:.1f}ms "
+            f"files={built['files_indexed']} order={built['modules'][:4]}..."
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Module-restricted search benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    parser.add_argument("--modules", type=int, default=16)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Name search benchmark: per-name Python loops vs the packed `NameTable`.
+
+Generates N synthetic asset names and runs wildcard and multi-token queries two ways:
+- baseline: `fnmatch` per name / token-in-name scoring per name, then a full sort
+- packed: one regex scan per term over the contiguous buffer, heap top-k
+
+Usage:
+    python -m benchmarks.bench_name_table --names 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import time
+
+from unreal_copilot.ue_client.name_table import NameTable
+
+PREFIXES = ("BP", "SM", "SK", "M", "MI", "T", "DA", "ABP", "WBP", "NS")
+WORDS = (
+    "Player", "Enemy", "Weapon", "Rifle", "Pistol", "Door", "Crate", "Health", "Ammo",
+    "Pickup", "Character", "Hero", "Boss", "Spawner", "Trigger", "Light", "Fire", "Ice",
+)
+
+
+def _names(count: int) -> list[str]:
+    names = []
+    for i in range(count):
+        a = WORDS[i % len(WORDS)]
+        b = WORDS[(i // len(WORDS)) % len(WORDS)]
+        names.append(f"{PREFIXES[i % len(PREFIXES)]}_{a}{b}_{i}")
+    return names
+
+
+def _baseline_wildcard(names: list[str], pattern: str) -> list[int]:
+    pattern = pattern.lower()
+    return [i for i, n in enumerate(names) if fnmatch.fnmatchcase(n.lower(), pattern)]
+
+
+def _baseline_rank(names: list[str], tokens: list[str], k: int) -> list[tuple[int, int]]:
+    lowered = [t.lower() for t in tokens]
+    scored = []
+    for i, n in enumerate(names):
+        lower = n.lower()
+        score = sum(1 for t in lowered if t in lower)
+        if score:
+            scored.append((i, score))
+    scored.sort(key=lambda x: (-x[1], len(names[x[0]]), x[0]))
+    return scored[:k]
+
+
+def _timed(fn, rounds: int) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = None
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) * 1000.0 / rounds, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Packed name table benchmark")
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    names = _names(args.names)
+    build_ms, table = _timed(lambda: NameTable(names), 1)
+    print(f"names={args.names} build={build_ms:.0f} ms")
+    print(f"{'query':<34}{'baseline ms':>12}{'packed ms':>11}{'hits':>9}")
+
+    for pattern in ("BP_*Rifle*", "wbp_door?ice_*", "*_1234*"):
+        base_ms, base = _timed(lambda: _baseline_wildcard(names, pattern), args.rounds)
+        fast_ms, fast = _timed(lambda: table.rows_matching(pattern), args.rounds)
+        assert base == fast, pattern
+        print(f"{'wildcard ' + pattern:<34}{base_ms:>12.1f}{fast_ms:>11.1f}{len(fast):>9}")
+
+    for tokens in (["player", "rifle"], ["boss", "fire", "spawner"], ["abp", "hero", "99"]):
+        label = "tokens " + " ".join(tokens)
+        base_ms, base = _timed(lambda: _baseline_rank(names, tokens, args.top_k), args.rounds)
+        fast_ms, fast = _timed(lambda: table.top_k(tokens, args.top_k), args.rounds)
+        assert base == fast, tokens
+        print(f"{label:<34}{base_ms:>12.1f}{fast_ms:>11.1f}{len(fast):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+C++ search relevance benchmark: token-count scoring vs BM25 ranking.
+
+Queries a synthetic C++ tree for specific methods (`USynth<i> Method<m>`) with
+`search_code(query_mode="tokens")` and `query_mode="ranked"`. The relevant line is the
+out-of-line definition `USynth<i>::Method<m>(`. Reports latency and mean reciprocal rank
+within the returned top-k (0 when the definition is not returned). Token mode stops at
+the first k matching lines in scan order, so it is fast but rarely reaches the definition.
+
+Usage:
+    python -m benchmarks.bench_ranked_search --classes 2000 --queries 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import get_analyzer
+
+from .synthetic_cpp import METHODS_PER_CLASS, class_name, generate_cpp_tree
+
+
+def _reciprocal_rank(matches: list[dict], definition: str) -> float:
+    for rank, match in enumerate(matches, 1):
+        lines = match["context"].split("\n")
+        # Context is centered on the match (2 lines before, unless clipped at the top).
+        center = lines[min(2, match["line"] - 1)] if lines else ""
+        if definition in center:
+            return 1.0 / rank
+    return 0.0
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    analyzer = get_analyzer()
+    queries = [
+        (class_name((i * 37) % args.classes), i % METHODS_PER_CLASS) for i in range(args.queries)
+    ]
+    with tempfile.TemporaryDirectory() as root:
+        get_config().add_source_path(generate_cpp_tree(root, args.classes))
+        start = time.perf_counter()
+        await analyzer.search_code("warmup", max_results=1, query_mode="ranked")
+        print(
+            f"classes={args.classes} files={args.classes * 2} k={args.k} "
+            f"index build={(time.perf_counter() - start) * 1000.0:.0f}ms"
+        )
+        print(f"{'mode':<10}{'ms/query':>10}{'MRR':>8}")
+        for mode in ("tokens", "ranked"):
+            total_rr = 0.0
+            start = time.perf_counter()
+            for cls, method in queries:
+                result = await analyzer.search_code(
+                    f"{cls} Method{method}", max_results=args.k, query_mode=mode
+                )
+                total_rr += _reciprocal_rank(result["matches"], f"{cls}::Method{method}(")
+            elapsed_ms = (time.perf_counter() - start) * 1000.0 / len(queries)
+            print(f"{mode:<10}{elapsed_ms:>10.1f}{total_rr / len(queries):>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ranked C++ search benchmark")
+    parser.add_argument("--classes", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("-k", type=int, default=20)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
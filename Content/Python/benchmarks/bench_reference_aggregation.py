@@ -0,0 +1,83 @@
+"""
+Reference aggregation benchmark: materialized matches vs streamed file groups.
+
+For heavily used identifiers in a synthetic C++ tree, compares:
+- materialized: `find_references` builds one dict with a 5-line context per match, then
+  the matches are grouped, sorted and trimmed to a few samples per file
+- streamed: `aggregate_references` derives counts/ranges from the reference index and
+  reads sample lines only for the files within the match budget (find_cpp_class_usage's
+  default of 200); file and match counts still cover the whole scope
+
+Reports wall time and peak traced memory (the index is warmed first for both).
+
+Usage:
+    python -m benchmarks.bench_reference_aggregation --classes 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+
+from unreal_copilot.config import get_config
+from unreal_copilot.cpp_analyzer import get_analyzer
+
+from .synthetic_cpp import generate_cpp_tree
+
+IDENTIFIERS = ("UObject", "int32", "Count", "USynth7")
+
+
+async def _materialized(identifier: str) -> int:
+    result = await get_analyzer().find_references(identifier, max_results=10**9)
+    by_file: dict[str, list[dict]] = {}
+    for match in result["matches"]:
+        by_file.setdefault(match["file"], []).append(match)
+    groups = []
+    for file_path, matches in by_file.items():
+        matches.sort(key=lambda m: m["line"])
+        samples = [
+            {"line": m["line"], "context": m["context"].split("\n")[0][:100]} for m in matches[:3]
+        ]
+        groups.append({"file": file_path, "match_count": len(matches), "sample_lines": samples})
+    return len(groups)
+
+
+async def _streamed(identifier: str) -> int:
+    result = await get_analyzer().aggregate_references(identifier, max_results=200)
+    return int(result["file_count"])
+
+
+async def _measure(fn, identifier: str) -> tuple[float, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    files = await fn(identifier)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / (1024 * 1024), files
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        get_config().add_source_path(generate_cpp_tree(root, args.classes))
+        analyzer = get_analyzer()
+        await analyzer.aggregate_references("warmup")
+        print(f"classes={args.classes} files={args.classes * 2}")
+        print(f"{'identifier':<12}{'mode':<14}{'ms':>10}{'peak MiB':>10}{'files':>8}")
+        for identifier in IDENTIFIERS:
+            for mode, fn in (("materialized", _materialized), ("streamed", _streamed)):
+                elapsed_ms, peak_mib, files = await _measure(fn, identifier)
+                print(f"{identifier:<12}{mode:<14}{elapsed_ms:>10.1f}{peak_mib:>10.2f}{files:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reference aggregation benchmark")
+    parser.add_argument("--classes", type=int, default=4000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Reference-chain benchmark: editor-side BFS vs the client-side dependency graph.
+
+Traces chains from several overlapping start assets, first through
+`/analysis/reference-chain` (the whole BFS runs in the editor every time), then through
+`AssetDependencyGraph` (only unseen nodes are fetched). Reports wall time and requests that
+reached the stand-in server.
+
+Usage:
+    python -m benchmarks.bench_reference_chain --assets 5000 --depth 4 --traces 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from unreal_copilot.ue_client import ResponseCache
+from unreal_copilot.ue_client.http_client import UEPluginClient
+
+from .stub_ue_server import start_stub_server
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = start_stub_server(asset_count=args.assets, latency_s=args.latency_ms / 1000.0)
+    # Zero-TTL response cache so the editor path really re-runs every trace.
+    client = UEPluginClient(server.url, cache=ResponseCache(ttl_s=0.0))
+    starts = [f"/Game/Synthetic/Asset_{i}" for i in range(args.traces)]
+    try:
+        print(
+            f"assets={args.assets} depth={args.depth} traces={args.traces} "
+            f"latency={args.latency_ms}ms"
+        )
+        print(f"{'mode':<18}{'ms':>10}{'server reqs':>13}{'nodes':>10}")
+
+        for mode in ("editor", "local-cold", "local-warm"):
+            if mode == "local-cold":
+                client.invalidate_cache()
+            server.reset_counts()
+            nodes = 0
+            start = time.perf_counter()
+            for path in starts:
+                if mode == "editor":
+                    result = await client.get_with_async(
+                        "/analysis/reference-chain",
+                        {"start": path, "depth": args.depth, "direction": "both"},
+                    )
+                else:
+                    result = await client.dependency_graph.trace(path, args.depth, "both")
+                nodes += int(result.get("unique_nodes", 0))
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            print(f"{mode:<18}{elapsed_ms:>10.1f}{server.total_requests():>13}{nodes:>10}")
+
+        print(f"graph: {client.get_stats()['dependency_graph']}")
+    finally:
+        await client.close()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reference-chain traversal benchmark")
+    parser.add_argument("--assets", type=int, default=5000)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--traces", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
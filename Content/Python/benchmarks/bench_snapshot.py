@@ -0,0 +1,80 @@
+"""
+Offline asset snapshot benchmark (`AssetSnapshot`).
+
+Builds a synthetic asset registry export, writes it as a packed snapshot file, loads it back
+and times the queries the Blueprint/Asset tools need: wildcard search, references,
+referencers and reference chains. The export round-trip through the stand-in server's
+`/analysis/snapshot` job is checked on a small graph first.
+
+Usage:
+    python -m benchmarks.bench_snapshot --assets 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from unreal_copilot.ue_client.http_client import UEPluginClient
+from unreal_copilot.ue_client.snapshot import AssetSnapshot, export_snapshot
+
+from .stub_ue_server import SyntheticAssetGraph, start_stub_server
+
+
+def _timed(label: str, fn, rounds: int = 1):
+    start = time.perf_counter()
+    result = None
+    for _ in range(rounds):
+        result = fn()
+    elapsed_ms = (time.perf_counter() - start) * 1000.0 / rounds
+    print(f"{label:<34}{elapsed_ms:>10.2f} ms")
+    return result
+
+
+async def _check_export(path: str) -> None:
+    server = start_stub_server(asset_count=2000)
+    client = UEPluginClient(server.url)
+    try:
+        snapshot = await export_snapshot(client, path)
+        expected = await client.get(
+            "/asset/referencers", {"asset_path": "/Game/Synthetic/Asset_9"}
+        )
+        assert snapshot.referencers("/Game/Synthetic/Asset_9") == expected["referencers"]
+        print(f"export via stub server: {snapshot.stats()}")
+    finally:
+        await client.close()
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Asset snapshot query benchmark")
+    parser.add_argument("--assets", type=int, default=500000)
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_check_export(os.path.join(tmp, "small.ucsnap")))
+
+        path = os.path.join(tmp, "assets.ucsnap")
+        payload = SyntheticAssetGraph(args.assets, 0).export_snapshot()
+        _timed("build + save", lambda: AssetSnapshot.from_export(payload).save(path))
+        print(f"file size: {os.path.getsize(path) / 1e6:.1f} MB")
+
+        snapshot = _timed("load", lambda: AssetSnapshot.load(path))
+        target = f"/Game/Synthetic/Asset_{args.assets // 2}"
+        _timed("search 'Asset_12*'", lambda: snapshot.search("Asset_12*", scope="all"), 5)
+        _timed("search '*99*' type=Blueprint", lambda: snapshot.search("*99*", "Blueprint"), 5)
+        _timed("references (x1000)", lambda: [snapshot.references(target) for _ in range(1000)])
+        _timed("referencers (first, builds index)", lambda: snapshot.referencers(target))
+        _timed("referencers (x1000)", lambda: [snapshot.referencers(target) for _ in range(1000)])
+        result = _timed(
+            f"trace depth={args.depth} both", lambda: snapshot.trace(target, args.depth), 5
+        )
+        print(f"trace unique_nodes={result['unique_nodes']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Specifier parsing microbenchmark: character-concatenating parser vs sliced, memoized parser.
+
+Builds a corpus of macro argument strings the way a large codebase repeats them (a few
+hundred distinct strings, most occurrences being common ones such as
+`EditAnywhere, BlueprintReadWrite, Category="..."`) and parses every occurrence with:
+- legacy: the previous `parse_specifiers` (`current += char` per character)
+- sliced: the new tokenizer without the cache
+- memoized: `parse_specifiers` (cache cleared first, so misses are included)
+- map: `parse_specifier_map` (structured output, also memoized)
+
+Usage:
+    python -m benchmarks.bench_specifier_parsing --occurrences 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from unreal_copilot.cpp_analyzer.patterns import (
+    _specifier_items,
+    _split_specifiers,
+    parse_specifier_map,
+    parse_specifiers,
+)
+
+_FLAGS = (
+    "EditAnywhere",
+    "EditDefaultsOnly",
+    "VisibleAnywhere",
+    "BlueprintReadWrite",
+    "BlueprintReadOnly",
+    "BlueprintCallable",
+    "BlueprintPure",
+    "Replicated",
+    "Transient",
+    "Server",
+    "Reliable",
+)
+_CATEGORIES = ("Health", "Combat|Damage", "Movement", "UI", "Abilities|Cost", "Camera")
+_META = (
+    "meta=(ClampMin=0, ClampMax=100)",
+    'meta=(DisplayName="Max Health", ToolTip="Upper bound, in points")',
+    "meta=(AllowPrivateAccess=true)",
+)
+
+
+def legacy_parse_specifiers(specifiers_str: str) -> list[str]:
+    result = []
+    depth = 0
+    current = ""
+    for char in specifiers_str:
+        if char == "(":
+            depth += 1
+            current += char
+        elif char == ")":
+            depth -= 1
+            current += char
+        elif char == "," and depth == 0:
+            if current.strip():
+                result.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        result.append(current.strip())
+    return result
+
+
+def _corpus(occurrences: int, distinct: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        parts = rng.sample(_FLAGS, rng.randint(1, 3))
+        parts.append(f'Category="{rng.choice(_CATEGORIES)}"')
+        if rng.random() < 0.4:
+            parts.append(rng.choice(_META))
+        pool.append(", ".join(parts))
+    # Zipf-like reuse: a handful of strings account for most occurrences.
+    weights = [1.0 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(pool, weights=weights, k=occurrences)
+
+
+def _timed(fn, corpus: list[str]) -> float:
+    start = time.perf_counter()
+    for s in corpus:
+        fn(s)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Specifier parsing microbenchmark")
+    parser.add_argument("--occurrences", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=400)
+    args = parser.parse_args()
+
+    corpus = _corpus(args.occurrences, args.distinct)
+    assert all(
+        parse_specifiers(s) == legacy_parse_specifiers(s) for s in set(corpus) if '"' not in s
+    )
+    _split_specifiers.cache_clear()
+    _specifier_items.cache_clear()
+
+    print(f"occurrences={len(corpus)} distinct={len(set(corpus))}")
+    print(f"{'parser':<12}{'ms':>10}{'us/macro':>10}")
+    for name, fn in (
+        ("legacy", legacy_parse_specifiers),
+        ("sliced", _split_specifiers.__wrapped__),
+        ("memoized", parse_specifiers),
+        ("map", parse_specifier_map),
+    ):
+        elapsed_ms = _timed(fn, corpus)
+        print(f"{name:<12}{elapsed_ms:>10.1f}{elapsed_ms * 1000.0 / len(corpus):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
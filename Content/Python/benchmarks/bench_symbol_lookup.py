@@ -0,0 +1,86 @@
+"""
+Fuzzy symbol lookup benchmark: linear difflib scan vs `SymbolIndex`.
+
+Generates N engine-like type names (U/A/F/S prefix + 2-4 PascalCase words from a mixed
+vocabulary) and looks up partial and misspelled names two ways:
+- scan: `difflib.get_close_matches` over every normalized name
+- index: `SymbolIndex.lookup` (bisect prefix range + deletion-seeded trie walk)
+
+Usage:
+    python -m benchmarks.bench_symbol_lookup --symbols 300000
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import time
+
+from unreal_copilot.cpp_analyzer.symbols import Symbol, SymbolIndex, normalize_symbol
+
+WORDS = (
+    "Lyra Health Component Movie Scene Anim Graph Node Pawn Actor Character Ability System "
+    "Gameplay Effect Tag Widget Slate Render Mesh Static Skeletal Material Instance Niagara "
+    "Emitter Particle Physics Body Setup Controller Player State Game Mode Level Sequence "
+    "Track Section Editor Asset Tools Blueprint Function Library Subsystem Manager Settings"
+).split()
+
+QUERIES = (
+    "LyraHealthComp",  # partial, no U prefix
+    "ULyraHealthComponent",  # exact
+    "LyraHelathComponent",  # transposition
+    "LyraHelthComp",  # deletion + partial
+    "MovieSceneTrak",  # partial with a typo
+)
+
+
+def _names(count: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    # Mix of real-looking words and pseudo-words, like a large engine codebase.
+    vocab = list(WORDS) + [
+        "".join(
+            rng.choice("bcdfghklmnprstvwz") + rng.choice("aeiou") + rng.choice("bcdfghklmnprstvwz")
+            for _ in range(rng.randint(1, 3))
+        ).capitalize()
+        for _ in range(1500)
+    ]
+    names = {"ULyraHealthComponent", "UMovieSceneTrack"}
+    while len(names) < count:
+        names.add(rng.choice("UAFS") + "".join(rng.choice(vocab) for _ in range(rng.randint(2, 4))))
+    return sorted(names)
+
+
+def _timed(fn, rounds: int) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = None
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) * 1000.0 / rounds, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fuzzy symbol lookup benchmark")
+    parser.add_argument("--symbols", type=int, default=300000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    names = _names(args.symbols)
+    normalized = [normalize_symbol(n) for n in names]
+    start = time.perf_counter()
+    index = SymbolIndex(Symbol(name=n, kind="class", file="", line=0) for n in names)
+    build_ms = (time.perf_counter() - start) * 1000.0
+    print(f"symbols={len(names)} build={build_ms:.0f}ms {index.stats()}")
+    print(f"{'query':<22}{'scan ms':>10}{'index ms':>10}  top match (scan | index)")
+
+    for query in QUERIES:
+        q = normalize_symbol(query)
+        scan_ms, scan = _timed(lambda: difflib.get_close_matches(q, normalized, n=5), 1)
+        index_ms, found = _timed(lambda: index.lookup(query, 5), args.rounds)
+        scan_top = scan[0] if scan else "-"
+        index_top = found[0]["name"] if found else "-"
+        print(f"{query:<22}{scan_ms:>10.1f}{index_ms:>10.3f}  {scan_top} | {index_top}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,488 @@
+"""
+Local stand-in for the UnrealCopilot editor HTTP API.
+
+Mirrors the routes registered in `UnrealAnalyzerHttpRoutes.cpp` closely enough to exercise
+`UEPluginClient` without a running editor:
+- /health
+- /blueprint/search, /blueprint/hierarchy, /blueprint/dependencies, /blueprint/referencers,
+  /blueprint/graph, /blueprint/details
+- /asset/search, /asset/references, /asset/referencers, /asset/metadata
+- /analysis/reference-chain, /analysis/cpp-class-usage, /analysis/snapshot,
+  /analysis/job/status, /analysis/job/result
+- POST /batch
+
+Assets are synthetic (`/Game/Synthetic/Asset_<i>`) with a deterministic dependency graph.
+An optional per-request latency simulates game-thread work in the editor.
+
+Usage:
+    python -m benchmarks.stub_ue_server --port 8080 --assets 1000 --latency-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+RouteHandler = Callable[[dict[str, str]], tuple[int, dict]]
+
+# Same clamp as GMaxJobResultChunkChars in the editor plugin.
+MAX_JOB_CHUNK_CHARS = 262144
+
+
+class SyntheticAssetGraph:
+    """Deterministic synthetic asset registry."""
+
+    def __init__(self, asset_count: int = 1000, graph_nodes: int = 200):
+        self.asset_count = max(1, asset_count)
+        self.graph_nodes = graph_nodes
+        self.paths = [f"/Game/Synthetic/Asset_{i}" for i in range(self.asset_count)]
+        self.index = {p: i for i, p in enumerate(self.paths)}
+
+        self.references: list[list[int]] = []
+        self.referencers: list[list[int]] = [[] for _ in range(self.asset_count)]
+        for i in range(self.asset_count):
+            targets = sorted({(i + 1) % self.asset_count, (i * 7 + 3) % self.asset_count} - {i})
+            self.references.append(targets)
+            for t in targets:
+                self.referencers[t].append(i)
+
+    def lookup(self, path: str) -> int | None:
+        """Resolve a package or object path to an asset index."""
+        return self.index.get(path.split(".")[0])
+
+    def asset_type(self, i: int) -> str:
+        return "Blueprint" if i % 3 == 0 else "DataAsset"
+
+    def export_snapshot(self) -> dict:
+        """Build the same columnar payload as the plugin's /analysis/snapshot."""
+        names = [p.rsplit("/", 1)[-1] for p in self.paths]
+        strings = ["Blueprint", "DataAsset"] + self.paths + names
+        n = self.asset_count
+        offsets = [0]
+        targets: list[int] = []
+        for refs in self.references:
+            targets.extend(refs)
+            offsets.append(len(targets))
+        return {
+            "ok": True,
+            "version": 1,
+            "scope": "all",
+            "asset_count": n,
+            "node_count": n,
+            "edge_count": len(targets),
+            "strings": strings,
+            "nodes": list(range(2, 2 + n)),
+            "assets": {
+                "node": list(range(n)),
+                "name": list(range(2 + n, 2 + 2 * n)),
+                "type": [0 if i % 3 == 0 else 1 for i in range(n)],
+            },
+            "edges": {"offsets": offsets, "targets": targets},
+        }
+
+
+class StubUEServer(ThreadingHTTPServer):
+    """Threaded HTTP server with per-route request counters."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        graph: SyntheticAssetGraph,
+        latency_s: float,
+        batch_enabled: bool = True,
+    ):
+        super().__init__(address, _StubRequestHandler)
+        self.graph = graph
+        self.latency_s = latency_s
+        self.batch_enabled = batch_enabled
+        self.request_counts: Counter[str] = Counter()
+        self.jobs: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.routes: dict[str, RouteHandler] = {
+            "/health": self._health,
+            "/blueprint/search": lambda q: self._search(q, blueprints_only=True),
+            "/blueprint/hierarchy": self._hierarchy,
+            "/blueprint/dependencies": lambda q: self._edges(q, "bp_path", "dependencies"),
+            "/blueprint/referencers": lambda q: self._edges(q, "bp_path", "referencers"),
+            "/blueprint/graph": self._graph,
+            "/blueprint/details": self._details,
+            "/asset/search": lambda q: self._search(q, blueprints_only=False),
+            "/asset/references": lambda q: self._edges(q, "asset_path", "references"),
+            "/asset/referencers": lambda q: self._edges(q, "asset_path", "referencers"),
+            "/asset/metadata": self._metadata,
+            "/analysis/reference-chain": self._reference_chain,
+            "/analysis/cpp-class-usage": self._cpp_class_usage,
+            "/analysis/snapshot": lambda q: self._start_job(self.graph.export_snapshot()),
+            "/analysis/job/status": self._job_status,
+            "/analysis/job/result": self._job_result,
+        }
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.request_counts.values())
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.request_counts.clear()
+
+    def count(self, path: str) -> None:
+        with self._lock:
+            self.request_counts[path] += 1
+
+    # ------------------------------------------------------------------
+    # Route handlers
+    # ------------------------------------------------------------------
+
+    def _error(self, message: str, code: int = 400, detail: str = "") -> tuple[int, dict]:
+        body: dict[str, Any] = {"ok": False, "error": message}
+        if detail:
+            body["detail"] = detail
+        return code, body
+
+    def _resolve(self, q: dict[str, str], key: str) -> tuple[int | None, tuple[int, dict] | None]:
+        path = q.get(key, "")
+        if not path:
+            return None, self._error(f"Missing required query param: {key}")
+        i = self.graph.lookup(path)
+        if i is None:
+            return None, self._error("Asset not found", 404, path)
+        return i, None
+
+    def _health(self, q: dict[str, str]) -> tuple[int, dict]:
+        return 200, {"ok": True, "status": "running", "plugin": "UnrealCopilot-stub"}
+
+    def _search(self, q: dict[str, str], *, blueprints_only: bool) -> tuple[int, dict]:
+        pattern = q.get("pattern", "*") or "*"
+        if not any(ch in pattern for ch in "*?"):
+            pattern = f"*{pattern}*"
+        matches = []
+        for i, path in enumerate(self.graph.paths):
+            name = path.rsplit("/", 1)[-1]
+            asset_type = self.graph.asset_type(i)
+            if blueprints_only and asset_type != "Blueprint":
+                continue
+            if fnmatch.fnmatchcase(name.lower(), pattern.lower()):
+                matches.append({"name": name, "path": path, "type": asset_type})
+        return 200, {"ok": True, "matches": matches, "count": len(matches)}
+
+    def _hierarchy(self, q: dict[str, str]) -> tuple[int, dict]:
+        i, err = self._resolve(q, "bp_path")
+        if err:
+            return err
+        return 200, {
+            "ok": True,
+            "blueprint": self.graph.paths[i],
+            "hierarchy": [{"name": "Actor", "path": "/Script/Engine.Actor", "is_native": True}],
+            "native_parent": "Actor",
+            "blueprint_parents": [],
+        }
+
+    def _edges(self, q: dict[str, str], key: str, field: str) -> tuple[int, dict]:
+        i, err = self._resolve(q, key)
+        if err:
+            return err
+        edges = self.graph.referencers[i] if field == "referencers" else self.graph.references[i]
+        items = [self.graph.paths[j] for j in edges]
+        owner = "blueprint" if key == "bp_path" else "asset"
+        return 200, {"ok": True, owner: self.graph.paths[i], field: items, "count": len(items)}
+
+    def _details(self, q: dict[str, str]) -> tuple[int, dict]:
+        i, err = self._resolve(q, "bp_path")
+        if err:
+            return err
+        variables = [{"name": f"Var{v}", "type": "float"} for v in range(8)]
+        return 200, {
+            "ok": True,
+            "blueprint": self.graph.paths[i],
+            "variables": variables,
+            "functions": [f"Func{f}" for f in range(6)],
+            "components": [],
+            "graphs": ["EventGraph"],
+            "parent_class": {"name": "Actor", "path": "/Script/Engine.Actor"},
+            "variable_count": len(variables),
+            "function_count": 6,
+            "component_count": 0,
+        }
+
+    def _metadata(self, q: dict[str, str]) -> tuple[int, dict]:
+        i, err = self._resolve(q, "asset_path")
+        if err:
+            return err
+        path = self.graph.paths[i]
+        name = path.rsplit("/", 1)[-1]
+        return 200, {
+            "ok": True,
+            "name": name,
+            "path": path,
+            "type": self.graph.asset_type(i),
+            "object_path": f"{path}.{name}",
+        }
+
+    def _build_graph_json(self, bp_path: str, graph_name: str) -> dict:
+        nodes = [
+            {"id": f"N{n}", "type": "K2Node_CallFunction", "title": f"Call Function {n}"}
+            for n in range(self.graph.graph_nodes)
+        ]
+        connections = [
+            {"from_node": f"N{n}", "from_pin": "then", "to_node": f"N{n + 1}", "to_pin": "execute"}
+            for n in range(self.graph.graph_nodes - 1)
+        ]
+        return {
+            "ok": True,
+            "blueprint": bp_path,
+            "graph": graph_name,
+            "nodes": nodes,
+            "connections": connections,
+            "node_count": len(nodes),
+            "connection_count": len(connections),
+        }
+
+    def _start_job(self, result: dict) -> tuple[int, dict]:
+        job_id = uuid.uuid4().hex.upper()
+        with self._lock:
+            self.jobs[job_id] = json.dumps(result)
+        return 200, {
+            "ok": True,
+            "mode": "async",
+            "job_id": job_id,
+            "status_url": f"/analysis/job/status?id={job_id}",
+            "result_url_template": (
+                f"/analysis/job/result?id={job_id}&offset={{offset}}&limit={{limit}}"
+            ),
+        }
+
+    def _graph(self, q: dict[str, str]) -> tuple[int, dict]:
+        i, err = self._resolve(q, "bp_path")
+        if err:
+            return err
+        result = self._build_graph_json(self.graph.paths[i], q.get("graph_name", "EventGraph"))
+        # Same threshold as HandleBlueprintGraph: 50+ nodes go async.
+        if self.graph.graph_nodes >= 50:
+            return self._start_job(result)
+        return 200, result
+
+    def _chain_node(
+        self, i: int, depth: int, max_depth: int, direction: str, visited: set[int]
+    ) -> dict:
+        node: dict[str, Any] = {"path": self.graph.paths[i], "depth": depth}
+        if depth >= max_depth:
+            node["children"] = []
+            return node
+        nxt: list[int] = []
+        if direction in ("references", "both"):
+            nxt.extend(self.graph.references[i])
+        if direction in ("referencers", "both"):
+            nxt.extend(self.graph.referencers[i])
+        children = []
+        for j in nxt:
+            if j in visited:
+                continue
+            visited.add(j)
+            children.append(self._chain_node(j, depth + 1, max_depth, direction, visited))
+        node["children"] = children
+        return node
+
+    def _reference_chain(self, q: dict[str, str]) -> tuple[int, dict]:
+        i, err = self._resolve(q, "start")
+        if err:
+            return err
+        direction = q.get("direction", "both")
+        max_depth = max(0, min(10, int(q.get("depth", "3") or 3)))
+        visited = {i}
+        chain = self._chain_node(i, 0, max_depth, direction, visited)
+        return self._start_job(
+            {
+                "ok": True,
+                "start": self.graph.paths[i],
+                "direction": direction,
+                "max_depth": max_depth,
+                "chain": chain,
+                "unique_nodes": len(visited),
+            }
+        )
+
+    def _cpp_class_usage(self, q: dict[str, str]) -> tuple[int, dict]:
+        cls = q.get("class", "")
+        if not cls:
+            return self._error("Missing required query param: class")
+        # Every Blueprint derives from the queried class; the other categories stay empty.
+        parents = [
+            {"name": path.rsplit("/", 1)[-1], "path": path}
+            for i, path in enumerate(self.graph.paths)
+            if self.graph.asset_type(i) == "Blueprint"
+        ]
+        return 200, {
+            "ok": True,
+            "class": cls,
+            "as_parent_class": parents,
+            "as_component": [],
+            "as_variable_type": [],
+            "as_function_call": [],
+        }
+
+    def _job_status(self, q: dict[str, str]) -> tuple[int, dict]:
+        job_id = q.get("id", "")
+        with self._lock:
+            payload = self.jobs.get(job_id)
+        if payload is None:
+            return self._error("Job not found", 404, job_id)
+        return 200, {
+            "ok": True,
+            "id": job_id,
+            "status": "done",
+            "total_chars": len(payload),
+            "max_chunk_chars": MAX_JOB_CHUNK_CHARS,
+        }
+
+    def _job_result(self, q: dict[str, str]) -> tuple[int, dict]:
+        job_id = q.get("id", "")
+        with self._lock:
+            payload = self.jobs.get(job_id)
+        if payload is None:
+            return self._error("Job not found", 404, job_id)
+        # Same clamping as HandleAnalysisJobResult.
+        offset = max(0, int(q.get("offset", "0") or 0))
+        limit = max(1, min(MAX_JOB_CHUNK_CHARS, int(q.get("limit", "65536") or 65536)))
+        total = len(payload)
+        safe_offset = min(offset, total)
+        safe_len = max(1, min(limit, max(1, total - safe_offset)))
+        next_offset = safe_offset + safe_len
+        return 200, {
+            "ok": True,
+            "id": job_id,
+            "offset": safe_offset,
+            "limit": safe_len,
+            "total_chars": total,
+            "next_offset": next_offset,
+            "done": next_offset >= total,
+            "chunk": payload[safe_offset : safe_offset + safe_len],
+        }
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the editor's HTTP server
+    disable_nagle_algorithm = True  # headers and body are written separately
+    server: StubUEServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _send_json(self, code: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:  # noqa: N802
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        handler = self.server.routes.get(parts.path)
+        self.server.count(parts.path)
+        if handler is None:
+            self._send_json(404, {"ok": False, "error": "Route not found", "detail": parts.path})
+            return
+        if self.server.latency_s > 0:
+            time.sleep(self.server.latency_s)
+        code, body = handler(query)
+        self._send_json(code, body)
+
+    def do_POST(self) -> None:  # noqa: N802
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        raw = self.rfile.read(length) if length else b""
+        self.server.count(parts.path)
+        if parts.path != "/batch" or not self.server.batch_enabled:
+            self._send_json(404, {"ok": False, "error": "Route not found", "detail": parts.path})
+            return
+        try:
+            requests = json.loads(raw or b"{}").get("requests", [])
+        except json.JSONDecodeError:
+            self._send_json(400, {"ok": False, "error": "Invalid JSON body"})
+            return
+        if self.server.latency_s > 0:
+            time.sleep(self.server.latency_s)
+        results = []
+        for item in requests:
+            handler = self.server.routes.get(str(item.get("path", "")))
+            if handler is None:
+                results.append(
+                    {"status": 404, "body": {"ok": False, "error": "Route not batchable"}}
+                )
+                continue
+            code, body = handler({k: str(v) for k, v in (item.get("params") or {}).items()})
+            results.append({"status": code, "body": body})
+        self._send_json(200, {"ok": True, "results": results, "count": len(results)})
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    *,
+    asset_count: int = 1000,
+    graph_nodes: int = 200,
+    latency_s: float = 0.0,
+    batch_enabled: bool = True,
+) -> StubUEServer:
+    """Start a stand-in server on a background thread.
+
+    Args:
+        host: Bind host
+        port: Bind port (0 picks a free port)
+        asset_count: Number of synthetic assets
+        graph_nodes: Node count of every synthetic Blueprint graph
+        latency_s: Simulated per-request editor latency
+        batch_enabled: Serve POST /batch (disable to mimic older plugins)
+
+    Returns:
+        The running server; call `shutdown()` to stop it.
+    """
+    graph = SyntheticAssetGraph(asset_count, graph_nodes)
+    server = StubUEServer((host, port), graph, latency_s, batch_enabled)
+    thread = threading.Thread(target=server.serve_forever, name="StubUEServer", daemon=True)
+    thread.start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stand-in UnrealCopilot editor HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--assets", type=int, default=1000)
+    parser.add_argument("--graph-nodes", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_stub_server(
+        args.host,
+        args.port,
+        asset_count=args.assets,
+        graph_nodes=args.graph_nodes,
+        latency_s=args.latency_ms / 1000.0,
+    )
+    print(f"[UnrealCopilot] Stub UE server listening on {server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
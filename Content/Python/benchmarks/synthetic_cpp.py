@@ -0,0 +1,153 @@
+"""
+Synthetic Unreal-style C++ source tree for analyzer benchmarks.
+
+Generates `Source/<Module>/{Public,Private}` modules with `.Build.cs` files. Each class has a
+header (UCLASS/UPROPERTY/UFUNCTION declarations, includes of sibling classes) and a `.cpp`
+file with out-of-line method definitions that call into other classes. The content is
+deterministic for a given size.
+
+Usage:
+    python -m benchmarks.synthetic_cpp /tmp/SynthProject --classes 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+METHODS_PER_CLASS = 4
+PROPERTIES_PER_CLASS = 4
+
+
+def class_name(i: int) -> str:
+    return f"USynth{i}"
+
+
+def _module_of(i: int, modules: int) -> int:
+    return i % modules
+
+
+def _base_of(i: int) -> str:
+    # Every 5th class derives from an earlier synthetic class, the rest from UObject.
+    return class_name(i - 1) if i % 5 == 4 else "UObject"
+
+
+def _header(i: int, classes: int, modules: int) -> str:
+    name = class_name(i)
+    api = f"SYNTHMOD{_module_of(i, modules)}_API"
+    deps = sorted({(i * 7 + 3) % classes, (i + 1) % classes} - {i})
+    includes = "\n".join(f'#include "Synth{d}.h"' for d in deps)
+    lines = [
+        "// Copyright Synthetic Project. All Rights Reserved.",
+        "",
+        "#pragma once",
+        "",
+        '#include "CoreMinimal.h"',
+        includes,
+        f'#include "Synth{i}.generated.h"',
+        "",
+        f"/** Synthetic class {i}: depends on {', '.join(class_name(d) for d in deps)}. */",
+        'UCLASS(Blueprintable, BlueprintType, meta = (DisplayName = "Synth"))',
+        f"class {api} {name} : public {_base_of(i)}",
+        "{",
+        "\tGENERATED_BODY()",
+        "",
+        "public:",
+    ]
+    for p in range(PROPERTIES_PER_CLASS):
+        spec = "EditAnywhere, BlueprintReadWrite" if p % 2 == 0 else "VisibleAnywhere"
+        lines += [
+            f'\tUPROPERTY({spec}, Category = "Synth|Values")',
+            f"\tfloat Value{p} = {p}.0f;",
+            "",
+        ]
+    for m in range(METHODS_PER_CLASS):
+        spec = "BlueprintCallable" if m % 2 == 0 else "BlueprintPure"
+        ret = "void" if m % 2 == 0 else "int32"
+        lines += [
+            f"\t/** Method {m} of {name}. */",
+            f'\tUFUNCTION({spec}, Category = "Synth")',
+            f"\t{ret} Method{m}(int32 Count, const FString& Label){' const' if m % 2 else ''};",
+            "",
+        ]
+    peer = class_name(deps[0]) if deps else "UObject"
+    lines += ["private:", f"\t{peer}* Peer = nullptr;", "};", ""]
+    return "\n".join(lines)
+
+
+def _source(i: int, classes: int) -> str:
+    name = class_name(i)
+    callee = (i * 13 + 5) % classes
+    lines = [
+        "// Copyright Synthetic Project. All Rights Reserved.",
+        "",
+        f'#include "Synth{i}.h"',
+        f'#include "Synth{callee}.h"',
+        "",
+    ]
+    for m in range(METHODS_PER_CLASS):
+        ret = "void" if m % 2 == 0 else "int32"
+        const = " const" if m % 2 else ""
+        lines += [
+            f"{ret} {name}::Method{m}(int32 Count, const FString& Label){const}",
+            "{",
+            f"\t{class_name(callee)}* Other = NewObject<{class_name(callee)}>();",
+            "\tif (Other && Count > 0)",
+            "\t{",
+            f"\t\tOther->Method{(m + 1) % METHODS_PER_CLASS}(Count - 1, Label);",
+            "\t}",
+            f'\tUE_LOG(LogTemp, Verbose, TEXT("{name}::Method{m} %d"), Count);',
+            "\treturn;" if m % 2 == 0 else f"\treturn Count + {m};",
+            "}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def _build_cs(module: str, deps: list[str]) -> str:
+    dep_list = ", ".join(f'"{d}"' for d in ["Core", "CoreUObject", "Engine", *deps])
+    return "\n".join(
+        [
+            "using UnrealBuildTool;",
+            "",
+            f"public class {module} : ModuleRules",
+            "{",
+            f"\tpublic {module}(ReadOnlyTargetRules Target) : base(Target)",
+            "\t{",
+            "\t\tPCHUsage = PCHUsageMode.UseExplicitOrSharedPCHs;",
+            f"\t\tPublicDependencyModuleNames.AddRange(new string[] {{ {dep_list} }});",
+            "\t}",
+            "}",
+            "",
+        ]
+    )
+
+
+def generate_cpp_tree(root: str | Path, classes: int = 1000, modules: int = 8) -> Path:
+    """Write the synthetic tree under `root` and return its `Source` directory."""
+    source = Path(root) / "Source"
+    modules = max(1, min(modules, classes))
+    for m in range(modules):
+        module = f"SynthMod{m}"
+        (source / module / "Public").mkdir(parents=True, exist_ok=True)
+        (source / module / "Private").mkdir(parents=True, exist_ok=True)
+        deps = [f"SynthMod{d}" for d in range(modules) if d != m]
+        (source / module / f"{module}.Build.cs").write_text(_build_cs(module, deps), "utf-8")
+    for i in range(classes):
+        module_dir = source / f"SynthMod{_module_of(i, modules)}"
+        (module_dir / "Public" / f"Synth{i}.h").write_text(_header(i, classes, modules), "utf-8")
+        (module_dir / "Private" / f"Synth{i}.cpp").write_text(_source(i, classes), "utf-8")
+    return source
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic UE C++ source tree")
+    parser.add_argument("root")
+    parser.add_argument("--classes", type=int, default=1000)
+    parser.add_argument("--modules", type=int, default=8)
+    args = parser.parse_args()
+    print(generate_cpp_tree(args.root, args.classes, args.modules))
+
+
+if __name__ == "__main__":
+    main()
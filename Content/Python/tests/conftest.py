@@ -0,0 +1,56 @@
+"""
+Shared fixtures.
+
+Every test runs against a fresh global configuration built from a clean environment (no
+auto-detected project or engine sources, no cache or snapshot files), so tests only see
+the source trees they write themselves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from unreal_copilot.config import Config, SourceType, get_config, reset_config
+
+_ENV_VARS = (
+    "CPP_SOURCE_PATH",
+    "PROJECT_PLUGINS_PATH",
+    "UNREAL_ENGINE_PATH",
+    "ENGINE_PLUGINS_PATH",
+    "ANALYZER_INDEX_CACHE",
+    "ENGINE_INDEX_PACK",
+    "UE_ASSET_SNAPSHOT",
+    "TOOL_TIMEOUT_S",
+)
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch: pytest.MonkeyPatch) -> Config:
+    """Fresh global configuration for each test."""
+    for name in _ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("ANALYZER_AUTO_DETECT_PROJECT_SOURCE", "false")
+    reset_config()
+    yield get_config()
+    reset_config()
+
+
+@pytest.fixture
+def cpp_source(tmp_path: Path, config: Config) -> Callable[..., Path]:
+    """Write C++ files ({relative path: text}) under a new source root and register it."""
+
+    def write(
+        files: dict[str, str], source_type: SourceType = SourceType.PROJECT_SOURCE
+    ) -> Path:
+        root = tmp_path / f"Source{len(config.get_source_configs())}"
+        for relative, text in files.items():
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+        config.add_source_path(root, source_type=source_type)
+        return root
+
+    return write
@@ -0,0 +1,153 @@
+"""CallGraph: edges, multi-hop walks, re-syncs and the release of unused symbols."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from unreal_copilot.cpp_analyzer import CppAnalyzer
+from unreal_copilot.cpp_analyzer.callgraph import CallGraph
+from unreal_copilot.cpp_analyzer.index import FileRecord
+from unreal_copilot.tools import unified
+
+GAME_MODE = """
+void AMyGameMode::BeginPlay()
+{
+    Super::BeginPlay();
+    SpawnPlayer();
+}
+
+void AMyGameMode::SpawnPlayer()
+{
+    UE_LOG(LogTemp, Log, TEXT("Spawn"));
+    GetWorld()->SpawnActor(PlayerClass);
+}
+"""
+
+
+def _write(path: Path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _sync(graph: CallGraph, path: str, present: bool = True) -> None:
+    graph.update(path, FileRecord(path, 0.0, 0) if present else None)
+    graph.sync()
+
+
+@pytest.fixture
+def graph() -> CallGraph:
+    return CallGraph()
+
+
+def test_callers_and_callees(graph, tmp_path):
+    _sync(graph, _write(tmp_path / "MyGameMode.cpp", GAME_MODE))
+
+    callees, truncated = graph.callees("AMyGameMode::BeginPlay")
+    assert {s["callee"] for s in callees} == {"Super::BeginPlay", "SpawnPlayer"}
+    assert not truncated
+
+    callers, _ = graph.callers("SpawnPlayer")
+    assert [(s["caller"], s["line"]) for s in callers] == [("AMyGameMode::BeginPlay", 5)]
+
+
+def test_macros_are_not_callees(graph, tmp_path):
+    _sync(graph, _write(tmp_path / "MyGameMode.cpp", GAME_MODE))
+    callees, _ = graph.callees("AMyGameMode::SpawnPlayer")
+    assert {s["callee"] for s in callees} == {"GetWorld", "SpawnActor"}
+
+
+def test_callees_follow_hops(graph, tmp_path):
+    _sync(graph, _write(tmp_path / "MyGameMode.cpp", GAME_MODE))
+    callees, _ = graph.callees("AMyGameMode::BeginPlay", depth=2)
+    assert {(s["callee"], s["depth"]) for s in callees} >= {
+        ("SpawnPlayer", 1),
+        ("SpawnActor", 2),
+    }
+
+
+def test_max_results_truncates(graph, tmp_path):
+    _sync(graph, _write(tmp_path / "MyGameMode.cpp", GAME_MODE))
+    callees, truncated = graph.callees("AMyGameMode::SpawnPlayer", max_results=1)
+    assert len(callees) == 1
+    assert truncated
+
+
+def test_resync_replaces_edges_and_releases_symbols(graph, tmp_path):
+    path = _write(tmp_path / "MyGameMode.cpp", GAME_MODE)
+    _sync(graph, path)
+
+    _write(tmp_path / "MyGameMode.cpp", "void AMyGameMode::Tick() { Refresh(); }\n")
+    _sync(graph, path)
+    assert graph.callers("SpawnPlayer")[0] == []
+    assert [s["caller"] for s in graph.callers("Refresh")[0]] == ["AMyGameMode::Tick"]
+    assert graph.stats()["symbols"] == 2
+    assert "spawnplayer" not in graph._by_member
+    assert "AMyGameMode::SpawnPlayer" not in graph._ids
+
+
+def test_removed_file_releases_everything(graph, tmp_path):
+    path = _write(tmp_path / "MyGameMode.cpp", GAME_MODE)
+    _sync(graph, path)
+    _sync(graph, path, present=False)
+
+    stats = graph.stats()
+    assert stats["files"] == 0
+    assert stats["symbols"] == 0
+    assert stats["edges"] == 0
+    assert graph._ids == {} and graph._by_name == {} and graph._by_member == {}
+
+
+def test_symbols_shared_by_files_survive_one_removal(graph, tmp_path):
+    first = _write(tmp_path / "A.cpp", "void FA::Run() { Shared(); }\n")
+    second = _write(tmp_path / "B.cpp", "void FB::Run() { Shared(); }\n")
+    _sync(graph, first)
+    _sync(graph, second)
+    _sync(graph, first, present=False)
+
+    assert [s["caller"] for s in graph.callers("Shared")[0]] == ["FB::Run"]
+    assert graph.stats()["symbols"] == 2
+
+
+def test_repeated_resyncs_do_not_grow_the_tables(graph, tmp_path):
+    path = tmp_path / "Churn.cpp"
+    for i in range(20):
+        _sync(graph, _write(path, f"void FChurn::Step{i}() {{ Helper{i}(); }}\n"))
+    assert graph.stats()["symbols"] == 2
+    # Released IDs are reused: at most the old and the new version are ever interned
+    assert len(graph._names) <= 4
+
+
+async def test_has_function_definition(cpp_source):
+    cpp_source(
+        {
+            "Thing.h": "class FThing { void Run(); };\n",
+            "Thing.cpp": "void FThing::Run()\n{\n    Helper();\n}\n",
+        }
+    )
+    analyzer = CppAnalyzer()
+    assert await analyzer.has_function_definition("FThing::Run")
+    assert await analyzer.has_function_definition("Run")
+    assert not await analyzer.has_function_definition("FOther::Run")
+    assert not await analyzer.has_function_definition("FThing")
+
+
+async def test_get_references_skips_the_call_graph_for_classes(cpp_source, monkeypatch):
+    cpp_source(
+        {
+            "Thing.h": "class FThing { void Run(); };\n",
+            "Thing.cpp": "void FThing::Run()\n{\n    Helper();\n}\n",
+        }
+    )
+    analyzer = CppAnalyzer()
+    monkeypatch.setattr(unified, "get_analyzer", lambda: analyzer)
+
+    await unified.get_references("FThing", domain="cpp", direction="both")
+    assert analyzer._call_graph.stats()["processed_files"] == 0
+
+    result = await unified.get_references(
+        "FThing::Run", domain="cpp", direction="outgoing"
+    )
+    assert analyzer._call_graph.stats()["processed_files"] > 0
+    assert "Helper" in str(result)
@@ -0,0 +1,66 @@
+"""find_class_hierarchy: recursion through coalesced calls, cycles and same-named bases."""
+
+from __future__ import annotations
+
+import asyncio
+
+from unreal_copilot.cpp_analyzer import CppAnalyzer
+
+# Generous bound: the regression was a task awaiting itself, i.e. a hang
+TIMEOUT_S = 10.0
+
+
+async def _hierarchy(class_name: str) -> dict:
+    analyzer = CppAnalyzer()
+    return await asyncio.wait_for(analyzer.find_class_hierarchy(class_name), TIMEOUT_S)
+
+
+async def test_base_with_the_same_unqualified_name(cpp_source):
+    cpp_source(
+        {
+            "Thing.h": (
+                "namespace Other { class FThing { }; }\n"
+                "class FThing : public Other::FThing\n"
+                "{\n"
+                "public:\n"
+                "    int X;\n"
+                "};\n"
+            )
+        }
+    )
+    result = await _hierarchy("FThing")
+    assert result["class"] == "FThing"
+    assert [s["class"] for s in result["superclasses"]] == ["FThing"]
+    assert result["timed_out"] is False
+
+
+async def test_cyclic_bases_stop_at_the_repeated_class(cpp_source):
+    cpp_source(
+        {
+            "Cycle.h": (
+                "class FA : public FB { int A; };\n"
+                "class FB : public FA { int B; };\n"
+            )
+        }
+    )
+    result = await _hierarchy("FA")
+    (base,) = result["superclasses"]
+    assert base["class"] == "FB"
+    assert [s["class"] for s in base["superclasses"]] == ["FA"]
+    assert base["superclasses"][0]["superclasses"] == []
+
+
+async def test_nested_hierarchy(cpp_source):
+    cpp_source(
+        {
+            "Chain.h": (
+                "class UBase { int A; };\n"
+                "class UMiddle : public UBase { int B; };\n"
+                "class ULeaf : public UMiddle, public IThing { int C; };\n"
+            )
+        }
+    )
+    result = await _hierarchy("ULeaf")
+    names = [s["class"] for s in result["superclasses"]]
+    assert names[0] == "UMiddle"
+    assert [s["class"] for s in result["superclasses"][0]["superclasses"]] == ["UBase"]
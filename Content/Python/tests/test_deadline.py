@@ -0,0 +1,107 @@
+"""Deadlines: budgets, nesting, cancellation and propagation into worker threads."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+
+import pytest
+
+from unreal_copilot.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    run_in_thread,
+    timed_out,
+)
+
+
+def test_deadline_without_budget_never_expires():
+    deadline = Deadline()
+    assert deadline.expires_at == math.inf
+    assert deadline.remaining() == math.inf
+    assert not deadline.expired()
+    deadline.check()
+
+
+def test_expired_deadline():
+    deadline = Deadline(0.0)
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+    with pytest.raises(DeadlineExceeded, match="deadline exceeded"):
+        deadline.check()
+
+
+def test_cancel_expires_the_deadline_and_its_children():
+    parent = Deadline(60.0)
+    child = Deadline(parent=parent)
+    parent.cancel()
+    assert child.expired()
+    assert child.remaining() == 0.0
+    with pytest.raises(DeadlineExceeded, match="cancelled"):
+        child.check()
+
+
+def test_child_never_outlives_its_parent():
+    parent = Deadline(1.0)
+    assert Deadline(60.0, parent=parent).expires_at == parent.expires_at
+    assert Deadline(0.5, parent=parent).expires_at < parent.expires_at
+
+
+def test_deadline_exceeded_is_a_timeout():
+    assert issubclass(DeadlineExceeded, TimeoutError)
+
+
+def test_deadline_scope_sets_and_restores_the_current_deadline():
+    assert current_deadline() is None
+    with deadline_scope(60.0) as outer:
+        assert current_deadline() is outer
+        with deadline_scope(120.0) as inner:
+            assert current_deadline() is inner
+            # Nested scopes never extend the enclosing deadline
+            assert inner.expires_at == outer.expires_at
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+@pytest.mark.parametrize("budget", [None, 0, -1])
+def test_deadline_scope_without_budget(budget):
+    with deadline_scope(budget) as deadline:
+        assert deadline.expires_at == math.inf
+        assert not timed_out()
+
+
+def test_timed_out():
+    assert not timed_out()
+    with deadline_scope(60.0) as deadline:
+        assert not timed_out()
+        deadline.cancel()
+        assert timed_out()
+
+
+async def test_run_in_thread_sees_the_deadline():
+    with deadline_scope(60.0) as deadline:
+        seen = await run_in_thread(current_deadline)
+    assert seen is not None and seen is not deadline
+    assert seen.parent is deadline
+
+
+async def test_cancelling_the_caller_stops_the_thread():
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def scan() -> None:
+        started.set()
+        deadline = current_deadline()
+        while not deadline.expired():
+            stopped.wait(0.001)
+        stopped.set()
+
+    task = asyncio.create_task(run_in_thread(scan))
+    await asyncio.to_thread(started.wait, 5.0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert await asyncio.to_thread(stopped.wait, 5.0)
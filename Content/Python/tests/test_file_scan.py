@@ -0,0 +1,87 @@
+"""File scan behind search_code: manifest order, early stop, deadlines, prefilter."""
+
+from __future__ import annotations
+
+import os
+
+from unreal_copilot.cpp_analyzer import CppAnalyzer
+from unreal_copilot.cpp_analyzer.file_scan import build_manifest, scan_files
+from unreal_copilot.deadline import Deadline
+
+
+def _tree(root, files: dict[str, str]) -> str:
+    for relative, text in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return str(root)
+
+
+def _names(manifest: list[str]) -> list[str]:
+    return [os.path.basename(p) for p in manifest]
+
+
+def test_manifest_orders_roots_then_paths(tmp_path):
+    first = _tree(tmp_path / "B", {"z.h": "", "Sub/a.cpp": "", "notes.txt": ""})
+    second = _tree(tmp_path / "A", {"b.h": ""})
+    manifest = build_manifest([first, second], (".h", ".cpp"))
+    assert _names(manifest) == ["a.cpp", "z.h", "b.h"]
+
+
+def test_manifest_lists_overlapping_roots_once(tmp_path):
+    root = _tree(tmp_path / "Root", {"Inner/x.h": ""})
+    assert len(build_manifest([root, os.path.join(root, "Inner")], (".h",))) == 1
+
+
+def test_manifest_accept_filter(tmp_path):
+    root = _tree(tmp_path / "Root", {"Keep/x.h": "", "Skip/y.h": ""})
+    manifest = build_manifest([root], (".h",), accept=lambda p: "Skip" not in p)
+    assert _names(manifest) == ["x.h"]
+
+
+def test_scan_stops_at_max_results():
+    scanned = []
+
+    def scan(path: str, limit: int) -> list[dict]:
+        scanned.append(path)
+        return [{"file": path, "line": n} for n in range(min(limit, 2))]
+
+    matches = scan_files(["a", "b", "c"], scan, max_results=3)
+    assert [(m["file"], m["line"]) for m in matches] == [("a", 0), ("a", 1), ("b", 0)]
+    assert scanned == ["a", "b"]
+
+
+def test_scan_stops_at_the_deadline():
+    deadline = Deadline(60.0)
+    scanned = []
+
+    def scan(path: str, limit: int) -> list[dict]:
+        scanned.append(path)
+        deadline.cancel()
+        return [{"file": path}]
+
+    assert scan_files(["a", "b"], scan, max_results=10, deadline=deadline) == [{"file": "a"}]
+    assert scanned == ["a"]
+
+
+async def test_search_code_regex_and_tokens(cpp_source):
+    cpp_source(
+        {
+            "A.cpp": "void A()\n{\n    NewObject<UThing>();\n}\n",
+            "B.cpp": "// NewObject in a comment\nvoid B() {}\n",
+            "C.h": "class UThing;\n",
+        }
+    )
+    analyzer = CppAnalyzer()
+    regex = await analyzer.search_code(r"NewObject<\w+>", query_mode="regex")
+    assert [(os.path.basename(m["file"]), m["line"]) for m in regex["matches"]] == [("A.cpp", 3)]
+
+    tokens = await analyzer.search_code("NewObject", query_mode="tokens", include_comments=True)
+    assert sorted(os.path.basename(m["file"]) for m in tokens["matches"]) == ["A.cpp", "B.cpp"]
+
+
+async def test_search_code_lookaround_skips_the_prefilter(cpp_source):
+    cpp_source({"A.cpp": "int Foo;\nint FooBar;\n"})
+    analyzer = CppAnalyzer()
+    result = await analyzer.search_code(r"Foo(?!Bar)", query_mode="regex")
+    assert [m["line"] for m in result["matches"]] == [1]
@@ -0,0 +1,99 @@
+"""UEPluginClient against an in-process fake plugin: batching, caching, async jobs."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from unreal_copilot.ue_client.cache import ResponseCache
+from unreal_copilot.ue_client.http_client import UEPluginClient
+
+GRAPH = {"ok": True, "nodes": [{"name": "Event BeginPlay"}]}
+ENVELOPE = {"ok": True, "mode": "async", "job_id": "job-1"}
+
+
+class FakePlugin:
+    """Answers /batch, plain GETs and the async job endpoints; /blueprint/graph is a job."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+
+    def body(self, path: str, params: dict) -> dict:
+        if path == "/blueprint/graph":
+            return ENVELOPE
+        if path == "/analysis/job/status":
+            return {"ok": True, "status": "done", "total_chars": len(json.dumps(GRAPH))}
+        if path == "/analysis/job/result":
+            text = json.dumps(GRAPH)
+            offset = int(params["offset"])
+            chunk = text[offset : offset + int(params["limit"])]
+            return {"ok": True, "chunk": chunk, "next_offset": offset + len(chunk)}
+        return {"ok": True, "path": path, **params}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        if request.url.path == "/batch":
+            items = json.loads(request.content)["requests"]
+            results = [{"status": 200, "body": self.body(i["path"], i["params"])} for i in items]
+            return httpx.Response(200, json={"ok": True, "results": results})
+        return httpx.Response(200, json=self.body(request.url.path, dict(request.url.params)))
+
+
+@pytest.fixture
+def plugin() -> FakePlugin:
+    return FakePlugin()
+
+
+@pytest.fixture
+async def client(plugin):
+    client = UEPluginClient("http://ue.test", cache=ResponseCache(max_size=16, ttl_s=60.0))
+    client._client = httpx.AsyncClient(
+        base_url="http://ue.test", transport=httpx.MockTransport(plugin)
+    )
+    yield client
+    await client.close()
+
+
+async def test_batch_answers_in_order_and_caches(client, plugin):
+    requests = [
+        ("/asset/references", {"asset_path": "/Game/A"}),
+        ("/asset/referencers", {"asset_path": "/Game/B"}),
+    ]
+    first = await client.batch(requests)
+    assert [r["asset_path"] for r in first] == ["/Game/A", "/Game/B"]
+    assert plugin.requests == ["/batch"]
+
+    assert await client.batch(requests) == first
+    assert plugin.requests == ["/batch"]
+
+
+async def test_batch_follows_job_envelopes_and_never_caches_them(client, plugin):
+    (graph,) = await client.batch([("/blueprint/graph", {"bp_path": "/Game/BP"})])
+    assert graph == GRAPH
+    assert "/analysis/job/result" in plugin.requests
+
+    # The cache holds the final result, so the next call needs no round-trip
+    sent = len(plugin.requests)
+    assert await client.get("/blueprint/graph", {"bp_path": "/Game/BP"}) == GRAPH
+    assert len(plugin.requests) == sent
+
+
+async def test_get_does_not_cache_job_envelopes(client, plugin):
+    assert await client.get("/blueprint/graph", {"bp_path": "/Game/BP"}) == ENVELOPE
+    assert await client.get("/blueprint/graph", {"bp_path": "/Game/BP"}) == ENVELOPE
+    assert plugin.requests == ["/blueprint/graph", "/blueprint/graph"]
+
+
+async def test_get_with_async_reassembles_the_result(client, plugin):
+    result = await client.get_with_async("/blueprint/graph", {"bp_path": "/Game/BP"})
+    assert result == GRAPH
+    assert client.get_stats()["cache"]["size"] == 1
+
+
+async def test_invalidate_cache_drops_the_asset(client, plugin):
+    await client.get("/asset/references", {"asset_path": "/Game/A"})
+    assert client.invalidate_cache("/Game/A") == 1
+    await client.get("/asset/references", {"asset_path": "/Game/A"})
+    assert plugin.requests == ["/asset/references", "/asset/references"]
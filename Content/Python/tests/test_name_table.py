@@ -0,0 +1,64 @@
+"""NameTable: substring and wildcard terms, scoring and top-k ranking."""
+
+from __future__ import annotations
+
+import pytest
+
+from unreal_copilot.ue_client.name_table import NameTable, compile_term
+
+NAMES = ["BP_PlayerCharacter", "BP_Enemy", "WBP_PlayerHUD", "M_Player", "BP_Player"]
+
+
+@pytest.fixture
+def table() -> NameTable:
+    return NameTable(NAMES)
+
+
+def test_substring_terms_are_case_insensitive(table):
+    assert table.rows_matching("player") == [0, 2, 3, 4]
+    assert table.rows_matching("PLAYERHUD") == [2]
+
+
+@pytest.mark.parametrize(
+    ("term", "rows"),
+    [
+        ("BP_*", [0, 1, 4]),
+        ("*Player", [3, 4]),
+        ("*_Player*", [0, 2, 3, 4]),
+        ("M_Play?r", [3]),
+        ("BP_?nemy", [1]),
+        ("Enemy", [1]),
+    ],
+)
+def test_wildcards_match_the_whole_name(table, term, rows):
+    assert table.rows_matching(term) == rows
+
+
+def test_match_all_and_empty_terms(table):
+    assert compile_term("*") is None
+    assert table.rows_matching("*") == list(range(len(NAMES)))
+    assert table.rows_matching("") == []
+    assert NameTable([]).rows_matching("x") == []
+
+
+def test_separators_in_names_cannot_leak_into_other_rows():
+    table = NameTable(["A\tB", "C\nD"])
+    assert len(table) == 2
+    assert table.rows_matching("a b") == [0]
+    assert table.rows_matching("C*D") == [1]
+
+
+def test_score_counts_distinct_terms(table):
+    assert table.score(["player", "bp_", "PLAYER"]) == {0: 2, 2: 2, 3: 1, 4: 2, 1: 1}
+
+
+def test_top_k_orders_by_score_then_length_then_row(table):
+    # Score 2: BP_Player (9), WBP_PlayerHUD (13), BP_PlayerCharacter (18); score 1:
+    # BP_Enemy and M_Player (8 each), lower row first
+    assert table.top_k(["player", "bp_"], 5) == [(4, 2), (2, 2), (0, 2), (1, 1), (3, 1)]
+
+
+def test_top_k_accept_filter_and_limits(table):
+    assert table.top_k(["player"], 2, accept=lambda row: row != 4) == [(3, 1), (2, 1)]
+    assert table.top_k(["player"], 0) == []
+    assert table.top_k(["nothing"], 5) == []
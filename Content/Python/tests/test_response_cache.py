@@ -0,0 +1,111 @@
+"""ResponseCache: TTL, LRU eviction, copies and asset-based invalidation."""
+
+from __future__ import annotations
+
+import pytest
+
+from unreal_copilot.ue_client import cache as cache_module
+from unreal_copilot.ue_client.cache import ResponseCache, normalize_asset_path
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def _key(path: str, asset: str):
+    return ResponseCache.make_key(path, {"asset_path": asset})
+
+
+def test_make_key_ignores_param_order_and_types():
+    assert ResponseCache.make_key("/p", {"a": 1, "b": "x"}) == ResponseCache.make_key(
+        "/p", {"b": "x", "a": "1"}
+    )
+    assert ResponseCache.make_key("/p", None) == ResponseCache.make_key("/p", {})
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = ResponseCache(ttl_s=30.0)
+    key = _key("/asset/metadata", "/Game/A")
+    cache.put(key, {"ok": True})
+    clock.now += 29.0
+    assert cache.get(key) == {"ok": True}
+    clock.now += 1.0
+    assert cache.get(key) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_size=2)
+    a, b, c = (_key("/asset/metadata", f"/Game/{n}") for n in "ABC")
+    cache.put(a, 1)
+    cache.put(b, 2)
+    cache.get(a)  # b is now the least recently used
+    cache.put(c, 3)
+    assert cache.get(b) is None
+    assert cache.get(a) == 1 and cache.get(c) == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_values_are_copied_in_and_out(clock):
+    cache = ResponseCache()
+    key = _key("/asset/metadata", "/Game/A")
+    value = {"tags": ["a"]}
+    cache.put(key, value)
+    value["tags"].append("stored")
+    cache.get(key)["tags"].append("returned")
+    assert cache.get(key) == {"tags": ["a"]}
+
+
+def test_invalidate_drops_the_asset_and_relationship_entries(clock):
+    cache = ResponseCache()
+    details = ResponseCache.make_key("/blueprint/details", {"bp_path": "/Game/BP.BP_C"})
+    other = _key("/asset/metadata", "/Game/Other")
+    references = _key("/asset/references", "/Game/Other")
+    for key in (details, other, references):
+        cache.put(key, {"ok": True})
+
+    assert cache.invalidate("/Game/BP.BP") == 2
+    assert cache.get(details) is None
+    assert cache.get(references) is None
+    assert cache.get(other) == {"ok": True}
+
+
+def test_clear(clock):
+    cache = ResponseCache()
+    cache.put(_key("/asset/metadata", "/Game/A"), 1)
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+def test_hit_rate(clock):
+    cache = ResponseCache()
+    key = _key("/asset/metadata", "/Game/A")
+    cache.get(key)
+    cache.put(key, 1)
+    cache.get(key)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/Game/A", "/Game/A"),
+        ("/Game/A.A", "/Game/A"),
+        ("/Game/BP.BP_C", "/Game/BP"),
+        (" /Game/Dir.With.Dots/A ", "/Game/Dir.With.Dots/A"),
+    ],
+)
+def test_normalize_asset_path(path, expected):
+    assert normalize_asset_path(path) == expected
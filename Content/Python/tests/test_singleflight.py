@@ -0,0 +1,178 @@
+"""SingleFlight: leader/follower sharing, cancellation, deadlines and re-issued calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from unreal_copilot.deadline import Deadline, DeadlineExceeded
+from unreal_copilot.singleflight import SingleFlight, coalesced, make_key
+
+
+class Work:
+    """Counts runs; each run waits for `release` and returns a fresh list."""
+
+    def __init__(self):
+        self.runs = 0
+        self.release = asyncio.Event()
+        self.cancelled = 0
+
+    async def __call__(self) -> list[int]:
+        self.runs += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return [self.runs]
+
+
+async def _settle() -> None:
+    """Let the tasks created so far reach their first await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_make_key_freezes_unhashable_arguments():
+    assert make_key("f", ([1, 2], {"a": {3}})) == make_key("f", ([1, 2], {"a": {3}}))
+    assert make_key("f", (1,)) != make_key("f", (2,))
+    assert make_key("f", (), {"b": 1, "a": 2}) == make_key("f", (), {"a": 2, "b": 1})
+
+
+async def test_concurrent_calls_share_one_run():
+    flight = SingleFlight()
+    work = Work()
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+    await _settle()
+    work.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert work.runs == 1
+    assert results == [[1], [1], [1]]
+    # Followers get copies: mutating one result never shows up in another
+    results[1].append(99)
+    assert results[0] == [1] and results[2] == [1]
+    stats = flight.stats()
+    assert stats["executions"] == 1 and stats["coalesced"] == 2 and stats["in_flight"] == 0
+
+
+async def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    work = Work()
+    work.release.set()
+    assert await flight.do("k", work) == [1]
+    assert await flight.do("k", work) == [2]
+
+
+async def test_exceptions_reach_every_caller():
+    flight = SingleFlight()
+    gate = asyncio.Event()
+
+    async def fail():
+        await gate.wait()
+        raise ValueError("boom")
+
+    tasks = [asyncio.create_task(flight.do("k", fail)) for _ in range(2)]
+    await _settle()
+    gate.set()
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        assert isinstance(result, ValueError)
+
+
+async def test_cancelled_caller_leaves_shared_work_running():
+    flight = SingleFlight()
+    work = Work()
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await _settle()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert work.cancelled == 0
+    work.release.set()
+    assert await second == [1]
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_work_is_cancelled_when_every_caller_left():
+    flight = SingleFlight()
+    work = Work()
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+    await _settle()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert work.cancelled == 1
+    assert flight.stats()["abandoned"] == 1
+
+
+async def test_follower_stops_at_its_own_deadline():
+    flight = SingleFlight()
+    work = Work()
+    leader = asyncio.create_task(flight.do("k", work, Deadline(None)))
+    await _settle()
+    with pytest.raises(DeadlineExceeded):
+        await flight.do("k", work, Deadline(0.01))
+
+    work.release.set()
+    assert await leader == [1]
+
+
+async def test_follower_with_a_later_deadline_reissues_a_cut_short_run():
+    flight = SingleFlight()
+    runs = 0
+
+    async def partial() -> dict:
+        nonlocal runs
+        runs += 1
+        if runs == 1:
+            # The leader's budget runs out mid-way: a partial result
+            await asyncio.sleep(0.05)
+            return {"run": runs, "timed_out": True}
+        return {"run": runs, "timed_out": False}
+
+    leader = asyncio.create_task(flight.do("k", partial, Deadline(0.02)))
+    await _settle()
+    follower = await flight.do("k", partial, Deadline(10.0))
+
+    assert (await leader)["run"] == 1
+    assert follower == {"run": 2, "timed_out": False}
+    assert flight.stats()["reissued"] == 1
+
+
+async def test_recursive_call_with_the_same_key_does_not_wait_on_itself():
+    flight = SingleFlight()
+    depth = 0
+
+    async def recurse() -> int:
+        nonlocal depth
+        depth += 1
+        if depth < 3:
+            return await flight.do("k", recurse)
+        return depth
+
+    assert await asyncio.wait_for(flight.do("k", recurse), 5.0) == 3
+
+
+async def test_coalesced_decorator():
+    class Service:
+        def __init__(self):
+            self._flight = SingleFlight()
+            self.calls = 0
+
+        @coalesced
+        async def lookup(self, name: str) -> str:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return name.upper()
+
+    service = Service()
+    results = await asyncio.gather(
+        service.lookup("a"), service.lookup("a"), service.lookup("b")
+    )
+    assert results == ["A", "A", "B"]
+    assert service.calls == 2
@@ -0,0 +1,71 @@
+"""Skill runs drop every cached UE plugin response, whatever their args name."""
+
+from __future__ import annotations
+
+import pytest
+
+from unreal_copilot.tools import skills
+from unreal_copilot.ue_client.cache import ResponseCache
+from unreal_copilot.ue_client.http_client import UEPluginClient
+
+CACHED = [
+    ("/asset/metadata", {"asset_path": "/Game/Characters/Hero/BP_Hero"}),
+    ("/blueprint/details", {"bp_path": "/Game/Weapons/BP_Rifle"}),
+]
+
+
+@pytest.fixture
+def client(monkeypatch) -> UEPluginClient:
+    client = UEPluginClient("http://ue.test", cache=ResponseCache())
+    for path, params in CACHED:
+        client._cache_store(path, params, {"ok": True})
+    monkeypatch.setattr(skills, "get_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    calls = []
+
+    def run(**kwargs):
+        calls.append(kwargs)
+        return {"ok": True}
+
+    monkeypatch.setattr(skills._runner, "run_script", run)
+    monkeypatch.setattr(skills._runner, "run_inline_python", run)
+    return calls
+
+
+def _cached(client: UEPluginClient) -> list[bool]:
+    return [client._cache_lookup(path, params) is not None for path, params in CACHED]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"folder": "/Game/Characters"},
+        {"asset_path": "/Game/Other/BP_Thing"},
+        '{"pattern": "BP_*"}',
+        None,
+    ],
+)
+def test_script_run_clears_the_cache(client, runner, args):
+    assert _cached(client) == [True, True]
+    result = skills.run_unreal_skill(skill_name="assets", script="edit.py", args=args)
+    assert result == {"ok": True}
+    assert _cached(client) == [False, False]
+
+
+def test_inline_python_clears_the_cache(client, runner):
+    skills.run_unreal_skill(python="print('hi')")
+    assert _cached(client) == [False, False]
+
+
+def test_failed_run_still_clears_the_cache(client, monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("script failed half-way")
+
+    monkeypatch.setattr(skills._runner, "run_script", fail)
+    result = skills.run_unreal_skill(skill_name="assets", script="edit.py")
+    assert result == {"ok": False, "error": "script failed half-way"}
+    assert _cached(client) == [False, False]
@@ -0,0 +1,143 @@
+"""AssetSnapshot: export decoding, save/load round trip, corrupt files and local answers."""
+
+from __future__ import annotations
+
+import pytest
+
+from unreal_copilot.ue_client.snapshot import (
+    SNAPSHOT_VERSION,
+    AssetSnapshot,
+    get_snapshot,
+    matches_scope,
+)
+
+STRINGS = [
+    "/Game/Maps/Level",
+    "Level",
+    "World",
+    "/Game/BP_Hero",
+    "BP_Hero",
+    "Blueprint",
+    "/Engine/Basic/Cube",
+    "Cube",
+    "StaticMesh",
+]
+# Level -> BP_Hero -> Cube, Level -> Cube
+EXPORT = {
+    "ok": True,
+    "version": SNAPSHOT_VERSION,
+    "strings": STRINGS,
+    "nodes": [0, 3, 6],
+    "assets": {"node": [0, 1, 2], "name": [1, 4, 7], "type": [2, 5, 8]},
+    "edges": {"offsets": [0, 2, 3, 3], "targets": [1, 2, 2]},
+}
+
+
+@pytest.fixture
+def snapshot() -> AssetSnapshot:
+    return AssetSnapshot.from_export(EXPORT)
+
+
+@pytest.fixture
+def saved(snapshot, tmp_path):
+    path = tmp_path / "assets.snapshot"
+    snapshot.save(path)
+    return path
+
+
+def test_references_and_referencers(snapshot):
+    assert snapshot.references("/Game/Maps/Level") == ["/Game/BP_Hero", "/Engine/Basic/Cube"]
+    assert snapshot.referencers("/Engine/Basic/Cube.Cube") == ["/Game/Maps/Level", "/Game/BP_Hero"]
+    assert snapshot.references("/Game/Missing") is None
+
+
+def test_round_trip(snapshot, saved):
+    loaded = AssetSnapshot.load(saved)
+    assert loaded.strings == snapshot.strings
+    for column in ("nodes", "asset_node", "asset_name", "asset_type", "edge_offsets"):
+        assert getattr(loaded, column) == getattr(snapshot, column)
+    assert loaded.edge_targets == snapshot.edge_targets
+    assert loaded.referencers("/Game/BP_Hero") == ["/Game/Maps/Level"]
+    assert loaded.source == str(saved)
+
+
+def test_save_leaves_no_temporary_file(saved):
+    assert [p.name for p in saved.parent.iterdir()] == [saved.name]
+
+
+def test_unsupported_export_version():
+    with pytest.raises(ValueError, match="version"):
+        AssetSnapshot.from_export({**EXPORT, "version": SNAPSHOT_VERSION + 1})
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        pytest.param(lambda data: b"NOTSNAP!" + data[8:], id="magic"),
+        pytest.param(lambda data: data[:10], id="header"),
+        pytest.param(lambda data: data[:-4], id="truncated"),
+        pytest.param(lambda data: data + b"\0", id="trailing"),
+        # Last edge target points past the node table
+        pytest.param(lambda data: data[:-4] + (99).to_bytes(4, "little"), id="edge-target"),
+    ],
+)
+def test_corrupt_files_are_rejected(saved, corrupt):
+    saved.write_bytes(corrupt(saved.read_bytes()))
+    with pytest.raises(ValueError):
+        AssetSnapshot.load(saved)
+
+
+def test_get_snapshot_follows_the_configured_file(config, saved):
+    assert get_snapshot() is None
+    config.ue_asset_snapshot = str(saved)
+    assert get_snapshot().asset_count == 3
+
+
+def test_get_snapshot_ignores_a_corrupt_file(config, saved, capsys):
+    saved.write_bytes(saved.read_bytes()[:-4])
+    config.ue_asset_snapshot = str(saved)
+    assert get_snapshot() is None
+    assert "Failed to load asset snapshot" in capsys.readouterr().out
+
+
+def test_search_by_pattern_type_and_scope(snapshot):
+    assert [a["name"] for a in snapshot.search("*")] == ["Level", "BP_Hero", "Cube"]
+    assert [a["name"] for a in snapshot.search("hero")] == ["BP_Hero"]
+    assert [a["name"] for a in snapshot.search("*", "StaticMesh")] == ["Cube"]
+    assert [a["name"] for a in snapshot.search("*", scope="project")] == ["Level", "BP_Hero"]
+
+
+def test_answer_mirrors_the_plugin_endpoints(snapshot):
+    refs = snapshot.answer("/asset/references", {"asset_path": "/Game/BP_Hero.BP_Hero"})
+    assert refs["references"] == ["/Engine/Basic/Cube"] and refs["source"] == "snapshot"
+
+    deps = snapshot.answer("/blueprint/dependencies", {"bp_path": "/Game/BP_Hero"})
+    assert deps["blueprint"] == "/Game/BP_Hero" and deps["dependencies"] == refs["references"]
+
+    meta = snapshot.answer("/asset/metadata", {"asset_path": "/Game/Maps/Level"})
+    assert (meta["name"], meta["type"]) == ("Level", "World")
+
+    found = snapshot.answer("/blueprint/search", {"pattern": "*"})
+    assert [m["name"] for m in found["matches"]] == ["BP_Hero"]
+
+
+def test_answer_falls_back_to_the_editor(snapshot):
+    assert snapshot.answer("/asset/references", {"asset_path": "/Game/Unknown"}) is None
+    assert snapshot.answer("/blueprint/search", {"class": "Actor"}) is None
+    assert snapshot.answer("/blueprint/graph", {"bp_path": "/Game/BP_Hero"}) is None
+
+
+@pytest.mark.parametrize(
+    ("path", "scope", "expected"),
+    [
+        ("/Game/A", "project", True),
+        ("/Engine/A", "project", False),
+        ("/Engine/A", "engine", True),
+        ("/Script/Engine", "engine", True),
+        ("/MyPlugin/A", "plugin", True),
+        ("/Game/A", "plugin", False),
+        ("/Engine/A", "all", True),
+    ],
+)
+def test_matches_scope(path, scope, expected):
+    assert matches_scope(path, scope) is expected
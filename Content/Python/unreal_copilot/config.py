@@ -18,13 +18,31 @@ C++ Analysis:
 Unreal Plugin Communication:
 - UE_PLUGIN_HOST: Host for Unreal Plugin HTTP API (default: localhost)
 - UE_PLUGIN_PORT: Port for Unreal Plugin HTTP API (default: 8080)
+- UE_PLUGIN_CONNECT_TIMEOUT: Connect timeout in seconds (default: 5)
+- UE_PLUGIN_READ_TIMEOUT: Read timeout in seconds (default: 60)
+- UE_PLUGIN_MAX_CONNECTIONS: Maximum pooled connections (default: 16)
+- UE_PLUGIN_MAX_KEEPALIVE: Maximum idle keep-alive connections (default: 8)
+- UE_PLUGIN_KEEPALIVE_EXPIRY: Idle keep-alive expiry in seconds (default: 30)
+- UE_PLUGIN_HTTP2: Enable HTTP/2 (default: false, requires the `h2` package)
+- UE_PLUGIN_CACHE_ENABLED: Cache Blueprint/Asset GET responses (default: true)
+- UE_PLUGIN_CACHE_TTL: Seconds a cached response stays valid (default: 30)
+- UE_PLUGIN_CACHE_MAX_SIZE: Maximum cached responses (default: 256)
+- UE_PLUGIN_GRAPH_TTL: Seconds cached asset dependency edges stay valid (default: 300)
+- UE_ASSET_SNAPSHOT: Asset registry snapshot file; answers asset queries offline (optional)
 
 Cache Settings:
 - ANALYZER_CACHE_ENABLED: Enable caching (default: true)
 - ANALYZER_CACHE_MAX_SIZE: Maximum cache entries (default: 1000)
+- ANALYZER_INDEX_REFRESH_S: Seconds between reference index freshness checks (default: 10)
+- ANALYZER_INDEX_CACHE: Reference index cache file, restored on the first query and
+  rewritten in the background after the index changes (optional)
+- ENGINE_INDEX_PACK: Prebuilt engine index pack to import instead of indexing the engine
+  sources (optional, see cpp_analyzer/packs.py)
 
 Search Defaults:
 - DEFAULT_SEARCH_SCOPE: Default search scope (project/engine/plugin/all, default: project)
+- TOOL_TIMEOUT_S: Time budget of a tool call in seconds; scans stop and return partial
+  results flagged `timed_out` (default: 50, 0 disables)
 """
 
 import os
@@ -210,6 +228,41 @@ class Config:
     ue_plugin_host: str = field(default_factory=lambda: os.getenv("UE_PLUGIN_HOST", "localhost"))
     ue_plugin_port: int = field(default_factory=lambda: int(os.getenv("UE_PLUGIN_PORT", "8080")))
 
+    # Unreal Plugin HTTP connection pool
+    ue_plugin_connect_timeout: float = field(
+        default_factory=lambda: float(os.getenv("UE_PLUGIN_CONNECT_TIMEOUT", "5"))
+    )
+    ue_plugin_read_timeout: float = field(
+        default_factory=lambda: float(os.getenv("UE_PLUGIN_READ_TIMEOUT", "60"))
+    )
+    ue_plugin_max_connections: int = field(
+        default_factory=lambda: int(os.getenv("UE_PLUGIN_MAX_CONNECTIONS", "16"))
+    )
+    ue_plugin_max_keepalive: int = field(
+        default_factory=lambda: int(os.getenv("UE_PLUGIN_MAX_KEEPALIVE", "8"))
+    )
+    ue_plugin_keepalive_expiry: float = field(
+        default_factory=lambda: float(os.getenv("UE_PLUGIN_KEEPALIVE_EXPIRY", "30"))
+    )
+    ue_plugin_http2: bool = field(
+        default_factory=lambda: _parse_bool(os.getenv("UE_PLUGIN_HTTP2"), False)
+    )
+
+    # Unreal Plugin response cache
+    ue_plugin_cache_enabled: bool = field(
+        default_factory=lambda: _parse_bool(os.getenv("UE_PLUGIN_CACHE_ENABLED"), True)
+    )
+    ue_plugin_cache_ttl: float = field(
+        default_factory=lambda: float(os.getenv("UE_PLUGIN_CACHE_TTL", "30"))
+    )
+    ue_plugin_cache_max_size: int = field(
+        default_factory=lambda: int(os.getenv("UE_PLUGIN_CACHE_MAX_SIZE", "256"))
+    )
+    ue_plugin_graph_ttl: float = field(
+        default_factory=lambda: float(os.getenv("UE_PLUGIN_GRAPH_TTL", "300"))
+    )
+    ue_asset_snapshot: str = field(default_factory=lambda: os.getenv("UE_ASSET_SNAPSHOT", ""))
+
     # Source paths with scope metadata
     _source_configs: list[SourceConfig] = field(default_factory=list)
 
@@ -223,11 +276,20 @@ class Config:
     cache_max_size: int = field(
         default_factory=lambda: int(os.getenv("ANALYZER_CACHE_MAX_SIZE", "1000"))
     )
+    index_refresh_s: float = field(
+        default_factory=lambda: float(os.getenv("ANALYZER_INDEX_REFRESH_S", "10"))
+    )
+    index_cache: str = field(default_factory=lambda: os.getenv("ANALYZER_INDEX_CACHE", ""))
+    engine_index_pack: str = field(default_factory=lambda: os.getenv("ENGINE_INDEX_PACK", ""))
 
     # Default search scope
     default_scope: SearchScope = field(
         default_factory=lambda: _parse_scope(os.getenv("DEFAULT_SEARCH_SCOPE"))
     )
+    # Time budget of a tool call (0: none)
+    tool_timeout_s: float = field(
+        default_factory=lambda: float(os.getenv("TOOL_TIMEOUT_S", "50"))
+    )
 
     def __post_init__(self):
         """Initialize paths from environment after dataclass init."""
@@ -26,7 +26,9 @@ from .patterns import (
     REPLICATION_SPECIFIERS,
     UE_PATTERNS,
     detect_ue_pattern,
+    parse_specifier_map,
     parse_specifiers,
+    specifier_names,
 )
 from .queries import (
     QUERY_PATTERNS,
@@ -51,6 +53,8 @@ __all__ = [
     "REPLICATION_SPECIFIERS",
     "detect_ue_pattern",
     "parse_specifiers",
+    "parse_specifier_map",
+    "specifier_names",
     # Queries
     "QUERY_PATTERNS",
     "get_query_pattern",
@@ -10,6 +10,9 @@ Core capabilities:
 - Code search and reference finding
 - UE pattern detection (UPROPERTY, UFUNCTION, etc.)
 - Blueprint exposure analysis
+- UE module map (Build.cs/.uplugin); searches can be restricted to modules
+- Include graph (who includes a header, transitively) for impact analysis
+- Go to implementation: out-of-line `Class::Method` definitions linked to declarations
 
 Supports four-layer search scope:
 - project: Project Source + Project Plugins (default)
@@ -18,7 +21,12 @@ Supports four-layer search scope:
 - all: Everything
 """
 
+import asyncio
+import fnmatch
+import os
 import re
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -28,12 +36,141 @@ from tree_sitter import Language, Parser, QueryCursor
 from tree_sitter import Query as TSQuery
 
 from ..config import SearchScope, get_config
-from .patterns import detect_ue_pattern, is_ue_macro_call
+from ..deadline import DeadlineExceeded, current_deadline, run_in_thread, timed_out
+from ..singleflight import SingleFlight, coalesced
+from .callgraph import CallGraph
+from .definitions import DefinitionIndex, parameter_signature
+from .exposure import ExposureIndex
+from .file_scan import build_manifest, scan_files
+from .includes import IncludeGraph
+from .index import CppReferenceIndex, query_terms
+from .modules import ModuleMap
+from .packs import VerifyMode, engine_root, export_pack, import_pack
+from .patterns import MACRO_ARGS, detect_ue_pattern, parse_specifiers
+from .preprocess import blank_ue_macros
 from .queries import QUERY_PATTERNS
+from .serialization import gc_paused
+from .symbols import Symbol, SymbolIndex
 
 # Type alias for scope parameter (includes new "plugin" scope)
 ScopeType = SearchScope | Literal["project", "engine", "plugin", "all"] | None
 
+# Symbol indexes kept at once (one per roots/modules/scope selection, oldest dropped first)
+_SYMBOL_INDEX_SLOTS = 4
+
+# Identifiers the reference index can answer (whole \w+ words).
+_IDENTIFIER_RE = re.compile(r"\w+")
+# Member reflection macros with their (possibly nested) argument list. The pattern starts
+# with a literal so the scan can skip ahead; the word boundary is a lookbehind (both names
+# are 9 characters long).
+_UE_MEMBER_MACRO_RE = re.compile(rf"(U(?:PROPERTY|FUNCTION))(?<!\w.{{9}})\s*{MACRO_ARGS}")
+
+# Type nodes reported as property/parameter/return types
+_TYPE_NODES = frozenset(
+    {"type_identifier", "primitive_type", "qualified_identifier", "template_type"}
+)
+# Declarators wrapping another declarator -> (suffix added to the type, operand index)
+_WRAPPING_DECLARATORS = {
+    "pointer_declarator": ("*", -1),
+    "reference_declarator": ("&", -1),
+    "parenthesized_declarator": ("", 1),
+    "attributed_declarator": ("", 0),
+}
+
+
+def _unwrap_declarator(node: Any) -> tuple[Any, str]:
+    """Innermost declarator below pointer/reference wrappers, and the collected suffix."""
+    suffix = ""
+    while node is not None and node.type in _WRAPPING_DECLARATORS:
+        marker, operand = _WRAPPING_DECLARATORS[node.type]
+        suffix += marker
+        children = node.children
+        node = children[operand] if len(children) > abs(operand) else None
+    return node, suffix
+
+
+def _function_declarator(node: Any) -> Any:
+    """The function_declarator among a declaration's children (None for non-functions).
+
+    Only the declarator path is followed (`T* F()`, `T& F()`), not the whole subtree.
+    """
+    for child in node.children:
+        child_type = child.type
+        if child_type == "function_declarator":
+            return child
+        if child_type in _WRAPPING_DECLARATORS:
+            inner, _ = _unwrap_declarator(child)
+            if inner is not None and inner.type == "function_declarator":
+                return inner
+    return None
+
+
+def _keyword(node: Any) -> str:
+    """Keyword of a specifier node (`static` for storage_class_specifier, ...)."""
+    return node.children[0].type if node.child_count else ""
+
+
+# Nodes whose children can hold function definitions
+_SCOPE_NODES = frozenset({"namespace_definition", "declaration_list", "linkage_specification"})
+
+
+def _definition_at(node: Any, row: int) -> Any:
+    """function_definition spanning `row` (0-based), descending through namespaces."""
+    while True:
+        for child in node.children:
+            if child.start_point[0] <= row <= child.end_point[0]:
+                if child.type == "function_definition":
+                    return child
+                if child.type in _SCOPE_NODES:
+                    node = child
+                    break
+        else:
+            return None
+
+
+def _match_declaration(site: Any, declarations: list[dict]) -> dict | None:
+    """Declaration of a definition site: same parameter types, else the only declaration
+    with as many parameters (types the declaration parser could not read still link)."""
+    params = list(site.parameters)
+    exact = [d for d in declarations if d["parameter_types"] == params]
+    if len(exact) > 1:
+        exact = [d for d in exact if d["is_const"] == site.is_const] or exact
+    if exact:
+        return exact[0]
+    same_arity = [d for d in declarations if len(d["parameter_types"]) == len(params)]
+    return same_arity[0] if len(same_arity) == 1 else None
+
+
+class _SourceText:
+    """Node text sliced from one shared copy of a file's source.
+
+    `node.text` copies the bytes out of the tree and each caller then decodes them. Parse
+    trees hold the UE-blanked bytes, whose offsets equal the original's, so text is sliced
+    from the original content instead: directly from the str when it is ASCII (byte and
+    character offsets agree), otherwise from its UTF-8 encoding.
+    """
+
+    __slots__ = ("content", "_data", "ue_macros_by_line")
+
+    def __init__(self, content: str):
+        self.content = content
+        self._data = None if content.isascii() else content.encode("utf-8")
+        # UPROPERTY/UFUNCTION macros by line, built once per file on first use
+        self.ue_macros_by_line: dict[int, dict] | None = None
+
+    def __call__(self, node: Any) -> str:
+        if not self.content:
+            return node.text.decode(errors="ignore")
+        if self._data is None:
+            return self.content[node.start_byte : node.end_byte]
+        return self._data[node.start_byte : node.end_byte].decode("utf-8", errors="ignore")
+
+    def char_offset(self, byte_offset: int) -> int:
+        """Index into `content` of a byte offset."""
+        if self._data is None:
+            return byte_offset
+        return len(self._data[:byte_offset].decode("utf-8", errors="ignore"))
+
 
 # ============================================================================
 # Data Classes
@@ -169,6 +306,122 @@ class ClassHierarchy:
 # ============================================================================
 
 
+def _is_under_any_root(file_path: str, roots: list[str]) -> bool:
+    """Check whether a file lies under any of the given roots."""
+    try:
+        p = Path(file_path).resolve()
+    except Exception:
+        return False
+    for r in roots:
+        try:
+            root = Path(r).resolve()
+        except Exception:
+            continue
+        # `is_relative_to` is 3.9+, and we are on 3.12 in uv typically.
+        try:
+            if p.is_relative_to(root):
+                return True
+        except Exception:
+            # Fallback for platforms where is_relative_to might fail
+            if str(p).lower().startswith(str(root).lower().rstrip("\\/") + "\\"):
+                return True
+    return False
+
+
+def _root_filter(roots: list[str]) -> Callable[[str], bool]:
+    """Build a fast `_is_under_any_root` for absolute paths.
+
+    A string prefix check settles almost every path; only the rest (symlinks, case
+    differences) pay for Path.resolve().
+    """
+    prefixes = tuple(os.path.join(str(Path(r).resolve()), "") for r in roots)
+
+    def accept(file_path: str) -> bool:
+        return file_path.startswith(prefixes) or _is_under_any_root(file_path, roots)
+
+    return accept
+
+
+def _expand_file_pattern(file_pattern: str) -> list[str]:
+    """Expand a `*.{h,cpp}` style pattern into plain glob patterns."""
+    if "{" in file_pattern:
+        base, ext_part = file_pattern.split("{")
+        extensions = ext_part.rstrip("}").split(",")
+        return [f"{base}{ext}" for ext in extensions]
+    return [file_pattern]
+
+
+def _line_ranges(lines: Any, gap: int = 3) -> list[tuple[int, int]]:
+    """Merge ascending line numbers into (start, end) ranges; lines within `gap` join."""
+    ranges: list[tuple[int, int]] = []
+    start = end = None
+    for line in lines:
+        if start is None:
+            start = end = line
+        elif line <= end + gap:
+            end = line
+        else:
+            ranges.append((start, end))
+            start = end = line
+    if start is not None:
+        ranges.append((start, end))
+    return ranges
+
+
+def _read_lines(file_path: str, wanted: list[int], width: int = 100) -> list[str]:
+    """Read the given ascending 1-based lines (stripped, clipped to `width`).
+
+    Stops at the last wanted line instead of reading the whole file.
+    """
+    if not wanted:
+        return []
+    out: list[str] = []
+    remaining = iter(wanted)
+    target = next(remaining)
+    try:
+        # newline="\n" keeps numbering identical to content.split("\n").
+        with open(file_path, encoding="utf-8", errors="ignore", newline="\n") as f:
+            for lineno, text in enumerate(f, 1):
+                if lineno < target:
+                    continue
+                out.append(text.strip()[:width])
+                target = next(remaining, None)
+                if target is None:
+                    break
+    except OSError:
+        pass
+    return out
+
+
+def _group_hits(
+    hits: list[tuple[str, Any]], max_results: int, samples_per_file: int
+) -> tuple[list[dict], int]:
+    """Turn ranked (file, lines) hits into file groups within a match budget.
+
+    Returns:
+        (groups, number of matches covered by the groups)
+    """
+    groups: list[dict] = []
+    retained = 0
+    for file_path, lines in hits:
+        if groups and retained + len(lines) > max_results:
+            break
+        retained += len(lines)
+        samples = list(lines[:samples_per_file])
+        groups.append(
+            {
+                "file": file_path,
+                "match_count": len(lines),
+                "line_ranges": _line_ranges(lines),
+                "sample_lines": [
+                    {"line": line, "context": text}
+                    for line, text in zip(samples, _read_lines(file_path, samples))
+                ],
+            }
+        )
+    return groups, retained
+
+
 class CppAnalyzer:
     """
     C++ source code analyzer using tree-sitter.
@@ -200,6 +453,43 @@ class CppAnalyzer:
         self._max_cache_size = 1000
         self._cache_queue: list[str] = []
 
+        # Identical concurrent public calls share one execution
+        self._flight = SingleFlight()
+
+        # UE modules (Build.cs/.uplugin); the reference index is partitioned by module
+        self._module_map = ModuleMap(get_config().index_refresh_s)
+        self._module_map_generation = 0
+
+        # Identifier -> (file, lines) index used by find_references
+        self._reference_index = CppReferenceIndex(
+            get_config().index_refresh_s,
+            module_resolver=self._module_map.module_for,
+            cache_path=get_config().index_cache,
+        )
+        # Prebuilt engine index pack (ENGINE_INDEX_PACK), imported before the first refresh
+        self._engine_pack: dict | None = None
+        if get_config().engine_index_pack:
+            pack_path = get_config().engine_index_pack
+            self._reference_index.add_preload(
+                "engine index pack", lambda: self._read_engine_pack(pack_path)
+            )
+        # Type-name indexes for fuzzy lookup: (roots, modules, scope) -> (reference index
+        # generation, index); rebuilt when the reference index changes
+        self._symbol_indexes: dict[tuple, tuple[int, SymbolIndex]] = {}
+        self._symbol_lock = threading.Lock()
+        # UCLASS/UPROPERTY/UFUNCTION/... entries, updated with the reference index
+        self._exposure_index = ExposureIndex()
+        self._reference_index.add_listener(self._exposure_index.update)
+        # #include edges, resolved and condensed lazily after the reference index changes
+        self._include_graph = IncludeGraph(self._module_map)
+        self._reference_index.add_listener(self._include_graph.update)
+        # Out-of-line `Owner::Member(` definitions by (owner, member)
+        self._definition_index = DefinitionIndex()
+        self._reference_index.add_listener(self._definition_index.update)
+        # Caller -> callee edges; changed files are parsed on the next call-graph query
+        self._call_graph = CallGraph()
+        self._reference_index.add_listener(self._call_graph.update)
+
         # Path configuration (legacy, use config instead)
         self._unreal_path: str | None = None
         self._custom_path: str | None = None
@@ -227,6 +517,22 @@ class CppAnalyzer:
         cache[key] = value
         self._cache_queue.append(key)
 
+    def get_stats(self) -> dict:
+        """Return cache sizes and request coalescing counters."""
+        return {
+            "class_cache": len(self._class_cache),
+            "ast_cache": len(self._ast_cache),
+            "singleflight": self._flight.stats(),
+            "reference_index": self._reference_index.stats(),
+            "symbol_indexes": self._symbol_index_stats(),
+            "exposure_index": self._exposure_index.stats(),
+            "module_map": self._module_map.stats(),
+            "include_graph": self._include_graph.stats(),
+            "definition_index": self._definition_index.stats(),
+            "call_graph": self._call_graph.stats(),
+            "engine_pack": self._engine_pack,
+        }
+
     # ========================================================================
     # Initialization
     # ========================================================================
@@ -296,6 +602,66 @@ class CppAnalyzer:
 
         return paths
 
+    def _normalize_scope(self, scope: ScopeType) -> SearchScope:
+        """Resolve a scope argument (None = configured default)."""
+        if scope is None:
+            return get_config().default_scope
+        if isinstance(scope, SearchScope):
+            return scope
+        try:
+            return SearchScope(str(scope))
+        except Exception:
+            return SearchScope.PROJECT
+
+    def _scope_safety_roots(self, norm_scope: SearchScope) -> list[str] | None:
+        """Roots that results of a scope must lie under (None = no filtering).
+
+        Even if configuration is wrong (e.g. engine path accidentally included in
+        project paths), this ensures `scope='project'` never returns engine files
+        outside the configured project roots (and vice versa).
+        """
+        cfg = get_config()
+        if norm_scope == SearchScope.PROJECT:
+            return cfg.get_project_paths()
+        if norm_scope == SearchScope.ENGINE:
+            return cfg.get_engine_paths()
+        if norm_scope == SearchScope.PLUGIN:
+            return cfg.get_plugin_paths()
+        return None
+
+    def _module_roots(
+        self, search_paths: list[str], module: str | None
+    ) -> tuple[list[str], list[str] | None]:
+        """Existing roots to index for a query, and the module names it is restricted to.
+
+        Without `module` these are the search paths. With it (comma-separated names), the
+        roots are the directories of those modules under the search paths, so only their
+        files are walked; no matching module gives no roots.
+        """
+        roots = [p for p in search_paths if Path(p).exists()]
+        if not module:
+            return roots, None
+        names = [m.strip() for m in module.split(",") if m.strip()]
+        self._discover_modules(roots)
+        module_roots = [
+            info.directory for name in names for info in self._module_map.get(name, roots)
+        ]
+        return list(dict.fromkeys(module_roots)), names
+
+    def _discover_modules(self, roots: list[str]) -> None:
+        """Discover modules under `roots`; re-partition the index if the layout changed."""
+        self._module_map.discover(roots)
+        if self._module_map.generation != self._module_map_generation:
+            self._module_map_generation = self._module_map.generation
+            self._reference_index.reassign_modules()
+
+    def _in_modules(self, names: list[str] | None) -> Callable[[str], bool] | None:
+        """File filter for a module restriction (None = no restriction)."""
+        if names is None:
+            return None
+        wanted = {n.lower() for n in names}
+        return lambda path: self._module_map.module_for(path).lower() in wanted
+
     # ========================================================================
     # File Parsing
     # ========================================================================
@@ -310,7 +676,8 @@ class CppAnalyzer:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         content = path.read_text(encoding="utf-8", errors="ignore")
-        tree = self._parser.parse(bytes(content, "utf-8"))
+        # UE macros are blanked (same offsets) so tree-sitter sees plain C++
+        tree = self._parser.parse(blank_ue_macros(bytes(content, "utf-8")))
 
         self._manage_cache(self._ast_cache, file_path, tree)
 
@@ -337,6 +704,8 @@ class CppAnalyzer:
                 content = Path(file_path).read_text(encoding="utf-8", errors="ignore")
             except Exception:
                 content = ""
+        # Shared by every class of the file
+        source = _SourceText(content)
 
         for _, captured in matches:
             # captured: dict[str, list[Node]]
@@ -350,10 +719,12 @@ class CppAnalyzer:
             if not body_nodes:
                 continue
 
-            class_name = name_nodes[0].text.decode(errors="ignore")
+            class_name = source(name_nodes[0])
             class_node = class_nodes[0]
 
-            class_info = self._extract_class_info(class_node, file_path, class_name, content)
+            class_info = self._extract_class_info(
+                class_node, file_path, class_name, content, source
+            )
             if class_info:
                 self._class_cache[class_name] = class_info
 
@@ -362,9 +733,16 @@ class CppAnalyzer:
     # ========================================================================
 
     def _extract_class_info(
-        self, node: Any, file_path: str, class_name: str, content: str = ""
+        self,
+        node: Any,
+        file_path: str,
+        class_name: str,
+        content: str = "",
+        source: _SourceText | None = None,
     ) -> ClassInfo | None:
         """Extract detailed class information from AST node."""
+        if source is None:
+            source = _SourceText(content)
         class_info = ClassInfo(
             name=class_name,
             file=file_path,
@@ -372,13 +750,13 @@ class CppAnalyzer:
         )
 
         # Check for UCLASS macro
-        uclass_match = self._find_uclass_for_node(node, content)
+        uclass_match = self._find_uclass_for_node(node, source)
         if uclass_match:
             class_info.is_uclass = True
             class_info.uclass_specifiers = uclass_match.get("specifiers", [])
 
         # Extract base classes / interfaces (multiple inheritance)
-        base_types = self._extract_base_types(node)
+        base_types = self._extract_base_types(node, source)
         # Improved interface detection: check for 'I' prefix and common interface patterns
         class_info.superclasses = []
         class_info.interfaces = []
@@ -388,45 +766,42 @@ class CppAnalyzer:
             else:
                 class_info.superclasses.append(base)
 
-        # Find the class body (field_declaration_list)
-        body_node = None
-        for child in node.children:
-            if child.type == "field_declaration_list":
-                body_node = child
-                break
-
-        if body_node:
-            # Build a map of UPROPERTY/UFUNCTION declarations by line
-            ue_macros_by_line = self._build_ue_macro_map(content) if content else {}
+        body_node = node.child_by_field_name("body")
+        if body_node is not None:
+            # Map of UPROPERTY/UFUNCTION declarations by line (shared by the file's classes)
+            if source.ue_macros_by_line is None:
+                source.ue_macros_by_line = self._build_ue_macro_map(source.content)
+            ue_macros_by_line = source.ue_macros_by_line
 
             # Extract methods and properties
             current_visibility = "private"  # Default for classes
 
+            # UE macros are blanked before parsing, so every member is a real declaration
             for child in body_node.children:
-                # Check for access specifier
-                if child.type == "access_specifier":
-                    specifier_text = child.text.decode().strip().rstrip(":")
-                    if specifier_text in ("public", "protected", "private"):
-                        current_visibility = specifier_text
-
-                # Skip UE macro calls (UPROPERTY, UFUNCTION, etc.) - they're not methods
-                if child.type in ("function_definition", "declaration"):
-                    child_text = child.text.decode() if child.text else ""
-                    if not is_ue_macro_call(child_text):
-                        method_info = self._extract_method_info(child, current_visibility)
+                child_type = child.type
+                if child_type == "access_specifier":
+                    keyword = _keyword(child)
+                    if keyword in ("public", "protected", "private"):
+                        current_visibility = keyword
+                elif child_type in ("function_definition", "declaration"):
+                    method_info = self._extract_method_info(child, current_visibility, source)
+                    if method_info:
+                        class_info.methods.append(method_info)
+                elif child_type == "field_declaration":
+                    # In-class method declarations are field declarations too
+                    if _function_declarator(child) is not None:
+                        method_info = self._extract_method_info(child, current_visibility, source)
                         if method_info:
                             class_info.methods.append(method_info)
-
-                # Extract field declarations
-                elif child.type == "field_declaration":
-                    prop_info = self._extract_property_info(
-                        child, current_visibility, ue_macros_by_line
-                    )
-                    if prop_info:
-                        class_info.properties.append(prop_info)
+                    else:
+                        prop_info = self._extract_property_info(
+                            child, current_visibility, ue_macros_by_line, source
+                        )
+                        if prop_info:
+                            class_info.properties.append(prop_info)
 
         # Extract preceding comments
-        class_info.comments = self._extract_comments(node)
+        class_info.comments = self._extract_comments(node, source)
 
         return class_info
 
@@ -447,53 +822,47 @@ class CppAnalyzer:
             return True
         return False
 
-    def _find_uclass_for_node(self, class_node: Any, content: str) -> dict | None:
+    def _find_uclass_for_node(self, class_node: Any, source: _SourceText) -> dict | None:
         """Find UCLASS macro that precedes this class node."""
+        content = source.content
         if not content:
             return None
 
-        line_num = class_node.start_point[0]
-        lines = content.split("\n")
-
-        # Look backwards from class definition for UCLASS
-        for i in range(line_num - 1, max(0, line_num - 10), -1):
-            if i >= len(lines):
-                continue
-            line = lines[i]
+        # Look backwards from class definition for UCLASS (up to 9 lines above it),
+        # scanning the shared content instead of splitting the file into lines
+        class_start = source.char_offset(class_node.start_byte)
+        line_start = content.rfind("\n", 0, class_start) + 1
+        for _ in range(9):
+            if line_start == 0:
+                break
+            prev_start = content.rfind("\n", 0, line_start - 1) + 1
+            line = content[prev_start : line_start - 1]
             if "UCLASS" in line:
                 # Extract specifiers
-                match = re.search(r"UCLASS\s*\(([^)]*)\)", line)
+                match = re.search(rf"UCLASS\s*{MACRO_ARGS}", line)
                 if match:
-                    from .patterns import parse_specifiers
-
-                    specifiers = parse_specifiers(match.group(1))
-                    return {"specifiers": specifiers}
+                    return {"specifiers": parse_specifiers(match.group(1))}
                 return {"specifiers": []}
+            line_start = prev_start
 
         return None
 
     def _build_ue_macro_map(self, content: str) -> dict[int, dict]:
         """Build a map of UE macros (UPROPERTY, UFUNCTION) by line number."""
         macro_map = {}
-        lines = content.split("\n")
-
-        for i, line in enumerate(lines):
-            for macro in ["UPROPERTY", "UFUNCTION"]:
-                if macro in line:
-                    match = re.search(rf"{macro}\s*\(([^)]*)\)", line)
-                    if match:
-                        from .patterns import parse_specifiers
-
-                        specifiers = parse_specifiers(match.group(1))
-                        macro_map[i + 1] = {"macro": macro, "specifiers": specifiers}
-                        macro_map[i + 2] = {
-                            "macro": macro,
-                            "specifiers": specifiers,
-                        }  # Next line too
+        line = 1
+        last = 0
+
+        for match in _UE_MEMBER_MACRO_RE.finditer(content):
+            line += content.count("\n", last, match.start())
+            last = match.start()
+            info = {"macro": match.group(1), "specifiers": parse_specifiers(match.group(2))}
+            macro_map[line] = info
+            macro_map[line + 1] = info  # Next line too
 
         return macro_map
 
-    def _extract_base_types(self, class_node: Any) -> list[str]:
+    def _extract_base_types(self, class_node: Any, source: _SourceText) -> list[str]:
         """
         Extract base types from a class node.
 
@@ -513,7 +882,7 @@ class CppAnalyzer:
 
         for child in base_clause.children:
             if child.type in ("type_identifier", "qualified_identifier", "scoped_identifier"):
-                text = child.text.decode(errors="ignore").strip()
+                text = source(child).strip()
                 if not text:
                     continue
                 # Handle qualified names like "public INavAgentInterface"
@@ -523,128 +892,87 @@ class CppAnalyzer:
 
         return bases
 
-    def _iter_descendants(self, node: Any) -> list[Any]:
-        """
-        Iterate all descendants of a node (depth-first).
-
-        Note: py-tree-sitter Node does not expose a `.descendants` helper in 0.25.x,
-        so we implement our own traversal using `.children`.
-        """
-        stack = list(getattr(node, "children", []) or [])
-        while stack:
-            cur = stack.pop()
-            yield cur
-            children = getattr(cur, "children", None)
-            if children:
-                stack.extend(children)
-
-    def _extract_method_info(self, node: Any, visibility: str) -> MethodInfo | None:
+    def _extract_method_info(
+        self, node: Any, visibility: str, source: _SourceText | None = None
+    ) -> MethodInfo | None:
         """Extract method information from a function node."""
-        # Find the function declarator
-        declarator = None
-        for child in self._iter_descendants(node):
-            if child.type == "function_declarator":
-                declarator = child
-                break
+        text = source or _SourceText("")
+        declarator = _function_declarator(node)
+        if declarator is None:
+            return None
 
-        if not declarator:
+        # declarator children: name, parameter_list, then qualifiers (const, override, ...)
+        declarator_children = declarator.children
+        name_node = declarator_children[0]
+        if name_node.type not in ("identifier", "field_identifier", "destructor_name"):
             return None
 
         method_info = MethodInfo(
-            name="",
+            name=text(name_node),
             return_type="",
             visibility=visibility,
             line=node.start_point[0] + 1,
         )
 
-        # Extract method name
-        for child in declarator.children:
-            if child.type == "identifier":
-                method_info.name = child.text.decode()
-                break
-            elif child.type == "field_identifier":
-                method_info.name = child.text.decode()
-                break
-            elif child.type == "destructor_name":
-                method_info.name = child.text.decode()
-                break
-
-        if not method_info.name:
-            return None
-
-        # Filter out UE macro names that look like methods
-        if method_info.name in (
-            "UPROPERTY",
-            "UFUNCTION",
-            "UCLASS",
-            "USTRUCT",
-            "UENUM",
-            "GENERATED_BODY",
-            "GENERATED_UCLASS_BODY",
-            "GENERATED_USTRUCT_BODY",
-        ):
-            return None
-
-        # Extract modifiers from node text
-        node_text = node.text.decode()
-        if "virtual" in node_text:
-            method_info.is_virtual = True
-        if "override" in node_text:
-            method_info.is_override = True
-        if "static" in node_text:
-            method_info.is_static = True
-        if node_text.rstrip().endswith("const"):
-            method_info.is_const = True
-
-        # Try to extract return type
+        # Modifiers and return type from the declaration's children (keywords are node types)
         for child in node.children:
-            if child.type in ("type_identifier", "primitive_type", "qualified_identifier"):
-                method_info.return_type = child.text.decode()
-                break
-
-        # Extract parameters
-        for child in declarator.children:
-            if child.type == "parameter_list":
-                method_info.parameters = self._extract_parameters(child)
-                break
+            child_type = child.type
+            if child_type == "virtual":
+                method_info.is_virtual = True
+            elif child_type == "storage_class_specifier":
+                method_info.is_static = method_info.is_static or _keyword(child) == "static"
+            elif child_type in _TYPE_NODES and not method_info.return_type:
+                # Absent for constructors/destructors
+                method_info.return_type = text(child)
+
+        for child in declarator_children:
+            child_type = child.type
+            if child_type == "parameter_list":
+                method_info.parameters = self._extract_parameters(child, text)
+            elif child_type == "type_qualifier":
+                method_info.is_const = method_info.is_const or _keyword(child) == "const"
+            elif child_type == "virtual_specifier":
+                method_info.is_override = method_info.is_override or _keyword(child) == "override"
 
         return method_info
 
-    def _extract_parameters(self, param_list: Any) -> list[ParameterInfo]:
+    def _extract_parameters(self, param_list: Any, text: _SourceText) -> list[ParameterInfo]:
         """Extract parameter information from a parameter list."""
         params = []
 
         for child in param_list.children:
-            if child.type == "parameter_declaration":
-                param = self._extract_single_parameter(child)
+            if child.type in ("parameter_declaration", "optional_parameter_declaration"):
+                param = self._extract_single_parameter(child, text)
                 if param:
                     params.append(param)
 
         return params
 
-    def _extract_single_parameter(self, param_node: Any) -> ParameterInfo | None:
+    def _extract_single_parameter(
+        self, param_node: Any, text: _SourceText
+    ) -> ParameterInfo | None:
         """Extract a single parameter's information."""
         param_type = ""
         param_name = ""
         default_value = None
 
-        for child in param_node.children:
-            if child.type in ("type_identifier", "primitive_type", "qualified_identifier"):
-                param_type = child.text.decode()
-            elif child.type == "identifier":
-                param_name = child.text.decode()
-            elif child.type == "pointer_declarator":
-                for subchild in child.children:
-                    if subchild.type == "identifier":
-                        param_name = subchild.text.decode()
-                param_type += "*"
-            elif child.type == "reference_declarator":
-                for subchild in child.children:
-                    if subchild.type == "identifier":
-                        param_name = subchild.text.decode()
-                param_type += "&"
-            elif child.type == "optional_parameter_declaration":
-                default_value = child.text.decode().split("=")[-1].strip()
+        children = param_node.children
+        if param_node.type == "optional_parameter_declaration":
+            # type, declarator, "=", default value
+            default_value = text(children[-1])
+            children = children[:-2]
+
+        for child in children:
+            child_type = child.type
+            if child_type in _TYPE_NODES:
+                param_type = text(child)
+            elif child_type == "identifier":
+                param_name = text(child)
+            elif child_type in _WRAPPING_DECLARATORS:
+                inner, suffix = _unwrap_declarator(child)
+                param_type += suffix
+                if inner is not None and inner.type == "identifier":
+                    param_name = text(inner)
 
         if param_type or param_name:
             return ParameterInfo(
@@ -655,32 +983,31 @@ class CppAnalyzer:
         return None
 
     def _extract_property_info(
-        self, node: Any, visibility: str, ue_macros_by_line: dict[int, dict] | None = None
+        self,
+        node: Any,
+        visibility: str,
+        ue_macros_by_line: dict[int, dict] | None = None,
+        source: _SourceText | None = None,
     ) -> PropertyInfo | None:
         """Extract property information from a field declaration."""
+        text = source or _SourceText("")
         prop_type = ""
         prop_name = ""
         is_static = False
 
-        node_text = node.text.decode()
-        if "static" in node_text:
-            is_static = True
-
         for child in node.children:
-            if child.type in (
-                "type_identifier",
-                "primitive_type",
-                "qualified_identifier",
-                "template_type",
-            ):
-                prop_type = child.text.decode()
-            elif child.type in ("identifier", "field_identifier"):
-                prop_name = child.text.decode()
-            elif child.type == "pointer_declarator":
-                for subchild in child.children:
-                    if subchild.type in ("identifier", "field_identifier"):
-                        prop_name = subchild.text.decode()
-                prop_type += "*"
+            child_type = child.type
+            if child_type in _TYPE_NODES:
+                prop_type = text(child)
+            elif child_type in ("identifier", "field_identifier"):
+                prop_name = text(child)
+            elif child_type in _WRAPPING_DECLARATORS:
+                inner, suffix = _unwrap_declarator(child)
+                prop_type += suffix
+                if inner is not None and inner.type in ("identifier", "field_identifier"):
+                    prop_name = text(inner)
+            elif child_type == "storage_class_specifier":
+                is_static = is_static or _keyword(child) == "static"
 
         if prop_name:
             # Check for UPROPERTY
@@ -705,13 +1032,13 @@ class CppAnalyzer:
             )
         return None
 
-    def _extract_comments(self, node: Any) -> list[str]:
+    def _extract_comments(self, node: Any, source: _SourceText | None = None) -> list[str]:
         """Extract comments preceding a node."""
+        text = source or _SourceText("")
         comments = []
         prev = node.prev_sibling
         while prev and prev.type == "comment":
-            comment_text = prev.text.decode().strip()
-            comments.insert(0, comment_text)
+            comments.insert(0, text(prev).strip())
             prev = prev.prev_sibling
         return comments
 
@@ -719,6 +1046,7 @@ class CppAnalyzer:
     # Public API - Class Analysis
     # ========================================================================
 
+    @coalesced
     async def analyze_class(
         self, class_name: str, source_path: str = "", scope: ScopeType = None
     ) -> dict:
@@ -752,6 +1080,10 @@ class CppAnalyzer:
                 continue
             for pattern in ["**/*.h", "**/*.cpp"]:
                 for file_path in base.rglob(pattern.replace("**/", "")):
+                    # Yield between files so concurrent callers can join this scan.
+                    await asyncio.sleep(0)
+                    if timed_out():
+                        raise DeadlineExceeded(f"Class not found before the deadline: {class_name}")
                     try:
                         await self._parse_file(str(file_path))
                         if class_name in self._class_cache:
@@ -761,6 +1093,7 @@ class CppAnalyzer:
 
         raise ValueError(f"Class not found: {class_name}")
 
+    @coalesced
     async def find_class_hierarchy(
         self, class_name: str, include_interfaces: bool = True, scope: ScopeType = None
     ) -> dict:
@@ -775,10 +1108,29 @@ class CppAnalyzer:
         Returns:
             Nested hierarchy dictionary
         """
+        hierarchy = await self._find_class_hierarchy(
+            class_name, include_interfaces, scope, {class_name}
+        )
+        if hierarchy is None:
+            return {**ClassHierarchy(class_name=class_name).to_dict(), "timed_out": True}
+        return {**hierarchy.to_dict(), "timed_out": timed_out()}
+
+    async def _find_class_hierarchy(
+        self, class_name: str, include_interfaces: bool, scope: ScopeType, visited: set[str]
+    ) -> ClassHierarchy | None:
+        """Hierarchy of `class_name` (None when the deadline passed first).
+
+        Recurses here rather than through the coalesced public method: a base with the
+        class's own unqualified name (`class FThing : public Other::FThing`) would
+        otherwise join the call that is waiting for it. Classes already in `visited`
+        (cycles, same-named bases) are listed without expanding them again.
+        """
         try:
             class_info = await self.analyze_class(class_name, scope=scope)
         except ValueError:
-            return ClassHierarchy(class_name=class_name).to_dict()
+            return ClassHierarchy(class_name=class_name)
+        except DeadlineExceeded:
+            return None
 
         hierarchy = ClassHierarchy(
             class_name=class_name,
@@ -787,33 +1139,36 @@ class CppAnalyzer:
 
         # Recursively build superclass hierarchies
         for superclass in class_info.get("superclasses", []):
+            if superclass in visited:
+                hierarchy.superclasses.append(ClassHierarchy(class_name=superclass))
+                continue
             try:
-                super_hierarchy_dict = await self.find_class_hierarchy(
-                    superclass, include_interfaces, scope=scope
+                nested = await self._find_class_hierarchy(
+                    superclass, include_interfaces, scope, visited | {superclass}
                 )
-                super_hierarchy = ClassHierarchy(
-                    class_name=super_hierarchy_dict["class"],
-                    superclasses=[],
-                    interfaces=super_hierarchy_dict.get("interfaces", []),
-                )
-                # Handle nested superclasses
-                for s in super_hierarchy_dict.get("superclasses", []):
-                    if isinstance(s, dict):
-                        super_hierarchy.superclasses.append(
-                            ClassHierarchy(
-                                class_name=s.get("class", ""), interfaces=s.get("interfaces", [])
-                            )
-                        )
-                hierarchy.superclasses.append(super_hierarchy)
             except Exception:
+                nested = None
+            if nested is None:
                 hierarchy.superclasses.append(ClassHierarchy(class_name=superclass))
-
-        return hierarchy.to_dict()
+                continue
+            # Handle nested superclasses (one level of names)
+            hierarchy.superclasses.append(
+                ClassHierarchy(
+                    class_name=nested.class_name,
+                    superclasses=[
+                        ClassHierarchy(class_name=s.class_name, interfaces=s.interfaces)
+                        for s in nested.superclasses
+                    ],
+                    interfaces=nested.interfaces,
+                )
+            )
+        return hierarchy
 
     # ========================================================================
     # Public API - Code Search
     # ========================================================================
 
+    @coalesced
     async def search_code(
         self,
         query: str,
@@ -822,7 +1177,8 @@ class CppAnalyzer:
         scope: ScopeType = None,
         max_results: int = 500,
         *,
-        query_mode: Literal["regex", "tokens", "smart"] = "regex",
+        query_mode: Literal["regex", "tokens", "smart", "ranked"] = "regex",
+        module: str | None = None,
     ) -> dict:
         """
         Search through C++ source code.
@@ -833,6 +1189,10 @@ class CppAnalyzer:
             include_comments: Whether to include comment lines
             scope: Search scope (project/engine/all). Default: project only.
             max_results: Maximum number of results to return (default: 500)
+            query_mode: "regex", "tokens" (substring hits, scored by token count),
+                "smart" (picks regex or tokens) or "ranked" (BM25 over identifier terms
+                from the reference index, best lines first)
+            module: Only search these UE modules (comma-separated names)
 
         Returns:
             Dictionary with matches and count
@@ -849,19 +1209,30 @@ class CppAnalyzer:
             }
 
         # Normalize scope early (for safety filtering later).
-        cfg = get_config()
-        norm_scope: SearchScope
-        if scope is None:
-            norm_scope = cfg.default_scope
-        elif isinstance(scope, SearchScope):
-            norm_scope = scope
-        else:
-            try:
-                norm_scope = SearchScope(str(scope))
-            except Exception:
-                norm_scope = SearchScope.PROJECT
+        norm_scope = self._normalize_scope(scope)
+
+        if query_mode == "ranked":
+            results = await run_in_thread(
+                self._search_ranked,
+                query,
+                _expand_file_pattern(file_pattern),
+                include_comments,
+                search_paths,
+                norm_scope,
+                max_results,
+                module,
+            )
+            return {
+                "matches": results,
+                "count": len(results),
+                "scope": str(scope or "project"),
+                "searched_paths": search_paths,
+                "truncated": len(results) >= max_results,
+                "timed_out": timed_out(),
+                "query_mode": query_mode,
+                "query_mode_resolved": "ranked",
+            }
 
-        results = []
         lowered_query = query.strip()
 
         def _looks_like_regex(q: str) -> bool:
@@ -911,112 +1282,114 @@ class CppAnalyzer:
                 }
 
         # Parse file patterns
-        patterns = []
-        if "{" in file_pattern:
-            base, ext_part = file_pattern.split("{")
-            extensions = ext_part.rstrip("}").split(",")
-            patterns = [f"{base}{ext}" for ext in extensions]
+        patterns = _expand_file_pattern(file_pattern)
+
+        # A module restriction walks only the module directories
+        scan_paths = search_paths
+        in_modules = None
+        if module:
+            scan_paths, names = await run_in_thread(self._module_roots, search_paths, module)
+            in_modules = self._in_modules(names)
+
+        # Whole-file prefilter: most files cannot match, and one search over the content
+        # is far cheaper than one per line. Patterns that look at the text around a match
+        # (\A, \Z, lookarounds) could see the neighbouring lines, so they are only matched
+        # per line.
+        prefilter: Callable[[str], Any] | None = None
+        if regex is not None:
+            if not any(s in query for s in ("\\A", "\\Z", "(?=", "(?!", "(?<")):
+                prefilter = re.compile(query, re.IGNORECASE | re.MULTILINE).search
         else:
-            patterns = [file_pattern]
+            lowered_tokens = [t.lower() for t in tokens]
 
-        for base_path in search_paths:
-            base = Path(base_path)
-            if not base.exists():
-                continue
-            for pattern in patterns:
-                glob_pattern = pattern.replace("*", "")
-                for file_path in base.rglob(f"*{glob_pattern}"):
-                    if len(results) >= max_results:
-                        break
-                    try:
-                        content = file_path.read_text(encoding="utf-8", errors="ignore")
-                        lines = content.split("\n")
-
-                        for i, line in enumerate(lines):
-                            if len(results) >= max_results:
-                                break
-                            if not include_comments:
-                                stripped = line.strip()
-                                if stripped.startswith("//") or stripped.startswith("/*"):
-                                    continue
-
-                            if query_mode_resolved == "regex":
-                                assert regex is not None
-                                if not regex.search(line):
-                                    continue
-                                context = "\n".join(lines[max(0, i - 2) : i + 3])
-                                results.append(
-                                    {
-                                        "file": str(file_path),
-                                        "line": i + 1,
-                                        "column": 1,
-                                        "context": context,
-                                        "score": 1,
-                                    }
-                                )
-                            else:
-                                lower_line = line.lower()
-                                matched = [t for t in tokens if t.lower() in lower_line]
-                                if not matched:
-                                    continue
-                                # Column: best effort - first matched token.
-                                first = matched[0]
-                                col = lower_line.find(first.lower())
-                                context = "\n".join(lines[max(0, i - 2) : i + 3])
-                                results.append(
-                                    {
-                                        "file": str(file_path),
-                                        "line": i + 1,
-                                        "column": (col + 1) if col >= 0 else 1,
-                                        "context": context,
-                                        "matched_terms": matched,
-                                        "score": len(matched),
-                                    }
-                                )
-                    except Exception:
+            def any_token(content: str) -> bool:
+                lower = content.lower()
+                return any(t in lower for t in lowered_tokens)
+
+            prefilter = any_token
+
+        def scan(path: str, limit: int) -> list[dict]:
+            matches: list[dict] = []
+            try:
+                with open(path, encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except OSError:
+                return matches
+            if prefilter is not None and not prefilter(content):
+                return matches
+            lines = content.split("\n")
+            for i, line in enumerate(lines):
+                if len(matches) >= limit:
+                    break
+                if not include_comments:
+                    stripped = line.strip()
+                    if stripped.startswith("//") or stripped.startswith("/*"):
                         continue
 
-        # In token mode, prefer higher-score matches first.
-        if query_mode_resolved == "tokens":
-            results.sort(key=lambda m: int(m.get("score", 0)), reverse=True)
+                if regex is not None:
+                    if not regex.search(line):
+                        continue
+                    context = "\n".join(lines[max(0, i - 2) : i + 3])
+                    matches.append(
+                        {
+                            "file": path,
+                            "line": i + 1,
+                            "column": 1,
+                            "context": context,
+                            "score": 1,
+                        }
+                    )
+                else:
+                    lower_line = line.lower()
+                    matched = [t for t in tokens if t.lower() in lower_line]
+                    if not matched:
+                        continue
+                    # Column: best effort - first matched token.
+                    first = matched[0]
+                    col = lower_line.find(first.lower())
+                    context = "\n".join(lines[max(0, i - 2) : i + 3])
+                    matches.append(
+                        {
+                            "file": path,
+                            "line": i + 1,
+                            "column": (col + 1) if col >= 0 else 1,
+                            "context": context,
+                            "matched_terms": matched,
+                            "score": len(matched),
+                        }
+                    )
+            return matches
 
         # --------------------------------------------------------------------
-        # SAFETY: Enforce scope filtering on returned matches.
+        # SAFETY: Enforce scope filtering on the files searched.
         #
         # Even if configuration is wrong (e.g. engine path accidentally included in
         # project paths), this ensures `scope='project'` never returns engine files
         # outside the configured project roots (and vice versa).
         # --------------------------------------------------------------------
-        def _is_under_any_root(file_path: str, roots: list[str]) -> bool:
-            try:
-                p = Path(file_path).resolve()
-            except Exception:
-                return False
-            for r in roots:
-                try:
-                    root = Path(r).resolve()
-                except Exception:
-                    continue
-                # `is_relative_to` is 3.9+, and we are on 3.12 in uv typically.
-                try:
-                    if p.is_relative_to(root):
-                        return True
-                except Exception:
-                    # Fallback for platforms where is_relative_to might fail
-                    if str(p).lower().startswith(str(root).lower().rstrip("\\/") + "\\"):
-                        return True
-            return False
+        safety_roots = self._scope_safety_roots(norm_scope)
+        under_scope = _root_filter(safety_roots) if safety_roots is not None else None
+
+        def accept(path: str) -> bool:
+            if in_modules is not None and not in_modules(path):
+                return False  # nested module
+            return under_scope is None or under_scope(path)
+
+        # One walk for every pattern, then the files are scanned in manifest order
+        # until max_results.
+        suffixes = tuple(pattern.replace("*", "") for pattern in patterns)
+        results = await run_in_thread(
+            lambda: scan_files(
+                build_manifest(scan_paths, suffixes, accept),
+                scan,
+                max_results,
+                current_deadline(),
+            )
+        )
 
-        if norm_scope == SearchScope.PROJECT:
-            proj_roots = cfg.get_project_paths()
-            results = [m for m in results if _is_under_any_root(str(m.get("file", "")), proj_roots)]
-        elif norm_scope == SearchScope.ENGINE:
-            eng_roots = cfg.get_engine_paths()
-            results = [m for m in results if _is_under_any_root(str(m.get("file", "")), eng_roots)]
-        elif norm_scope == SearchScope.PLUGIN:
-            plugin_roots = cfg.get_plugin_paths()
-            results = [m for m in results if _is_under_any_root(str(m.get("file", "")), plugin_roots)]
-        # SearchScope.ALL: keep as-is.
+        # In token mode, prefer higher-score matches first.
+        if query_mode_resolved == "tokens":
+            results.sort(key=lambda m: int(m.get("score", 0)), reverse=True)
 
         return {
             "matches": results,
@@ -1024,33 +1397,792 @@ class CppAnalyzer:
             "scope": str(scope or "project"),
             "searched_paths": search_paths,
             "truncated": len(results) >= max_results,
+            "timed_out": timed_out(),
             "query_mode": query_mode,
             "query_mode_resolved": query_mode_resolved,
         }
 
+    @coalesced
     async def find_references(
         self,
         identifier: str,
         ref_type: Literal["class", "function", "variable"] | None = None,
         scope: ScopeType = None,
+        max_results: int = 500,
+        module: str | None = None,
     ) -> dict:
         """
         Find all references to an identifier.
 
+        Whole-word identifiers are answered from the reference index, so only files that
+        mention the identifier are read (for context lines).
+
         Args:
             identifier: Name of the class, function, or variable
             ref_type: Optional type filter
             scope: Search scope (project/engine/all). Default: project only.
+            max_results: Maximum number of matches to return (default: 500)
+            module: Only search these UE modules (comma-separated names)
 
         Returns:
-            Dictionary with references and count
+            Dictionary with references and count (`total_count` counts all matching lines)
+        """
+        if not _IDENTIFIER_RE.fullmatch(identifier):
+            return await self.search_code(
+                rf"\b{re.escape(identifier)}\b",
+                scope=scope,
+                max_results=max_results,
+                module=module,
+            )
+
+        search_paths = self._get_search_paths(scope)
+        if not search_paths:
+            return {
+                "matches": [],
+                "count": 0,
+                "total_count": 0,
+                "scope": str(scope or "project"),
+                "searched_paths": [],
+            }
+
+        hits = await run_in_thread(
+            self._lookup_identifier, identifier, search_paths, scope, module
+        )
+        total_count = sum(len(lines) for _, lines in hits)
+
+        matches: list[dict] = []
+        for file_path, lines in hits:
+            if len(matches) >= max_results:
+                break
+            try:
+                text = Path(file_path).read_text(encoding="utf-8", errors="ignore").split("\n")
+            except OSError:
+                continue
+            for line in lines[: max_results - len(matches)]:
+                i = line - 1
+                matches.append(
+                    {
+                        "file": file_path,
+                        "line": line,
+                        "column": 1,
+                        "context": "\n".join(text[max(0, i - 2) : i + 3]),
+                        "score": 1,
+                    }
+                )
+
+        return {
+            "matches": matches,
+            "count": len(matches),
+            "total_count": total_count,
+            "scope": str(scope or "project"),
+            "searched_paths": search_paths,
+            "truncated": total_count > len(matches),
+            "timed_out": timed_out(),
+        }
+
+    def _search_ranked(
+        self,
+        query: str,
+        patterns: list[str],
+        include_comments: bool,
+        search_paths: list[str],
+        norm_scope: SearchScope | None,
+        max_results: int,
+        module: str | None = None,
+    ) -> list[dict]:
+        """BM25-ranked line search over the reference index (runs in a worker thread)."""
+        terms = query_terms(query)
+        if not terms:
+            return []
+        roots, modules = self._module_roots(search_paths, module)
+        self._reference_index.refresh(roots)
+
+        safety_roots = self._scope_safety_roots(norm_scope)
+        under_scope = _root_filter(safety_roots) if safety_roots is not None else None
+        accepted: dict[str, bool] = {}
+
+        def accept_file(path: str) -> bool:
+            ok = accepted.get(path)
+            if ok is None:
+                name = os.path.basename(path)
+                ok = any(fnmatch.fnmatch(name, pat) for pat in patterns) and (
+                    under_scope is None or under_scope(path)
+                )
+                accepted[path] = ok
+            return ok
+
+        ranked = self._reference_index.rank(
+            terms,
+            roots,
+            max_results,
+            include_comments=include_comments,
+            accept_file=accept_file,
+            modules=modules,
+        )
+
+        # Context is built only for the returned lines, one read per file.
+        texts: dict[str, list[str]] = {}
+        results = []
+        for score, file_path, line, matched in ranked:
+            lines = texts.get(file_path)
+            if lines is None:
+                try:
+                    content = Path(file_path).read_text(encoding="utf-8", errors="ignore")
+                except OSError:
+                    content = ""
+                lines = texts[file_path] = content.split("\n")
+            i = line - 1
+            lower_line = lines[i].lower() if i < len(lines) else ""
+            col = min((c for c in (lower_line.find(t) for t in matched) if c >= 0), default=0)
+            results.append(
+                {
+                    "file": file_path,
+                    "line": line,
+                    "column": col + 1,
+                    "context": "\n".join(lines[max(0, i - 2) : i + 3]),
+                    "matched_terms": matched,
+                    "score": round(score, 3),
+                }
+            )
+        return results
+
+    def _lookup_identifier(
+        self,
+        identifier: str,
+        search_paths: list[str],
+        scope: ScopeType,
+        module: str | None = None,
+    ) -> list[tuple[str, Any]]:
+        """Refresh the reference index for the scope and return (file, lines) hits."""
+        roots, modules = self._module_roots(search_paths, module)
+        self._reference_index.refresh(roots)
+        hits = list(self._reference_index.lookup(identifier, roots, modules))
+        safety_roots = self._scope_safety_roots(self._normalize_scope(scope))
+        if safety_roots is not None:
+            under_scope = _root_filter(safety_roots)
+            hits = [h for h in hits if under_scope(h[0])]
+        return hits
+
+    @coalesced
+    async def aggregate_references(
+        self,
+        identifier: str,
+        scope: ScopeType = None,
+        max_results: int = 500,
+        samples_per_file: int = 3,
+        module: str | None = None,
+    ) -> dict:
         """
-        return await self.search_code(rf"\b{re.escape(identifier)}\b", scope=scope)
+        Find references to an identifier, grouped by file.
+
+        Files are ranked by match count. Line ranges come straight from the reference
+        index; sample lines are read only for the files that are returned, and only up
+        to the last sampled line.
+
+        Args:
+            identifier: Name of the class, function, or variable
+            scope: Search scope (project/engine/all). Default: project only.
+            max_results: Match budget; files are returned until their matches exceed it
+            samples_per_file: Sample lines per file (first occurrences)
+            module: Only search these UE modules (comma-separated names)
+
+        Returns:
+            Dictionary with `files` (file, match_count, line_ranges, sample_lines),
+            `total_count` and `file_count` over the whole scope
+        """
+        search_paths = self._get_search_paths(scope)
+        if not search_paths:
+            return {
+                "files": [],
+                "file_count": 0,
+                "total_count": 0,
+                "scope": str(scope or "project"),
+                "searched_paths": [],
+                "truncated": False,
+            }
+
+        if _IDENTIFIER_RE.fullmatch(identifier):
+            hits = await run_in_thread(
+                self._lookup_identifier, identifier, search_paths, scope, module
+            )
+        else:
+            result = await self.search_code(
+                rf"\b{re.escape(identifier)}\b",
+                scope=scope,
+                max_results=max_results,
+                module=module,
+            )
+            by_file: dict[str, list[int]] = {}
+            for m in result.get("matches", []):
+                by_file.setdefault(str(m.get("file", "")), []).append(int(m.get("line", 0)))
+            hits = [(path, sorted(lines)) for path, lines in by_file.items() if path]
+
+        hits.sort(key=lambda h: (-len(h[1]), h[0]))
+        total_count = sum(len(lines) for _, lines in hits)
+        files, retained = await run_in_thread(
+            _group_hits, hits, max_results, samples_per_file
+        )
+
+        return {
+            "files": files,
+            "file_count": len(hits),
+            "total_count": total_count,
+            "scope": str(scope or "project"),
+            "searched_paths": search_paths,
+            "truncated": total_count > retained,
+            "timed_out": timed_out(),
+        }
+
+    @coalesced
+    async def find_symbols(
+        self, name: str, scope: ScopeType = None, limit: int = 10, module: str | None = None
+    ) -> dict:
+        """
+        Fuzzy/prefix lookup of C++ type names (class/struct/union/enum definitions).
+
+        Handles partial, misspelled and prefix-less names: `LyraHealthComp` finds
+        `ULyraHealthComponent`.
+
+        Args:
+            name: Possibly partial or misspelled type name
+            scope: Search scope (project/engine/all). Default: project only.
+            limit: Maximum number of candidates
+            module: Only consider these UE modules (comma-separated names)
+
+        Returns:
+            Dictionary with ranked `candidates` (name, kind, file, line, distance, match)
+        """
+        search_paths = self._get_search_paths(scope)
+        candidates = await run_in_thread(
+            self._lookup_symbols, name, search_paths, self._normalize_scope(scope), limit, module
+        )
+        return {
+            "query": name,
+            "candidates": candidates,
+            "count": len(candidates),
+            "scope": str(scope or "project"),
+            "timed_out": timed_out(),
+        }
+
+    def _lookup_symbols(
+        self,
+        name: str,
+        search_paths: list[str],
+        norm_scope: SearchScope | None,
+        limit: int,
+        module: str | None = None,
+    ) -> list[dict]:
+        roots, modules = self._module_roots(search_paths, module)
+        self._reference_index.refresh(roots)
+        key = (tuple(roots), tuple(modules or ()), norm_scope)
+        generation = self._reference_index.generation
+        with self._symbol_lock:
+            cached = self._symbol_indexes.get(key)
+        if cached is not None and cached[0] == generation:
+            return cached[1].lookup(name, limit)
+
+        # Built outside the lock: lookups of other scopes keep using their own index
+        definitions = self._reference_index.definitions(
+            roots, kinds=("class", "struct", "union", "enum"), modules=modules
+        )
+        safety_roots = self._scope_safety_roots(norm_scope)
+        under_scope = _root_filter(safety_roots) if safety_roots is not None else None
+        index = SymbolIndex(
+            Symbol(name=sym_name, kind=kind, file=path, line=line)
+            for kind, sym_name, path, line in definitions
+            if under_scope is None or under_scope(path)
+        )
+        with self._symbol_lock:
+            self._symbol_indexes.pop(key, None)
+            if len(self._symbol_indexes) >= _SYMBOL_INDEX_SLOTS:
+                del self._symbol_indexes[next(iter(self._symbol_indexes))]
+            self._symbol_indexes[key] = (generation, index)
+        return index.lookup(name, limit)
+
+    def _symbol_index_stats(self) -> list[dict]:
+        with self._symbol_lock:
+            return [index.stats() for _, index in self._symbol_indexes.values()]
+
+    # ========================================================================
+    # Public API - Modules
+    # ========================================================================
+
+    @coalesced
+    async def get_modules(self, scope: ScopeType = None, module: str | None = None) -> dict:
+        """
+        List the UE modules (from *.Build.cs) and plugins (from *.uplugin) of a scope.
+
+        Args:
+            scope: Search scope (project/engine/all). Default: project only.
+            module: Only these modules (comma-separated names), with the modules they
+                depend on (transitively) in `dependencies`
+
+        Returns:
+            Dictionary with `modules` (name, directory, plugin, dependencies, include
+            paths), `plugins`, and `index_order` (module names, dependencies first)
+        """
+        search_paths = self._get_search_paths(scope)
+
+        def run() -> dict:
+            roots = [p for p in search_paths if Path(p).exists()]
+            self._discover_modules(roots)
+            infos = self._module_map.modules(roots)
+            result: dict[str, Any] = {}
+            if module:
+                names = [m.strip() for m in module.split(",") if m.strip()]
+                wanted = {n.lower() for n in names}
+                infos = [info for info in infos if info.name.lower() in wanted]
+                result["dependencies"] = self._module_map.dependencies(names)
+            in_scope = {info.name for info in infos}
+            result["modules"] = [info.to_dict() for info in infos]
+            result["plugins"] = [
+                plugin.to_dict()
+                for plugin in self._module_map.plugins(roots)
+                if any(m["name"] in in_scope for m in plugin.modules)
+            ]
+            result["index_order"] = [
+                name for name in self._module_map.dependency_order(roots) if name in in_scope
+            ]
+            return result
+
+        result = await run_in_thread(run)
+        result.update(
+            count=len(result["modules"]),
+            scope=str(scope or "project"),
+            searched_paths=search_paths,
+        )
+        return result
+
+    @coalesced
+    async def build_index(self, scope: ScopeType = None, module: str | None = None) -> dict:
+        """
+        Index a scope module by module, dependencies before the modules using them.
+
+        Queries index lazily; this warms the index up front in an order where the
+        modules most others depend on (Core, Engine, ...) are searchable first. With
+        ANALYZER_INDEX_CACHE set, the index is then saved there, so the next server
+        start restores it instead of re-tokenizing every file.
+
+        Args:
+            scope: Search scope (project/engine/all). Default: project only.
+            module: Only these modules (comma-separated names) and their dependencies
+
+        Returns:
+            Dictionary with the modules indexed in order, the files (re-)tokenized and
+            the files written to the index cache
+        """
+        search_paths = self._get_search_paths(scope)
+
+        def run() -> tuple[list[str], int, int]:
+            roots = [p for p in search_paths if Path(p).exists()]
+            self._discover_modules(roots)
+            order = self._module_map.dependency_order(roots)
+            if module:
+                names = [m.strip() for m in module.split(",") if m.strip()]
+                wanted = {n.lower() for n in names + self._module_map.dependencies(names)}
+                order = [name for name in order if name.lower() in wanted]
+            changed = 0
+            for name in order:
+                for info in self._module_map.get(name, roots):
+                    changed += self._reference_index.refresh([info.directory])
+            if not module:
+                # Files outside any module
+                changed += self._reference_index.refresh(roots, force=True)
+            cached = 0
+            cache_path = self._reference_index.cache_path
+            if cache_path and (changed or not os.path.exists(cache_path)):
+                cached = self._reference_index.save_cache()
+            return order, changed, cached
+
+        order, changed, cached = await run_in_thread(run)
+        return {
+            "modules": order,
+            "module_count": len(order),
+            "files_indexed": changed,
+            "files_cached": cached,
+            "timed_out": timed_out(),
+            "scope": str(scope or "project"),
+            "searched_paths": search_paths,
+        }
+
+    def _read_engine_pack(self, path: str, verify: VerifyMode = "hash") -> list:
+        """Records of an engine index pack that match the local engine sources."""
+        root = engine_root(get_config().get_engine_paths())
+        if root is None:
+            raise ValueError("No engine source path configured for the engine index pack")
+        records, summary = import_pack(path, root, verify=verify)
+        summary["path"] = str(path)
+        self._engine_pack = summary
+        return records
+
+    @coalesced
+    async def import_engine_pack(self, path: str, verify: VerifyMode = "hash") -> dict:
+        """
+        Import a prebuilt engine index pack (see `export_engine_pack`).
+
+        Engine files that match the pack are not tokenized again; files that differ
+        locally (or are missing from the pack) are indexed as usual.
+
+        Args:
+            path: Pack file
+            verify: "hash" (compare file contents, default) or "size" (sizes only)
+
+        Returns:
+            Dictionary with the pack manifest and the files imported / missing / changed
+        """
+
+        def run() -> dict:
+            with gc_paused():
+                records = self._read_engine_pack(path, verify)
+                restored = self._reference_index.restore(records)
+            return {**(self._engine_pack or {}), "restored": restored}
+
+        return await run_in_thread(run)
+
+    @coalesced
+    async def export_engine_pack(self, path: str) -> dict:
+        """
+        Index the engine sources and plugins and export them as a shareable index pack.
+
+        The pack is keyed by engine version and stores paths relative to the engine
+        root plus a content hash per file, so other workstations with the same engine
+        can import it (ENGINE_INDEX_PACK) instead of indexing the engine themselves.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Dictionary with the pack manifest (engine version, files, covered roots)
+        """
+        search_paths = self._get_search_paths("engine")
+        root = engine_root(search_paths)
+        if root is None:
+            raise ValueError("No engine source path configured")
+        await self.build_index(scope="engine")
+
+        def run() -> dict:
+            roots = [p for p in search_paths if Path(p).exists()]
+            info = export_pack(self._reference_index.records(roots), root, path)
+            return info.to_dict()
+
+        result = await run_in_thread(run)
+        result.update(path=str(path), engine_root=root, searched_paths=search_paths)
+        return result
+
+    # ========================================================================
+    # Public API - Include Graph
+    # ========================================================================
+
+    @coalesced
+    async def get_include_graph(
+        self,
+        file_path: str,
+        direction: Literal["incoming", "outgoing", "both"] = "both",
+        transitive: bool = True,
+        scope: ScopeType = None,
+        max_results: int = 200,
+    ) -> dict:
+        """
+        Include relationships of a C++ file, for impact analysis.
+
+        Answered from the project-wide include graph (built from the reference index),
+        so "which files transitively include X.h" does not re-read any file.
+
+        Args:
+            file_path: Absolute path, or an include-style path such as
+                "GameFramework/Actor.h" (matched against indexed files)
+            direction: "incoming" (files including it), "outgoing" (files it includes)
+                or "both"
+            transitive: Follow includes transitively (default) or only direct ones
+            scope: Search scope (project/engine/all). Default: project only.
+            max_results: Maximum files listed per direction (counts cover all)
+
+        Returns:
+            Dictionary with `includers` / `includes` (file lists with counts), `impact`
+            (direct/transitive includers, translation units, per module) and
+            `unresolved_includes`
+        """
+        search_paths = self._get_search_paths(scope)
+        norm_scope = self._normalize_scope(scope)
+
+        def run() -> dict:
+            roots = [p for p in search_paths if Path(p).exists()]
+            self._reference_index.refresh(roots)
+            graph = self._include_graph
+            found = graph.find(file_path)
+            if not found:
+                return {"file": file_path, "found": False, "error": "file_not_indexed"}
+            target = found[0]
+            safety_roots = self._scope_safety_roots(norm_scope)
+            under_scope = _root_filter(safety_roots) if safety_roots is not None else None
+            result: dict[str, Any] = {"file": target, "found": True}
+            if len(found) > 1:
+                result["candidates"] = found[1:]
+            if direction in ("incoming", "both"):
+                includers = graph.includers(
+                    target, transitive=transitive, accept_file=under_scope
+                )
+                result["includers"] = includers[:max_results]
+                result["includer_count"] = len(includers)
+                result["impact"] = graph.impact(target)
+            if direction in ("outgoing", "both"):
+                includes = graph.includes(target, transitive=transitive)
+                result["includes"] = includes[:max_results]
+                result["include_count"] = len(includes)
+                result["unresolved_includes"] = graph.unresolved(target)
+            result["truncated"] = (
+                result.get("includer_count", 0) > max_results
+                or result.get("include_count", 0) > max_results
+            )
+            return result
+
+        result = await run_in_thread(run)
+        result.update(
+            direction=direction,
+            transitive=transitive,
+            scope=str(scope or "project"),
+            searched_paths=search_paths,
+            timed_out=timed_out(),
+        )
+        return result
+
+    # ========================================================================
+    # Public API - Implementations
+    # ========================================================================
+
+    @coalesced
+    async def has_function_definition(self, name: str, scope: ScopeType = None) -> bool:
+        """
+        Whether `name` is a function with an out-of-line definition in the scope.
+
+        Answered from the definition index, so callers can skip the call graph (which
+        parses every file on first use) for names that are not functions.
+
+        Args:
+            name: `Class::Method` (outer namespaces are ignored) or a bare member name
+            scope: Search scope (project/engine/all). Default: project only.
+        """
+        parts = [p.strip() for p in name.split("::")]
+        member = parts[-1]
+        owner = parts[-2] if len(parts) > 1 else ""
+        if not member:
+            return False
+        search_paths = self._get_search_paths(scope)
+
+        def check() -> bool:
+            roots = [p for p in search_paths if Path(p).exists()]
+            self._reference_index.refresh(roots)
+            return self._definition_index.defines(member, owner, roots)
+
+        return await run_in_thread(check)
+
+    @coalesced
+    async def find_implementation(
+        self,
+        qualified_name: str,
+        scope: ScopeType = None,
+        include_snippet: bool = True,
+        max_snippet_lines: int = 40,
+    ) -> dict:
+        """
+        Go to implementation: out-of-line definitions of `Class::Method`.
+
+        Definitions come from the definition index (no text search). Each one is linked
+        to its declaration in the class by parameter signature (falling back to the only
+        declaration with the same number of parameters).
+
+        Args:
+            qualified_name: `Class::Method` (outer namespaces are ignored)
+            scope: Search scope (project/engine/all). Default: project only.
+            include_snippet: Include the definition's source (up to `max_snippet_lines`)
+            max_snippet_lines: Maximum snippet lines per definition
+
+        Returns:
+            Dictionary with `definitions` (file, line, end_line, signature, declaration,
+            snippet) and the class's `declarations` of the method
+        """
+        parts = [p.strip() for p in qualified_name.split("::")]
+        if len(parts) < 2 or not parts[-1] or not parts[-2]:
+            raise ValueError(f"Expected 'Class::Method', got: {qualified_name}")
+        owner, member = parts[-2], parts[-1]
+
+        search_paths = self._get_search_paths(scope)
+        norm_scope = self._normalize_scope(scope)
+
+        def lookup() -> tuple[list, list[str]]:
+            roots = [p for p in search_paths if Path(p).exists()]
+            self._reference_index.refresh(roots)
+            sites = self._definition_index.lookup(owner, member, roots)
+            safety_roots = self._scope_safety_roots(norm_scope)
+            if safety_roots is not None:
+                under_scope = _root_filter(safety_roots)
+                sites = [site for site in sites if under_scope(site.file)]
+            # Files defining the class, so analyze_class does not scan for it
+            class_files = [
+                path
+                for kind, name, path, _ in self._reference_index.definitions(
+                    roots, kinds=("class", "struct"), identifier=owner
+                )
+                if name == owner
+            ]
+            return sites, class_files
+
+        sites, class_files = await run_in_thread(lookup)
+
+        declarations: list[dict] = []
+        for class_file in class_files:
+            if owner in self._class_cache:
+                break
+            try:
+                await self._parse_file(class_file)
+            except Exception:
+                continue
+        try:
+            class_info = await self.analyze_class(owner, scope=scope)
+        except ValueError:
+            class_info = None
+        if class_info is not None:
+            for method in class_info.get("methods", []):
+                if method["name"].lower() == member.lower():
+                    params = method.get("parameters", [])
+                    declarations.append(
+                        {
+                            "file": class_info.get("file", ""),
+                            "line": method.get("line", 0),
+                            "parameter_types": list(
+                                parameter_signature([p.get("type", "") for p in params])
+                            ),
+                            "is_const": method.get("is_const", False),
+                        }
+                    )
+
+        definitions = await run_in_thread(
+            self._describe_definitions,
+            sites,
+            declarations,
+            max_snippet_lines if include_snippet else 0,
+        )
+        return {
+            "qualified_name": f"{owner}::{member}",
+            "class": owner,
+            "method": member,
+            "definitions": definitions,
+            "count": len(definitions),
+            "declarations": declarations,
+            "scope": str(scope or "project"),
+            "timed_out": timed_out(),
+        }
+
+    def _describe_definitions(
+        self, sites: list, declarations: list[dict], max_snippet_lines: int
+    ) -> list[dict]:
+        """Definition dicts with body range, linked declaration and snippet."""
+        results = []
+        trees: dict[str, tuple[Any, list[str]]] = {}
+        for site in sites:
+            parsed = trees.get(site.file)
+            if parsed is None:
+                try:
+                    content = Path(site.file).read_text(encoding="utf-8", errors="ignore")
+                except OSError:
+                    content = ""
+                tree = self._parser.parse(blank_ue_macros(content.encode("utf-8")))
+                parsed = trees[site.file] = (tree, content.split("\n"))
+            tree, lines = parsed
+            node = _definition_at(tree.root_node, site.line - 1)
+            body = node.child_by_field_name("body") if node is not None else None
+            if body is None or body.start_point[0] < site.line - 1:
+                # No definition starts here: a call inside another function's body, or a
+                # declaration the index took for a definition.
+                continue
+            entry = site.to_dict()
+            entry["declaration"] = _match_declaration(site, declarations)
+            end_line = node.end_point[0] + 1
+            entry["end_line"] = end_line
+            if max_snippet_lines > 0:
+                last = min(end_line, site.line + max_snippet_lines - 1)
+                entry["snippet"] = "\n".join(lines[site.line - 1 : last])
+                entry["snippet_truncated"] = last < end_line
+            results.append(entry)
+        return results
+
+    # ========================================================================
+    # Public API - Call Graph
+    # ========================================================================
+
+    @coalesced
+    async def get_call_graph(
+        self,
+        function: str,
+        direction: Literal["incoming", "outgoing", "both"] = "incoming",
+        depth: int = 1,
+        scope: ScopeType = None,
+        max_results: int = 200,
+    ) -> dict:
+        """
+        Callers and/or callees of a C++ function, up to `depth` hops.
+
+        Answered from the static call graph (call expressions inside function bodies,
+        parsed once per changed file), not by searching for the name.
+
+        Args:
+            function: `Class::Method` or a bare function/method name (`ApplyDamage`).
+                Unqualified calls (`Obj->ApplyDamage()`) match any class, see `qualified`
+                on each call site.
+            direction: "incoming" (callers), "outgoing" (callees) or "both"
+            depth: Hops to follow (1 = direct callers/callees)
+            scope: Search scope (project/engine/all). Default: project only.
+            max_results: Maximum call sites per direction
+
+        Returns:
+            Dictionary with `callers` / `callees` (call sites: caller, callee, file, line,
+            depth, qualified), their counts and `truncated`
+        """
+        search_paths = self._get_search_paths(scope)
+        norm_scope = self._normalize_scope(scope)
+        depth = max(1, int(depth))
+
+        def run() -> dict:
+            roots = [p for p in search_paths if Path(p).exists()]
+            self._reference_index.refresh(roots)
+            self._call_graph.sync()
+            under_roots = _root_filter(roots)
+            safety_roots = self._scope_safety_roots(norm_scope)
+            under_scope = _root_filter(safety_roots) if safety_roots is not None else None
+
+            def accept(path: str) -> bool:
+                return under_roots(path) and (under_scope is None or under_scope(path))
+
+            result: dict[str, Any] = {"function": function, "truncated": False}
+            walks = []
+            if direction in ("incoming", "both"):
+                walks.append(("callers", "caller_count", self._call_graph.callers))
+            if direction in ("outgoing", "both"):
+                walks.append(("callees", "callee_count", self._call_graph.callees))
+            for key, count_key, walk in walks:
+                sites, truncated = walk(
+                    function, depth=depth, max_results=max_results, accept_file=accept
+                )
+                result[key] = sites
+                result[count_key] = len(sites)
+                result["truncated"] = result["truncated"] or truncated
+            return result
+
+        result = await run_in_thread(run)
+        result.update(
+            direction=direction,
+            depth=depth,
+            scope=str(scope or "project"),
+            searched_paths=search_paths,
+            timed_out=timed_out(),
+        )
+        return result
 
     # ========================================================================
     # Public API - Pattern Detection
     # ========================================================================
 
+    @coalesced
     async def detect_patterns(self, file_path: str) -> dict:
         """
         Detect Unreal Engine patterns in a file.
@@ -1070,6 +2202,7 @@ class CppAnalyzer:
 
         return {"patterns": patterns, "file": file_path}
 
+    @coalesced
     async def analyze_file(
         self,
         file_path: str,
@@ -1194,6 +2327,7 @@ class CppAnalyzer:
             "ue_patterns": ue_patterns,
         }
 
+    @coalesced
     async def get_blueprint_exposure(self, file_path: str) -> dict:
         """
         Get all Blueprint-exposed API from a file.
@@ -1245,6 +2379,67 @@ class CppAnalyzer:
 
         return exposure
 
+    @coalesced
+    async def query_exposure(
+        self,
+        specifier: str | None = None,
+        module: str | None = None,
+        class_name: str | None = None,
+        replicated: bool | None = None,
+        pattern_type: str | None = None,
+        blueprint_exposed: bool | None = None,
+        scope: ScopeType = None,
+        limit: int = 500,
+    ) -> dict:
+        """
+        Query reflected declarations (UCLASS/UPROPERTY/UFUNCTION/...) across the codebase.
+
+        Backed by a project-wide index that is built on first use and updated per changed
+        file, so queries do not re-parse headers.
+
+        Args:
+            specifier: Specifier name (e.g. "BlueprintCallable") or name=value
+                (e.g. "Category=Health")
+            module: Module name(s), comma-separated (from *.Build.cs)
+            class_name: Owning class/struct name
+            replicated: Only replicated (True) or non-replicated (False) declarations
+            pattern_type: UCLASS/USTRUCT/UENUM/UINTERFACE/UPROPERTY/UFUNCTION
+            blueprint_exposed: Only Blueprint-exposed (True) or hidden (False) declarations
+            scope: Search scope (project/engine/all). Default: project only.
+            limit: Maximum number of entries returned
+
+        Returns:
+            Dictionary with matching `entries`, `count` and `total_count`
+        """
+        search_paths = self._get_search_paths(scope)
+        norm_scope = self._normalize_scope(scope)
+
+        def run() -> tuple[list, int]:
+            roots, _ = self._module_roots(search_paths, module)
+            self._reference_index.refresh(roots)
+            safety_roots = self._scope_safety_roots(norm_scope)
+            return self._exposure_index.query(
+                specifier=specifier,
+                module=module,
+                class_name=class_name,
+                replicated=replicated,
+                pattern_type=pattern_type,
+                blueprint_exposed=blueprint_exposed,
+                roots=roots,
+                accept_file=_root_filter(safety_roots) if safety_roots is not None else None,
+                limit=limit,
+            )
+
+        entries, total_count = await run_in_thread(run)
+        return {
+            "entries": [e.to_dict() for e in entries],
+            "count": len(entries),
+            "total_count": total_count,
+            "scope": str(scope or "project"),
+            "searched_paths": search_paths,
+            "timed_out": timed_out(),
+        }
+
 
 # ============================================================================
 # Global Instance
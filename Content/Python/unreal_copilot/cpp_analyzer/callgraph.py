@@ -0,0 +1,438 @@
+"""
+Static call graph of C++ functions.
+
+The graph subscribes to `CppReferenceIndex` like the other derived indexes, but it needs
+the AST: changed files are only queued by the listener and parsed with tree-sitter on
+the next query (`sync`), so building the reference index stays as cheap as before and
+a file is parsed again only after it changes. Files without anything that looks like a
+function body (`) {`) are not parsed at all.
+
+Every `call_expression` inside a function definition is an edge from the enclosing
+function to the callee as written:
+- callers are definitions, named `Owner::Member` (out-of-line definitions, or inline
+  members named after their class) or `Name` for free functions
+- callees keep their qualification when the call has one (`UGameplayStatics::ApplyDamage`)
+  (`Super::BeginPlay` too) and are bare member names otherwise (`Other->Method1(...)`),
+  since the receiver's type is not resolved
+- all-caps callees are macros (`UE_LOG`, `TEXT`, `UE_CLOG`) and are skipped
+
+Symbol names are interned to integer IDs, counted by the edges that use them: when a
+re-synced or removed file leaves a symbol unused, its name is dropped and its ID reused,
+so the tables follow the current sources in a long-running server. Each file keeps its
+edges packed in one `array("i")` of (caller, callee, line) triples; after a sync the
+edges of all files are concatenated and indexed both ways (CSR: per-symbol offsets into
+an edge-order array), and callers/callees up to N hops are a breadth-first walk over
+those arrays.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
+from pathlib import Path
+
+import tree_sitter_cpp as tscpp
+from tree_sitter import Language, Parser, QueryCursor
+from tree_sitter import Query as TSQuery
+
+from ..deadline import current_deadline
+from .index import FileRecord
+from .preprocess import blank_ue_macros
+from .queries import QUERY_PATTERNS
+
+# Something that can open a function body: `) {`, `) const {`, `) override {`, ...
+_BODY = re.compile(rb"\)\s*(?:(?:const|override|final|noexcept)\s*)*\{")
+_MACRO_NAME = re.compile(r"[A-Z][A-Z0-9_]*\Z")
+_CLASS_NODES = frozenset({"class_specifier", "struct_specifier", "union_specifier"})
+
+
+def _strip_template_args(text: str) -> str:
+    """`A<B>::C<D>` -> `A::C`, with whitespace removed."""
+    out = []
+    depth = 0
+    for char in text:
+        if char == "<":
+            depth += 1
+        elif char == ">":
+            depth = max(0, depth - 1)
+        elif depth == 0 and not char.isspace():
+            out.append(char)
+    return "".join(out)
+
+
+def _qualified(text: str) -> str:
+    """Last two components of a qualified name (`UE::Net::FFoo::Bar` -> `FFoo::Bar`)."""
+    parts = [p for p in _strip_template_args(text).split("::") if p]
+    return "::".join(parts[-2:])
+
+
+def _member(name: str) -> str:
+    return name.rpartition("::")[2]
+
+
+def _callee_name(node) -> str | None:
+    """Callee of a call_expression's `function` node, as written (None if unnamed)."""
+    kind = node.type
+    if kind == "field_expression":
+        node = node.child_by_field_name("field")
+        if node is not None and node.type == "template_method":
+            node = node.child_by_field_name("name")
+        if node is None or node.type != "field_identifier":
+            return None
+        name = node.text.decode("utf-8", "ignore")
+    elif kind == "template_function":
+        node = node.child_by_field_name("name")
+        name = node.text.decode("utf-8", "ignore") if node is not None else ""
+    elif kind in ("identifier", "qualified_identifier"):
+        name = _qualified(node.text.decode("utf-8", "ignore"))
+    else:
+        return None
+    if not name or _MACRO_NAME.match(_member(name)):
+        return None
+    return name
+
+
+def _function_name(name_node) -> str:
+    """Name of a definition: `Owner::Member`, or `Member` of the enclosing class, or free."""
+    name = _qualified(name_node.text.decode("utf-8", "ignore"))
+    if "::" in name:
+        return name
+    parent = name_node.parent
+    while parent is not None:
+        if parent.type in _CLASS_NODES:
+            owner = parent.child_by_field_name("name")
+            if owner is not None:
+                return f"{_qualified(owner.text.decode('utf-8', 'ignore'))}::{name}"
+            break
+        parent = parent.parent
+    return name
+
+
+class CallGraph:
+    """Caller -> callee edges between C++ functions, kept in step with a reference index."""
+
+    def __init__(self):
+        """Initialize an empty graph (feed it with `update` or `CppReferenceIndex`)."""
+        language = Language(tscpp.language())
+        self._parser = Parser(language)
+        self._function_query = TSQuery(language, QUERY_PATTERNS["FUNCTION"])
+        self._call_query = TSQuery(language, QUERY_PATTERNS["CALL"])
+        self._lock = threading.RLock()
+        # Files waiting to be parsed (path -> still indexed)
+        self._pending: dict[str, bool] = {}
+        # path -> packed (caller, callee, line) triples
+        self._file_edges: dict[str, array] = {}
+        self._processed_files = 0
+        # Interned symbols; lower-cased name / member -> ids
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._by_name: dict[str, list[int]] = {}
+        self._by_member: dict[str, list[int]] = {}
+        # Edges using each symbol; unused symbols are released after a sync
+        self._refs: list[int] = []
+        self._unused: set[int] = set()
+        self._free: list[int] = []
+        # Built state: edge columns, and CSR offsets/edge numbers by caller and by callee
+        self._stale = True
+        self._paths: list[str] = []
+        self._edge_caller = array("i")
+        self._edge_callee = array("i")
+        self._edge_line = array("i")
+        self._edge_file = array("i")
+        self._out_offsets = array("i")
+        self._out_edges = array("i")
+        self._in_offsets = array("i")
+        self._in_edges = array("i")
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def update(self, path: str, record: FileRecord | None) -> None:
+        """Queue `path` for (re)parsing or removal (listener for `CppReferenceIndex`)."""
+        with self._lock:
+            self._pending[path] = record is not None
+
+    def sync(self) -> int:
+        """Parse the queued files and rebuild the packed edge index; returns files processed.
+
+        Files not reached before the request's deadline stay queued for the next sync.
+        """
+        deadline = current_deadline()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            processed = 0
+            items = iter(pending.items())
+            for path, present in items:
+                if present and deadline is not None and deadline.expired():
+                    self._pending[path] = present
+                    self._pending.update(items)
+                    break
+                edges = self._extract(path) if present else None
+                if edges:
+                    self._count(edges, 1)
+                    old = self._file_edges.get(path)
+                    self._file_edges[path] = edges
+                else:
+                    old = self._file_edges.pop(path, None)
+                if old is not None:
+                    self._count(old, -1)
+                processed += present
+            self._release_unused()
+            self._processed_files += processed
+            if pending:
+                self._stale = True
+            if self._stale:
+                self._build()
+            return processed
+
+    def _intern(self, name: str) -> int:
+        symbol = self._ids.get(name)
+        if symbol is None:
+            if self._free:
+                symbol = self._free.pop()
+                self._names[symbol] = name
+            else:
+                symbol = len(self._names)
+                self._names.append(name)
+                self._refs.append(0)
+            self._ids[name] = symbol
+            self._by_name.setdefault(name.lower(), []).append(symbol)
+            self._by_member.setdefault(_member(name).lower(), []).append(symbol)
+            # Unused until an edge refers to it (a function without calls never does)
+            self._unused.add(symbol)
+        return symbol
+
+    def _count(self, edges: array, delta: int) -> None:
+        """Add `delta` to the use counts of the callers and callees of packed `edges`."""
+        refs = self._refs
+        for i in range(0, len(edges), 3):
+            for symbol in (edges[i], edges[i + 1]):
+                refs[symbol] += delta
+                if not refs[symbol]:
+                    self._unused.add(symbol)
+
+    def _release_unused(self) -> None:
+        """Drop the names of symbols no edge uses any more; their IDs are reused."""
+        for symbol in self._unused:
+            if self._refs[symbol]:
+                continue
+            name = self._names[symbol]
+            del self._ids[name]
+            for table, key in (
+                (self._by_name, name.lower()),
+                (self._by_member, _member(name).lower()),
+            ):
+                ids = table[key]
+                ids.remove(symbol)
+                if not ids:
+                    del table[key]
+            self._names[symbol] = ""
+            self._free.append(symbol)
+        self._unused.clear()
+
+    def _extract(self, path: str) -> array | None:
+        try:
+            content = Path(path).read_bytes()
+        except OSError:
+            return None
+        if not _BODY.search(content):
+            return None
+        root = self._parser.parse(blank_ue_macros(content)).root_node
+
+        functions: list[tuple[int, int, int]] = []  # (start byte, end byte, symbol)
+        for _, captured in QueryCursor(self._function_query).matches(root):
+            name_nodes = captured.get("func_name") or []
+            func_nodes = captured.get("function") or []
+            if name_nodes and func_nodes:
+                node = func_nodes[0]
+                symbol = self._intern(_function_name(name_nodes[0]))
+                functions.append((node.start_byte, node.end_byte, symbol))
+        if not functions:
+            return None
+        functions.sort()
+        starts = [f[0] for f in functions]
+
+        edges = array("i")
+        for _, captured in QueryCursor(self._call_query).matches(root):
+            callee_nodes = captured.get("callee") or []
+            if not callee_nodes:
+                continue
+            callee = _callee_name(callee_nodes[0])
+            if callee is None:
+                continue
+            offset = callee_nodes[0].start_byte
+            # Innermost enclosing definition (definitions only nest via local classes)
+            i = bisect_right(starts, offset) - 1
+            while i >= 0 and functions[i][1] <= offset:
+                i -= 1
+            if i < 0:
+                continue
+            line = callee_nodes[0].start_point[0] + 1
+            edges.extend((functions[i][2], self._intern(callee), line))
+        return edges or None
+
+    def _build(self) -> None:
+        self._paths = sorted(self._file_edges)
+        caller, callee, line, file = array("i"), array("i"), array("i"), array("i")
+        for file_id, path in enumerate(self._paths):
+            packed = self._file_edges[path]
+            caller.extend(packed[0::3])
+            callee.extend(packed[1::3])
+            line.extend(packed[2::3])
+            file.extend([file_id] * (len(packed) // 3))
+        self._edge_caller, self._edge_callee = caller, callee
+        self._edge_line, self._edge_file = line, file
+        self._out_offsets, self._out_edges = self._csr(caller)
+        self._in_offsets, self._in_edges = self._csr(callee)
+        self._stale = False
+
+    def _csr(self, keys: array) -> tuple[array, array]:
+        """Counting sort of edge numbers by `keys`: edges of symbol s are
+        `edges[offsets[s]:offsets[s + 1]]`."""
+        offsets = array("i", bytes(4 * (len(self._names) + 1)))
+        for key in keys:
+            offsets[key + 1] += 1
+        for s in range(len(self._names)):
+            offsets[s + 1] += offsets[s]
+        cursor = offsets[:-1]
+        edges = array("i", bytes(4 * len(keys)))
+        for edge, key in enumerate(keys):
+            edges[cursor[key]] = edge
+            cursor[key] += 1
+        return offsets, edges
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _out(self, symbol: int) -> array:
+        if symbol + 1 >= len(self._out_offsets):
+            return array("i")
+        return self._out_edges[self._out_offsets[symbol] : self._out_offsets[symbol + 1]]
+
+    def _in(self, symbol: int) -> array:
+        if symbol + 1 >= len(self._in_offsets):
+            return array("i")
+        return self._in_edges[self._in_offsets[symbol] : self._in_offsets[symbol + 1]]
+
+    def _defined(self, symbols: list[int]) -> list[int]:
+        """The symbols among `symbols` that are functions with calls in their body."""
+        return [s for s in symbols if len(self._out(s))]
+
+    def _callee_targets(self, name: str) -> list[int]:
+        """Callee symbols a call to `name` may have been recorded as."""
+        if "::" in name:
+            qualified = self._by_name.get(_qualified(name).lower(), [])
+            bare = self._by_name.get(_member(name).lower(), [])
+            return qualified + bare
+        return list(self._by_member.get(name.lower(), []))
+
+    def _definitions_of(self, name: str) -> list[int]:
+        """Defined functions `name` may refer to (bare names match every owner)."""
+        if "::" in name:
+            return self._defined(self._by_name.get(_qualified(name).lower(), []))
+        return self._defined(self._by_member.get(name.lower(), []))
+
+    def _site(self, edge: int, hops: int) -> dict:
+        callee = self._names[self._edge_callee[edge]]
+        return {
+            "caller": self._names[self._edge_caller[edge]],
+            "callee": callee,
+            "file": self._paths[self._edge_file[edge]],
+            "line": self._edge_line[edge],
+            "depth": hops,
+            # Unqualified calls (`Obj->Foo()`) match every class with a member `Foo`
+            "qualified": "::" in callee,
+        }
+
+    def _walk(
+        self,
+        start: list[int],
+        depth: int,
+        max_results: int,
+        accept_file: Callable[[str], bool] | None,
+        incoming: bool,
+    ) -> tuple[list[dict], bool]:
+        accepted = None
+        if accept_file is not None:
+            accepted = [accept_file(p) for p in self._paths]
+        visited = set(start)
+        frontier = list(start)
+        sites: list[dict] = []
+        for hops in range(1, max(1, depth) + 1):
+            following: list[int] = []
+            for symbol in frontier:
+                for edge in self._in(symbol) if incoming else self._out(symbol):
+                    if accepted is not None and not accepted[self._edge_file[edge]]:
+                        continue
+                    if len(sites) >= max_results:
+                        return sites, True
+                    sites.append(self._site(edge, hops))
+                    if incoming:
+                        # Calls to the caller, qualified or by its bare member name
+                        caller = self._edge_caller[edge]
+                        name = self._names[caller]
+                        nxt = self._callee_targets(name) if "::" in name else [caller]
+                    else:
+                        nxt = self._definitions_of(self._names[self._edge_callee[edge]])
+                    for s in nxt:
+                        if s not in visited:
+                            visited.add(s)
+                            following.append(s)
+            frontier = following
+            if not frontier:
+                break
+        return sites, False
+
+    def callers(
+        self,
+        name: str,
+        *,
+        depth: int = 1,
+        max_results: int = 200,
+        accept_file: Callable[[str], bool] | None = None,
+    ) -> tuple[list[dict], bool]:
+        """Call sites of `name` and, up to `depth` hops, of its callers (BFS order).
+
+        Returns the sites and whether `max_results` cut the walk short.
+        """
+        with self._lock:
+            return self._walk(self._callee_targets(name), depth, max_results, accept_file, True)
+
+    def callees(
+        self,
+        name: str,
+        *,
+        depth: int = 1,
+        max_results: int = 200,
+        accept_file: Callable[[str], bool] | None = None,
+    ) -> tuple[list[dict], bool]:
+        """Calls made by `name` and, up to `depth` hops, by its callees (BFS order)."""
+        with self._lock:
+            return self._walk(self._definitions_of(name), depth, max_results, accept_file, False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            packed = (
+                self._edge_caller,
+                self._edge_callee,
+                self._edge_line,
+                self._edge_file,
+                self._out_offsets,
+                self._out_edges,
+                self._in_offsets,
+                self._in_edges,
+            )
+            return {
+                "files": len(self._file_edges),
+                "processed_files": self._processed_files,
+                "pending": len(self._pending),
+                "symbols": len(self._names) - len(self._free),
+                "edges": len(self._edge_caller),
+                "packed_bytes": sum(a.itemsize * len(a) for a in packed),
+                "stale": self._stale,
+            }
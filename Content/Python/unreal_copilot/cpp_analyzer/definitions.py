@@ -0,0 +1,166 @@
+"""
+Index of out-of-line member function definitions (`void AFoo::BeginPlay() { ... }`).
+
+The reference index already records each `Owner::Member(` definition line and its
+parameter list; this index subscribes to it and keys the definitions by owner and
+member, so "go to implementation" is a dictionary lookup instead of a text search.
+
+Overloads are told apart by parameter signature: the parameter types with names,
+default values and cv-qualifiers dropped and whitespace removed (`const FString& Label`
+-> `FString&`). Declarations from the class analysis are normalized the same way.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+from .index import FileRecord
+
+_QUALIFIERS = frozenset({"const", "volatile", "class", "struct", "enum", "typename"})
+_TOKEN = re.compile(r"\w+|::|[^\w\s]")
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*\Z")
+# Tokens after which a trailing identifier is still part of the type (`unsigned int`)
+_TYPE_WORDS = frozenset({"::", "unsigned", "signed", "long", "short"})
+
+
+def split_parameters(text: str) -> list[str]:
+    """Split a parameter list on top-level commas (not inside <...>, (...) or {...})."""
+    params = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+        if char in "<([{":
+            depth += 1
+        elif char in ">)]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            params.append(text[start:i])
+            start = i + 1
+    params.append(text[start:])
+    return [p.strip() for p in params if p.strip()]
+
+
+def normalize_parameter(param: str) -> str:
+    """Type of one parameter declaration, in a form comparable across declarations."""
+    param = param.split("=", 1)[0]
+    tokens = [t for t in _TOKEN.findall(param) if t not in _QUALIFIERS]
+    # Drop the parameter name: a trailing identifier after the type
+    if len(tokens) > 1 and _IDENTIFIER.match(tokens[-1]) and tokens[-2] not in _TYPE_WORDS:
+        tokens.pop()
+    return "".join(tokens)
+
+
+def parameter_signature(params: list[str] | str) -> tuple[str, ...]:
+    """Normalized parameter types (`"void"` alone means no parameters)."""
+    if isinstance(params, str):
+        params = split_parameters(params)
+    types = tuple(normalize_parameter(p) for p in params)
+    return () if types == ("void",) else types
+
+
+@dataclass(frozen=True)
+class DefinitionSite:
+    """One out-of-line member function definition."""
+
+    owner: str
+    member: str
+    file: str
+    line: int
+    parameters: tuple[str, ...]  # normalized types
+    parameter_text: str
+    is_const: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "class": self.owner,
+            "method": self.member,
+            "file": self.file,
+            "line": self.line,
+            "signature": f"({self.parameter_text}){' const' if self.is_const else ''}",
+            "parameter_types": list(self.parameters),
+        }
+
+
+class DefinitionIndex:
+    """(owner, member) -> definition sites, kept in step with a reference index."""
+
+    def __init__(self):
+        """Initialize an empty index (feed it with `update` or `CppReferenceIndex`)."""
+        self._lock = threading.RLock()
+        # (lower-cased owner, lower-cased member) -> sites, and file -> its keys
+        self._sites: dict[tuple[str, str], list[DefinitionSite]] = {}
+        self._by_file: dict[str, list[tuple[str, str]]] = {}
+        # lower-cased member -> owners (lower-cased) defining it
+        self._owners: dict[str, set[str]] = {}
+
+    def update(self, path: str, record: FileRecord | None) -> None:
+        """Replace the definitions of `path` (listener for `CppReferenceIndex`)."""
+        with self._lock:
+            for key in self._by_file.pop(path, ()):
+                sites = [s for s in self._sites.get(key, ()) if s.file != path]
+                if sites:
+                    self._sites[key] = sites
+                else:
+                    self._sites.pop(key, None)
+                    owners = self._owners.get(key[1])
+                    if owners is not None:
+                        owners.discard(key[0])
+                        if not owners:
+                            del self._owners[key[1]]
+            if record is None:
+                return
+            keys = []
+            for kind, name, line in record.definitions:
+                if kind != "function":
+                    continue
+                owner, _, member = name.partition("::")
+                text, is_const = record.signatures.get(line, ("", False))
+                text = " ".join(text.split())
+                site = DefinitionSite(
+                    owner=owner,
+                    member=member,
+                    file=path,
+                    line=line,
+                    parameters=parameter_signature(text),
+                    parameter_text=text,
+                    is_const=is_const,
+                )
+                key = (owner.lower(), member.lower())
+                self._sites.setdefault(key, []).append(site)
+                self._owners.setdefault(key[1], set()).add(key[0])
+                keys.append(key)
+            if keys:
+                self._by_file[path] = keys
+
+    def lookup(
+        self, owner: str, member: str, roots: list[str] | None = None
+    ) -> list[DefinitionSite]:
+        """Definitions of `owner::member` (case-insensitive), optionally under `roots`."""
+        with self._lock:
+            sites = list(self._sites.get((owner.lower(), member.lower()), ()))
+        if roots is not None:
+            prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+            sites = [s for s in sites if s.file.startswith(prefixes)]
+        return sorted(sites, key=lambda s: (s.file, s.line))
+
+    def defines(self, member: str, owner: str = "", roots: list[str] | None = None) -> bool:
+        """Whether `owner::member` (any owner if empty) has a definition, optionally
+        under `roots`."""
+        with self._lock:
+            owners = [owner.lower()] if owner else list(self._owners.get(member.lower(), ()))
+            sites = [s for o in owners for s in self._sites.get((o, member.lower()), ())]
+        if roots is None:
+            return bool(sites)
+        prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+        return any(s.file.startswith(prefixes) for s in sites)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "members": len(self._sites),
+                "definitions": sum(len(s) for s in self._sites.values()),
+                "files": len(self._by_file),
+            }
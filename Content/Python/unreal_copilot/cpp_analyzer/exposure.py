@@ -0,0 +1,241 @@
+"""
+Project-wide index of UE reflection macros (UCLASS/USTRUCT/UENUM/UINTERFACE/UPROPERTY/
+UFUNCTION) and their specifiers.
+
+Answering "every BlueprintCallable function in module X" used to mean running
+`detect_ue_pattern` over every header. The index subscribes to `CppReferenceIndex`, which
+already re-tokenizes only new or changed files, so entries are added and dropped per file
+as the tree changes. Queries intersect inverted sets (specifier, module, owner class,
+pattern type, replication) instead of scanning.
+
+Each entry records:
+- owner: the enclosing class/struct (nearest preceding definition in the file); type
+  macros (UCLASS/USTRUCT/UINTERFACE/UENUM) own themselves
+- module: the file's UE module, as resolved by the reference index (`modules.ModuleMap`)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .index import FileRecord
+from .patterns import BLUEPRINT_SPECIFIERS, REPLICATION_SPECIFIERS
+
+_TYPE_MACROS = frozenset({"UCLASS", "USTRUCT", "UINTERFACE", "UENUM"})
+_OWNER_KINDS = frozenset({"class", "struct"})
+
+
+def specifier_key(specifier: str) -> str:
+    """Lower-cased specifier name (`ReplicatedUsing=OnRep_Health` -> `replicatedusing`)."""
+    return specifier.split("=", 1)[0].strip().lower()
+
+
+def _specifier_value(specifier: str) -> str:
+    _, _, value = specifier.partition("=")
+    return value.strip().strip('"').lower()
+
+
+@dataclass(frozen=True)
+class ExposureEntry:
+    """One reflected declaration."""
+
+    pattern_type: str
+    name: str
+    owner: str
+    module: str
+    specifiers: tuple[str, ...]
+    file: str
+    line: int
+    is_blueprint_exposed: bool
+    is_replicated: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "pattern_type": self.pattern_type,
+            "name": self.name,
+            "owner": self.owner,
+            "module": self.module,
+            "specifiers": list(self.specifiers),
+            "file": self.file,
+            "line": self.line,
+            "is_blueprint_exposed": self.is_blueprint_exposed,
+            "is_replicated": self.is_replicated,
+        }
+
+
+class ExposureIndex:
+    """Inverted index over reflected declarations, kept in step with a reference index."""
+
+    def __init__(self):
+        """Initialize an empty index (feed it with `update` or `CppReferenceIndex`)."""
+        self._lock = threading.RLock()
+        self._entries: dict[int, ExposureEntry] = {}
+        self._by_file: dict[str, list[int]] = {}
+        self._next_id = 0
+        # lower-cased key -> entry ids
+        self._by_specifier: dict[str, set[int]] = {}
+        self._by_module: dict[str, set[int]] = {}
+        self._by_owner: dict[str, set[int]] = {}
+        self._by_type: dict[str, set[int]] = {}
+        self._replicated: set[int] = set()
+        self._exposed: set[int] = set()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def update(self, path: str, record: FileRecord | None) -> None:
+        """Replace the entries of `path` (listener for `CppReferenceIndex`)."""
+        with self._lock:
+            self._drop(path)
+            if record is None or not record.ue_macros:
+                return
+            owners = sorted(
+                (line, name) for kind, name, line in record.definitions if kind in _OWNER_KINDS
+            )
+            owner_lines = [line for line, _ in owners]
+            module = record.module
+            ids = []
+            for pattern_type, name, specifiers, line in record.ue_macros:
+                if pattern_type in _TYPE_MACROS:
+                    owner = name
+                else:
+                    i = bisect_right(owner_lines, line)
+                    owner = owners[i - 1][1] if i else ""
+                keys = {specifier_key(s) for s in specifiers}
+                names = {s.split("=", 1)[0].strip() for s in specifiers}
+                entry = ExposureEntry(
+                    pattern_type=pattern_type,
+                    name=name,
+                    owner=owner,
+                    module=module,
+                    specifiers=specifiers,
+                    file=path,
+                    line=line,
+                    is_blueprint_exposed=bool(names & BLUEPRINT_SPECIFIERS),
+                    is_replicated=bool(names & REPLICATION_SPECIFIERS),
+                )
+                entry_id = self._next_id
+                self._next_id += 1
+                self._entries[entry_id] = entry
+                ids.append(entry_id)
+                for key in keys:
+                    self._by_specifier.setdefault(key, set()).add(entry_id)
+                self._by_module.setdefault(module.lower(), set()).add(entry_id)
+                self._by_owner.setdefault(owner.lower(), set()).add(entry_id)
+                self._by_type.setdefault(pattern_type, set()).add(entry_id)
+                if entry.is_replicated:
+                    self._replicated.add(entry_id)
+                if entry.is_blueprint_exposed:
+                    self._exposed.add(entry_id)
+            self._by_file[path] = ids
+
+    def _drop(self, path: str) -> None:
+        for entry_id in self._by_file.pop(path, ()):
+            entry = self._entries.pop(entry_id)
+            for key in {specifier_key(s) for s in entry.specifiers}:
+                self._discard(self._by_specifier, key, entry_id)
+            self._discard(self._by_module, entry.module.lower(), entry_id)
+            self._discard(self._by_owner, entry.owner.lower(), entry_id)
+            self._discard(self._by_type, entry.pattern_type, entry_id)
+            self._replicated.discard(entry_id)
+            self._exposed.discard(entry_id)
+
+    @staticmethod
+    def _discard(index: dict[str, set[int]], key: str, entry_id: int) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(entry_id)
+            if not ids:
+                del index[key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        specifier: str | None = None,
+        module: str | None = None,
+        class_name: str | None = None,
+        replicated: bool | None = None,
+        pattern_type: str | None = None,
+        blueprint_exposed: bool | None = None,
+        roots: list[str] | None = None,
+        accept_file: Callable[[str], bool] | None = None,
+        limit: int = 500,
+    ) -> tuple[list[ExposureEntry], int]:
+        """Entries matching every given filter, ordered by file and line.
+
+        Args:
+            specifier: Specifier name (`BlueprintCallable`) or name=value (`Category=Health`),
+                case-insensitive
+            module: Module name, or comma-separated names (case-insensitive)
+            class_name: Owner class/struct name (case-insensitive)
+            replicated: Keep only replicated (True) or non-replicated (False) entries
+            pattern_type: UCLASS/USTRUCT/UENUM/UINTERFACE/UPROPERTY/UFUNCTION
+            blueprint_exposed: Keep only Blueprint-exposed (True) or hidden (False) entries
+            roots: Keep only files under these directories
+            accept_file: Additional per-file filter
+            limit: Maximum number of entries returned
+
+        Returns:
+            (entries, total number of matches)
+        """
+        with self._lock:
+            candidates: list[set[int]] = []
+            if specifier:
+                candidates.append(self._by_specifier.get(specifier_key(specifier), set()))
+            if module:
+                names = [m.strip().lower() for m in module.split(",") if m.strip()]
+                candidates.append(set().union(*(self._by_module.get(m, ()) for m in names)))
+            if class_name:
+                candidates.append(self._by_owner.get(class_name.lower(), set()))
+            if pattern_type:
+                candidates.append(self._by_type.get(pattern_type.upper(), set()))
+            if replicated:
+                candidates.append(self._replicated)
+            if blueprint_exposed:
+                candidates.append(self._exposed)
+
+            if candidates:
+                candidates.sort(key=len)
+                ids = set(candidates[0]).intersection(*candidates[1:])
+            else:
+                ids = set(self._entries)
+            if replicated is False:
+                ids -= self._replicated
+            if blueprint_exposed is False:
+                ids -= self._exposed
+            entries = [self._entries[i] for i in ids]
+
+        if specifier and "=" in specifier:
+            key, value = specifier_key(specifier), _specifier_value(specifier)
+            entries = [
+                e
+                for e in entries
+                if any(
+                    specifier_key(s) == key and _specifier_value(s) == value
+                    for s in e.specifiers
+                )
+            ]
+        if roots is not None:
+            prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+            entries = [e for e in entries if e.file.startswith(prefixes)]
+        if accept_file is not None:
+            entries = [e for e in entries if accept_file(e.file)]
+        entries.sort(key=lambda e: (e.file, e.line))
+        return entries[:limit], len(entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "files": len(self._by_file),
+                "specifiers": len(self._by_specifier),
+                "modules": len(self._by_module),
+            }
@@ -0,0 +1,74 @@
+"""
+File scan behind `search_code`.
+
+The files to scan are listed once for every file pattern (the manifest), roots in the
+given order and the files of each root sorted by path, then read one by one on the
+calling worker thread until `max_results` matches are found or the request deadline
+expires. The matching itself is made cheap by the whole-file prefilter of the caller;
+the scan is bound by the interpreter, so it runs on one thread.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+
+from ..deadline import Deadline
+
+# scan(path, limit) -> matches of one file (at most `limit`)
+ScanFile = Callable[[str, int], list[dict]]
+
+
+def build_manifest(
+    roots: Iterable[str],
+    suffixes: tuple[str, ...],
+    accept: Callable[[str], bool] | None = None,
+) -> list[str]:
+    """The files under `roots` ending with one of `suffixes`.
+
+    Roots are listed in the given order and the files of each root sorted by path, so
+    the manifest (and the order of the results) does not depend on the file system.
+    """
+    manifest: list[str] = []
+    seen: set[str] = set()
+    for root in roots:
+        found: list[str] = []
+        stack = [os.path.normpath(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    path = entry.path
+                    if not entry.name.endswith(suffixes) or path in seen:
+                        continue
+                    if accept is not None and not accept(path):
+                        continue
+                    seen.add(path)
+                    found.append(path)
+        found.sort()
+        manifest.extend(found)
+    return manifest
+
+
+def scan_files(
+    manifest: Iterable[str],
+    scan: ScanFile,
+    max_results: int,
+    deadline: Deadline | None = None,
+) -> list[dict]:
+    """Scan the files of `manifest` in order; returns up to `max_results` matches.
+
+    When `deadline` expires, the scan stops and the matches found so far are returned.
+    """
+    matches: list[dict] = []
+    for path in manifest:
+        if len(matches) >= max_results or (deadline is not None and deadline.expired()):
+            break
+        matches.extend(scan(path, max_results - len(matches)))
+    return matches
@@ -0,0 +1,377 @@
+"""
+Project-wide `#include` graph with precomputed reverse reachability.
+
+The graph subscribes to `CppReferenceIndex` (which records each file's `#include` lines)
+and is rebuilt lazily after the index changes. Include paths are resolved like UBT does
+for the common cases:
+- relative to the including file's directory
+- otherwise against module include directories: any indexed file whose path ends with
+  the include path is a candidate; candidates under an include directory (module root,
+  Public, Classes, Private or a declared include path) of the including module or one
+  of its dependencies win over the rest
+Includes of files outside the index (CoreMinimal.h when the engine is not indexed,
+`*.generated.h`) stay unresolved.
+
+"Which files transitively include X.h" is answered from the condensation of the graph
+(include cycles collapse into one node). Condensed nodes are numbered so that every
+includer comes before the files it includes, and the transitive includers of a node are
+kept as an int bitset over those numbers, computed once per node per graph build (the
+bitsets of a node's includers are reused), so impact queries on widely included headers
+do not walk the graph again.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+
+from .index import FileRecord
+from .modules import ModuleMap
+
+# Directories of a module that UBT puts on the include path
+_MODULE_INCLUDE_DIRS = ("", "Public", "Classes", "Private")
+# Extensions of translation units (files that are compiled, not included)
+TRANSLATION_UNIT_EXTENSIONS = (".cpp", ".cc", ".cxx", ".c")
+
+
+def _bit_indices(bits: int) -> list[int]:
+    """Positions of the set bits of `bits`, ascending."""
+    text = bin(bits)[:1:-1]
+    indices = []
+    i = text.find("1")
+    while i >= 0:
+        indices.append(i)
+        i = text.find("1", i + 1)
+    return indices
+
+
+class IncludeGraph:
+    """Forward/reverse include graph over the files of a reference index."""
+
+    def __init__(self, module_map: ModuleMap | None = None):
+        """Initialize an empty graph.
+
+        Args:
+            module_map: Used to prefer includes found under module include directories
+        """
+        self._module_map = module_map
+        self._lock = threading.RLock()
+        # path -> (include path as written, line), and path -> owning module
+        self._includes: dict[str, list[tuple[str, int]]] = {}
+        self._modules: dict[str, str] = {}
+        self._dirty = True
+        self._builds = 0
+        # Built state
+        self._paths: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._forward: list[list[int]] = []
+        self._reverse: list[list[int]] = []
+        self._unresolved: dict[int, list[str]] = {}
+        self._edges = 0
+        # Condensation: node -> component, component -> nodes, component -> including
+        # components; components are numbered includers first
+        self._component: list[int] = []
+        self._members: list[list[int]] = []
+        self._component_includers: list[list[int]] = []
+        # component -> bitset of components that transitively include it
+        self._includer_bits: dict[int, int] = {}
+        # module name (lower-cased) -> modules whose headers it can see (lower-cased)
+        self._visible: dict[str, frozenset[str]] = {}
+        self._include_dirs: dict[str, frozenset[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def update(self, path: str, record: FileRecord | None) -> None:
+        """Record the includes of `path` (listener for `CppReferenceIndex`)."""
+        with self._lock:
+            if record is None:
+                self._includes.pop(path, None)
+                self._modules.pop(path, None)
+            else:
+                self._includes[path] = record.includes
+                self._modules[path] = record.module
+            self._dirty = True
+
+    def _ensure_built(self) -> None:
+        if self._dirty:
+            self._build()
+
+    def _build(self) -> None:
+        self._paths = sorted(self._includes)
+        self._ids = {path: i for i, path in enumerate(self._paths)}
+        self._by_name = {}
+        for path in self._paths:
+            self._by_name.setdefault(os.path.basename(path).lower(), []).append(path)
+        self._visible = {}
+        self._include_dirs = {}
+
+        n = len(self._paths)
+        self._forward = [[] for _ in range(n)]
+        self._reverse = [[] for _ in range(n)]
+        self._unresolved = {}
+        self._edges = 0
+        for source, path in enumerate(self._paths):
+            targets = []
+            for spec, _ in self._includes[path]:
+                resolved = self._resolve(spec, path)
+                if resolved is None:
+                    self._unresolved.setdefault(source, []).append(spec)
+                    continue
+                target = self._ids[resolved]
+                if target != source and target not in targets:
+                    targets.append(target)
+                    self._reverse[target].append(source)
+            self._forward[source] = targets
+            self._edges += len(targets)
+
+        self._condense()
+        self._includer_bits = {}
+        self._dirty = False
+        self._builds += 1
+
+    def _condense(self) -> None:
+        """Strongly connected components (iterative Tarjan) of the forward graph."""
+        n = len(self._paths)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child_pos = work.pop()
+                if child_pos == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                children = self._forward[node]
+                recursed = False
+                while child_pos < len(children):
+                    child = children[child_pos]
+                    child_pos += 1
+                    if index[child] < 0:
+                        work.append((node, child_pos))
+                        work.append((child, 0))
+                        recursed = True
+                        break
+                    if on_stack[child]:
+                        low[node] = min(low[node], index[child])
+                if recursed:
+                    continue
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        members.append(member)
+                        if member == node:
+                            break
+                    components.append(members)
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+        # Tarjan emits a component after everything it includes; reversed, includers
+        # come first.
+        components.reverse()
+        self._members = components
+        self._component = [0] * n
+        for c, members in enumerate(components):
+            for member in members:
+                self._component[member] = c
+        includers: list[set[int]] = [set() for _ in components]
+        for target, sources in enumerate(self._reverse):
+            c = self._component[target]
+            for source in sources:
+                sc = self._component[source]
+                if sc != c:
+                    includers[c].add(sc)
+        self._component_includers = [sorted(s) for s in includers]
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def _resolve(self, spec: str, from_path: str) -> str | None:
+        spec = spec.replace("/", os.sep).replace("\\", os.sep)
+        relative = os.path.normpath(os.path.join(os.path.dirname(from_path), spec))
+        if relative in self._ids:
+            return relative
+        candidates = self._by_name.get(os.path.basename(spec).lower())
+        if not candidates:
+            return None
+        suffix = os.sep + spec.lstrip("." + os.sep)
+        matching = [c for c in candidates if c.endswith(suffix)]
+        if len(matching) <= 1:
+            return matching[0] if matching else None
+        visible = self._visible_modules(self._modules.get(from_path, ""))
+        return min(matching, key=lambda c: (self._rank(c, suffix, visible), len(c), c))
+
+    def _rank(self, candidate: str, suffix: str, visible: frozenset[str]) -> int:
+        """0: under an include dir of a visible module, 1: in a visible module, 2: other."""
+        module = self._modules.get(candidate, "").lower()
+        if module not in visible:
+            return 2
+        include_dir = candidate[: -len(suffix)]
+        return 0 if include_dir in self._module_include_dirs(candidate, module) else 1
+
+    def _visible_modules(self, module: str) -> frozenset[str]:
+        key = module.lower()
+        visible = self._visible.get(key)
+        if visible is None:
+            names = {key}
+            if self._module_map is not None and module:
+                for info in self._module_map.get(module):
+                    names.update(d.lower() for d in info.dependencies)
+                    names.update(d.lower() for d in info.public_include_modules)
+                    names.update(d.lower() for d in info.private_include_modules)
+            visible = self._visible[key] = frozenset(names)
+        return visible
+
+    def _module_include_dirs(self, path: str, module: str) -> frozenset[str]:
+        dirs = self._include_dirs.get(module)
+        if dirs is None:
+            found: set[str] = set()
+            info = self._module_map.module_info_for(path) if self._module_map else None
+            if info is not None:
+                extra = info.public_include_paths + info.private_include_paths
+                for sub in (*_MODULE_INCLUDE_DIRS, *extra):
+                    found.add(os.path.normpath(os.path.join(info.directory, sub)))
+            dirs = self._include_dirs[module] = frozenset(found)
+        return dirs
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find(self, path: str) -> list[str]:
+        """Indexed files matching `path`: the file itself, or files ending with it."""
+        with self._lock:
+            self._ensure_built()
+            normalized = os.path.normpath(path)
+            if normalized in self._ids:
+                return [normalized]
+            spec = path.replace("/", os.sep).replace("\\", os.sep).lstrip("." + os.sep)
+            candidates = self._by_name.get(os.path.basename(spec).lower(), [])
+            suffix = os.sep + spec.lower()
+            return [c for c in candidates if c.lower().endswith(suffix)]
+
+    def includes(self, path: str, *, transitive: bool = False) -> list[str]:
+        """Files `path` includes (resolved), directly or transitively."""
+        with self._lock:
+            self._ensure_built()
+            node = self._ids.get(path)
+            if node is None:
+                return []
+            if not transitive:
+                return [self._paths[t] for t in self._forward[node]]
+            seen = {node}
+            pending = [node]
+            while pending:
+                for target in self._forward[pending.pop()]:
+                    if target not in seen:
+                        seen.add(target)
+                        pending.append(target)
+            seen.discard(node)
+            return sorted(self._paths[t] for t in seen)
+
+    def unresolved(self, path: str) -> list[str]:
+        """Include paths of `path` that match no indexed file."""
+        with self._lock:
+            self._ensure_built()
+            node = self._ids.get(path)
+            return list(self._unresolved.get(node, ())) if node is not None else []
+
+    def includers(
+        self,
+        path: str,
+        *,
+        transitive: bool = False,
+        accept_file: Callable[[str], bool] | None = None,
+    ) -> list[str]:
+        """Files that include `path`, directly or transitively (sorted)."""
+        with self._lock:
+            self._ensure_built()
+            node = self._ids.get(path)
+            if node is None:
+                return []
+            if not transitive:
+                found = [self._paths[s] for s in self._reverse[node]]
+            else:
+                component = self._component[node]
+                nodes = [m for m in self._members[component] if m != node]
+                for c in _bit_indices(self._includers_of(component)):
+                    nodes.extend(self._members[c])
+                found = [self._paths[m] for m in nodes]
+        if accept_file is not None:
+            found = [p for p in found if accept_file(p)]
+        return sorted(found)
+
+    def _includers_of(self, component: int) -> int:
+        """Bitset of the components that transitively include `component` (memoized).
+
+        Includers have smaller numbers, so each bitset only spans the numbers below its
+        component. Computed depth-first; every visited component keeps its bitset.
+        """
+        memo = self._includer_bits
+        bits = memo.get(component)
+        if bits is not None:
+            return bits
+        work = [component]
+        while work:
+            c = work[-1]
+            if c in memo:
+                work.pop()
+                continue
+            pending = [p for p in self._component_includers[c] if p not in memo]
+            if pending:
+                work.extend(pending)
+                continue
+            work.pop()
+            bits = 0
+            for p in self._component_includers[c]:
+                bits |= memo[p] | (1 << p)
+            memo[c] = bits
+        return memo[component]
+
+    def impact(self, path: str) -> dict:
+        """Counts of the files affected by a change to `path`."""
+        with self._lock:
+            self._ensure_built()
+            node = self._ids.get(path)
+            if node is None:
+                return {"direct_includers": 0, "transitive_includers": 0}
+            includers = self.includers(path, transitive=True)
+            by_module: dict[str, int] = {}
+            for includer in includers:
+                module = self._modules.get(includer, "")
+                by_module[module] = by_module.get(module, 0) + 1
+            return {
+                "direct_includers": len(self._reverse[node]),
+                "transitive_includers": len(includers),
+                "translation_units": sum(
+                    1 for p in includers if p.endswith(TRANSLATION_UNIT_EXTENSIONS)
+                ),
+                "by_module": dict(sorted(by_module.items(), key=lambda kv: (-kv[1], kv[0]))),
+            }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "files": len(self._includes),
+                "edges": self._edges,
+                "unresolved": sum(len(v) for v in self._unresolved.values()),
+                "components": len(self._members),
+                "memoized": len(self._includer_bits),
+                "builds": self._builds,
+                "stale": self._dirty,
+            }
@@ -0,0 +1,740 @@
+"""
+Identifier index over C++ source trees.
+
+`find_references` used to regex-scan every file of the scope on each call. The index keeps,
+per file, the lines on which each identifier occurs (case-insensitive, whole `\\w+` words,
+i.e. the same matches as `\\bName\\b` with IGNORECASE), so a lookup only touches the files
+that actually mention the identifier.
+
+It also keeps a BM25 inverted index for ranked search: every line is a document, and its
+terms are identifiers split on camelCase/PascalCase/digits (subwords of one letter are
+dropped, the whole identifier is kept). Lines that define a type/function or follow a UE
+reflection macro (UCLASS/UPROPERTY/UFUNCTION/...) are boosted.
+
+Files are tracked by mtime/size: a root is re-walked at most every ANALYZER_INDEX_REFRESH_S
+seconds, and only new or changed files are re-tokenized.
+
+With a module resolver (see `modules.ModuleMap`), files are also partitioned by UE module,
+so module-restricted lookups and rankings only visit the files of those modules.
+
+With a cache path, the records are saved in a packed binary file (`save_cache`, see
+`serialization.py`) and restored before the first refresh, which then only re-reads the
+files that changed since. After a refresh that changed the index, the cache is rewritten
+in a background thread, at most every CACHE_SAVE_INTERVAL_S seconds. Other record
+sources (prebuilt engine packs, see `packs.py`) are restored the same way (`add_preload`).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from ..deadline import Deadline, current_deadline
+from .patterns import detect_ue_pattern
+
+INDEXED_EXTENSIONS = (".h", ".cpp")
+
+# Line flags (FileRecord.line_flags)
+FLAG_DEFINITION = 1
+FLAG_UE_MACRO = 2
+FLAG_COMMENT = 4
+
+# BM25 parameters and score multipliers for flagged lines
+BM25_K1 = 1.2
+BM25_B = 0.75
+DEFINITION_BOOST = 2.0
+UE_MACRO_BOOST = 1.5
+
+# Minimum seconds between automatic index cache writes
+CACHE_SAVE_INTERVAL_S = 60.0
+
+_WORD = re.compile(r"\w+")
+_SUBWORD = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_DEFINITION = re.compile(
+    r"^\s*(?:template\s*<.*>\s*)?"
+    r"(?:(?P<kind>class|struct|union|namespace|enum)(?:\s+class)?\s+(?:\w+_API\s+)?(?P<name>\w+)"
+    r"|[\w:<>,*&\s]*?\b(?P<owner>\w+)::(?P<member>~?\w+)\s*\("
+    r"|#\s*define\s+(?P<macro>\w+))"
+)
+_UE_MACRO = re.compile(
+    r"^\s*U(?:CLASS|STRUCT|ENUM|INTERFACE|PROPERTY|FUNCTION|DELEGATE)\s*\("
+)
+# Leading keywords that make an `Owner::Member(` line a statement (a call), not a definition
+_STATEMENT_PREFIX = re.compile(
+    r"\b(?:return|co_return|co_yield|co_await|throw|else|case|goto|new|delete)\b"
+)
+_QUALIFIER_SUFFIX = re.compile(r"(?:\w+\s*::\s*)+$")
+_INCLUDE = re.compile(r'#\s*include\s*[<"]([^>"]+)[>"]')
+_CONST_QUALIFIER = re.compile(r"\s*const\b")
+# Lines searched for the closing parenthesis of a multi-line parameter list
+_SIGNATURE_LINES = 8
+
+
+@lru_cache(maxsize=65536)
+def split_identifier(word: str) -> tuple[str, ...]:
+    """Split an identifier into lower-cased search terms.
+
+    `UHealthComponent` -> ("health", "component", "uhealthcomponent")
+    """
+    terms = [s.lower() for s in _SUBWORD.findall(word) if len(s) > 1]
+    whole = word.lower()
+    if whole not in terms:
+        terms.append(whole)
+    return tuple(terms)
+
+
+def query_terms(query: str) -> list[str]:
+    """Distinct search terms of a free-text query."""
+    return list(dict.fromkeys(t for w in _WORD.findall(query) for t in split_identifier(w)))
+
+
+@dataclass
+class FileRecord:
+    """Indexed state of one source file."""
+
+    path: str
+    mtime: float
+    size: int
+    # lower-cased identifier -> 1-based line numbers (ascending)
+    identifiers: dict[str, array] = field(default_factory=dict)
+    # search term -> line numbers, repeated once per occurrence (term frequency)
+    terms: dict[str, array] = field(default_factory=dict)
+    # number of terms on each line (index = line - 1)
+    line_lengths: array = field(default_factory=lambda: array("I"))
+    # line -> FLAG_* bits (lines without flags are omitted)
+    line_flags: dict[int, int] = field(default_factory=dict)
+    # (kind, name, line): kind is class/struct/union/namespace/enum, "function" for
+    # out-of-line `Owner::Member(` definitions (name "Owner::Member") or "macro"
+    definitions: list[tuple[str, str, int]] = field(default_factory=list)
+    # (pattern_type, name, specifiers, line) of UCLASS/UPROPERTY/UFUNCTION/... macros
+    ue_macros: list[tuple[str, str, tuple[str, ...], int]] = field(default_factory=list)
+    # line of a "function" definition -> (parameter list text, const-qualified)
+    signatures: dict[int, tuple[str, bool]] = field(default_factory=dict)
+    # (path as written, line) of every `#include "..."` / `#include <...>`
+    includes: list[tuple[str, int]] = field(default_factory=list)
+    # owning UE module (set by the index when it has a module resolver)
+    module: str = ""
+
+    @property
+    def term_lines(self) -> int:
+        """Number of lines with at least one term (BM25 documents)."""
+        return sum(1 for n in self.line_lengths if n)
+
+
+def _parameter_text(lines: list[str], index: int, start: int) -> tuple[str, bool]:
+    """Parameter list starting after the `(` at `lines[index][start - 1]`, and whether the
+    function is const-qualified. The list may continue on the following lines."""
+    depth = 1
+    parts = []
+    for i in range(index, min(index + _SIGNATURE_LINES, len(lines))):
+        line = lines[i][start:] if i == index else lines[i]
+        for pos, char in enumerate(line):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    parts.append(line[:pos])
+                    rest = line[pos + 1 :]
+                    return " ".join(parts), _CONST_QUALIFIER.match(rest) is not None
+        parts.append(line)
+    return " ".join(parts), False
+
+
+def _is_function_definition(line: str, m: re.Match) -> bool:
+    """Tell `void UFoo::Bar(` (or the constructor `UFoo::UFoo(`) from the first line of a
+    multi-line call such as `return UGameplayStatics::ApplyDamage(Target,`."""
+    prefix = line[: m.start("owner")]
+    if _STATEMENT_PREFIX.search(prefix):
+        return False
+    if _QUALIFIER_SUFFIX.sub("", prefix).strip(" \t*&"):
+        return True  # return type
+    return m["member"].lstrip("~") == m["owner"]
+
+
+def tokenize_file(path: str, mtime: float, size: int) -> FileRecord:
+    """Read and tokenize one file (lines are split on "\\n", like search_code)."""
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+    lines_by_ident: dict[str, list[int]] = {}
+    lines_by_term: dict[str, list[int]] = {}
+    line_lengths = array("I")
+    line_flags: dict[int, int] = {}
+    definitions: list[tuple[str, str, int]] = []
+    signatures: dict[int, tuple[str, bool]] = {}
+    includes: list[tuple[str, int]] = []
+    after_macro = False
+    source_lines = content.split("\n")
+    for lineno, line in enumerate(source_lines, 1):
+        words = _WORD.findall(line)
+        if not words:
+            line_lengths.append(0)
+            continue
+        for word in {w.lower() for w in words}:
+            lines = lines_by_ident.get(word)
+            if lines is None:
+                lines_by_ident[word] = [lineno]
+            else:
+                lines.append(lineno)
+
+        length = 0
+        for word in words:
+            for term in split_identifier(word):
+                length += 1
+                lines = lines_by_term.get(term)
+                if lines is None:
+                    lines_by_term[term] = [lineno]
+                else:
+                    lines.append(lineno)
+        line_lengths.append(length)
+
+        stripped = line.lstrip()
+        if stripped.startswith("#"):
+            m = _INCLUDE.match(stripped)
+            if m is not None:
+                includes.append((m.group(1).strip(), lineno))
+        flags = 0
+        if stripped.startswith(("//", "/*")):
+            flags |= FLAG_COMMENT
+        elif _UE_MACRO.match(line):
+            flags |= FLAG_UE_MACRO
+            after_macro = True
+        else:
+            if after_macro:
+                # The declaration annotated by the preceding macro.
+                flags |= FLAG_UE_MACRO
+                after_macro = False
+            m = _DEFINITION.match(line)
+            if m is not None and m["member"] and not _is_function_definition(line, m):
+                m = None
+            if m is not None and not line.rstrip().endswith(";"):
+                flags |= FLAG_DEFINITION
+                if m["name"]:
+                    definitions.append((m["kind"], m["name"], lineno))
+                elif m["member"]:
+                    definitions.append(("function", f"{m['owner']}::{m['member']}", lineno))
+                    signatures[lineno] = _parameter_text(source_lines, lineno - 1, m.end())
+                else:
+                    definitions.append(("macro", m["macro"], lineno))
+        if flags:
+            line_flags[lineno] = flags
+
+    ue_macros = []
+    if any(flags & FLAG_UE_MACRO for flags in line_flags.values()):
+        ue_macros = [
+            (p["pattern_type"], p["name"], tuple(p["specifiers"]), p["line"])
+            for p in detect_ue_pattern(content, path)
+        ]
+
+    return FileRecord(
+        path=path,
+        mtime=mtime,
+        size=size,
+        identifiers={word: array("i", lines) for word, lines in lines_by_ident.items()},
+        terms={term: array("i", lines) for term, lines in lines_by_term.items()},
+        line_lengths=line_lengths,
+        line_flags=line_flags,
+        definitions=definitions,
+        ue_macros=ue_macros,
+        signatures=signatures,
+        includes=includes,
+    )
+
+
+class CppReferenceIndex:
+    """Incrementally maintained identifier -> (file, lines) index with BM25 ranking."""
+
+    def __init__(
+        self,
+        refresh_interval_s: float = 10.0,
+        module_resolver: Callable[[str], str] | None = None,
+        cache_path: str = "",
+    ):
+        """Initialize an empty index.
+
+        Args:
+            refresh_interval_s: Minimum seconds between re-walks of the same root
+            module_resolver: Maps a file path to its module name ("" for none)
+            cache_path: Binary cache of the records, restored before the first refresh
+        """
+        self.refresh_interval_s = refresh_interval_s
+        self._module_resolver = module_resolver
+        self.cache_path = cache_path
+        # (name, loader) of record sources restored before the first refresh
+        self._preloads: list[tuple[str, Callable[[], Iterable[FileRecord]]]] = []
+        if cache_path:
+            self._preloads.append(("index cache", self._read_cache))
+        self._restored_files = 0
+        # Index generation last written to the cache, and when (monotonic)
+        self._saved_generation = 0
+        self._last_save = -math.inf
+        self._save_lock = threading.Lock()
+        self._save_thread: threading.Thread | None = None
+        # lower-cased module name -> files (kept in step with _files)
+        self._module_files: dict[str, set[str]] = {}
+        self._files: dict[str, FileRecord] = {}
+        self._roots: dict[str, float] = {}  # root -> last refresh (monotonic)
+        self._lock = threading.RLock()
+        self._files_indexed = 0
+        self._refreshes = 0
+        # BM25 collection statistics (kept in step with _files)
+        self._term_files: dict[str, set[str]] = {}
+        self._df: Counter[str] = Counter()
+        self._doc_count = 0
+        self._token_count = 0
+        # Bumped on every change, so derived indexes know when to rebuild.
+        self.generation = 0
+        # Called as listener(path, record) on add and listener(path, None) on removal
+        self._listeners: list[Callable[[str, FileRecord | None], None]] = []
+
+    def add_listener(self, listener: Callable[[str, FileRecord | None], None]) -> None:
+        """Subscribe to file changes (replays the files already indexed)."""
+        with self._lock:
+            self._listeners.append(listener)
+            for path, record in self._files.items():
+                listener(path, record)
+
+    def _add(self, record: FileRecord) -> None:
+        self._remove(record.path)
+        if self._module_resolver is not None:
+            record.module = self._module_resolver(record.path)
+        self._files[record.path] = record
+        self._module_files.setdefault(record.module.lower(), set()).add(record.path)
+        path = record.path
+        term_files = self._term_files
+        df = self._df
+        for term, lines in record.terms.items():
+            files = term_files.get(term)
+            if files is None:
+                term_files[term] = {path}
+            else:
+                files.add(path)
+            # Most terms occur once per file; skip building a set for those
+            df[term] = df.get(term, 0) + (1 if len(lines) == 1 else len(set(lines)))
+        self._doc_count += record.term_lines
+        self._token_count += sum(record.line_lengths)
+        self.generation += 1
+        for listener in self._listeners:
+            listener(record.path, record)
+
+    def _remove(self, path: str) -> None:
+        record = self._files.pop(path, None)
+        if record is None:
+            return
+        partition = self._module_files.get(record.module.lower())
+        if partition is not None:
+            partition.discard(path)
+            if not partition:
+                del self._module_files[record.module.lower()]
+        for term, lines in record.terms.items():
+            files = self._term_files.get(term)
+            if files is not None:
+                files.discard(path)
+                if not files:
+                    del self._term_files[term]
+            self._df[term] -= len(set(lines))
+            if self._df[term] <= 0:
+                del self._df[term]
+        self._doc_count -= record.term_lines
+        self._token_count -= sum(record.line_lengths)
+        self.generation += 1
+        for listener in self._listeners:
+            listener(path, None)
+
+    def refresh(self, roots: list[str], *, force: bool = False) -> int:
+        """Bring the index up to date for `roots`.
+
+        Stops early when the request's deadline passes; a root whose walk was cut short
+        keeps its previous state for the files not reached and is walked again next time.
+
+        Args:
+            roots: Source roots to index
+            force: Re-walk even if the refresh interval has not elapsed
+
+        Returns:
+            Number of files (re-)tokenized
+        """
+        if self._preloads:
+            self._run_preloads()
+        deadline = current_deadline()
+        changed = 0
+        for root in roots:
+            root = os.path.normpath(root)
+            with self._lock:
+                last = self._roots.get(root)
+                if not force and last is not None:
+                    if time.monotonic() - last < self.refresh_interval_s:
+                        continue
+                count, complete = self._refresh_root(root, deadline)
+                changed += count
+                if not complete:
+                    break
+                self._roots[root] = time.monotonic()
+        if self.cache_path:
+            self._schedule_save()
+        return changed
+
+    def _schedule_save(self) -> None:
+        """Rewrite the cache in the background if the index changed since the last write
+        (at most every CACHE_SAVE_INTERVAL_S seconds, one write at a time)."""
+        with self._lock:
+            if self.generation == self._saved_generation:
+                return
+            if time.monotonic() - self._last_save < CACHE_SAVE_INTERVAL_S:
+                return
+            if self._save_thread is not None and self._save_thread.is_alive():
+                return
+            self._last_save = time.monotonic()
+            self._save_thread = threading.Thread(
+                target=self._autosave, name="cpp-index-cache", daemon=True
+            )
+            self._save_thread.start()
+
+    def _autosave(self) -> None:
+        try:
+            self.save_cache()
+        except (OSError, ValueError) as e:
+            print(f"[UnrealCopilot] Warning: Failed to save index cache: {e}")
+
+    def _refresh_root(self, root: str, deadline: Deadline | None) -> tuple[int, bool]:
+        seen: set[str] = set()
+        changed = 0
+        complete = True
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if not filename.endswith(INDEXED_EXTENSIONS):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                record = self._files.get(path)
+                if record is not None and record.mtime == st.st_mtime and record.size == st.st_size:
+                    continue
+                if deadline is not None and deadline.expired():
+                    complete = False
+                    break
+                try:
+                    self._add(tokenize_file(path, st.st_mtime, st.st_size))
+                except OSError:
+                    continue
+                changed += 1
+            if not complete:
+                break
+
+        # Files not reached by a cut-short walk are not known to be gone
+        if complete:
+            prefix = root.rstrip("\\/") + os.sep
+            for path in [p for p in self._files if p.startswith(prefix) and p not in seen]:
+                self._remove(path)
+
+        self._files_indexed += changed
+        self._refreshes += 1
+        return changed, complete
+
+    def reassign_modules(self) -> None:
+        """Re-resolve every file's module (after modules were added or removed)."""
+        with self._lock:
+            if self._module_resolver is None:
+                return
+            self._module_files.clear()
+            for path, record in self._files.items():
+                module = self._module_resolver(path)
+                self._module_files.setdefault(module.lower(), set()).add(path)
+                if module != record.module:
+                    record.module = module
+                    for listener in self._listeners:
+                        listener(path, record)
+
+    def _records(self, modules: Collection[str] | None) -> Iterator[tuple[str, FileRecord]]:
+        """(path, record) of all files, or only those of `modules` (call under the lock)."""
+        if modules is None:
+            yield from self._files.items()
+            return
+        files = self._files
+        for module in dict.fromkeys(m.lower() for m in modules):
+            for path in self._module_files.get(module, ()):
+                yield path, files[path]
+
+    def lookup(
+        self, identifier: str, roots: list[str], modules: Collection[str] | None = None
+    ) -> Iterator[tuple[str, array]]:
+        """Yield (file, line numbers) for files under `roots` that contain `identifier`.
+
+        Args:
+            identifier: Whole identifier (case-insensitive)
+            roots: Source roots to search
+            modules: Only visit the files of these modules (case-insensitive)
+        """
+        key = identifier.lower()
+        prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+        with self._lock:
+            hits = [
+                (path, record.identifiers[key])
+                for path, record in self._records(modules)
+                if key in record.identifiers and path.startswith(prefixes)
+            ]
+        yield from hits
+
+    def definitions(
+        self,
+        roots: list[str],
+        kinds: tuple[str, ...] | None = None,
+        modules: Collection[str] | None = None,
+        identifier: str | None = None,
+    ) -> list[tuple[str, str, str, int]]:
+        """(kind, name, file, line) of every definition under `roots` (and `modules`).
+
+        With `identifier`, only files mentioning it are visited (whole identifiers are
+        also search terms, so their files come from the term postings).
+        """
+        prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+        with self._lock:
+            records: Iterator[tuple[str, FileRecord]] = self._records(modules)
+            if identifier:
+                partition = None if modules is None else dict(records)
+                records = (
+                    (path, self._files[path])
+                    for path in self._term_files.get(identifier.lower(), ())
+                    if partition is None or path in partition
+                )
+            return [
+                (kind, name, path, line)
+                for path, record in records
+                if path.startswith(prefixes)
+                for kind, name, line in record.definitions
+                if kinds is None or kind in kinds
+            ]
+
+    def rank(
+        self,
+        terms: list[str],
+        roots: list[str],
+        k: int,
+        *,
+        include_comments: bool = True,
+        accept_file: Callable[[str], bool] | None = None,
+        modules: Collection[str] | None = None,
+    ) -> list[tuple[float, str, int, list[str]]]:
+        """Top-k lines under `roots` by BM25 score over `terms`.
+
+        Terms are scored rarest first (term-at-a-time). Once the k-th best partial score
+        beats the most the remaining terms could add to an unseen line, remaining terms
+        only update lines already in the candidate set instead of walking their postings.
+
+        Args:
+            terms: Search terms (see `query_terms`)
+            roots: Source roots to search
+            k: Number of lines to return
+            include_comments: Whether comment lines may be returned
+            accept_file: Optional file filter (e.g. extension pattern)
+            modules: Only score the files of these modules (case-insensitive). BM25
+                statistics stay collection-wide, so scores are comparable across calls.
+
+        Returns:
+            (score, file, line, matched terms), best first
+        """
+        if k <= 0 or not terms:
+            return []
+        prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+        max_boost = DEFINITION_BOOST * UE_MACRO_BOOST
+        scores: dict[tuple[str, int], float] = {}
+        matched: dict[tuple[str, int], list[str]] = {}
+        with self._lock:
+            if not self._doc_count:
+                return []
+            n_docs = self._doc_count
+            avgdl = self._token_count / n_docs
+            files = self._files
+            in_modules: set[str] | None = None
+            if modules is not None:
+                in_modules = set()
+                for module in modules:
+                    in_modules.update(self._module_files.get(module.lower(), ()))
+
+            def boost(path: str, line: int) -> float:
+                flags = files[path].line_flags.get(line, 0)
+                if flags & FLAG_COMMENT and not include_comments:
+                    return -1.0
+                factor = 1.0
+                if flags & FLAG_DEFINITION:
+                    factor *= DEFINITION_BOOST
+                if flags & FLAG_UE_MACRO:
+                    factor *= UE_MACRO_BOOST
+                return factor
+
+            def contribution(idf: float, tf: int, path: str, line: int) -> float:
+                dl = files[path].line_lengths[line - 1]
+                norm = BM25_K1 * (1.0 - BM25_B + BM25_B * dl / avgdl)
+                return idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+            weighted = []
+            for term in dict.fromkeys(terms):
+                df = self._df.get(term, 0)
+                if df:
+                    weighted.append((df, term, math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))))
+            weighted.sort()
+            # Upper bound of a single term's contribution (tf -> inf, boosted).
+            bounds = [idf * (BM25_K1 + 1) * max_boost for _, _, idf in weighted]
+
+            boosts: dict[tuple[str, int], float] = {}
+            for i, (_, term, idf) in enumerate(weighted):
+                remaining = sum(bounds[i:])
+                if len(scores) >= k:
+                    kth = heapq.nlargest(
+                        k, (score * boosts[key] for key, score in scores.items())
+                    )[-1]
+                else:
+                    kth = -1.0
+                if kth >= remaining:
+                    # No unseen line can reach the top k: only update candidates.
+                    for key in scores:
+                        path, line = key
+                        postings = files[path].terms.get(term)
+                        if postings is None:
+                            continue
+                        tf = bisect_right(postings, line) - bisect_left(postings, line)
+                        if tf:
+                            scores[key] += contribution(idf, tf, path, line)
+                            matched[key].append(term)
+                    continue
+
+                term_files = self._term_files.get(term, ())
+                if in_modules is not None and len(in_modules) < len(term_files):
+                    term_files = in_modules.intersection(term_files)
+                for path in term_files:
+                    if in_modules is not None and path not in in_modules:
+                        continue
+                    if not path.startswith(prefixes):
+                        continue
+                    if accept_file is not None and not accept_file(path):
+                        continue
+                    for line, tf in Counter(files[path].terms[term]).items():
+                        key = (path, line)
+                        if key in scores:
+                            scores[key] += contribution(idf, tf, path, line)
+                            matched[key].append(term)
+                        else:
+                            scores[key] = contribution(idf, tf, path, line)
+                            matched[key] = [term]
+                            boosts[key] = boost(path, line)
+
+            best = heapq.nlargest(k, ((score * boosts[key], key) for key, score in scores.items()))
+        return [
+            (score, path, line, matched[(path, line)])
+            for score, (path, line) in best
+            if score >= 0.0
+        ]
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Forget one file (or everything); it is re-read on the next refresh."""
+        with self._lock:
+            if path is None:
+                for listener in self._listeners:
+                    for known in self._files:
+                        listener(known, None)
+                self._files.clear()
+                self._module_files.clear()
+                self._roots.clear()
+                self._term_files.clear()
+                self._df.clear()
+                self._doc_count = 0
+                self._token_count = 0
+                self.generation += 1
+            else:
+                self._remove(os.path.normpath(path))
+                self._roots.clear()
+
+    def add_preload(self, name: str, loader: Callable[[], Iterable[FileRecord]]) -> None:
+        """Restore the records returned by `loader` before the next refresh."""
+        with self._lock:
+            self._preloads.append((name, loader))
+
+    def _run_preloads(self) -> None:
+        """Restore every pending record source (a missing file is not an error)."""
+        from .serialization import gc_paused
+
+        with self._lock:
+            preloads, self._preloads = self._preloads, []
+            for name, loader in preloads:
+                empty = self.generation == 0
+                try:
+                    with gc_paused():
+                        self._restored_files += self.restore(loader())
+                except FileNotFoundError:
+                    continue
+                except (OSError, ValueError) as e:
+                    print(f"[UnrealCopilot] Warning: Failed to load {name}: {e}")
+                if empty and loader == self._read_cache:
+                    # The index holds just what the cache holds: nothing to write back
+                    self._saved_generation = self.generation
+
+    def _read_cache(self) -> list[FileRecord]:
+        from .serialization import load_records
+
+        return load_records(self.cache_path)
+
+    def restore(self, records: Iterable[FileRecord]) -> int:
+        """Add records computed elsewhere for files not indexed yet; returns the count.
+
+        The records must carry the file's current mtime and size; a later refresh
+        re-tokenizes them like any other file once they change.
+        """
+        restored = 0
+        with self._lock:
+            for record in records:
+                if record.path not in self._files:
+                    self._add(record)
+                    restored += 1
+        return restored
+
+    def records(self, roots: list[str] | None = None) -> list[FileRecord]:
+        """Records of all files, or of the files under `roots`."""
+        with self._lock:
+            if roots is None:
+                return list(self._files.values())
+            prefixes = tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
+            return [r for path, r in self._files.items() if path.startswith(prefixes)]
+
+    def save_cache(self, path: str = "") -> int:
+        """Write every record to `path` (default: the cache path); returns the file count."""
+        from .serialization import save_records
+
+        target = path or self.cache_path
+        if not target:
+            raise ValueError("No index cache path configured")
+        with self._save_lock:
+            with self._lock:
+                records = list(self._files.values())
+                generation = self.generation
+            count = save_records(records, target)
+            if target == self.cache_path:
+                with self._lock:
+                    self._saved_generation = generation
+                    self._last_save = time.monotonic()
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "roots": len(self._roots),
+                "files_indexed": self._files_indexed,
+                "refreshes": self._refreshes,
+                "terms": len(self._df),
+                "documents": self._doc_count,
+                "modules": len(self._module_files),
+                "restored_files": self._restored_files,
+            }
@@ -0,0 +1,438 @@
+"""
+UE module map from `*.Build.cs` and `*.uplugin` files.
+
+A UE codebase is a set of modules: a directory holding `<Name>.Build.cs` owns every
+source file below it (up to a nested module). Build rules declare the module's include
+paths and its public/private dependencies; a `.uplugin` lists the modules a plugin ships
+(type, loading phase) and the plugins it depends on.
+
+`ModuleMap` resolves files to modules lazily (nearest ancestor Build.cs, cached per
+directory), and `discover` walks roots for the module list, which `dependency_order`
+sorts so that dependencies come before the modules using them.
+
+Build.cs files are C#; they are read with regexes for the common forms
+(`PublicDependencyModuleNames.AddRange(new string[] { "Core", ... })`, `.Add("Engine")`,
+`PublicIncludePaths.Add(Path.Combine(ModuleDirectory, "Public"))`). Conditional
+dependencies are all included, and computed paths are kept as their literal parts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+BUILD_SUFFIX = ".Build.cs"
+PLUGIN_SUFFIX = ".uplugin"
+
+# Directories that never hold module sources
+_SKIPPED_DIRS = frozenset(
+    {"Binaries", "Intermediate", "Saved", "DerivedDataCache", "Content", ".git", ".vs"}
+)
+
+_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r'"((?:\\.|[^"\\])*)"')
+# `<List>.Add(...)` / `<List>.AddRange(...)`: group 1 is the list name, the argument list
+# (one level of nested parentheses) is group 2
+_LIST_CALL = re.compile(
+    r"\b(\w+(?:ModuleNames|IncludePaths))\s*\.\s*Add(?:Range)?\s*\(((?:[^()]|\([^()]*\))*)\)"
+)
+# Trailing commas are common in hand-edited .uplugin files
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
+_LISTS = {
+    "PublicDependencyModuleNames": "public_dependencies",
+    "PrivateDependencyModuleNames": "private_dependencies",
+    "DynamicallyLoadedModuleNames": "dynamically_loaded",
+    "PublicIncludePathModuleNames": "public_include_modules",
+    "PrivateIncludePathModuleNames": "private_include_modules",
+    "PublicIncludePaths": "public_include_paths",
+    "PrivateIncludePaths": "private_include_paths",
+}
+
+
+@dataclass
+class ModuleInfo:
+    """One UE module (a `<Name>.Build.cs` and the directory holding it)."""
+
+    name: str
+    directory: str
+    build_file: str
+    plugin: str = ""  # owning plugin name ("" for game/engine modules)
+    module_type: str = ""  # Runtime, Editor, ... (from the .uplugin, when known)
+    public_dependencies: list[str] = field(default_factory=list)
+    private_dependencies: list[str] = field(default_factory=list)
+    dynamically_loaded: list[str] = field(default_factory=list)
+    public_include_modules: list[str] = field(default_factory=list)
+    private_include_modules: list[str] = field(default_factory=list)
+    public_include_paths: list[str] = field(default_factory=list)
+    private_include_paths: list[str] = field(default_factory=list)
+    mtime: float = 0.0
+
+    @property
+    def dependencies(self) -> list[str]:
+        """Modules this one links against (public first)."""
+        return list(dict.fromkeys(self.public_dependencies + self.private_dependencies))
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "directory": self.directory,
+            "build_file": self.build_file,
+            "plugin": self.plugin,
+            "module_type": self.module_type,
+            "public_dependencies": self.public_dependencies,
+            "private_dependencies": self.private_dependencies,
+            "dynamically_loaded": self.dynamically_loaded,
+            "public_include_paths": self.public_include_paths,
+            "private_include_paths": self.private_include_paths,
+        }
+
+
+@dataclass
+class PluginInfo:
+    """One plugin descriptor (`<Name>.uplugin`)."""
+
+    name: str
+    directory: str
+    descriptor: str
+    # {"name", "type", "loading_phase"} per module the plugin declares
+    modules: list[dict] = field(default_factory=list)
+    # names of plugins this one depends on
+    plugins: list[str] = field(default_factory=list)
+    enabled_by_default: bool | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "directory": self.directory,
+            "descriptor": self.descriptor,
+            "modules": self.modules,
+            "plugins": self.plugins,
+            "enabled_by_default": self.enabled_by_default,
+        }
+
+
+def parse_build_cs(path: str) -> ModuleInfo:
+    """Read a `<Name>.Build.cs` file (missing or unreadable files give an empty module)."""
+    name = os.path.basename(path)[: -len(BUILD_SUFFIX)]
+    info = ModuleInfo(name=name, directory=os.path.dirname(path), build_file=path)
+    try:
+        with open(path, encoding="utf-8-sig", errors="ignore") as f:
+            text = f.read()
+        info.mtime = os.stat(path).st_mtime
+    except OSError:
+        return info
+    text = _COMMENT.sub("", text)
+    for m in _LIST_CALL.finditer(text):
+        attr = _LISTS.get(m.group(1))
+        if attr is None:
+            continue
+        values = getattr(info, attr)
+        for value in _STRING.findall(m.group(2)):
+            if value and value not in values:
+                values.append(value)
+    return info
+
+
+def parse_uplugin(path: str) -> PluginInfo:
+    """Read a `.uplugin` descriptor (JSON; unreadable files give an empty plugin)."""
+    info = PluginInfo(
+        name=os.path.basename(path)[: -len(PLUGIN_SUFFIX)],
+        directory=os.path.dirname(path),
+        descriptor=path,
+    )
+    try:
+        with open(path, encoding="utf-8-sig", errors="ignore") as f:
+            data = json.loads(_TRAILING_COMMA.sub(r"\1", f.read()))
+    except (OSError, ValueError):
+        return info
+    if not isinstance(data, dict):
+        return info
+    for module in data.get("Modules") or []:
+        if isinstance(module, dict) and module.get("Name"):
+            info.modules.append(
+                {
+                    "name": str(module["Name"]),
+                    "type": str(module.get("Type", "")),
+                    "loading_phase": str(module.get("LoadingPhase", "")),
+                }
+            )
+    for plugin in data.get("Plugins") or []:
+        if isinstance(plugin, dict) and plugin.get("Name"):
+            info.plugins.append(str(plugin["Name"]))
+    if "EnabledByDefault" in data:
+        info.enabled_by_default = bool(data["EnabledByDefault"])
+    return info
+
+
+class ModuleMap:
+    """Modules and plugins of the configured source trees."""
+
+    def __init__(self, refresh_interval_s: float = 10.0):
+        """Initialize an empty map.
+
+        Args:
+            refresh_interval_s: Minimum seconds between re-walks of the same root
+        """
+        self.refresh_interval_s = refresh_interval_s
+        self._lock = threading.RLock()
+        # build file -> module, and lower-cased name -> build files (names can repeat
+        # across engine/project trees)
+        self._modules: dict[str, ModuleInfo] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._plugins: dict[str, PluginInfo] = {}  # descriptor -> plugin
+        # directory -> build file owning it ("" when none), and -> descriptor above it
+        self._dir_module: dict[str, str] = {}
+        self._dir_plugin: dict[str, str] = {}
+        self._roots: dict[str, float] = {}  # root -> last discovery (monotonic)
+        # Bumped when discovery adds or removes modules (file -> module may have changed)
+        self.generation = 0
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def module_for(self, path: str) -> str:
+        """Name of the module owning `path` ("" when no Build.cs is above it)."""
+        build_file = self._owning_file(os.path.dirname(path), BUILD_SUFFIX, self._dir_module)
+        if not build_file:
+            return ""
+        return self._load_module(build_file).name
+
+    def module_info_for(self, path: str) -> ModuleInfo | None:
+        """Module owning `path`, parsed from its Build.cs."""
+        build_file = self._owning_file(os.path.dirname(path), BUILD_SUFFIX, self._dir_module)
+        return self._load_module(build_file) if build_file else None
+
+    def _owning_file(self, directory: str, suffix: str, cache: dict[str, str]) -> str:
+        """Nearest `*<suffix>` in `directory` or above it (cached per directory)."""
+        visited = []
+        found = ""
+        with self._lock:
+            while directory not in cache:
+                visited.append(directory)
+                try:
+                    names = sorted(f for f in os.listdir(directory) if f.endswith(suffix))
+                except OSError:
+                    names = []
+                if names:
+                    found = os.path.join(directory, names[0])
+                    break
+                parent = os.path.dirname(directory)
+                if parent == directory:
+                    break
+                directory = parent
+            else:
+                found = cache[directory]
+            for d in visited:
+                cache[d] = found
+        return found
+
+    def _load_module(self, build_file: str) -> ModuleInfo:
+        with self._lock:
+            info = self._modules.get(build_file)
+            if info is not None:
+                return info
+            info = parse_build_cs(build_file)
+            descriptor = self._owning_file(info.directory, PLUGIN_SUFFIX, self._dir_plugin)
+            if descriptor:
+                plugin = self._load_plugin(descriptor)
+                info.plugin = plugin.name
+                for declared in plugin.modules:
+                    if declared["name"] == info.name:
+                        info.module_type = declared["type"]
+            self._modules[build_file] = info
+            self._by_name.setdefault(info.name.lower(), []).append(build_file)
+            return info
+
+    def _load_plugin(self, descriptor: str) -> PluginInfo:
+        plugin = self._plugins.get(descriptor)
+        if plugin is None:
+            plugin = self._plugins[descriptor] = parse_uplugin(descriptor)
+        return plugin
+
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+
+    def discover(self, roots: list[str], *, force: bool = False) -> int:
+        """Find every module and plugin under `roots`.
+
+        Build.cs files whose mtime changed are re-read.
+
+        Returns:
+            Number of modules (re-)read
+        """
+        changed = 0
+        for root in roots:
+            root = os.path.normpath(root)
+            with self._lock:
+                last = self._roots.get(root)
+                if not force and last is not None:
+                    if time.monotonic() - last < self.refresh_interval_s:
+                        continue
+                changed += self._discover_root(root)
+                self._roots[root] = time.monotonic()
+        return changed
+
+    def _discover_root(self, root: str) -> int:
+        changed = 0
+        layout_changed = False
+        seen: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _SKIPPED_DIRS]
+            for filename in filenames:
+                if not filename.endswith(BUILD_SUFFIX):
+                    continue
+                build_file = os.path.join(dirpath, filename)
+                seen.add(build_file)
+                known = self._modules.get(build_file)
+                try:
+                    mtime = os.stat(build_file).st_mtime
+                except OSError:
+                    continue
+                if known is not None and known.mtime == mtime:
+                    continue
+                if known is not None:
+                    self._forget(build_file)
+                else:
+                    layout_changed = True
+                self._load_module(build_file)
+                changed += 1
+        prefix = root.rstrip("\\/") + os.sep
+        for build_file in [p for p in self._modules if p.startswith(prefix) and p not in seen]:
+            self._forget(build_file)
+            layout_changed = True
+        if layout_changed:
+            # New or removed Build.cs files change which module owns a directory
+            self._dir_module.clear()
+            self.generation += 1
+        return changed
+
+    def _forget(self, build_file: str) -> None:
+        info = self._modules.pop(build_file, None)
+        if info is None:
+            return
+        files = self._by_name.get(info.name.lower(), [])
+        if build_file in files:
+            files.remove(build_file)
+        if not files:
+            self._by_name.pop(info.name.lower(), None)
+
+    def invalidate(self) -> None:
+        """Forget everything; modules are re-read on next use."""
+        with self._lock:
+            self._modules.clear()
+            self._by_name.clear()
+            self._plugins.clear()
+            self._dir_module.clear()
+            self._dir_plugin.clear()
+            self._roots.clear()
+            self.generation += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, name: str, roots: list[str] | None = None) -> list[ModuleInfo]:
+        """Modules called `name` (case-insensitive), optionally only those under `roots`."""
+        prefixes = _prefixes(roots)
+        with self._lock:
+            return [
+                self._modules[build_file]
+                for build_file in self._by_name.get(name.lower(), ())
+                if prefixes is None or build_file.startswith(prefixes)
+            ]
+
+    def modules(self, roots: list[str] | None = None) -> list[ModuleInfo]:
+        """Known modules (after `discover`), optionally only those under `roots`."""
+        prefixes = _prefixes(roots)
+        with self._lock:
+            return sorted(
+                (
+                    info
+                    for build_file, info in self._modules.items()
+                    if prefixes is None or build_file.startswith(prefixes)
+                ),
+                key=lambda info: (info.name.lower(), info.build_file),
+            )
+
+    def plugins(self, roots: list[str] | None = None) -> list[PluginInfo]:
+        """Plugins owning known modules, optionally only those with modules under `roots`."""
+        return [
+            self._plugins[descriptor]
+            for descriptor in sorted(
+                {
+                    self._dir_plugin.get(info.directory, "")
+                    for info in self.modules(roots)
+                    if info.plugin
+                }
+                - {""}
+            )
+        ]
+
+    def dependencies(self, names: list[str], *, transitive: bool = True) -> list[str]:
+        """Modules that `names` depend on (`transitive`: the whole closure), by name."""
+        with self._lock:
+            result: dict[str, None] = {}
+            requested = {n.lower() for n in names}
+            pending = list(names)
+            while pending:
+                name = pending.pop()
+                for build_file in self._by_name.get(name.lower(), ()):
+                    for dep in self._modules[build_file].dependencies:
+                        if dep not in result and dep.lower() not in requested:
+                            result[dep] = None
+                            if transitive:
+                                pending.append(dep)
+            return list(result)
+
+    def dependency_order(self, roots: list[str] | None = None) -> list[str]:
+        """Module names under `roots`, dependencies first.
+
+        Dependency cycles (legal between private dependencies) are broken at the module
+        that comes first by name. Dependencies outside `roots` are ignored.
+        """
+        infos = self.modules(roots)
+        names = {info.name.lower(): info.name for info in infos}
+        deps = {
+            info.name.lower(): [d.lower() for d in info.dependencies if d.lower() in names]
+            for info in infos
+        }
+        order: list[str] = []
+        state: dict[str, int] = {}  # 1 = in progress, 2 = done
+        for start in sorted(deps):
+            if state.get(start):
+                continue
+            stack = [(start, iter(deps[start]))]
+            state[start] = 1
+            while stack:
+                name, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    state[name] = 2
+                    order.append(names[name])
+                elif not state.get(child):
+                    state[child] = 1
+                    stack.append((child, iter(deps[child])))
+        return order
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "modules": len(self._modules),
+                "plugins": len(self._plugins),
+                "roots": len(self._roots),
+                "directories": len(self._dir_module),
+            }
+
+
+def _prefixes(roots: list[str] | None) -> tuple[str, ...] | None:
+    if roots is None:
+        return None
+    return tuple(os.path.normpath(r).rstrip("\\/") + os.sep for r in roots)
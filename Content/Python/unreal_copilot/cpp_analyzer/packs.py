@@ -0,0 +1,226 @@
+"""
+Prebuilt engine index packs.
+
+Engine sources are the same on every workstation with the same engine build, yet every
+analyzer tokenizes them again. A pack is the reference index records of the engine's
+files, exported once and shared: paths are stored relative to the engine root (the
+directory holding `Engine/`), and each file carries a content hash, so a pack built on
+one machine applies to any install of the same engine.
+
+Packs are keyed by engine version (`Engine/Build/Build.version`: major.minor.patch and
+changelist). On import:
+- a pack for another engine version is refused (when both versions are known)
+- each file is checked against the local copy: it must exist with the same size and,
+  with `verify="hash"` (default), the same content hash; files that do not match are
+  left out and tokenized locally as usual
+- imported records take the local path and mtime, so the index treats them as current
+
+File layout (little-endian):
+    header   "<8sII": magic, version, byte length of the manifest
+    bytes    manifest (UTF-8 JSON, see `PackInfo`)
+    u64[]    content hash per file, in record order
+    records  the index records (`serialization.write_records`), relative "/" paths
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from .index import FileRecord
+from .serialization import read_records, write_records
+
+PACK_MAGIC = b"UCPACK\x00\x01"
+PACK_VERSION = 1
+_HEADER = struct.Struct("<8sII")
+# Bytes hashed per read
+_HASH_CHUNK = 1 << 20
+
+VerifyMode = Literal["hash", "size"]
+
+
+def file_hash(path: str) -> int:
+    """64-bit content hash of a file (BLAKE2b)."""
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def engine_root(paths: Iterable[str]) -> str | None:
+    """Directory holding `Engine/`, from engine source/plugin paths (None if unknown)."""
+    for path in paths:
+        parts = Path(path).resolve().parts
+        if "Engine" in parts:
+            index = len(parts) - 1 - parts[::-1].index("Engine")
+            return str(Path(*parts[:index])) if index else None
+    return None
+
+
+def engine_version(root: str | None) -> dict:
+    """Fields of `Engine/Build/Build.version` under `root` (empty if unreadable)."""
+    if not root:
+        return {}
+    try:
+        with open(os.path.join(root, "Engine", "Build", "Build.version"), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def version_key(version: dict) -> str:
+    """`major.minor.patch-changelist` ("" when the version is unknown)."""
+    if "MajorVersion" not in version:
+        return ""
+    numbers = ".".join(
+        str(version.get(k, 0)) for k in ("MajorVersion", "MinorVersion", "PatchVersion")
+    )
+    return f"{numbers}-{version.get('Changelist', 0)}"
+
+
+@dataclass
+class PackInfo:
+    """Manifest of an index pack."""
+
+    engine_version: str  # version_key() of the engine the pack was built from
+    branch: str = ""
+    files: int = 0
+    created: float = 0.0
+    # Top-level directories covered (relative to the engine root), e.g. "Engine/Source"
+    roots: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+def _relative(path: str, root: str) -> str:
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def export_pack(records: Iterable[FileRecord], root: str, path: str | Path) -> PackInfo:
+    """Write the records of files under `root` (the engine root) to a pack file."""
+    version = engine_version(root)
+    relative: list[FileRecord] = []
+    hashes = array("Q")
+    covered: set[str] = set()
+    for record in records:
+        rel = _relative(record.path, root)
+        if rel.startswith("../"):
+            continue
+        try:
+            hashes.append(file_hash(record.path))
+        except OSError:
+            continue
+        relative.append(dataclasses.replace(record, path=rel, mtime=0.0))
+        covered.add("/".join(rel.split("/")[:2]))
+    info = PackInfo(
+        engine_version=version_key(version),
+        branch=str(version.get("BranchName", "")),
+        files=len(relative),
+        created=time.time(),
+        roots=sorted(covered),
+    )
+
+    manifest = json.dumps(info.to_dict()).encode("utf-8")
+    if sys.byteorder != "little":
+        hashes.byteswap()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(manifest)))
+        f.write(manifest)
+        f.write(hashes.tobytes())
+        write_records(f, relative)
+    os.replace(tmp, path)
+    return info
+
+
+def _read_manifest(data: memoryview, path: str | Path) -> tuple[PackInfo, int]:
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Not an index pack: {path}")
+    magic, version, manifest_len = _HEADER.unpack_from(data, 0)
+    if magic != PACK_MAGIC or version != PACK_VERSION:
+        raise ValueError(f"Not an index pack (or unsupported version): {path}")
+    offset = _HEADER.size + manifest_len
+    try:
+        manifest = json.loads(bytes(data[_HEADER.size : offset]).decode("utf-8"))
+        info = PackInfo(**manifest)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Corrupt index pack manifest: {path}") from e
+    return info, offset
+
+
+def read_pack_info(path: str | Path) -> PackInfo:
+    """Manifest of a pack file (reads only the header)."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) == _HEADER.size:
+            head += f.read(_HEADER.unpack(head)[2])
+    return _read_manifest(memoryview(head), path)[0]
+
+
+def import_pack(
+    path: str | Path, root: str, *, verify: VerifyMode = "hash"
+) -> tuple[list[FileRecord], dict]:
+    """Records of a pack that match the local engine under `root`.
+
+    Returns:
+        The records (local paths and mtimes), and a summary: the pack manifest and the
+        files imported, missing locally and changed locally
+
+    Raises:
+        ValueError: Not a pack, or built from another engine version
+    """
+    data = memoryview(Path(path).read_bytes())
+    info, offset = _read_manifest(data, path)
+    local = version_key(engine_version(root))
+    if info.engine_version and local and info.engine_version != local:
+        raise ValueError(
+            f"Index pack is for engine {info.engine_version}, local engine is {local}: {path}"
+        )
+    hashes = array("Q")
+    end = offset + info.files * hashes.itemsize
+    hashes.frombytes(data[offset:end])
+    if sys.byteorder != "little":
+        hashes.byteswap()
+    records, _ = read_records(data, end)
+    if len(records) != len(hashes):
+        raise ValueError(f"Corrupt index pack: {path}")
+
+    imported: list[FileRecord] = []
+    missing = changed = 0
+    for record, expected in zip(records, hashes):
+        local_path = os.path.join(root, *record.path.split("/"))
+        try:
+            st = os.stat(local_path)
+        except OSError:
+            missing += 1
+            continue
+        if st.st_size != record.size or (verify == "hash" and file_hash(local_path) != expected):
+            changed += 1
+            continue
+        record.path = local_path
+        record.mtime = st.st_mtime
+        imported.append(record)
+    summary = {
+        "pack": info.to_dict(),
+        "local_engine_version": local,
+        "verify": verify,
+        "imported": len(imported),
+        "missing": missing,
+        "changed": changed,
+    }
+    return imported, summary
@@ -7,7 +7,8 @@ to understand Blueprint ↔ C++ boundaries.
 
 import re
 from dataclasses import dataclass
-from typing import Set
+from functools import lru_cache
+from typing import Any, Set
 
 
 @dataclass
@@ -26,23 +27,26 @@ class PatternMatch:
 # Regex Patterns for UE Macros
 # ============================================================================
 
+# Macro argument list, allowing one level of nested parentheses (`meta = (...)`)
+MACRO_ARGS = r"\(((?:[^()]|\([^()]*\))*)\)"
+
 UE_PATTERNS = {
     # UPROPERTY - handles UE_API and other macros between UPROPERTY and type
     "UPROPERTY": re.compile(
-        r"UPROPERTY\s*\(([^)]*)\)\s*\n?\s*(?:\w+_API\s+)?([\w\s\*<>:,&]+?)\s+(\w+)\s*(?:=|;|\[)",
+        rf"UPROPERTY\s*{MACRO_ARGS}\s*\n?\s*(?:\w+_API\s+)?([\w\s\*<>:,&]+?)\s+(\w+)\s*(?:=|;|\[)",
         re.MULTILINE,
     ),
     # UFUNCTION - handles UE_API and other export macros
     "UFUNCTION": re.compile(
-        r"UFUNCTION\s*\(([^)]*)\)\s*\n?\s*(?:\w+_API\s+)?([\w\s\*<>:&]+?)\s+(\w+)\s*\([^)]*\)",
+        rf"UFUNCTION\s*{MACRO_ARGS}\s*\n?\s*(?:\w+_API\s+)?([\w\s\*<>:&]+?)\s+(\w+)\s*\([^)]*\)",
         re.MULTILINE,
     ),
     # UCLASS - handles various API export macros
-    "UCLASS": re.compile(r"UCLASS\s*\(([^)]*)\)\s*class\s+(?:\w+_API\s+)?(\w+)", re.MULTILINE),
-    "USTRUCT": re.compile(r"USTRUCT\s*\(([^)]*)\)\s*struct\s+(?:\w+_API\s+)?(\w+)", re.MULTILINE),
-    "UENUM": re.compile(r"UENUM\s*\(([^)]*)\)\s*enum\s+(?:class\s+)?(\w+)", re.MULTILINE),
+    "UCLASS": re.compile(rf"UCLASS\s*{MACRO_ARGS}\s*class\s+(?:\w+_API\s+)?(\w+)", re.MULTILINE),
+    "USTRUCT": re.compile(rf"USTRUCT\s*{MACRO_ARGS}\s*struct\s+(?:\w+_API\s+)?(\w+)", re.MULTILINE),
+    "UENUM": re.compile(rf"UENUM\s*{MACRO_ARGS}\s*enum\s+(?:class\s+)?(\w+)", re.MULTILINE),
     "UINTERFACE": re.compile(
-        r"UINTERFACE\s*\(([^)]*)\)\s*class\s+(?:\w+_API\s+)?(\w+)", re.MULTILINE
+        rf"UINTERFACE\s*{MACRO_ARGS}\s*class\s+(?:\w+_API\s+)?(\w+)", re.MULTILINE
     ),
     "GENERATED_BODY": re.compile(
         r"GENERATED_(?:BODY|UCLASS_BODY|USTRUCT_BODY)\s*\(\s*\)", re.MULTILINE
@@ -148,6 +152,52 @@ REPLICATION_SPECIFIERS = {
 # ============================================================================
 
 
+# One specifier: quoted strings and one level of parentheses may contain commas.
+_SPECIFIER_PART = re.compile(r'(?:[^,"()]+|"[^"]*"|\([^()"]*(?:"[^"]*"[^()"]*)*\))+')
+# Escaped characters are matched (and skipped) as a unit so `\"` does not close a quote.
+_SPECIFIER_DELIMITERS = re.compile(r'\\.|[(),"]')
+
+
+@lru_cache(maxsize=8192)
+def _split_specifiers(specifiers_str: str) -> tuple[str, ...]:
+    """Top-level comma-separated parts (commas inside parentheses or quotes are kept)."""
+    if "(" not in specifiers_str and '"' not in specifiers_str:
+        return tuple(part for part in (p.strip() for p in specifiers_str.split(",")) if part)
+
+    parts = _SPECIFIER_PART.findall(specifiers_str)
+    # Everything not covered by a part must be a separating comma; otherwise the string
+    # has escapes, deeper nesting or unbalanced parentheses/quotes and is scanned below.
+    covered = sum(map(len, parts)) + specifiers_str.count(",") - sum(p.count(",") for p in parts)
+    if covered == len(specifiers_str) and "\\" not in specifiers_str:
+        return tuple(part for part in map(str.strip, parts) if part)
+
+    parts = []
+    depth = 0
+    start = 0
+    in_quote = False
+    # Only delimiters are visited; the text between them is sliced, not copied per char.
+    for m in _SPECIFIER_DELIMITERS.finditer(specifiers_str):
+        char = m.group()
+        if in_quote:
+            if char == '"':
+                in_quote = False
+        elif char == '"':
+            in_quote = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            part = specifiers_str[start : m.start()].strip()
+            if part:
+                parts.append(part)
+            start = m.end()
+    part = specifiers_str[start:].strip()
+    if part:
+        parts.append(part)
+    return tuple(parts)
+
+
 def parse_specifiers(specifiers_str: str) -> list[str]:
     """
     Parse specifiers from a macro argument string.
@@ -158,28 +208,61 @@ def parse_specifiers(specifiers_str: str) -> list[str]:
     Returns:
         List of individual specifiers
     """
-    result = []
-    depth = 0
-    current = ""
+    return list(_split_specifiers(specifiers_str))
 
-    for char in specifiers_str:
-        if char == "(":
-            depth += 1
-            current += char
-        elif char == ")":
-            depth -= 1
-            current += char
-        elif char == "," and depth == 0:
-            if current.strip():
-                result.append(current.strip())
-            current = ""
+
+@lru_cache(maxsize=8192)
+def specifier_names(specifiers_str: str) -> frozenset[str]:
+    """Specifier names without values (`Category="X"` -> `Category`)."""
+    return frozenset(p.split("=", 1)[0].strip() for p in _split_specifiers(specifiers_str))
+
+
+SpecifierItems = tuple[tuple[str, "str | bool | SpecifierItems"], ...]
+
+
+@lru_cache(maxsize=8192)
+def _specifier_items(specifiers_str: str) -> SpecifierItems:
+    items = []
+    for part in _split_specifiers(specifiers_str):
+        key, eq, value = part.partition("=")
+        key = key.strip()
+        if not eq:
+            items.append((key, True))
+            continue
+        value = value.strip()
+        if value.startswith("("):
+            # Nested list such as meta=(...); the closing parenthesis may be missing when
+            # the caller's regex stopped at the first ")".
+            inner = value[1:-1] if value.endswith(")") else value[1:]
+            items.append((key, _specifier_items(inner)))
         else:
-            current += char
+            if len(value) >= 2 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            items.append((key, value))
+    return tuple(items)
+
 
-    if current.strip():
-        result.append(current.strip())
+def _items_to_dict(items: SpecifierItems) -> dict[str, Any]:
+    return {k: _items_to_dict(v) if isinstance(v, tuple) else v for k, v in items}
 
-    return result
+
+def parse_specifier_map(specifiers_str: str) -> dict[str, Any]:
+    """
+    Parse a macro argument string into a structured mapping.
+
+    `EditAnywhere, Category="Health", meta=(ClampMin=0, DisplayName="HP")` becomes
+    `{"EditAnywhere": True, "Category": "Health", "meta": {"ClampMin": "0", "DisplayName": "HP"}}`.
+
+    Flags map to True, values are unquoted strings and parenthesized lists become nested
+    dicts. Parsing is memoized by the raw string; the returned dict is a fresh copy.
+
+    Args:
+        specifiers_str: The string inside macro parentheses
+
+    Returns:
+        Specifier name -> True | value | nested mapping
+    """
+    return _items_to_dict(_specifier_items(specifiers_str))
 
 
 def detect_ue_pattern(content: str, file_path: str) -> list[dict]:
@@ -198,6 +281,7 @@ def detect_ue_pattern(content: str, file_path: str) -> list[dict]:
         - pattern_type: UPROPERTY, UFUNCTION, UCLASS, etc.
         - name: Name of the item
         - specifiers: List of specifiers
+        - specifier_map: Specifiers as a mapping (see parse_specifier_map)
         - line: Line number
         - context: Surrounding code
         - is_blueprint_exposed: Whether exposed to Blueprints
@@ -213,6 +297,7 @@ def detect_ue_pattern(content: str, file_path: str) -> list[dict]:
         for match in regex.finditer(content):
             specifiers_str = match.group(1) if match.lastindex >= 1 else ""
             specifiers = parse_specifiers(specifiers_str)
+            specifier_map = parse_specifier_map(specifiers_str)
 
             # Get line number
             line_num = content[: match.start()].count("\n") + 1
@@ -229,15 +314,16 @@ def detect_ue_pattern(content: str, file_path: str) -> list[dict]:
                 name = match.group(3) if match.lastindex >= 3 else ""
 
             # Check Blueprint and replication exposure
-            specifier_names = {s.split("=")[0].strip() for s in specifiers}
-            is_blueprint_exposed = bool(specifier_names & BLUEPRINT_SPECIFIERS)
-            is_replicated = bool(specifier_names & REPLICATION_SPECIFIERS)
+            names = specifier_names(specifiers_str)
+            is_blueprint_exposed = not names.isdisjoint(BLUEPRINT_SPECIFIERS)
+            is_replicated = not names.isdisjoint(REPLICATION_SPECIFIERS)
 
             patterns.append(
                 {
                     "pattern_type": pattern_type,
                     "name": name,
                     "specifiers": specifiers,
+                    "specifier_map": specifier_map,
                     "line": line_num,
                     "context": context,
                     "is_blueprint_exposed": is_blueprint_exposed,
@@ -0,0 +1,111 @@
+"""
+UE macro blanking before tree-sitter parsing.
+
+tree-sitter-cpp does not expand macros, so UE headers parse badly:
+`class MYGAME_API UFoo : public UObject` becomes a function definition named after the
+export macro, and `UPROPERTY(...)` / `GENERATED_BODY()` turn into call expressions or
+ERROR nodes. `blank_ue_macros` overwrites known UE macro invocations with spaces
+(newlines are kept), so byte offsets and line/column positions are unchanged and nodes
+can still be mapped back to the original text.
+
+Macros in comments and string literals are left alone. Macro arguments may contain
+nested parentheses and quoted strings; an unterminated argument list is left as is.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+
+# Function-like macros that are blanked together with their argument list.
+UE_FUNCTION_MACROS = (
+    "UCLASS",
+    "USTRUCT",
+    "UENUM",
+    "UINTERFACE",
+    "UPROPERTY",
+    "UFUNCTION",
+    "UDELEGATE",
+    "UPARAM",
+    "UMETA",
+    "GENERATED_BODY",
+    "GENERATED_UCLASS_BODY",
+    "GENERATED_USTRUCT_BODY",
+    "GENERATED_UINTERFACE_BODY",
+    "GENERATED_IINTERFACE_BODY",
+    "UE_DEPRECATED",
+    "UE_DEPRECATED_FORGAME",
+)
+
+# Object-like macros: `*_API` export macros and inlining hints.
+UE_OBJECT_MACROS = ("FORCEINLINE", "FORCENOINLINE", "FORCEINLINE_DEBUGGABLE")
+
+_FUNCTION_NAMES = b"|".join(m.encode() for m in UE_FUNCTION_MACROS)
+_OBJECT_NAMES = b"|".join(m.encode() for m in UE_OBJECT_MACROS)
+_MACRO = re.compile(
+    rb"\b(?=[A-Z])(?:(?P<call>" + _FUNCTION_NAMES + rb")\s*\("
+    rb"|(?P<word>[A-Z][A-Z0-9_]*_API|" + _OBJECT_NAMES + rb")\b)"
+)
+# Comments and string/char literals, matched in source order so that quotes inside comments
+# (and comment markers inside strings) are handled.
+_SKIPPED = re.compile(
+    rb"//[^\n]*|/\*.*?(?:\*/|\Z)|\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'", re.DOTALL
+)
+# Argument list with at most one level of nested parentheses (the common case). Possessive
+# quantifiers keep a failed match (unterminated list) linear.
+_SIMPLE_ARGS = re.compile(
+    rb'\((?:[^()"]++|"(?:\\.|[^"\\])*+"|\((?:[^()"]++|"(?:\\.|[^"\\])*+")*+\))*+\)'
+)
+_ARG_DELIMITERS = re.compile(rb'\\.|["()]')
+_NOT_NEWLINE = re.compile(rb"[^\r\n]")
+
+
+def _closing_paren(source: bytes, open_pos: int) -> int:
+    """Offset just past the parenthesis matching the one at `open_pos` (-1 if unmatched)."""
+    m = _SIMPLE_ARGS.match(source, open_pos)
+    if m is not None:
+        return m.end()
+    depth = 0
+    in_quote = False
+    for m in _ARG_DELIMITERS.finditer(source, open_pos):
+        char = m.group()
+        if in_quote:
+            if char == b'"':
+                in_quote = False
+        elif char == b'"':
+            in_quote = True
+        elif char == b"(":
+            depth += 1
+        elif char == b")":
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return -1
+
+
+def blank_ue_macros(source: bytes) -> bytes:
+    """Return `source` with UE macro invocations replaced by spaces (same length)."""
+    chunks: list[bytes] = []
+    pos = 0
+    skipped: tuple[list[int], list[int]] | None = None
+    for m in _MACRO.finditer(source):
+        start = m.start()
+        if start < pos:
+            continue  # inside an argument list already blanked
+        if skipped is None:
+            spans = [(s.start(), s.end()) for s in _SKIPPED.finditer(source)]
+            skipped = ([a for a, _ in spans], [b for _, b in spans])
+        i = bisect_right(skipped[0], start) - 1
+        if i >= 0 and start < skipped[1][i]:
+            continue  # in a comment or string literal
+        end = m.end() if m["word"] is not None else _closing_paren(source, m.end() - 1)
+        if end < 0:
+            continue
+        span = source[start:end]
+        chunks.append(source[pos:start])
+        chunks.append(_NOT_NEWLINE.sub(b" ", span) if b"\n" in span else b" " * len(span))
+        pos = end
+    if not chunks:
+        return source
+    chunks.append(source[pos:])
+    return b"".join(chunks)
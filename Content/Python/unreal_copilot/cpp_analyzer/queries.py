@@ -22,12 +22,35 @@ QUERY_PATTERNS = {
             name: (type_identifier) @struct_name
             body: (field_declaration_list)? @struct_body) @struct
     """,
-    # Match function definitions
+    # Match function definitions, including out-of-line members (`void AFoo::Bar()`,
+    # `AFoo::~AFoo()`), inline members and functions returning pointers/references
     "FUNCTION": """
         (function_definition
-            declarator: (function_declarator
-                declarator: (identifier) @func_name
-                parameters: (parameter_list) @params)) @function
+            declarator: [
+                (function_declarator
+                    declarator: [
+                        (identifier) (qualified_identifier) (field_identifier)
+                        (destructor_name) (operator_name)
+                    ] @func_name
+                    parameters: (parameter_list) @params)
+                (pointer_declarator
+                    declarator: (function_declarator
+                        declarator: [
+                            (identifier) (qualified_identifier) (field_identifier)
+                        ] @func_name
+                        parameters: (parameter_list) @params))
+                (reference_declarator
+                    (function_declarator
+                        declarator: [
+                            (identifier) (qualified_identifier) (field_identifier)
+                        ] @func_name
+                        parameters: (parameter_list) @params))
+            ]) @function
+    """,
+    # Match call expressions (`Foo()`, `A::Foo()`, `Obj->Foo()`, `Foo<T>()`)
+    "CALL": """
+        (call_expression
+            function: (_) @callee) @call
     """,
     # Match field declarations (class members)
     "FIELD_DECLARATION": """
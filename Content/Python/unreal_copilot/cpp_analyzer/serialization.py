@@ -0,0 +1,266 @@
+"""
+Packed binary format for reference index records (`FileRecord`).
+
+The index is rebuilt by tokenizing every file, which on an engine-sized tree takes far
+longer than reading back what was computed last time. `save_records` writes the records
+(identifier and term postings, line lengths/flags, definitions, UE macro records,
+signatures, includes) to one file; `load_records` reads them back with one read and
+array copies (`frombytes` / array slicing), no per-value unpacking or parsing.
+
+Like the asset snapshot (`ue_client/snapshot.py`), every string is interned once into a
+NUL-joined string table and referenced by id, and the rest is flat int columns. Engine
+index packs (`packs.py`) embed the same layout (`write_records` / `read_records`).
+
+File layout (little-endian):
+    header   "<8sIIIQ": magic, version, string_count, file_count, pool_count
+    u32      byte length of the string blob
+    bytes    UTF-8 strings joined with NUL
+    i32[]    path and module string id per file
+    f64[]    mtime per file
+    i64[]    size per file, then pool offset per file (file_count + 1)
+    i32[]    pool: the sections of each file, in order, each prefixed with its count:
+             identifiers (id, n, lines...), terms (id, n, lines...), line lengths,
+             flags (line, bits), definitions (kind, name, line), UE macros (type, name,
+             line, n, specifiers...), signatures (line, text, const), includes (path, line)
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+from .index import FileRecord
+
+INDEX_MAGIC = b"UCIDX\x00\x00\x01"
+INDEX_VERSION = 2  # 2: call sites no longer recorded as definitions
+_HEADER = struct.Struct("<8sIIIQ")
+_U32 = struct.Struct("<I")
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector.
+
+    Decoding creates millions of dicts and tuples, none of them garbage; left enabled,
+    the collector repeatedly scans them all and roughly doubles the load time.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _read_array(data: memoryview, offset: int, typecode: str, count: int) -> tuple[array, int]:
+    arr = array(typecode)
+    end = offset + count * arr.itemsize
+    arr.frombytes(data[offset:end])
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr, end
+
+
+def _write_array(f, arr: array) -> None:
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    f.write(arr.tobytes())
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def __call__(self, text: str) -> int:
+        sid = self._ids.get(text)
+        if sid is None:
+            sid = self._ids[text] = len(self.strings)
+            self.strings.append(text.replace("\0", ""))
+        return sid
+
+
+def _encode(record: FileRecord, intern: _StringTable, pool: array) -> None:
+    for postings in (record.identifiers, record.terms):
+        pool.append(len(postings))
+        for key, lines in postings.items():
+            pool.append(intern(key))
+            pool.append(len(lines))
+            pool.extend(lines)
+    pool.append(len(record.line_lengths))
+    pool.frombytes(record.line_lengths.tobytes())  # array("I"), same item size
+    pool.append(len(record.line_flags))
+    for line, flags in record.line_flags.items():
+        pool.extend((line, flags))
+    pool.append(len(record.definitions))
+    for kind, name, line in record.definitions:
+        pool.extend((intern(kind), intern(name), line))
+    pool.append(len(record.ue_macros))
+    for pattern_type, name, specifiers, line in record.ue_macros:
+        pool.extend((intern(pattern_type), intern(name), line, len(specifiers)))
+        pool.extend(intern(s) for s in specifiers)
+    pool.append(len(record.signatures))
+    for line, (text, is_const) in record.signatures.items():
+        pool.extend((line, intern(text), int(is_const)))
+    pool.append(len(record.includes))
+    for spec, line in record.includes:
+        pool.extend((intern(spec), line))
+
+
+def _decode(
+    pool: array, p: int, strings: list[str], path: str, mtime: float, size: int, module: str
+) -> FileRecord:
+    postings: list[dict[str, array]] = []
+    for _ in range(2):
+        entries: dict[str, array] = {}
+        count = pool[p]
+        p += 1
+        for _ in range(count):
+            key, n = pool[p], pool[p + 1]
+            entries[strings[key]] = pool[p + 2 : p + 2 + n]
+            p += 2 + n
+        postings.append(entries)
+    n = pool[p]
+    line_lengths = array("I")
+    line_lengths.frombytes(pool[p + 1 : p + 1 + n].tobytes())
+    p += 1 + n
+    n = pool[p]
+    flat = pool[p + 1 : p + 1 + 2 * n]
+    line_flags = dict(zip(flat[0::2], flat[1::2]))
+    p += 1 + 2 * n
+    n = pool[p]
+    flat = pool[p + 1 : p + 1 + 3 * n]
+    definitions = [
+        (strings[kind], strings[name], line)
+        for kind, name, line in zip(flat[0::3], flat[1::3], flat[2::3])
+    ]
+    p += 1 + 3 * n
+    ue_macros = []
+    count = pool[p]
+    p += 1
+    for _ in range(count):
+        pattern_type, name, line, n = pool[p : p + 4]
+        specifiers = tuple(strings[s] for s in pool[p + 4 : p + 4 + n])
+        ue_macros.append((strings[pattern_type], strings[name], specifiers, line))
+        p += 4 + n
+    n = pool[p]
+    flat = pool[p + 1 : p + 1 + 3 * n]
+    signatures = {
+        line: (strings[text], bool(is_const))
+        for line, text, is_const in zip(flat[0::3], flat[1::3], flat[2::3])
+    }
+    p += 1 + 3 * n
+    n = pool[p]
+    flat = pool[p + 1 : p + 1 + 2 * n]
+    includes = [(strings[spec], line) for spec, line in zip(flat[0::2], flat[1::2])]
+    return FileRecord(
+        path=path,
+        mtime=mtime,
+        size=size,
+        identifiers=postings[0],
+        terms=postings[1],
+        line_lengths=line_lengths,
+        line_flags=line_flags,
+        definitions=definitions,
+        ue_macros=ue_macros,
+        signatures=signatures,
+        includes=includes,
+        module=module,
+    )
+
+
+def write_records(f: BinaryIO, records: Iterable[FileRecord]) -> int:
+    """Write `records` to an open binary file; returns the file count."""
+    intern = _StringTable()
+    names, mtimes, sizes = array("i"), array("d"), array("q")
+    offsets, pool = array("q", [0]), array("i")
+    for record in records:
+        names.extend((intern(record.path), intern(record.module)))
+        mtimes.append(record.mtime)
+        sizes.append(record.size)
+        _encode(record, intern, pool)
+        offsets.append(len(pool))
+    file_count = len(mtimes)
+
+    blob = "\0".join(intern.strings).encode("utf-8")
+    f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(intern.strings), file_count, len(pool)))
+    f.write(_U32.pack(len(blob)))
+    f.write(blob)
+    for arr in (names, mtimes, sizes, offsets, pool):
+        _write_array(f, arr)
+    return file_count
+
+
+def read_records(data: memoryview, offset: int = 0) -> tuple[list[FileRecord], int]:
+    """Decode the records written by `write_records` at `offset`; returns them and the
+    offset after them."""
+    if len(data) < offset + _HEADER.size + _U32.size:
+        raise ValueError("Truncated index records")
+    magic, version, string_count, file_count, pool_count = _HEADER.unpack_from(data, offset)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        raise ValueError("Not index records (or unsupported version)")
+    offset += _HEADER.size
+    (blob_len,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    blob = bytes(data[offset : offset + blob_len]).decode("utf-8")
+    offset += blob_len
+    strings = blob.split("\0") if string_count else []
+    if len(strings) != string_count:
+        raise ValueError("Corrupt index records string table")
+
+    names, offset = _read_array(data, offset, "i", 2 * file_count)
+    mtimes, offset = _read_array(data, offset, "d", file_count)
+    sizes, offset = _read_array(data, offset, "q", file_count)
+    offsets, offset = _read_array(data, offset, "q", file_count + 1)
+    pool, offset = _read_array(data, offset, "i", pool_count)
+    if len(pool) != pool_count or (file_count and offsets[-1] != pool_count):
+        raise ValueError("Corrupt index records")
+    try:
+        records = [
+            _decode(
+                pool,
+                offsets[i],
+                strings,
+                strings[names[2 * i]],
+                mtimes[i],
+                sizes[i],
+                strings[names[2 * i + 1]],
+            )
+            for i in range(file_count)
+        ]
+    except IndexError as e:
+        # A pool offset or string id out of range
+        raise ValueError(f"Corrupt index records ({e})") from None
+    return records, offset
+
+
+def save_records(records: Iterable[FileRecord], path: str | Path) -> int:
+    """Write `records` to a packed binary file (atomically); returns the file count."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        count = write_records(f, records)
+    os.replace(tmp, path)
+    return count
+
+
+def load_records(path: str | Path) -> list[FileRecord]:
+    """Load the records written by `save_records`."""
+    data = memoryview(Path(path).read_bytes())
+    try:
+        records, end = read_records(data)
+    except ValueError as e:
+        raise ValueError(f"{e}: {path}") from None
+    if end != len(data):
+        raise ValueError(f"Corrupt index cache: {path}")
+    return records
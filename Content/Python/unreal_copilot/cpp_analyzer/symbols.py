@@ -0,0 +1,231 @@
+"""
+Fuzzy and prefix lookup over C++ type names.
+
+Names are normalized (lower-cased, UE type prefix `U/A/F/I/E/T/S` dropped when it precedes
+an uppercase letter), so `LyraHealthComp` and `ULyraHealthComponent` share a key prefix.
+
+Lookups combine:
+- exact and prefix matches from a sorted key list (bisect)
+- typo-tolerant matches: a SymSpell-style deletion index over the first `PREFIX_LENGTH`
+  characters of each key (`SEED_DELETES` deletions) yields the key heads close to the
+  query's head. From each of those, an edit-distance row is carried down the sorted key
+  list as if it were a trie (siblings are found by bisect), pruned as soon as every cell
+  exceeds `MAX_EDIT_DISTANCE`. Only keys whose head is within the limit are visited.
+
+Fuzzy matching runs with one edit first and widens to `MAX_EDIT_DISTANCE` only when nothing
+closer was found. Candidates are ranked by the edit distance between the query and the
+closest head of the key (so partial names match), then by how much of the name is left over.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+MAX_EDIT_DISTANCE = 2
+PREFIX_LENGTH = 5
+# Deletions per side in the seed index: heads with one edit (or an insert/delete pair)
+# are found; the rest of the name may hold the remaining edits.
+SEED_DELETES = 1
+
+_UE_TYPE_PREFIXES = frozenset("UAFIETS")
+
+
+def normalize_symbol(name: str) -> str:
+    """Lower-cased lookup key with the UE type prefix dropped."""
+    name = name.rsplit("::", 1)[-1]
+    if len(name) > 2 and name[0] in _UE_TYPE_PREFIXES and name[1].isupper():
+        name = name[1:]
+    return name.lower()
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """All strings reachable from `word` by removing up to `max_distance` characters."""
+    out = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        out |= frontier
+    return out
+
+
+def _next_row(
+    row: list[int],
+    prev_row: list[int] | None,
+    ch: str,
+    prev_ch: str,
+    query: str,
+    depth: int,
+    max_distance: int,
+) -> list[int]:
+    """Optimal-string-alignment DP row for the key prefix of length `depth` ending in `ch`.
+
+    Only the diagonal band |depth - j| <= max_distance is computed; every other cell is
+    already over the limit and is stored as max_distance + 1.
+    """
+    over = max_distance + 1
+    n = len(query)
+    nxt = [over] * (n + 1)
+    if depth <= max_distance:
+        nxt[0] = depth
+    lo = depth - max_distance if depth > max_distance else 1
+    hi = depth + max_distance if depth + max_distance < n else n
+    left = nxt[lo - 1]
+    for j in range(lo, hi + 1):
+        qc = query[j - 1]
+        value = row[j - 1] if qc == ch else row[j - 1] + 1
+        if row[j] < value:
+            value = row[j] + 1
+        if left < value:
+            value = left + 1
+        if prev_row is not None and qc == prev_ch and j > 1 and query[j - 2] == ch:
+            if prev_row[j - 2] < value:
+                value = prev_row[j - 2] + 1
+        if value > over:
+            value = over
+        nxt[j] = left = value
+    return nxt
+
+
+@dataclass
+class Symbol:
+    """One indexed definition."""
+
+    name: str
+    kind: str
+    file: str
+    line: int
+
+
+class SymbolIndex:
+    """Immutable fuzzy/prefix index over symbol names."""
+
+    def __init__(self, symbols: Iterable[Symbol]):
+        """Index symbols (duplicates by name keep every definition)."""
+        by_key: dict[str, list[Symbol]] = {}
+        for sym in symbols:
+            by_key.setdefault(normalize_symbol(sym.name), []).append(sym)
+        self._by_key = by_key
+        self._keys = sorted(by_key)
+        self._deletes: dict[str, list[str]] = {}
+        for prefix in dict.fromkeys(k[:PREFIX_LENGTH] for k in self._keys):
+            for variant in _deletes(prefix, SEED_DELETES):
+                self._deletes.setdefault(variant, []).append(prefix)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._by_key.values())
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        keys = self._keys
+        lo = bisect_left(keys, prefix)
+        return lo, bisect_left(keys, prefix + "\uffff", lo)
+
+    def _fuzzy_ranges(self, q: str, max_distance: int) -> list[tuple[int, int, int]]:
+        """(distance, lo, hi): key ranges whose shared head is within `max_distance` of `q`."""
+        keys = self._keys
+        n = len(q)
+        found: list[tuple[int, int, int]] = []
+        root = [min(j, max_distance + 1) for j in range(n + 1)]
+        starts = {
+            prefix
+            for variant in _deletes(q[:PREFIX_LENGTH], SEED_DELETES)
+            for prefix in self._deletes.get(variant, ())
+        }
+        # Rows of the start prefixes and their heads, computed once per distinct head.
+        rows: dict[str, tuple[list[int], list[int] | None]] = {"": (root, None)}
+        recorded: set[str] = set()
+        stack = []
+        for prefix in starts:
+            for depth in range(1, len(prefix) + 1):
+                head = prefix[:depth]
+                if head in rows:
+                    continue
+                row, prev_row = rows[head[:-1]]
+                prev_ch = head[-2] if depth > 1 else ""
+                nxt = _next_row(row, prev_row, head[-1], prev_ch, q, depth, max_distance)
+                rows[head] = (nxt, row)
+                if nxt[-1] <= max_distance and head not in recorded:
+                    recorded.add(head)
+                    found.append((nxt[-1], *self._range(head)))
+            row, prev_row = rows[prefix]
+            if min(row) <= max_distance:
+                stack.append((*self._range(prefix), len(prefix), row, prev_row, prefix[-1]))
+
+        while stack:
+            lo, hi, depth, row, prev_row, prev_ch = stack.pop()
+            if depth >= n + max_distance:
+                continue
+            i = lo
+            while i < hi:
+                key = keys[i]
+                if len(key) <= depth:
+                    i += 1
+                    continue
+                ch = key[depth]
+                j = bisect_left(keys, key[:depth] + chr(ord(ch) + 1), i, hi)
+                nxt = _next_row(row, prev_row, ch, prev_ch, q, depth + 1, max_distance)
+                if nxt[-1] <= max_distance:
+                    found.append((nxt[-1], i, j))
+                if min(nxt) <= max_distance:
+                    stack.append((i, j, depth + 1, nxt, row, ch))
+                i = j
+        return found
+
+    def lookup(self, query: str, limit: int = 10) -> list[dict]:
+        """Ranked candidates for a (possibly partial or misspelled) name.
+
+        Returns:
+            Dicts with name, kind, file, line, distance (edits against the closest head of
+            the name) and match ("exact" | "prefix" | "fuzzy"), best first
+        """
+        q = normalize_symbol(query.strip())
+        if not q or limit <= 0:
+            return []
+        keys = self._keys
+
+        def leftover(i: int) -> tuple[int, str]:
+            return len(keys[i]) - len(q), keys[i]
+
+        # key index -> (distance, match rank, leftover)
+        ranked: dict[int, tuple[int, int, int]] = {}
+        lo, hi = self._range(q)
+        for i in heapq.nsmallest(limit, range(lo, hi), key=leftover):
+            ranked[i] = (0, 0 if keys[i] == q else 1, len(keys[i]) - len(q))
+
+        # One edit first; two edits only when nothing closer exists (much wider walk).
+        for max_distance in range(1, MAX_EDIT_DISTANCE + 1):
+            if len(q) <= max_distance or len(ranked) >= limit:
+                break
+            for distance, lo, hi in sorted(self._fuzzy_ranges(q, max_distance)):
+                if distance == 0:
+                    continue  # same as the prefix matches above
+                for i in heapq.nsmallest(limit, range(lo, hi), key=leftover):
+                    if i not in ranked:
+                        ranked[i] = (distance, 2, abs(len(keys[i]) - len(q)))
+            if ranked:
+                break
+
+        out = []
+        for i in heapq.nsmallest(limit, ranked, key=lambda i: (*ranked[i], keys[i])):
+            distance, match_rank, _ = ranked[i]
+            for sym in self._by_key[keys[i]]:
+                out.append(
+                    {
+                        "name": sym.name,
+                        "kind": sym.kind,
+                        "file": sym.file,
+                        "line": sym.line,
+                        "distance": distance,
+                        "match": ("exact", "prefix", "fuzzy")[match_rank],
+                    }
+                )
+        return out[:limit]
+
+    def stats(self) -> dict:
+        return {
+            "symbols": len(self),
+            "keys": len(self._keys),
+            "delete_variants": len(self._deletes),
+        }
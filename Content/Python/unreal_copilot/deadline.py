@@ -0,0 +1,123 @@
+"""
+Per-request deadlines.
+
+A tool call gets a time budget (`timeout_s`, default TOOL_TIMEOUT_S). The deadline is
+held in a context variable, so it follows the call through `await`s and into worker
+threads started with `run_in_thread`, without being passed through every signature:
+- scanners (index refresh, search_code, call-graph sync) check it between files and
+  stop early; the analyzer then returns what it has, flagged `timed_out`
+- the UE plugin client caps each request's timeout at the time left, and raises
+  `DeadlineExceeded` instead of starting a request after the deadline
+
+Work that nobody waits for any more is cancelled: when the task awaiting
+`run_in_thread` is cancelled (the MCP client gave up, or every coalesced caller left),
+the thread's deadline is cancelled too, and the scan stops at its next check instead of
+running to completion in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work cannot start or finish before the request's deadline."""
+
+
+class Deadline:
+    """Point in time after which a request's remaining work is abandoned."""
+
+    __slots__ = ("expires_at", "parent", "_cancelled")
+
+    def __init__(self, seconds: float | None = None, parent: Deadline | None = None):
+        """Create a deadline.
+
+        Args:
+            seconds: Time budget from now (None: no time limit of its own)
+            parent: Enclosing deadline; this one expires no later than the parent
+        """
+        self.expires_at = math.inf if seconds is None else time.monotonic() + seconds
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+        self.parent = parent
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Expire now (the work this deadline governs was abandoned)."""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self.parent is not None and self.parent.cancelled)
+
+    def expired(self) -> bool:
+        """True once the deadline has passed or was cancelled."""
+        return self.cancelled or time.monotonic() >= self.expires_at
+
+    def remaining(self) -> float:
+        """Seconds left (0 when expired, inf without a time limit)."""
+        if self.cancelled:
+            return 0.0
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self) -> None:
+        """Raise `DeadlineExceeded` if the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceeded("cancelled" if self.cancelled else "deadline exceeded")
+
+
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "unreal_copilot_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    """Deadline of the running request (None outside any `deadline_scope`)."""
+    return _current.get()
+
+
+def timed_out() -> bool:
+    """True when the running request's deadline has passed (work may be incomplete)."""
+    deadline = _current.get()
+    return deadline is not None and deadline.expired()
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline]:
+    """Run the enclosed calls under a deadline `seconds` from now.
+
+    Nested scopes never extend the enclosing deadline. `None` or a non-positive budget
+    adds no time limit (an enclosing deadline still applies).
+    """
+    budget = seconds if seconds is not None and seconds > 0 else None
+    deadline = Deadline(budget, parent=_current.get())
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+async def run_in_thread(fn: Callable[..., T], /, *args) -> T:
+    """`asyncio.to_thread` that stops the thread's work when the caller is cancelled.
+
+    `fn` runs under a child of the current deadline; cancelling the awaiting task
+    cancels that child, so cooperative checks in `fn` return early.
+    """
+    deadline = Deadline(parent=_current.get())
+    context = contextvars.copy_context()
+    context.run(_current.set, deadline)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, context.run, fn, *args)
+    except asyncio.CancelledError:
+        deadline.cancel()
+        raise
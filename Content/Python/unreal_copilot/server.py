@@ -8,7 +8,9 @@ Environment variables:
 - UNREAL_ENGINE_PATH: Engine source root (optional)
 - UE_PLUGIN_HOST: Unreal Editor plugin HTTP API host
 - UE_PLUGIN_PORT: Unreal Editor plugin HTTP API port (default: 8080)
+- UE_ASSET_SNAPSHOT: Asset registry snapshot file (answers asset queries without the editor)
 - DEFAULT_SEARCH_SCOPE: Default scope (project/engine/all)
+- TOOL_TIMEOUT_S: Time budget of a tool call in seconds (default: 50, 0 disables)
 """
 
 from __future__ import annotations
@@ -30,9 +32,11 @@ mcp = FastMCP(
 
 
 def _is_ue_plugin_available() -> bool:
-    """Check if the UE plugin HTTP API is configured."""
+    """Check if the UE plugin HTTP API (or an offline asset snapshot) is configured."""
     host = os.getenv("UE_PLUGIN_HOST")
-    return host is not None and host.strip() != ""
+    if host is not None and host.strip() != "":
+        return True
+    return bool(os.getenv("UE_ASSET_SNAPSHOT", "").strip())
 
 
 def register_tools():
@@ -49,7 +53,7 @@ def register_tools():
 
     Specialized tools (4):
     - get_blueprint_graph: Blueprint graph (EventGraph/function graphs)
-    - detect_ue_patterns: UE macro detection (format='detailed'|'summary')
+    - detect_ue_patterns: UE macro detection per file or codebase-wide (specifier/module/class)
     - trace_reference_chain: Cross-domain reference chain
     - find_cpp_class_usage: C++ class usage (Blueprint + C++)
     """
@@ -195,6 +199,24 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         help="Default search scope",
         default=None,
     )
+    parser.add_argument(
+        "--tool-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Time budget of a tool call; slower scans return partial results (default: 50)",
+        default=None,
+    )
+    parser.add_argument(
+        "--engine-index-pack",
+        help="Prebuilt engine index pack to import instead of indexing the engine",
+        default=None,
+    )
+    parser.add_argument(
+        "--export-engine-pack",
+        metavar="PATH",
+        help="Index the engine sources, write an engine index pack to PATH and exit",
+        default=None,
+    )
     parser.add_argument(
         "--no-init",
         action="store_true",
@@ -245,6 +267,23 @@ def _apply_cli_overrides(args: argparse.Namespace) -> None:
         os.environ["UE_PLUGIN_PORT"] = str(args.ue_plugin_port)
     if args.default_scope:
         os.environ["DEFAULT_SEARCH_SCOPE"] = args.default_scope
+    if args.tool_timeout is not None:
+        os.environ["TOOL_TIMEOUT_S"] = str(args.tool_timeout)
+    if args.engine_index_pack:
+        os.environ["ENGINE_INDEX_PACK"] = args.engine_index_pack
+
+
+def _export_engine_pack(path: str) -> None:
+    """Build the engine index and write it as a shareable pack."""
+    import asyncio
+
+    from .cpp_analyzer import get_analyzer
+
+    info = asyncio.run(get_analyzer().export_engine_pack(path))
+    print(
+        f"[UnrealCopilot] Engine index pack: {info['path']} "
+        f"(engine {info['engine_version'] or 'unknown'}, {info['files']} files)"
+    )
 
 
 def main():
@@ -260,8 +299,14 @@ def main():
         print(f"  UNREAL_ENGINE_PATH: {os.getenv('UNREAL_ENGINE_PATH')}")
         print(f"  UE_PLUGIN_URL: {cfg.ue_plugin_url}")
         print(f"  DEFAULT_SCOPE: {cfg.default_scope}")
+        print(f"  TOOL_TIMEOUT_S: {cfg.tool_timeout_s}")
         print(f"  Project paths: {cfg.get_project_paths()}")
         print(f"  Engine paths: {cfg.get_engine_paths()}")
+        print(f"  ENGINE_INDEX_PACK: {cfg.engine_index_pack}")
+        return
+
+    if args.export_engine_pack:
+        _export_engine_pack(args.export_engine_pack)
         return
 
     register_tools()
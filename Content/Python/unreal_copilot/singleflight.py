@@ -0,0 +1,210 @@
+"""
+Request coalescing ("single-flight") for identical in-flight calls.
+
+When several agents or parallel tool calls ask for the same thing at once (e.g. the same
+`/blueprint/graph` or `analyze_class("AActor")`), only the first caller runs the work; the
+others await the same task and receive a copy of its result (or its exception).
+
+Coalescing only covers calls that overlap in time. Completed results are not kept here;
+caching is the job of the response cache / analyzer caches.
+
+A caller that is cancelled does not cancel the shared work while others still wait on it;
+once the last caller is gone, the work is cancelled (see `deadline.run_in_thread` for how
+that reaches worker threads).
+
+The shared work runs under the first caller's deadline, so:
+- no follower waits past its own deadline (`DeadlineExceeded`), even if the work goes on
+- a caller with a later deadline whose shared run ended after the leader's deadline
+  passed (a partial `timed_out` result, or a failure) re-issues the call as a new leader
+"""
+
+import asyncio
+import copy
+import functools
+import math
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from .deadline import Deadline, DeadlineExceeded, current_deadline
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn call arguments (lists, dicts, sets) into a hashable key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _outlives(own: Deadline | None, leader: Deadline | None) -> bool:
+    """True when the shared run may have been cut short by a deadline the caller does not
+    have: the leader's deadline passed and the caller's own is later and still running."""
+    if leader is None or not leader.expired():
+        return False
+    return own is None or (not own.expired() and own.expires_at > leader.expires_at)
+
+
+def make_key(name: str, args: tuple = (), kwargs: dict | None = None) -> Hashable:
+    """Build a coalescing key from a call name and its arguments."""
+    return name, _freeze(args), _freeze(kwargs or {})
+
+
+class SingleFlight:
+    """Share one in-flight task between concurrent callers with the same key."""
+
+    def __init__(self):
+        """Initialize an empty in-flight table."""
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # Deadline each in-flight task runs under (its leader's)
+        self._deadlines: dict[asyncio.Task, Deadline | None] = {}
+        # Callers still awaiting each in-flight task
+        self._waiters: dict[asyncio.Task, int] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._executions = 0
+        self._coalesced = 0
+        self._abandoned = 0
+        self._reissued = 0
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]], deadline: Deadline | None = None
+    ) -> T:
+        """Run `fn()` unless an identical call is already in flight, then share its result.
+
+        Args:
+            key: Hashable identity of the call (see `make_key`)
+            fn: Zero-argument coroutine factory doing the actual work
+            deadline: The caller's deadline (default: the current one)
+
+        Returns:
+            The result of `fn()`. Coalesced callers get a deep copy, so mutating a result
+            never affects other callers.
+
+        Raises:
+            DeadlineExceeded: The deadline of a coalesced caller passed before the shared
+                work finished
+        """
+        if deadline is None:
+            deadline = current_deadline()
+        reissue = False
+        while True:
+            task, leader, leader_deadline = self._join(key, fn, deadline, reissue)
+            try:
+                # The leader's work stops at the leader's deadline by itself (partial
+                # results); followers may have an earlier one.
+                result = await self._wait(task, None if leader else deadline)
+            except Exception:
+                if leader or not _outlives(deadline, leader_deadline):
+                    raise
+            else:
+                if leader or not _outlives(deadline, leader_deadline):
+                    return result if leader else copy.deepcopy(result)
+            # The shared run was cut short by the leader's earlier deadline: run it again
+            # under ours (as the new in-flight task, which later callers join).
+            reissue = True
+            with self._lock:
+                self._reissued += 1
+
+    def _join(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]], deadline: Deadline | None, lead: bool
+    ) -> tuple[asyncio.Task, bool, Deadline | None]:
+        """Join the in-flight task of `key` or start it (always with `lead`); returns the
+        task, whether this caller leads it and the deadline it runs under."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._calls += not lead
+            task = self._inflight.get(key)
+            # Tasks are bound to their event loop; never share across loops/threads. A
+            # task never joins itself (a recursive call with the same key would wait on
+            # its own completion).
+            leader = (
+                lead
+                or task is None
+                or task.done()
+                or task.get_loop() is not loop
+                or task is asyncio.current_task()
+            )
+            if leader:
+                task = loop.create_task(fn())
+                self._inflight[key] = task
+                self._deadlines[task] = deadline
+                self._executions += 1
+                task.add_done_callback(functools.partial(self._forget, key))
+            else:
+                self._coalesced += 1
+            self._waiters[task] = self._waiters.get(task, 0) + 1
+            return task, leader, self._deadlines.get(task)
+
+    async def _wait(self, task: asyncio.Task, deadline: Deadline | None) -> Any:
+        """Await `task` for one caller, no longer than `deadline`."""
+        # Shield: a cancelled caller must not cancel the work other callers wait on.
+        waiter = asyncio.shield(task)
+        try:
+            if deadline is not None and deadline.expires_at < math.inf:
+                await asyncio.wait((waiter,), timeout=deadline.remaining())
+                if not waiter.done():
+                    waiter.cancel()
+                    raise DeadlineExceeded("deadline exceeded")
+            return await waiter
+        finally:
+            with self._lock:
+                # Only a cancelled or timed-out caller leaves before the task is done
+                abandoned = self._release(task) == 0 and not task.done()
+                self._abandoned += abandoned
+            if abandoned:
+                task.cancel()
+
+    def _release(self, task: asyncio.Task) -> int:
+        """Drop one waiter of `task` (call under the lock); returns the waiters left."""
+        left = self._waiters.get(task, 1) - 1
+        if left > 0:
+            self._waiters[task] = left
+        else:
+            self._waiters.pop(task, None)
+        return left
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            self._deadlines.pop(task, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller has gone away.
+            task.exception()
+
+    def stats(self) -> dict:
+        """Return call/coalescing counters."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "coalesce_rate": (self._coalesced / self._calls) if self._calls else 0.0,
+                "in_flight": len(self._inflight),
+                "abandoned": self._abandoned,
+                "reissued": self._reissued,
+            }
+
+
+def coalesced(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Decorate an async method so identical concurrent calls share one execution.
+
+    The instance must provide a `SingleFlight` as `self._flight`.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = make_key(method.__name__, args, kwargs)
+        return await self._flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
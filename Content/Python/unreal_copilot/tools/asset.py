@@ -5,6 +5,8 @@ These tools communicate with the Unreal Plugin HTTP API to query
 asset references, referencers, and metadata.
 """
 
+from typing import Literal
+
 from ..ue_client import get_client
 from ..ue_client.http_client import UEPluginError
 
@@ -89,6 +91,55 @@ async def get_asset_referencers(asset_path: str) -> dict:
         return _ue_error("get_asset_referencers", e)
 
 
+async def get_asset_references_batch(
+    asset_paths: list[str], direction: Literal["outgoing", "incoming", "both"] = "both"
+) -> dict:
+    """
+    Get references and/or referencers of many assets in one batched call (UE plugin required).
+
+    Args:
+        asset_paths: Asset package paths (e.g. `/Game/...`).
+        direction: 'outgoing' (references) | 'incoming' (referencers) | 'both'.
+
+    Returns:
+        A dict:
+        - ok: bool
+        - results: dict[str, dict] keyed by asset path, each with
+          `outgoing` and/or `incoming` lists (or `error`)
+        - count: int
+    """
+    endpoints: list[tuple[str, str, str]] = []
+    if direction in ("outgoing", "both"):
+        endpoints.append(("outgoing", "/asset/references", "references"))
+    if direction in ("incoming", "both"):
+        endpoints.append(("incoming", "/asset/referencers", "referencers"))
+
+    requests = [
+        (endpoint, {"asset_path": asset_path})
+        for asset_path in asset_paths
+        for _, endpoint, _ in endpoints
+    ]
+
+    client = get_client()
+    try:
+        responses = await client.batch(requests)
+    except UEPluginError as e:
+        return _ue_error("get_asset_references_batch", e)
+
+    results: dict[str, dict] = {}
+    it = iter(responses)
+    for asset_path in asset_paths:
+        entry = results.setdefault(asset_path, {})
+        for key, _, field in endpoints:
+            response = next(it)
+            if response.get("ok") is False:
+                entry["error"] = response.get("error", "request failed")
+            else:
+                entry[key] = response.get(field, [])
+
+    return {"ok": True, "results": results, "count": len(results)}
+
+
 async def get_asset_metadata(asset_path: str) -> dict:
     """
     Get basic metadata of an asset (UE plugin required).
@@ -92,6 +92,8 @@ async def search_cpp_code(
     include_comments: bool = True,
     scope: ScopeType = "project",
     max_results: int = 500,
+    query_mode: Literal["regex", "tokens", "smart", "ranked"] = "regex",
+    module: str | None = None,
 ) -> dict:
     """
     Search C++ source code (regex) (tree-sitter).
@@ -102,6 +104,9 @@ async def search_cpp_code(
         include_comments: Include matches in comment lines.
         scope: Search scope: `project` (default) | `engine` | `all`.
         max_results: Limit returned matches.
+        query_mode: `regex` (default) | `tokens` | `smart` | `ranked` (BM25 over
+            camelCase-split identifiers; definitions and UE-macro symbols first).
+        module: Only search these UE modules (comma-separated, from `*.Build.cs`).
 
     Returns:
         A dict:
@@ -112,7 +117,13 @@ async def search_cpp_code(
     """
     analyzer = get_analyzer()
     return await analyzer.search_code(
-        query, file_pattern, include_comments, scope=scope, max_results=max_results
+        query,
+        file_pattern,
+        include_comments,
+        scope=scope,
+        max_results=max_results,
+        query_mode=query_mode,
+        module=module,
     )
 
 
@@ -120,6 +131,7 @@ async def find_cpp_references(
     identifier: str,
     ref_type: Literal["class", "function", "variable"] | None = None,
     scope: ScopeType = "project",
+    module: str | None = None,
 ) -> dict:
     """
     Find references to a C++ identifier (best-effort) (tree-sitter/regex).
@@ -128,6 +140,7 @@ async def find_cpp_references(
         identifier: Identifier name.
         ref_type: Optional filter (currently best-effort; may be ignored).
         scope: Search scope: `project` (default) | `engine` | `all`.
+        module: Only search these UE modules (comma-separated, from `*.Build.cs`).
 
     Returns:
         A dict:
@@ -136,7 +149,7 @@ async def find_cpp_references(
         - scope: str
     """
     analyzer = get_analyzer()
-    return await analyzer.find_references(identifier, ref_type, scope=scope)
+    return await analyzer.find_references(identifier, ref_type, scope=scope, module=module)
 
 
 # ============================================================================
@@ -145,19 +158,53 @@ async def find_cpp_references(
 
 
 async def detect_ue_patterns(
-    file_path: Annotated[str, "C++ file path (.h/.cpp). Example: 'Source/MyGame/MyActor.h'"],
+    file_path: Annotated[
+        str,
+        "C++ file path (.h/.cpp). Example: 'Source/MyGame/MyActor.h'. "
+        "Leave empty to query the whole codebase with the filters below.",
+    ] = "",
     format: Annotated[
         Literal["detailed", "summary"],
         "Output format: 'detailed' (default) | 'summary' (Blueprint-exposed only).",
     ] = "detailed",
+    specifier: Annotated[
+        str | None,
+        "Codebase query: specifier name or name=value. "
+        "Example: 'BlueprintCallable', 'Category=Health'",
+    ] = None,
+    module: Annotated[
+        str | None, "Codebase query: module name(s), comma-separated (from *.Build.cs)"
+    ] = None,
+    class_name: Annotated[str | None, "Codebase query: owning class/struct name"] = None,
+    replicated: Annotated[
+        bool | None, "Codebase query: only replicated (true) / non-replicated (false)"
+    ] = None,
+    scope: Annotated[
+        Literal["project", "engine", "all"],
+        "Codebase query scope: 'project' (default) | 'engine' | 'all'.",
+    ] = "project",
+    max_results: Annotated[int, "Codebase query: maximum entries returned"] = 200,
 ) -> dict:
     """
     Detect UE macros (UPROPERTY/UFUNCTION/UCLASS) in a C++ file.
 
     Returns all UE patterns with specifiers, or a Blueprint-exposed summary.
+    Without file_path, queries a precomputed codebase-wide index instead
+    (e.g. every BlueprintCallable function of a module).
     """
     analyzer = get_analyzer()
 
+    if not file_path:
+        return await analyzer.query_exposure(
+            specifier=specifier,
+            module=module,
+            class_name=class_name,
+            replicated=replicated,
+            blueprint_exposed=True if format == "summary" else None,
+            scope=scope,
+            limit=max_results,
+        )
+
     if format == "summary":
         # Return Blueprint-exposed API summary
         return await analyzer.get_blueprint_exposure(file_path)
@@ -6,10 +6,11 @@ Only a minimal subset is exposed by the MCP server:
 - find_cpp_class_usage
 """
 
+import asyncio
 from pathlib import Path
 from typing import Annotated, Literal
 
-from ..ue_client import get_client
+from ..ue_client import get_client, get_snapshot
 from ..ue_client.http_client import UEPluginError
 
 
@@ -23,37 +24,25 @@ def _ue_error(tool: str, e: Exception) -> dict:
     }
 
 
-def _aggregate_cpp_references(
-    matches: list[dict], class_name: str, max_lines_per_file: int = 3
-) -> list[dict]:
+def _aggregate_cpp_references(files: list[dict], class_name: str) -> list[dict]:
     """
-    Aggregate C++ references by file, distinguishing definition from usage.
+    Label file-grouped C++ references, distinguishing definition from usage.
 
     Args:
-        matches: Raw matches from find_references.
+        files: File groups from CppAnalyzer.aggregate_references.
         class_name: The class being searched for (to detect definition file).
-        max_lines_per_file: Max individual lines to show per file.
 
     Returns:
         Aggregated reference list with file-level grouping.
     """
-    # Group by file
-    by_file: dict[str, list[dict]] = {}
-    for match in matches:
-        file_path = match.get("file", "")
-        if not file_path:
-            continue
-        if file_path not in by_file:
-            by_file[file_path] = []
-        by_file[file_path].append(match)
-
     aggregated = []
     # Strip common prefixes like 'U', 'A', 'F' for matching header files
     stripped_name = class_name
     if class_name and class_name[0] in ("U", "A", "F", "I", "E", "T", "S"):
         stripped_name = class_name[1:]
 
-    for file_path, file_matches in by_file.items():
+    for group in files:
+        file_path = group["file"]
         file_name = Path(file_path).name
         stem = Path(file_path).stem
 
@@ -64,29 +53,8 @@ def _aggregate_cpp_references(
         elif f"{stripped_name}.h" in file_name or f"{stripped_name}.cpp" in file_name:
             is_definition_file = True
 
-        # Sort by line number
-        file_matches.sort(key=lambda m: m.get("line", 0))
-
-        # Aggregate consecutive lines
-        line_ranges = []
-        current_start = None
-        current_end = None
-
-        for match in file_matches:
-            line = match.get("line", 0)
-            if current_start is None:
-                current_start = current_end = line
-            elif line <= current_end + 3:  # Within 3 lines = consecutive
-                current_end = line
-            else:
-                line_ranges.append((current_start, current_end))
-                current_start = current_end = line
-
-        if current_start is not None:
-            line_ranges.append((current_start, current_end))
-
-        # Build aggregated entry
-        total_matches = len(file_matches)
+        total_matches = group["match_count"]
+        line_ranges = [f"{s}-{e}" if s != e else str(s) for s, e in group["line_ranges"]]
 
         if is_definition_file:
             # For definition file, just show summary
@@ -95,29 +63,21 @@ def _aggregate_cpp_references(
                     "file": file_path,
                     "is_definition": True,
                     "match_count": total_matches,
-                    "line_ranges": [f"{s}-{e}" if s != e else str(s) for s, e in line_ranges],
+                    "line_ranges": line_ranges,
                     "note": f"Class definition file ({total_matches} references, likely self-references)",
                 }
             )
         else:
             # For usage files, show some sample lines
-            sample_lines = []
-            for match in file_matches[:max_lines_per_file]:
-                sample_lines.append(
-                    {
-                        "line": match.get("line"),
-                        "context": match.get("context", "").split("\n")[0][:100],
-                    }
-                )
-
+            sample_lines = group["sample_lines"]
             entry = {
                 "file": file_path,
                 "is_definition": False,
                 "match_count": total_matches,
-                "line_ranges": [f"{s}-{e}" if s != e else str(s) for s, e in line_ranges],
+                "line_ranges": line_ranges,
                 "sample_lines": sample_lines,
             }
-            if total_matches > max_lines_per_file:
+            if total_matches > len(sample_lines):
                 entry["truncated"] = True
 
             aggregated.append(entry)
@@ -138,8 +98,17 @@ async def trace_reference_chain(
         Literal["outgoing", "incoming", "both"],
         "Direction: 'outgoing' | 'incoming' | 'both' (default).",
     ] = "both",
+    include_soft_references: Annotated[
+        bool,
+        "Follow Blueprint CDO soft references too (default). False traces hard references "
+        "only, from the local graph or asset snapshot (much faster).",
+    ] = True,
 ) -> dict:
-    """Trace a cross-domain reference chain (UE plugin required)."""
+    """Trace a cross-domain reference chain (UE plugin required).
+
+    Soft references are only known to the editor. Hard-reference-only results (local
+    graph, snapshot) carry `includes_soft_references: False`.
+    """
     # Map unified direction names to UE plugin's expected values
     ue_direction = {
         "outgoing": "references",
@@ -148,13 +117,27 @@ async def trace_reference_chain(
     }.get(direction, "both")
 
     client = get_client()
+    snapshot = get_snapshot()
     try:
-        return await client.get_with_async(
+        if not include_soft_references:
+            if snapshot is not None:
+                return snapshot.trace(start_asset, max_depth, ue_direction)
+            # Hard references are traversed locally; only unseen nodes hit the editor.
+            return await client.dependency_graph.trace(start_asset, max_depth, ue_direction)
+
+        result = await client.get_with_async(
             "/analysis/reference-chain",
             {"start": start_asset, "depth": max_depth, "direction": ue_direction},
             timeout_s=120.0,
         )
+        result.setdefault("includes_soft_references", True)
+        return result
     except UEPluginError as e:
+        if snapshot is not None and include_soft_references:
+            # Editor offline: the snapshot still has the hard references (flagged as such)
+            result = snapshot.trace(start_asset, max_depth, ue_direction)
+            result["warning"] = f"Soft references unavailable (editor not reachable): {e}"
+            return result
         return _ue_error("trace_reference_chain", e)
 
 
@@ -167,31 +150,39 @@ async def find_cpp_class_usage(
     max_results: Annotated[int, "Max C++ matches to return (default: 200)."] = 200,
 ) -> dict:
     """Find usage of a C++ class across Blueprint/Asset and C++ code."""
-    client = get_client()
-    try:
-        bp_result = await client.get("/analysis/cpp-class-usage", {"class": cpp_class})
+    from ..cpp_analyzer import get_analyzer
 
+    async def cpp_half() -> dict:
         # Always include C++ references with aggregation
         try:
-            from ..cpp_analyzer import get_analyzer
-
             analyzer = get_analyzer()
-            cpp_result = await analyzer.find_references(cpp_class, scope=scope)
-            raw_matches = cpp_result.get("matches", [])[:max_results]
-            total_count = cpp_result.get("count", len(raw_matches))
+            cpp_result = await analyzer.aggregate_references(
+                cpp_class, scope=scope, max_results=max_results
+            )
+            total_count = cpp_result["total_count"]
 
             # Always aggregate by file
-            aggregated = _aggregate_cpp_references(raw_matches, cpp_class)
-            bp_result["cpp_references"] = aggregated
-            bp_result["cpp_reference_count"] = total_count
-            bp_result["cpp_files_with_references"] = len(aggregated)
-            bp_result["cpp_reference_truncated"] = total_count > len(raw_matches)
+            aggregated = _aggregate_cpp_references(cpp_result["files"], cpp_class)
+            return {
+                "cpp_references": aggregated,
+                "cpp_reference_count": total_count,
+                "cpp_files_with_references": cpp_result["file_count"],
+                "cpp_reference_truncated": cpp_result["truncated"],
+            }
         except Exception as e:
-            bp_result["cpp_references"] = []
-            bp_result["cpp_reference_count"] = 0
-            bp_result["cpp_error"] = str(e)
+            return {"cpp_references": [], "cpp_reference_count": 0, "cpp_error": str(e)}
 
+    client = get_client()
+    # The editor query and the C++ scan are independent: run them concurrently.
+    cpp_task = asyncio.ensure_future(cpp_half())
+    try:
+        try:
+            bp_result = await client.get("/analysis/cpp-class-usage", {"class": cpp_class})
+        except UEPluginError as e:
+            return _ue_error("find_cpp_class_usage", e)
+        bp_result.update(await cpp_task)
         return bp_result
-    except UEPluginError as e:
-        return _ue_error("find_cpp_class_usage", e)
-
+    finally:
+        # Editor error, other failure or cancellation: nobody waits for the C++ scan
+        if not cpp_task.done():
+            cpp_task.cancel()
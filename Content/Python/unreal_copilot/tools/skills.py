@@ -5,6 +5,7 @@ import json
 from typing import Any, Dict, Optional
 
 from ..skills.runner import SkillRunner
+from ..ue_client import get_client
 
 _runner = SkillRunner()
 
@@ -34,18 +35,31 @@ def run_unreal_skill(
         normalized_args = _normalize_args(args)
 
         if python is not None and python.strip():
-            return _runner.run_inline_python(python_code=python, args=normalized_args)
+            try:
+                return _runner.run_inline_python(python_code=python, args=normalized_args)
+            finally:
+                _invalidate_ue_cache()
 
         if not skill_name:
             return {"ok": False, "error": "skill_name is required when running a skill script"}
         if not script:
             return {"ok": False, "error": "script is required when running a skill script"}
 
-        return _runner.run_script(skill_name=skill_name, script=script, args=normalized_args)
+        try:
+            return _runner.run_script(skill_name=skill_name, script=script, args=normalized_args)
+        finally:
+            _invalidate_ue_cache()
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
 
 
+def _invalidate_ue_cache() -> None:
+    # Skill runs may mutate assets (CppSkillApiSubsystem): not only the ones named in the
+    # args, but everything under a folder argument, assets found by a search, or renamed
+    # and deleted ones. Any cached UE plugin response may be stale, so drop them all.
+    get_client().invalidate_cache()
+
+
 def _normalize_args(args: Optional[Dict[str, Any] | str]) -> Optional[Dict[str, Any]]:
     if args is None:
         return None
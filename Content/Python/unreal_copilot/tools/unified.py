@@ -13,11 +13,15 @@ Therefore:
 
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from typing import Annotated, Literal
 
+from ..config import get_config
 from ..cpp_analyzer import get_analyzer
-from ..ue_client import get_client
+from ..deadline import Deadline, DeadlineExceeded, deadline_scope
+from ..ue_client import BLUEPRINT_TYPES, get_client, get_snapshot
 from ..ue_client.http_client import UEPluginError
+from ..ue_client.name_table import NameTable
 
 # Type aliases (plugin scope searches only plugin directories/assets)
 ScopeType = Literal["project", "engine", "plugin", "all"]
@@ -66,6 +70,39 @@ def _ue_error(tool: str, e: Exception) -> dict:
     }
 
 
+def _deadline(timeout_s: float | None) -> AbstractContextManager[Deadline]:
+    """
+    Deadline scope of one tool call.
+
+    Args:
+        timeout_s: Time budget in seconds (None: TOOL_TIMEOUT_S; 0: no limit).
+
+    Returns:
+        Context manager yielding the call's Deadline.
+    """
+    return deadline_scope(get_config().tool_timeout_s if timeout_s is None else timeout_s)
+
+
+def _timeout_error(tool: str, e: Exception) -> dict:
+    """
+    Build the payload of a tool call whose deadline passed before any result.
+
+    Args:
+        tool: Tool name.
+        e: DeadlineExceeded.
+
+    Returns:
+        A dict with ok/error_code/timed_out/detail/suggestions.
+    """
+    return {
+        "ok": False,
+        "error_code": "timed_out",
+        "timed_out": True,
+        "detail": f"{tool}: {e}",
+        "suggestions": ["Retry with a larger timeout_s, or narrow the scope/module."],
+    }
+
+
 def _split_query_tokens(query: str) -> list[str]:
     """
     Split a user query into whitespace-separated tokens.
@@ -79,21 +116,28 @@ def _split_query_tokens(query: str) -> list[str]:
     return [t for t in query.strip().split() if t]
 
 
-def _score_name_tokens(name: str, tokens: list[str]) -> int:
+def _rank_matches(matches: list[dict], tokens: list[str], limit: int) -> list[dict]:
     """
-    Score a name by how many tokens appear in it (case-insensitive).
+    Rank name matches by how many tokens each name contains (case-insensitive).
+
+    Names are packed into one NameTable, so every token is a single scan and the
+    top-k is selected with a heap instead of scoring and sorting the full list.
 
     Args:
-        name: Candidate name.
-        tokens: Tokens to match.
+        matches: Candidate matches with a `name` field.
+        tokens: Tokens (substrings or UE wildcards) to match.
+        limit: Number of matches to keep.
 
     Returns:
-        Integer score (higher is more relevant).
+        Best matches first, each with a `relevance_score`.
     """
-    if not name or not tokens:
-        return 0
-    lower = name.lower()
-    return sum(1 for t in tokens if t.lower() in lower)
+    table = NameTable(str(m.get("name", "")) for m in matches)
+    ranked = []
+    for row, score in table.top_k(tokens, limit):
+        match = matches[row]
+        match["relevance_score"] = score
+        ranked.append(match)
+    return ranked
 
 
 async def search(
@@ -122,6 +166,21 @@ async def search(
         ),
     ] = "",
     max_results: Annotated[int, "Max results per domain (default: 100)"] = 100,
+    query_mode: Annotated[
+        Literal["smart", "ranked"],
+        (
+            "C++ matching: 'smart' (default; regex or substring tokens) | 'ranked' "
+            "(BM25 relevance over camelCase-split identifiers, definitions first)."
+        ),
+    ] = "smart",
+    module: Annotated[
+        str | None,
+        "C++ only: restrict to UE module(s), comma-separated (from *.Build.cs).",
+    ] = None,
+    timeout_s: Annotated[
+        float | None,
+        "Time budget in seconds; partial results are flagged timed_out (default: server).",
+    ] = None,
 ) -> dict:
     """
     Unified search across C++, Blueprint, and Asset domains.
@@ -135,173 +194,211 @@ async def search(
         - total_count: int
         - cpp_matches / blueprint_matches / asset_matches (if searched)
     """
-    # Resolve domains to search
-    if domain == "all":
-        resolved_domains: list[Literal["cpp", "blueprint", "asset"]] = ["cpp", "blueprint", "asset"]
-    elif domain in ("cpp", "blueprint", "asset"):
-        resolved_domains = [domain]
-    else:
-        resolved_domains = ["cpp", "blueprint", "asset"]
-
-    results = {
-        "query": query,
-        "scope": scope,
-        "domains_searched": resolved_domains,
-        "total_count": 0,
-        "ok": True,
-        "errors": [],
-    }
-
-    # C++ search
-    if "cpp" in resolved_domains:
-        try:
-            analyzer = get_analyzer()
-            cpp_result = await analyzer.search_code(
-                query,
-                "*.{h,cpp}",  # Default file pattern
-                True,  # Always include comments
-                scope=scope,
-                max_results=max_results,
-                query_mode="smart",  # Always smart mode
-            )
-            results["cpp_matches"] = cpp_result.get("matches", [])
-            results["cpp_count"] = cpp_result.get("count", 0)
-            results["cpp_truncated"] = cpp_result.get("truncated", False)
-            results["total_count"] += results["cpp_count"]
-        except Exception as e:
-            results["cpp_matches"] = []
-            results["cpp_count"] = 0
-            results["cpp_error"] = str(e)
-            results["ok"] = False
-            results["errors"].append({"domain": "cpp", "error": str(e)})
-
-    # Blueprint search (requires UE Plugin)
-    if "blueprint" in resolved_domains:
-        try:
-            client = get_client()
-            tokens = _split_query_tokens(query)
-            patterns = tokens if tokens else [query]
-
-            merged: dict[str, dict] = {}
-            for pat in patterns:
-                # Pass scope to UE plugin for server-side filtering
-                bp_result = await client.get(
-                    "/blueprint/search",
-                    {"pattern": pat, "class": type_filter, "scope": scope},
-                )
-                for m in bp_result.get("matches", []):
-                    path = str(m.get("path", ""))
-                    if path:
-                        merged[path] = m
-
-            matches = list(merged.values())
-
-            # Apply scope filter (client-side fallback for older UE plugin versions)
-            if scope == "project":
-                # Project: /Game/ assets + plugin assets (not /Script/ or /Engine/)
-                matches = [
-                    m for m in matches
-                    if not m.get("path", "").startswith("/Script/")
-                    and not m.get("path", "").startswith("/Engine/")
-                ]
-            elif scope == "engine":
-                # Engine: /Script/ and /Engine/ assets
-                matches = [
-                    m for m in matches
-                    if m.get("path", "").startswith("/Script/")
-                    or m.get("path", "").startswith("/Engine/")
-                ]
-            elif scope == "plugin":
-                # Plugin: only plugin assets (not /Game/, /Engine/, /Script/)
-                matches = [m for m in matches if _is_plugin_asset_path(m.get("path", ""))]
-            # scope == "all": no filtering
-
-            # Score & sort for multi-token queries
-            if len(patterns) > 1:
-                for m in matches:
-                    m["relevance_score"] = _score_name_tokens(str(m.get("name", "")), patterns)
-                matches.sort(key=lambda x: int(x.get("relevance_score", 0)), reverse=True)
-
-            results["blueprint_matches"] = matches[:max_results]
-            results["blueprint_count"] = len(results["blueprint_matches"])
-            results["total_count"] += results["blueprint_count"]
-        except UEPluginError as e:
-            results["blueprint_matches"] = []
-            results["blueprint_count"] = 0
-            results["blueprint_error"] = str(e)
-            results["ok"] = False
-            results["errors"].append({"domain": "blueprint", "error": str(e)})
-        except Exception as e:
-            results["blueprint_matches"] = []
-            results["blueprint_count"] = 0
-            results["blueprint_error"] = str(e)
-            results["ok"] = False
-            results["errors"].append({"domain": "blueprint", "error": str(e)})
-
-    # Asset search (requires UE Plugin)
-    if "asset" in resolved_domains:
-        try:
-            client = get_client()
-            tokens = _split_query_tokens(query)
-            patterns = tokens if tokens else [query]
-
-            merged: dict[str, dict] = {}
-            for pat in patterns:
-                # Pass scope to UE plugin for server-side filtering
-                asset_result = await client.get(
-                    "/asset/search",
-                    {"pattern": pat, "type": type_filter, "scope": scope},
+    with _deadline(timeout_s) as deadline:
+        # Resolve domains to search
+        if domain == "all":
+            resolved_domains: list[Literal["cpp", "blueprint", "asset"]] = [
+                "cpp",
+                "blueprint",
+                "asset",
+            ]
+        elif domain in ("cpp", "blueprint", "asset"):
+            resolved_domains = [domain]
+        else:
+            resolved_domains = ["cpp", "blueprint", "asset"]
+
+        results = {
+            "query": query,
+            "scope": scope,
+            "domains_searched": resolved_domains,
+            "total_count": 0,
+            "ok": True,
+            "timed_out": False,
+            "errors": [],
+        }
+
+        # C++ search
+        if "cpp" in resolved_domains:
+            try:
+                analyzer = get_analyzer()
+                cpp_result = await analyzer.search_code(
+                    query,
+                    "*.{h,cpp}",  # Default file pattern
+                    True,  # Always include comments
+                    scope=scope,
+                    max_results=max_results,
+                    query_mode=query_mode,
+                    module=module,
                 )
-                for m in asset_result.get("matches", []):
-                    path = str(m.get("path", ""))
-                    if path:
-                        merged[path] = m
-
-            matches = list(merged.values())
-
-            # Apply scope filter (client-side fallback for older UE plugin versions)
-            if scope == "project":
-                # Project: /Game/ assets + plugin assets (not /Script/ or /Engine/)
-                matches = [
-                    m for m in matches
-                    if not m.get("path", "").startswith("/Script/")
-                    and not m.get("path", "").startswith("/Engine/")
-                ]
-            elif scope == "engine":
-                # Engine: /Script/ and /Engine/ assets
-                matches = [
-                    m for m in matches
-                    if m.get("path", "").startswith("/Script/")
-                    or m.get("path", "").startswith("/Engine/")
-                ]
-            elif scope == "plugin":
-                # Plugin: only plugin assets (not /Game/, /Engine/, /Script/)
-                matches = [m for m in matches if _is_plugin_asset_path(m.get("path", ""))]
-            # scope == "all": no filtering
-
-            # Score & sort for multi-token queries
-            if len(patterns) > 1:
-                for m in matches:
-                    m["relevance_score"] = _score_name_tokens(str(m.get("name", "")), patterns)
-                matches.sort(key=lambda x: int(x.get("relevance_score", 0)), reverse=True)
-
-            results["asset_matches"] = matches[:max_results]
-            results["asset_count"] = len(results["asset_matches"])
-            results["total_count"] += results["asset_count"]
-        except UEPluginError as e:
-            results["asset_matches"] = []
-            results["asset_count"] = 0
-            results["asset_error"] = str(e)
-            results["ok"] = False
-            results["errors"].append({"domain": "asset", "error": str(e)})
-        except Exception as e:
-            results["asset_matches"] = []
-            results["asset_count"] = 0
-            results["asset_error"] = str(e)
-            results["ok"] = False
-            results["errors"].append({"domain": "asset", "error": str(e)})
+                results["cpp_matches"] = cpp_result.get("matches", [])
+                results["cpp_count"] = cpp_result.get("count", 0)
+                results["cpp_truncated"] = cpp_result.get("truncated", False)
+                results["timed_out"] = bool(cpp_result.get("timed_out"))
+                results["total_count"] += results["cpp_count"]
+            except Exception as e:
+                results["cpp_matches"] = []
+                results["cpp_count"] = 0
+                results["cpp_error"] = str(e)
+                results["ok"] = False
+                results["errors"].append({"domain": "cpp", "error": str(e)})
+
+        # Blueprint search (requires UE Plugin)
+        if "blueprint" in resolved_domains:
+            try:
+                client = get_client()
+                tokens = _split_query_tokens(query)
+                patterns = tokens if tokens else [query]
+
+                snapshot = get_snapshot()
+                if snapshot is not None and not type_filter and len(patterns) > 1:
+                    # Offline snapshot: rank all tokens in one pass over the packed name table.
+                    matches = snapshot.rank(
+                        patterns, BLUEPRINT_TYPES, scope=scope, k=max_results
+                    )
+                else:
+                    merged: dict[str, dict] = {}
+                    for pat in patterns:
+                        if deadline.expired():
+                            # Keep the matches of the patterns searched so far
+                            results["timed_out"] = True
+                            break
+                        # Pass scope to UE plugin for server-side filtering
+                        bp_result = await client.get(
+                            "/blueprint/search",
+                            {"pattern": pat, "class": type_filter, "scope": scope},
+                        )
+                        for m in bp_result.get("matches", []):
+                            path = str(m.get("path", ""))
+                            if path:
+                                merged[path] = m
+
+                    matches = list(merged.values())
+
+                    # Apply scope filter (client-side fallback for older UE plugin versions)
+                    if scope == "project":
+                        # Project: /Game/ assets + plugin assets (not /Script/ or /Engine/)
+                        matches = [
+                            m for m in matches
+                            if not m.get("path", "").startswith("/Script/")
+                            and not m.get("path", "").startswith("/Engine/")
+                        ]
+                    elif scope == "engine":
+                        # Engine: /Script/ and /Engine/ assets
+                        matches = [
+                            m for m in matches
+                            if m.get("path", "").startswith("/Script/")
+                            or m.get("path", "").startswith("/Engine/")
+                        ]
+                    elif scope == "plugin":
+                        # Plugin: only plugin assets (not /Game/, /Engine/, /Script/)
+                        matches = [m for m in matches if _is_plugin_asset_path(m.get("path", ""))]
+                    # scope == "all": no filtering
+
+                    # Score & rank for multi-token queries
+                    if len(patterns) > 1:
+                        matches = _rank_matches(matches, patterns, max_results)
+
+                results["blueprint_matches"] = matches[:max_results]
+                results["blueprint_count"] = len(results["blueprint_matches"])
+                results["total_count"] += results["blueprint_count"]
+            except DeadlineExceeded as e:
+                results["blueprint_matches"] = []
+                results["blueprint_count"] = 0
+                results["blueprint_error"] = str(e)
+                results["ok"] = False
+                results["timed_out"] = True
+                results["errors"].append({"domain": "blueprint", "error": str(e)})
+            except UEPluginError as e:
+                results["blueprint_matches"] = []
+                results["blueprint_count"] = 0
+                results["blueprint_error"] = str(e)
+                results["ok"] = False
+                results["errors"].append({"domain": "blueprint", "error": str(e)})
+            except Exception as e:
+                results["blueprint_matches"] = []
+                results["blueprint_count"] = 0
+                results["blueprint_error"] = str(e)
+                results["ok"] = False
+                results["errors"].append({"domain": "blueprint", "error": str(e)})
+
+        # Asset search (requires UE Plugin)
+        if "asset" in resolved_domains:
+            try:
+                client = get_client()
+                tokens = _split_query_tokens(query)
+                patterns = tokens if tokens else [query]
+
+                snapshot = get_snapshot()
+                if snapshot is not None and len(patterns) > 1:
+                    # Offline snapshot: rank all tokens in one pass over the packed name table.
+                    matches = snapshot.rank(patterns, type_filter, scope=scope, k=max_results)
+                else:
+                    merged: dict[str, dict] = {}
+                    for pat in patterns:
+                        if deadline.expired():
+                            # Keep the matches of the patterns searched so far
+                            results["timed_out"] = True
+                            break
+                        # Pass scope to UE plugin for server-side filtering
+                        asset_result = await client.get(
+                            "/asset/search",
+                            {"pattern": pat, "type": type_filter, "scope": scope},
+                        )
+                        for m in asset_result.get("matches", []):
+                            path = str(m.get("path", ""))
+                            if path:
+                                merged[path] = m
+
+                    matches = list(merged.values())
+
+                    # Apply scope filter (client-side fallback for older UE plugin versions)
+                    if scope == "project":
+                        # Project: /Game/ assets + plugin assets (not /Script/ or /Engine/)
+                        matches = [
+                            m for m in matches
+                            if not m.get("path", "").startswith("/Script/")
+                            and not m.get("path", "").startswith("/Engine/")
+                        ]
+                    elif scope == "engine":
+                        # Engine: /Script/ and /Engine/ assets
+                        matches = [
+                            m for m in matches
+                            if m.get("path", "").startswith("/Script/")
+                            or m.get("path", "").startswith("/Engine/")
+                        ]
+                    elif scope == "plugin":
+                        # Plugin: only plugin assets (not /Game/, /Engine/, /Script/)
+                        matches = [m for m in matches if _is_plugin_asset_path(m.get("path", ""))]
+                    # scope == "all": no filtering
+
+                    # Score & rank for multi-token queries
+                    if len(patterns) > 1:
+                        matches = _rank_matches(matches, patterns, max_results)
+
+                results["asset_matches"] = matches[:max_results]
+                results["asset_count"] = len(results["asset_matches"])
+                results["total_count"] += results["asset_count"]
+            except DeadlineExceeded as e:
+                results["asset_matches"] = []
+                results["asset_count"] = 0
+                results["asset_error"] = str(e)
+                results["ok"] = False
+                results["timed_out"] = True
+                results["errors"].append({"domain": "asset", "error": str(e)})
+            except UEPluginError as e:
+                results["asset_matches"] = []
+                results["asset_count"] = 0
+                results["asset_error"] = str(e)
+                results["ok"] = False
+                results["errors"].append({"domain": "asset", "error": str(e)})
+            except Exception as e:
+                results["asset_matches"] = []
+                results["asset_count"] = 0
+                results["asset_error"] = str(e)
+                results["ok"] = False
+                results["errors"].append({"domain": "asset", "error": str(e)})
 
-    return results
+        return results
 
 
 async def get_hierarchy(
@@ -320,25 +417,33 @@ async def get_hierarchy(
         ScopeType,
         "C++ search scope: 'project' (default) | 'engine' | 'plugin' | 'all'.",
     ] = "project",
+    timeout_s: Annotated[
+        float | None,
+        "Time budget in seconds; partial results are flagged timed_out (default: server).",
+    ] = None,
 ) -> dict:
     """Get inheritance hierarchy for a class (C++ or Blueprint)."""
-    if domain == "cpp":
-        analyzer = get_analyzer()
-        return await analyzer.find_class_hierarchy(name, True, scope=scope)  # Always include interfaces
-    else:
-        try:
-            client = get_client()
-            return await client.get("/blueprint/hierarchy", {"bp_path": name})
-        except UEPluginError as e:
-            return _ue_error("get_hierarchy", e)
+    with _deadline(timeout_s):
+        if domain == "cpp":
+            analyzer = get_analyzer()
+            # Always include interfaces
+            return await analyzer.find_class_hierarchy(name, True, scope=scope)
+        else:
+            try:
+                client = get_client()
+                return await client.get("/blueprint/hierarchy", {"bp_path": name})
+            except DeadlineExceeded as e:
+                return _timeout_error("get_hierarchy", e)
+            except UEPluginError as e:
+                return _ue_error("get_hierarchy", e)
 
 
 async def get_references(
     path: Annotated[
         str,
         (
-            "Identifier or asset path.\n"
-            "Examples: 'ULyraHealthComponent', '/Game/BP_Player'"
+            "Identifier, C++ file or asset path.\n"
+            "Examples: 'ULyraHealthComponent', 'GameFramework/Actor.h', '/Game/BP_Player'"
         ),
     ],
     domain: Annotated[
@@ -353,52 +458,111 @@ async def get_references(
         Literal["outgoing", "incoming", "both"],
         "Direction: 'outgoing' | 'incoming' | 'both' (default).",
     ] = "both",
+    module: Annotated[
+        str | None,
+        "C++ only: restrict to UE module(s), comma-separated (from *.Build.cs).",
+    ] = None,
+    depth: Annotated[
+        int,
+        "C++ functions only: call-graph hops for callers/callees (default 1).",
+    ] = 1,
+    include_calls: Annotated[
+        bool | None,
+        "C++ identifiers only: add callers/callees from the call graph. Default: only "
+        "when the name has an out-of-line function definition (the graph is parsed on "
+        "first use); set it for free or inline functions.",
+    ] = None,
+    timeout_s: Annotated[
+        float | None,
+        "Time budget in seconds; partial results are flagged timed_out (default: server).",
+    ] = None,
 ) -> dict:
     """
     Get references for an item (outgoing/incoming/both).
-    """
-    results = {
-        "path": path,
-        "domain": domain,
-        "direction": direction,
-    }
 
-    if domain == "cpp":
-        # For C++, use identifier search
-        analyzer = get_analyzer()
-        if direction in ("incoming", "both"):
-            refs = await analyzer.find_references(path, scope=scope)
-            results["references"] = refs.get("matches", [])
-            results["reference_count"] = refs.get("count", 0)
-        results["ok"] = True
-        return results
-
-    # Blueprint/Asset use UE Plugin
-    try:
-        client = get_client()
-        param_key = "bp_path" if domain == "blueprint" else "asset_path"
-
-        if direction in ("outgoing", "both"):
-            endpoint = f"/{domain}/references" if domain == "asset" else f"/{domain}/dependencies"
-            out_result = await client.get(endpoint, {param_key: path})
-            results["outgoing"] = out_result.get("dependencies", out_result.get("references", []))
+    For a C++ file (.h/.cpp), references are includes: incoming lists the files that
+    include it (transitively, with an impact summary), outgoing the files it includes.
+    For a C++ function (`ApplyDamage`, `AFoo::BeginPlay`), incoming adds its callers and
+    outgoing lists its callees, from the static call graph. Names without an out-of-line
+    function definition (classes, variables) skip the call graph unless `include_calls`
+    is set.
+    """
+    with _deadline(timeout_s):
+        results = {
+            "path": path,
+            "domain": domain,
+            "direction": direction,
+        }
+
+        if domain == "cpp":
+            analyzer = get_analyzer()
+            if path.lower().strip().endswith((".h", ".hpp", ".inl", ".cpp", ".cc", ".cxx")):
+                # For C++ files, use the include graph
+                graph = await analyzer.get_include_graph(path, direction=direction, scope=scope)
+                results.update(graph)
+                results["ok"] = bool(graph.get("found"))
+                return results
+            # For C++ identifiers, use identifier search
+            if direction in ("incoming", "both"):
+                refs = await analyzer.find_references(path, scope=scope, module=module)
+                results["references"] = refs.get("matches", [])
+                results["reference_count"] = refs.get("count", 0)
+                results["timed_out"] = bool(refs.get("timed_out"))
+            # ...and the call graph when the identifier is a function
+            if include_calls is None:
+                include_calls = await analyzer.has_function_definition(path, scope=scope)
+            if include_calls:
+                calls = await analyzer.get_call_graph(
+                    path, direction=direction, depth=depth, scope=scope
+                )
+                for key in ("callers", "caller_count", "callees", "callee_count"):
+                    if key in calls:
+                        results[key] = calls[key]
+                results["timed_out"] = results.get("timed_out") or bool(calls.get("timed_out"))
+            results["ok"] = True
+            return results
+
+        # Blueprint/Asset use UE Plugin (both directions share one batched round-trip)
+        try:
+            client = get_client()
+            param_key = "bp_path" if domain == "blueprint" else "asset_path"
 
-        if direction in ("incoming", "both"):
-            in_result = await client.get(f"/{domain}/referencers", {param_key: path})
-            results["incoming"] = in_result.get("referencers", [])
+            queries: list[tuple[str, str]] = []
+            if direction in ("outgoing", "both"):
+                endpoint = (
+                    f"/{domain}/references" if domain == "asset" else f"/{domain}/dependencies"
+                )
+                queries.append(("outgoing", endpoint))
+            if direction in ("incoming", "both"):
+                queries.append(("incoming", f"/{domain}/referencers"))
 
-        results["ok"] = True
-        return results
-    except UEPluginError as e:
-        return _ue_error("get_references", e)
+            responses = await client.batch(
+                [(endpoint, {param_key: path}) for _, endpoint in queries]
+            )
+            for (key, _), response in zip(queries, responses):
+                if response.get("ok") is False:
+                    raise UEPluginError(str(response.get("error", "request failed")))
+                if key == "outgoing":
+                    results["outgoing"] = response.get(
+                        "dependencies", response.get("references", [])
+                    )
+                else:
+                    results["incoming"] = response.get("referencers", [])
+
+            results["ok"] = True
+            return results
+        except DeadlineExceeded as e:
+            return _timeout_error("get_references", e)
+        except UEPluginError as e:
+            return _ue_error("get_references", e)
 
 
 async def get_details(
     path: Annotated[
         str,
         (
-            "C++ class/file OR Blueprint/Asset path.\n"
-            "Examples: 'ULyraHealthComponent', '/Game/BP_Player'"
+            "C++ class/file/`Class::Method` OR Blueprint/Asset path.\n"
+            "Examples: 'ULyraHealthComponent', 'ALyraCharacter::BeginPlay', '/Game/BP_Player'"
         ),
     ],
     domain: Annotated[
@@ -409,59 +573,102 @@ async def get_details(
         ScopeType,
         "C++ search scope: 'project' (default) | 'engine' | 'plugin' | 'all'.",
     ] = "project",
+    timeout_s: Annotated[
+        float | None,
+        "Time budget in seconds; partial results are flagged timed_out (default: server).",
+    ] = None,
 ) -> dict:
     """
     Get detailed information about an item.
     """
-    if domain == "cpp":
-        analyzer = get_analyzer()
+    with _deadline(timeout_s):
+        if domain == "cpp":
+            analyzer = get_analyzer()
 
-        # If user passed a file path, return file-oriented analysis instead of "Class not found".
-        lowered = path.lower().strip()
-        if lowered.endswith((".h", ".hpp", ".cpp", ".cc", ".cxx")):
-            try:
+            # A file path gets file-oriented analysis instead of "Class not found".
+            lowered = path.lower().strip()
+            if lowered.endswith((".h", ".hpp", ".cpp", ".cc", ".cxx")):
+                try:
+                    return {
+                        "type": "cpp_file",
+                        "ok": True,
+                        "result": await analyzer.analyze_file(path),
+                    }
+                except Exception as e:
+                    return {
+                        "ok": False,
+                        "error_code": "cpp_file_analyze_failed",
+                        "detail": str(e),
+                        "suggestions": [
+                            "Check that the file exists and is readable.",
+                            (
+                                "If you meant a class name, pass it as "
+                                "get_details(path='ULyraHealthComponent', domain='cpp')."
+                            ),
+                        ],
+                    }
+
+            # `Class::Method`: go to the out-of-line implementation(s).
+            if "::" in path:
+                try:
+                    result = await analyzer.find_implementation(path, scope=scope)
+                except Exception as e:
+                    result = {"count": 0, "error": str(e)}
+                if result.get("count"):
+                    return {"type": "cpp_implementation", "ok": True, "result": result}
                 return {
-                    "type": "cpp_file",
-                    "ok": True,
-                    "result": await analyzer.analyze_file(path),
+                    "ok": False,
+                    "error_code": "cpp_implementation_not_found",
+                    "detail": result.get("error", f"No out-of-line definition of {path}"),
+                    "declarations": result.get("declarations", []),
+                    "suggestions": [
+                        "The method may be defined inline in its header; "
+                        "use get_details on the class name to see its declaration.",
+                    ],
                 }
+
+            # Otherwise treat as a class name.
+            try:
+                return await analyzer.analyze_class(path, scope=scope)
+            except DeadlineExceeded as e:
+                return _timeout_error("get_details", e)
             except Exception as e:
-                return {
+                error = {
                     "ok": False,
-                    "error_code": "cpp_file_analyze_failed",
+                    "error_code": "cpp_class_not_found",
                     "detail": str(e),
                     "suggestions": [
-                        "Check that the file exists and is readable.",
-                        (
-                            "If you meant a class name, pass it as "
-                            "get_details(path='ULyraHealthComponent', domain='cpp')."
-                        ),
+                        "If you passed a file path, set domain='cpp' and pass a .h/.cpp path.",
                     ],
                 }
+                # Partial or misspelled names: offer ranked candidates from the symbol index.
+                try:
+                    candidates = (await analyzer.find_symbols(path, scope=scope, limit=5))[
+                        "candidates"
+                    ]
+                except Exception:
+                    candidates = []
+                if candidates:
+                    error["candidates"] = candidates
+                    error["suggestions"].append(
+                        f"Did you mean '{candidates[0]['name']}'? "
+                        "Retry get_details with one of the candidate names."
+                    )
+                else:
+                    error["suggestions"].append(
+                        "Try search(query='LyraHealthComponent', domain='cpp', "
+                        "scope='project') to find candidates."
+                    )
+                return error
 
-        # Otherwise treat as a class name.
         try:
-            return await analyzer.analyze_class(path, scope=scope)
-        except Exception as e:
-            return {
-                "ok": False,
-                "error_code": "cpp_class_not_found",
-                "detail": str(e),
-                "suggestions": [
-                    "If you passed a file path, set domain='cpp' and pass a .h/.cpp path.",
-                    (
-                        "Try search(query='LyraHealthComponent', domain='cpp', scope='project') "
-                        "to find candidates."
-                    ),
-                ],
-            }
-
-    try:
-        client = get_client()
-        if domain == "blueprint":
-            return await client.get("/blueprint/details", {"bp_path": path})
-        else:  # asset
-            return await client.get("/asset/metadata", {"asset_path": path})
-    except UEPluginError as e:
-        return _ue_error("get_details", e)
+            client = get_client()
+            if domain == "blueprint":
+                return await client.get("/blueprint/details", {"bp_path": path})
+            else:  # asset
+                return await client.get("/asset/metadata", {"asset_path": path})
+        except DeadlineExceeded as e:
+            return _timeout_error("get_details", e)
+        except UEPluginError as e:
+            return _ue_error("get_details", e)
 
@@ -4,7 +4,24 @@ Unreal Plugin HTTP Client.
 Provides communication with the UnrealCopilot plugin running in the Editor.
 """
 
+from .cache import ResponseCache
 from .http_client import UEPluginClient, get_client
+from .snapshot import (
+    BLUEPRINT_TYPES,
+    AssetSnapshot,
+    export_snapshot,
+    get_snapshot,
+    set_snapshot,
+)
 
-__all__ = ["UEPluginClient", "get_client"]
+__all__ = [
+    "UEPluginClient",
+    "ResponseCache",
+    "AssetSnapshot",
+    "BLUEPRINT_TYPES",
+    "get_client",
+    "get_snapshot",
+    "set_snapshot",
+    "export_snapshot",
+]
 
@@ -0,0 +1,144 @@
+"""
+Response cache for Unreal Plugin GET endpoints.
+
+Blueprint/Asset queries make the editor load and re-serialize assets on the game thread,
+and agents tend to repeat the same query many times per session. The cache keeps recent
+responses keyed by (path, params) with TTL + LRU eviction.
+
+Invalidation:
+- `invalidate(asset_path)` drops every entry whose query params name that asset, plus all
+  relationship entries (references/referencers/dependencies), which may list it.
+- `clear()` drops everything.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Query params that carry an asset path.
+ASSET_PARAM_KEYS = ("bp_path", "asset_path", "start")
+
+# Endpoints whose responses list *other* assets, so any asset change may affect them.
+RELATIONSHIP_PATHS = frozenset(
+    {
+        "/blueprint/dependencies",
+        "/blueprint/referencers",
+        "/blueprint/soft-references",
+        "/asset/references",
+        "/asset/referencers",
+        "/analysis/reference-chain",
+    }
+)
+
+
+def normalize_asset_path(path: str) -> str:
+    """Normalize an object path ("/Game/A.A") to its package path ("/Game/A")."""
+    path = str(path).strip()
+    last = path.rsplit("/", 1)[-1]
+    if "." in last:
+        path = path[: len(path) - len(last)] + last.split(".", 1)[0]
+    return path
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of decoded JSON responses."""
+
+    def __init__(self, max_size: int = 256, ttl_s: float = 30.0):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_s: Seconds a response stays valid
+        """
+        self.max_size = max(1, max_size)
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def make_key(path: str, params: dict | None) -> CacheKey:
+        """Build a hashable key from an API path and its query params."""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return path, items
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Return a copy of a fresh cached response, or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # Callers may mutate the returned dict; never hand out the cached object itself.
+        return copy.deepcopy(value)
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store a response (a private copy is kept)."""
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_s, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, asset_path: str | None = None) -> int:
+        """Drop entries affected by a change to `asset_path` (all entries if None).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if asset_path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                target = normalize_asset_path(asset_path)
+                stale = [
+                    key
+                    for key in self._entries
+                    if key[0] in RELATIONSHIP_PATHS
+                    or any(
+                        k in ASSET_PARAM_KEYS and normalize_asset_path(v) == target
+                        for k, v in key[1]
+                    )
+                ]
+                for key in stale:
+                    del self._entries[key]
+                removed = len(stale)
+            self._invalidations += removed
+            return removed
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.invalidate(None)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current hit rate."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_s": self.ttl_s,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
@@ -0,0 +1,257 @@
+"""
+Client-side asset dependency graph.
+
+Reference-chain traces used to run the whole BFS inside the editor on every call. This
+module keeps the edges returned by `/asset/references` and `/asset/referencers` in memory
+and traverses them locally:
+
+- Each BFS level fetches only the nodes never seen before, in one `/batch` round-trip.
+- Depth limit, visited-set pruning and cycle detection run in Python.
+- Repeated or overlapping traces are answered from memory.
+- Node name/type come from `/asset/metadata`, fetched in the same batches.
+
+Only hard (asset registry) dependencies are known here. Blueprint CDO soft references are
+extracted by the editor's `/analysis/reference-chain`; local traces are marked with
+`includes_soft_references: False`.
+
+Edges expire after UE_PLUGIN_GRAPH_TTL seconds. `invalidate(asset_path)` drops the outgoing
+edges of that asset and every incoming list (a changed asset may now reference anything).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Literal
+
+from .cache import normalize_asset_path
+
+if TYPE_CHECKING:
+    from .http_client import UEPluginClient
+
+# Editor-side direction names (as used by /analysis/reference-chain).
+ChainDirection = Literal["references", "referencers", "both"]
+
+MAX_CHAIN_DEPTH = 10
+
+_EDGE_ENDPOINTS = {
+    "references": ("/asset/references", "references"),
+    "referencers": ("/asset/referencers", "referencers"),
+}
+
+
+class AssetDependencyGraph:
+    """In-memory asset reference graph filled lazily from the UE plugin."""
+
+    def __init__(self, client: UEPluginClient, ttl_s: float = 300.0):
+        """Initialize an empty graph.
+
+        Args:
+            client: Client used to fetch missing edges
+            ttl_s: Seconds fetched edges stay valid
+        """
+        self._client = client
+        self.ttl_s = ttl_s
+        # kind ("references" / "referencers") -> package path -> (fetched_at, neighbours)
+        self._edges: dict[str, dict[str, tuple[float, list[str]]]] = {
+            "references": {},
+            "referencers": {},
+        }
+        # package path -> (fetched_at, {name, type}); empty for packages without assets
+        self._info: dict[str, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+        self._nodes_fetched = 0
+        self._nodes_reused = 0
+
+    # -------------------------------------------------------------------------
+    # Edge storage
+    # -------------------------------------------------------------------------
+    def _lookup(self, kind: str, path: str, now: float) -> list[str] | None:
+        entry = self._edges[kind].get(path)
+        if entry is None or now - entry[0] > self.ttl_s:
+            return None
+        return entry[1]
+
+    def _lookup_info(self, path: str, now: float) -> dict | None:
+        entry = self._info.get(path)
+        if entry is None or now - entry[0] > self.ttl_s:
+            return None
+        return entry[1]
+
+    async def _ensure(self, paths: list[str], kinds: list[str], info_paths: list[str]) -> None:
+        """Fetch the edges of `paths` and the name/type of `info_paths` that are not cached
+        yet (one batched round-trip)."""
+        now = time.monotonic()
+        with self._lock:
+            missing = [
+                (kind, path)
+                for path in paths
+                for kind in kinds
+                if self._lookup(kind, path, now) is None
+            ]
+            self._nodes_reused += len(paths) * len(kinds) - len(missing)
+            missing_info = [p for p in info_paths if self._lookup_info(p, now) is None]
+        if not missing and not missing_info:
+            return
+
+        requests = [
+            (_EDGE_ENDPOINTS[kind][0], {"asset_path": path}) for kind, path in missing
+        ]
+        requests += [("/asset/metadata", {"asset_path": path}) for path in missing_info]
+        responses = await self._client.batch(requests)
+
+        fetched_at = time.monotonic()
+        with self._lock:
+            for path, response in zip(missing_info, responses[len(missing) :]):
+                # Packages without assets (e.g. /Script/...) answer 404: keep them nameless
+                # until the TTL runs out instead of asking on every trace.
+                info = {}
+                if response.get("ok") is not False:
+                    info = {k: str(response[k]) for k in ("name", "type") if response.get(k)}
+                self._info[path] = (fetched_at, info)
+            for (kind, path), response in zip(missing, responses):
+                if response.get("ok") is False:
+                    # Unknown/failed node: treat as a leaf for this trace, retry next time.
+                    continue
+                field = _EDGE_ENDPOINTS[kind][1]
+                neighbours = [str(p) for p in response.get(field, [])]
+                self._edges[kind][path] = (fetched_at, neighbours)
+                self._nodes_fetched += 1
+
+    def neighbours(self, path: str, direction: ChainDirection) -> list[str]:
+        """Return cached neighbours of a node (outgoing first, then incoming)."""
+        now = time.monotonic()
+        result: list[str] = []
+        with self._lock:
+            for kind in _kinds(direction):
+                result.extend(self._lookup(kind, path, now) or [])
+        return result
+
+    def _node(self, path: str, depth: int) -> dict:
+        """Chain node like the editor's: {path, depth, name, type, children}."""
+        node: dict = {"path": path, "depth": depth}
+        with self._lock:
+            node.update(self._lookup_info(path, time.monotonic()) or {})
+        node["children"] = []
+        return node
+
+    # -------------------------------------------------------------------------
+    # Traversal
+    # -------------------------------------------------------------------------
+    async def trace(
+        self, start: str, max_depth: int = 3, direction: ChainDirection = "both"
+    ) -> dict:
+        """Trace a reference chain with a level-by-level BFS.
+
+        Each node is expanded once, at the shallowest depth it is reached. Edges to nodes
+        already in the chain are pruned and counted as `pruned_edges`; edges that point
+        back to an ancestor are also counted as `cycle_edges`.
+
+        Args:
+            start: Starting asset (package or object path)
+            max_depth: Maximum depth (clamped to 0..10)
+            direction: 'references' | 'referencers' | 'both'
+
+        Returns:
+            Same shape as the editor's /analysis/reference-chain:
+            {ok, start, direction, max_depth, chain: {path, depth, name, type, children},
+            unique_nodes}, hard references only (`includes_soft_references` is False)
+        """
+        start_path = normalize_asset_path(start)
+        max_depth = max(0, min(MAX_CHAIN_DEPTH, int(max_depth)))
+        kinds = _kinds(direction)
+        fetched_before = self._nodes_fetched
+
+        # Tree structure first (path -> (depth, child paths)); the nodes are built once
+        # the name/type of every reached path is known.
+        tree: dict[str, tuple[int, list[str]]] = {start_path: (0, [])}
+        parents: dict[str, str | None] = {start_path: None}
+        pruned_edges = 0
+        cycle_edges = 0
+
+        # Each level fetches the edges of the frontier and the name/type of its nodes; the
+        # last level (not expanded) only needs the latter.
+        frontier = [start_path]
+        for depth in range(max_depth + 1):
+            if not frontier:
+                break
+            expand = depth < max_depth
+            await self._ensure(frontier if expand else [], kinds, frontier)
+            if not expand:
+                break
+            next_frontier: list[str] = []
+            for path in frontier:
+                for neighbour in self.neighbours(path, direction):
+                    if neighbour in tree:
+                        pruned_edges += 1
+                        if _is_ancestor(parents, neighbour, path):
+                            cycle_edges += 1
+                        continue
+                    tree[path][1].append(neighbour)
+                    tree[neighbour] = (depth + 1, [])
+                    parents[neighbour] = path
+                    next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        nodes = {path: self._node(path, depth) for path, (depth, _) in tree.items()}
+        for path, (_, children) in tree.items():
+            nodes[path]["children"] = [nodes[child] for child in children]
+
+        return {
+            "ok": True,
+            "start": start_path,
+            "direction": direction,
+            "max_depth": max_depth,
+            "chain": nodes[start_path],
+            "unique_nodes": len(nodes),
+            "pruned_edges": pruned_edges,
+            "cycle_edges": cycle_edges,
+            "fetched_nodes": self._nodes_fetched - fetched_before,
+            "includes_soft_references": False,
+            "source": "local_graph",
+        }
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+    def invalidate(self, asset_path: str | None = None) -> None:
+        """Drop edges affected by a change to `asset_path` (everything if None)."""
+        with self._lock:
+            if asset_path is None:
+                for edges in self._edges.values():
+                    edges.clear()
+                self._info.clear()
+                return
+            package = normalize_asset_path(asset_path)
+            self._edges["references"].pop(package, None)
+            self._info.pop(package, None)
+            self._edges["referencers"].clear()
+
+    def stats(self) -> dict:
+        """Return graph size and fetch/reuse counters."""
+        with self._lock:
+            return {
+                "nodes_with_references": len(self._edges["references"]),
+                "nodes_with_referencers": len(self._edges["referencers"]),
+                "nodes_fetched": self._nodes_fetched,
+                "nodes_reused": self._nodes_reused,
+                "ttl_s": self.ttl_s,
+            }
+
+
+def _kinds(direction: str) -> list[str]:
+    if direction == "references":
+        return ["references"]
+    if direction == "referencers":
+        return ["referencers"]
+    return ["references", "referencers"]
+
+
+def _is_ancestor(parents: dict[str, str | None], candidate: str, node: str) -> bool:
+    """Check whether `candidate` lies on the tree path from the root to `node`."""
+    current: str | None = node
+    while current is not None:
+        if current == candidate:
+            return True
+        current = parents.get(current)
+    return False
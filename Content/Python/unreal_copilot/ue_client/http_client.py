@@ -2,38 +2,162 @@
 HTTP Client for Unreal Plugin API.
 
 Supports automatic async job handling for large responses to avoid socket_send_failure.
+
+Responses of read-only Blueprint/Asset endpoints are cached (TTL + LRU, see `cache.py`).
+Call `invalidate_cache()` after anything that mutates assets. Identical GETs that are in
+flight at the same time are coalesced into one round-trip (see `singleflight.py`).
+In snapshot mode (UE_ASSET_SNAPSHOT), asset search/references/metadata are answered from
+the snapshot file (see `snapshot.py`).
+
+Connection handling:
+- A single pooled `httpx.AsyncClient` is shared by all calls, so bursts of small requests
+  reuse keep-alive connections instead of reconnecting to the editor each time.
+- Connect and read timeouts are separate: an unreachable editor fails fast, while large
+  graph payloads still get a long read window.
+- HTTP/2 is opt-in (UE_PLUGIN_HTTP2). The editor's built-in HTTP server only speaks
+  HTTP/1.1, so this is only useful behind an HTTP/2-capable proxy. httpx does not support
+  HTTP/1.1 pipelining; concurrency comes from the connection pool instead.
+
+Deadlines: every request is bounded by the request's deadline (an explicit `deadline`
+argument, else the current one, see `deadline.py`): its timeouts are capped at the time
+left, and no request is started once the deadline has passed (`DeadlineExceeded`).
 """
 
 import asyncio
+import importlib.util
 import json
 import time
+from typing import Any
 from urllib.parse import quote
 
 import httpx
 
 from ..config import get_config
+from ..deadline import Deadline, DeadlineExceeded, current_deadline
+from ..singleflight import SingleFlight, make_key
+from .cache import ResponseCache
+from .dependency_graph import AssetDependencyGraph
+from .snapshot import get_snapshot
+
+# Matches the `limit` clamp of /analysis/job/result in the editor plugin.
+DEFAULT_JOB_CHUNK_CHARS = 262144
+
+# Must not exceed GMaxBatchRequests in the editor plugin.
+BATCH_MAX_REQUESTS = 256
+
+# Read-only endpoints whose responses may be served from the response cache.
+CACHEABLE_PATHS = frozenset(
+    {
+        "/blueprint/details",
+        "/blueprint/hierarchy",
+        "/blueprint/graph",
+        "/blueprint/dependencies",
+        "/blueprint/referencers",
+        "/blueprint/soft-references",
+        "/asset/metadata",
+        "/asset/references",
+        "/asset/referencers",
+    }
+)
+
+
+def _is_job_envelope(response: Any) -> bool:
+    """Whether `response` is an async job envelope (mode='async', job_id=...)."""
+    return (
+        isinstance(response, dict)
+        and response.get("mode") == "async"
+        and bool(response.get("job_id"))
+    )
+
+
+def _http2_available() -> bool:
+    """Check whether the optional `h2` package (httpx HTTP/2 support) is installed."""
+    return importlib.util.find_spec("h2") is not None
 
 
 class UEPluginClient:
     """HTTP client for communicating with Unreal Plugin."""
 
-    def __init__(self, base_url: str | None = None, timeout: float = 60.0):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float | None = None,
+        *,
+        connect_timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        cache: ResponseCache | None = None,
+    ):
         """Initialize the client.
 
+        Unset arguments fall back to the UE_PLUGIN_* settings in config.
+
         Args:
             base_url: Base URL of the Unreal plugin API (default from config)
-            timeout: Request timeout in seconds (increased to 60s for large responses)
+            timeout: Read timeout in seconds (default 60s for large responses)
+            connect_timeout: Connect timeout in seconds
+            max_connections: Maximum number of pooled connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+            http2: Enable HTTP/2 (requires the `h2` package)
+            cache: Response cache (default from config; None when caching is disabled)
         """
-        self.base_url = base_url or get_config().ue_plugin_url
-        self.timeout = timeout
+        config = get_config()
+        self.base_url = base_url or config.ue_plugin_url
+        self.timeout = timeout if timeout is not None else config.ue_plugin_read_timeout
+        self.connect_timeout = (
+            connect_timeout if connect_timeout is not None else config.ue_plugin_connect_timeout
+        )
+        self.max_connections = (
+            max_connections if max_connections is not None else config.ue_plugin_max_connections
+        )
+        self.max_keepalive_connections = (
+            max_keepalive_connections
+            if max_keepalive_connections is not None
+            else config.ue_plugin_max_keepalive
+        )
+        self.keepalive_expiry = (
+            keepalive_expiry if keepalive_expiry is not None else config.ue_plugin_keepalive_expiry
+        )
+        self.http2 = http2 if http2 is not None else config.ue_plugin_http2
+        if cache is None and config.ue_plugin_cache_enabled:
+            cache = ResponseCache(config.ue_plugin_cache_max_size, config.ue_plugin_cache_ttl)
+        self._cache = cache
         self._client: httpx.AsyncClient | None = None
+        # Identical concurrent GETs share one round-trip.
+        self._flight = SingleFlight()
+        # Local asset reference graph for client-side reference-chain traversal.
+        self._graph = AssetDependencyGraph(self, config.ue_plugin_graph_ttl)
+
+        # Statistics / capability detection
+        self._round_trips = 0
+        self._snapshot_hits = 0
+        self._batch_supported: bool | None = None  # unknown until the first /batch call
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
+            http2 = self.http2
+            if http2 and not _http2_available():
+                print("[UnrealCopilot] Warning: HTTP/2 requested but 'h2' is not installed.")
+                http2 = False
+
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                timeout=self.timeout,
+                timeout=httpx.Timeout(
+                    self.timeout,
+                    connect=self.connect_timeout,
+                    # Waiting for a free pooled connection is bounded by the read timeout.
+                    pool=self.timeout,
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=http2,
             )
         return self._client
 
@@ -43,54 +167,279 @@ class UEPluginClient:
             await self._client.aclose()
             self._client = None
 
-    async def get(self, path: str, params: dict | None = None) -> dict:
+    async def get(
+        self,
+        path: str,
+        params: dict | None = None,
+        *,
+        use_cache: bool = True,
+        deadline: Deadline | None = None,
+    ) -> dict:
         """Make a GET request.
 
         Args:
             path: API path (may contain asset paths that need encoding)
             params: Query parameters
+            use_cache: Serve/store cacheable endpoints through the response cache
+            deadline: Request deadline (default: the current one)
 
         Returns:
             JSON response as dictionary
 
         Raises:
             UEPluginError: If the request fails
+            DeadlineExceeded: If the deadline passed before the response arrived
         """
+        cached = self._cache_lookup(path, params) if use_cache else None
+        if cached is not None:
+            return cached
+
+        if deadline is None:
+            deadline = current_deadline()
+        return await self._flight.do(
+            make_key("GET", (path,), params),
+            lambda: self._fetch(path, params, use_cache, deadline),
+            deadline,
+        )
+
+    async def _fetch(
+        self, path: str, params: dict | None, use_cache: bool, deadline: Deadline | None
+    ) -> dict:
+        """Perform one GET round-trip (see `get`)."""
         client = await self._get_client()
+        timeout = self._request_timeout(path, deadline)
 
         # Encode asset paths in the URL
         encoded_path = self._encode_path(path)
 
+        self._round_trips += 1
         try:
-            response = await client.get(encoded_path, params=params)
+            response = await client.get(encoded_path, params=params, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            result = response.json()
         except httpx.HTTPStatusError as e:
-            raise UEPluginError(f"HTTP {e.response.status_code}: {e.response.text}") from e
+            raise UEPluginError(
+                f"HTTP {e.response.status_code}: {e.response.text}",
+                status_code=e.response.status_code,
+            ) from e
         except httpx.RequestError as e:
-            raise UEPluginError(f"Request failed: {e}") from e
+            raise self._request_error(path, e, deadline) from e
+
+        if use_cache:
+            self._cache_store(path, params, result)
+        return result
 
-    async def post(self, path: str, data: dict | None = None) -> dict:
+    async def post(
+        self, path: str, data: dict | None = None, *, deadline: Deadline | None = None
+    ) -> dict:
         """Make a POST request.
 
         Args:
             path: API path
             data: JSON body
+            deadline: Request deadline (default: the current one)
 
         Returns:
             JSON response as dictionary
         """
         client = await self._get_client()
+        if deadline is None:
+            deadline = current_deadline()
+        timeout = self._request_timeout(path, deadline)
         encoded_path = self._encode_path(path)
 
+        self._round_trips += 1
         try:
-            response = await client.post(encoded_path, json=data)
+            response = await client.post(encoded_path, json=data, timeout=timeout)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
-            raise UEPluginError(f"HTTP {e.response.status_code}: {e.response.text}") from e
+            raise UEPluginError(
+                f"HTTP {e.response.status_code}: {e.response.text}",
+                status_code=e.response.status_code,
+            ) from e
         except httpx.RequestError as e:
-            raise UEPluginError(f"Request failed: {e}") from e
+            raise self._request_error(path, e, deadline) from e
+
+    def _request_timeout(self, path: str, deadline: Deadline | None) -> Any:
+        """Timeouts of one request, capped at the time left before `deadline` (the client
+        defaults without a deadline).
+
+        Raises:
+            DeadlineExceeded: The deadline has already passed
+        """
+        if deadline is None:
+            return httpx.USE_CLIENT_DEFAULT
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded before requesting {path}")
+        return httpx.Timeout(
+            min(self.timeout, remaining),
+            connect=min(self.connect_timeout, remaining),
+            pool=min(self.timeout, remaining),
+        )
+
+    @staticmethod
+    def _request_error(path: str, e: httpx.RequestError, deadline: Deadline | None) -> Exception:
+        """Exception for a failed request: `DeadlineExceeded` if the deadline cut it off."""
+        if isinstance(e, httpx.TimeoutException) and deadline is not None and deadline.expired():
+            return DeadlineExceeded(f"Deadline exceeded waiting for {path}")
+        return UEPluginError(f"Request failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Response cache
+    # -------------------------------------------------------------------------
+    def _cache_lookup(self, path: str, params: dict | None) -> dict | None:
+        """Return a local answer (asset snapshot or response cache), or None."""
+        snapshot = get_snapshot()
+        if snapshot is not None:
+            local = snapshot.answer(path, params)
+            if local is not None:
+                self._snapshot_hits += 1
+                return local
+        if self._cache is None or path not in CACHEABLE_PATHS:
+            return None
+        return self._cache.get(ResponseCache.make_key(path, params))
+
+    def _cache_store(self, path: str, params: dict | None, result: dict) -> None:
+        """Cache a successful response of a cacheable endpoint."""
+        if self._cache is None or path not in CACHEABLE_PATHS:
+            return
+        if isinstance(result, dict) and result.get("ok", True) is False:
+            return
+        # Async job envelopes point at short-lived jobs; only final results are cached.
+        if _is_job_envelope(result):
+            return
+        self._cache.put(ResponseCache.make_key(path, params), result)
+
+    def invalidate_cache(self, asset_path: str | None = None) -> int:
+        """Drop cached responses (and graph edges) affected by a change to an asset.
+
+        Args:
+            asset_path: Changed asset (package or object path). None clears the whole cache.
+
+        Returns:
+            Number of cache entries removed
+        """
+        self._graph.invalidate(asset_path)
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate(asset_path)
+
+    @property
+    def dependency_graph(self) -> AssetDependencyGraph:
+        """Local asset reference graph (filled lazily, invalidated with the cache)."""
+        return self._graph
+
+    def get_stats(self) -> dict:
+        """Return client statistics (response cache hit rate, coalesced requests etc.)."""
+        return {
+            "round_trips": self._round_trips,
+            "snapshot_hits": self._snapshot_hits,
+            "batch_supported": self._batch_supported,
+            "cache": self._cache.stats() if self._cache is not None else {"enabled": False},
+            "singleflight": self._flight.stats(),
+            "dependency_graph": self._graph.stats(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Batch requests
+    # -------------------------------------------------------------------------
+    async def batch(
+        self, requests: list[tuple[str, dict | None]], *, deadline: Deadline | None = None
+    ) -> list[dict]:
+        """Run many GET queries in as few round-trips as possible.
+
+        Cached responses are answered locally; the rest are sent to the plugin's `/batch`
+        endpoint in groups of BATCH_MAX_REQUESTS. Older plugins without `/batch` fall back
+        to concurrent individual GETs.
+
+        Args:
+            requests: (path, params) pairs, e.g. ("/asset/references", {"asset_path": p})
+            deadline: Request deadline (default: the current one)
+
+        Returns:
+            One JSON response per request, in the same order. Async job envelopes are
+            followed to their results. Per-item failures are returned as error payloads
+            ({"ok": False, "error": ..., "status": ...}) instead of raising.
+
+        Raises:
+            UEPluginError: If the plugin is unreachable
+        """
+        results: list[dict | None] = [self._cache_lookup(path, params) for path, params in requests]
+        pending = [i for i, r in enumerate(results) if r is None]
+        if deadline is None:
+            deadline = current_deadline()
+
+        for start in range(0, len(pending), BATCH_MAX_REQUESTS):
+            group = pending[start : start + BATCH_MAX_REQUESTS]
+            responses = await self._send_batch([requests[i] for i in group], deadline)
+            responses = await asyncio.gather(
+                *(self._follow_job(response, deadline) for response in responses)
+            )
+            for i, response in zip(group, responses):
+                path, params = requests[i]
+                self._cache_store(path, params, response)
+                results[i] = response
+
+        return [r if r is not None else {"ok": False, "error": "missing"} for r in results]
+
+    async def _send_batch(
+        self, requests: list[tuple[str, dict | None]], deadline: Deadline | None
+    ) -> list[dict]:
+        """Send one group of requests via `/batch` (or individually on older plugins)."""
+        if self._batch_supported is not False:
+            payload = {
+                "requests": [
+                    {"path": path, "params": {k: str(v) for k, v in (params or {}).items()}}
+                    for path, params in requests
+                ]
+            }
+            try:
+                response = await self.post("/batch", payload, deadline=deadline)
+            except UEPluginError as e:
+                if e.status_code not in (404, 405):
+                    raise
+                self._batch_supported = False
+            else:
+                self._batch_supported = True
+                items = response.get("results", [])
+                if len(items) != len(requests):
+                    raise UEPluginError(
+                        f"Batch response size mismatch ({len(items)} != {len(requests)})"
+                    )
+                return [self._unwrap_batch_item(item) for item in items]
+
+        async def one(path: str, params: dict | None) -> dict:
+            try:
+                return await self.get(path, params, use_cache=False, deadline=deadline)
+            except UEPluginError as e:
+                if e.status_code is None:
+                    raise
+                return {"ok": False, "error": str(e), "status": e.status_code}
+
+        return list(await asyncio.gather(*(one(path, params) for path, params in requests)))
+
+    async def _follow_job(self, response: dict, deadline: Deadline | None) -> dict:
+        """The result of a batched response that is an async job envelope."""
+        if not _is_job_envelope(response):
+            return response
+        try:
+            return await self._fetch_async_job(str(response["job_id"]), deadline=deadline)
+        except UEPluginError as e:
+            return {"ok": False, "error": str(e), "status": e.status_code}
+
+    @staticmethod
+    def _unwrap_batch_item(item: dict) -> dict:
+        """Convert a `/batch` result item into a plain response dict."""
+        status = int(item.get("status", 500))
+        body = item.get("body")
+        if not isinstance(body, dict):
+            body = {}
+        if status >= 400:
+            body = {"ok": False, "status": status, **body}
+            body.setdefault("error", f"HTTP {status}")
+        return body
 
     def _encode_path(self, path: str) -> str:
         """Encode asset paths in the URL.
@@ -148,8 +497,11 @@ class UEPluginClient:
         params: dict | None = None,
         *,
         timeout_s: float = 120.0,
-        poll_interval_s: float = 0.1,
-        chunk_size: int = 65536,
+        poll_interval_s: float = 0.05,
+        max_poll_interval_s: float = 1.0,
+        chunk_size: int = DEFAULT_JOB_CHUNK_CHARS,
+        max_parallel_chunks: int = 4,
+        deadline: Deadline | None = None,
     ) -> dict:
         """Make a GET request with automatic async job handling.
 
@@ -161,32 +513,70 @@ class UEPluginClient:
             path: API path
             params: Query parameters
             timeout_s: Maximum time to wait for async job completion
-            poll_interval_s: Interval between status polls
-            chunk_size: Maximum characters per chunk when fetching result
+            poll_interval_s: Initial interval between status polls (backs off)
+            max_poll_interval_s: Upper bound for the status poll interval
+            chunk_size: Requested characters per chunk (capped by the server)
+            max_parallel_chunks: Maximum concurrent chunk requests
+            deadline: Request deadline (default: the current one); polling stops there
+                even if `timeout_s` has not elapsed
 
         Returns:
             Final JSON response (either direct or reassembled from chunks)
 
         Raises:
             UEPluginError: If the request fails or times out
+            DeadlineExceeded: If the deadline passed before the result was complete
         """
+        cached = self._cache_lookup(path, params)
+        if cached is not None:
+            return cached
+
+        if deadline is None:
+            deadline = current_deadline()
+
+        return await self._flight.do(
+            make_key("GET_ASYNC", (path,), params),
+            lambda: self._get_with_async(
+                path,
+                params,
+                timeout_s=timeout_s,
+                poll_interval_s=poll_interval_s,
+                max_poll_interval_s=max_poll_interval_s,
+                chunk_size=chunk_size,
+                max_parallel_chunks=max_parallel_chunks,
+                deadline=deadline,
+            ),
+            deadline,
+        )
+
+    async def _get_with_async(
+        self,
+        path: str,
+        params: dict | None,
+        *,
+        timeout_s: float,
+        poll_interval_s: float,
+        max_poll_interval_s: float,
+        chunk_size: int,
+        max_parallel_chunks: int,
+        deadline: Deadline | None,
+    ) -> dict:
+        """Fetch a response, following an async job envelope (see `get_with_async`)."""
         # First request - may return direct result or async job envelope
-        response = await self.get(path, params)
-
-        # Check if it's an async job envelope
-        if (
-            isinstance(response, dict)
-            and response.get("mode") == "async"
-            and response.get("job_id")
-        ):
-            return await self._fetch_async_job(
+        response = await self.get(path, params, use_cache=False, deadline=deadline)
+
+        if _is_job_envelope(response):
+            response = await self._fetch_async_job(
                 job_id=str(response["job_id"]),
                 timeout_s=timeout_s,
                 poll_interval_s=poll_interval_s,
+                max_poll_interval_s=max_poll_interval_s,
                 chunk_size=chunk_size,
+                max_parallel_chunks=max_parallel_chunks,
+                deadline=deadline,
             )
 
-        # Direct response
+        self._cache_store(path, params, response)
         return response
 
     async def _fetch_async_job(
@@ -194,66 +584,102 @@ class UEPluginClient:
         job_id: str,
         *,
         timeout_s: float = 120.0,
-        poll_interval_s: float = 0.1,
-        chunk_size: int = 65536,
+        poll_interval_s: float = 0.05,
+        max_poll_interval_s: float = 1.0,
+        chunk_size: int = DEFAULT_JOB_CHUNK_CHARS,
+        max_parallel_chunks: int = 4,
+        deadline: Deadline | None = None,
     ) -> dict:
         """Fetch result from an async job via chunked retrieval.
 
+        Polling backs off geometrically, so short jobs are picked up quickly and long
+        jobs do not flood the editor with status requests. Once `total_chars` is known,
+        the result ranges are fetched concurrently.
+
         Args:
             job_id: The async job ID
             timeout_s: Maximum time to wait for job completion
-            poll_interval_s: Interval between status polls
-            chunk_size: Maximum characters per chunk
+            poll_interval_s: Initial interval between status polls
+            max_poll_interval_s: Upper bound for the status poll interval
+            chunk_size: Requested characters per chunk
+            max_parallel_chunks: Maximum concurrent chunk requests
+            deadline: Request deadline; polling and chunk requests stop there
 
         Returns:
             Reassembled JSON result
 
         Raises:
             UEPluginError: If job fails or times out
+            DeadlineExceeded: If the deadline passed first
         """
         start_t = time.monotonic()
+        interval = max(0.001, poll_interval_s)
 
         # Poll for job completion
         while True:
-            status = await self.get("/analysis/job/status", {"id": job_id})
+            status = await self.get("/analysis/job/status", {"id": job_id}, deadline=deadline)
             state = status.get("status")
 
             if state == "done":
                 total_chars = int(status.get("total_chars", 0))
+                # Older plugins do not advertise a limit; they clamp to the same default.
+                max_chunk = int(status.get("max_chunk_chars", DEFAULT_JOB_CHUNK_CHARS))
                 break
 
             if state == "error":
                 raise UEPluginError(f"Async job failed: {status.get('error', 'Unknown error')}")
 
-            if (time.monotonic() - start_t) > timeout_s:
+            elapsed = time.monotonic() - start_t
+            if elapsed > timeout_s:
                 raise UEPluginError(
                     f"Async job timeout after {timeout_s}s (id={job_id}, status={state})"
                 )
-
-            await asyncio.sleep(poll_interval_s)
-
-        # Fetch result in chunks
-        chunks: list[str] = []
-        offset = 0
-
-        while offset < total_chars:
-            part = await self.get(
-                "/analysis/job/result",
-                {
-                    "id": job_id,
-                    "offset": offset,
-                    "limit": chunk_size,
-                },
-            )
-            chunks.append(part.get("chunk", ""))
-            offset = int(part.get("next_offset", offset + chunk_size))
-
-            if part.get("done", False):
-                break
-
-        # Reassemble and parse JSON
+            left = timeout_s - elapsed
+            if deadline is not None:
+                if deadline.expired():
+                    raise DeadlineExceeded(
+                        f"Deadline exceeded waiting for async job (id={job_id}, status={state})"
+                    )
+                left = min(left, deadline.remaining())
+
+            await asyncio.sleep(min(interval, max(0.0, left)))
+            interval = min(interval * 1.5, max_poll_interval_s)
+
+        if total_chars <= 0:
+            raise UEPluginError(f"Async job returned an empty result (id={job_id})")
+
+        stride = max(1, min(chunk_size, max_chunk))
+        ranges = [(lo, min(lo + stride, total_chars)) for lo in range(0, total_chars, stride)]
+        sem = asyncio.Semaphore(max(1, max_parallel_chunks))
+
+        async def fetch_range(lo: int, hi: int) -> str:
+            # The server may clamp `limit`; keep reading until the range is covered.
+            parts: list[str] = []
+            offset = lo
+            async with sem:
+                while offset < hi:
+                    part = await self.get(
+                        "/analysis/job/result",
+                        {"id": job_id, "offset": offset, "limit": hi - offset},
+                        deadline=deadline,
+                    )
+                    chunk = part.get("chunk", "")
+                    if not chunk:
+                        raise UEPluginError(
+                            f"Async job result ended early at offset {offset} (id={job_id})"
+                        )
+                    parts.append(chunk)
+                    offset = int(part.get("next_offset", offset + len(chunk)))
+            return parts[0] if len(parts) == 1 else "".join(parts)
+
+        chunks = await asyncio.gather(*(fetch_range(lo, hi) for lo, hi in ranges))
+
+        # Reassemble and parse JSON. The stdlib parser is not incremental, so release the
+        # chunk list as soon as the joined text exists to keep at most one extra copy alive.
+        text = "".join(chunks)
+        del chunks
         try:
-            return json.loads("".join(chunks))
+            return json.loads(text)
         except json.JSONDecodeError as e:
             raise UEPluginError(f"Failed to parse async job result: {e}") from e
 
@@ -261,7 +687,10 @@ class UEPluginClient:
 class UEPluginError(Exception):
     """Error from Unreal Plugin API."""
 
-    pass
+    def __init__(self, message: str, *, status_code: int | None = None):
+        super().__init__(message)
+        # HTTP status of the failed response (None for connection errors)
+        self.status_code = status_code
 
 
 # Global client instance
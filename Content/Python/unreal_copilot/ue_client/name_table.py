@@ -0,0 +1,126 @@
+"""
+Packed name table for wildcard and multi-token name search.
+
+All names are lower-cased and stored in one contiguous string, one `\n<name>\t<row>`
+record per name. A query term is compiled once and run over the whole buffer with a single
+`re.findall` scan that captures the row ids of matching records. This replaces per-name
+Python loops (fnmatch / `in` per candidate) with C-level scanning.
+
+Term syntax follows the plugin's search endpoints:
+- a term with `*` / `?` is a UE wildcard matched against the whole name
+- any other term matches as a case-insensitive substring
+
+Ranking scores each row by the number of distinct terms it matches and keeps the top-k with
+a heap in one pass.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable
+from itertools import chain
+
+_REST_OF_NAME = "[^\t\n]*"
+_ROW_ID = "\t(\\d+)"
+
+
+def _clean(name: str) -> str:
+    return str(name).lower().replace("\n", " ").replace("\t", " ")
+
+
+def compile_term(term: str) -> re.Pattern[str] | None:
+    """Compile one query term into a regex over the packed buffer.
+
+    Each regex runs through the end of the name and captures the row id, so a row yields
+    at most one match. Returns None for a term that matches every name (e.g. `*`).
+    """
+    term = term.lower()
+    if not any(ch in term for ch in "*?"):
+        return re.compile(re.escape(term) + _REST_OF_NAME + _ROW_ID)
+    anchored_start = not term.startswith("*")
+    anchored_end = not term.endswith("*")
+    body = term.strip("*")
+    if not body:
+        return None
+    parts = ["\n" if anchored_start else ""]
+    for ch in body:
+        if ch == "*":
+            parts.append(_REST_OF_NAME)
+        elif ch == "?":
+            parts.append("[^\t\n]")
+        else:
+            parts.append(re.escape(ch))
+    parts.append(_ROW_ID if anchored_end else _REST_OF_NAME + _ROW_ID)
+    return re.compile("".join(parts))
+
+
+class NameTable:
+    """Immutable table of names packed into one buffer."""
+
+    def __init__(self, names: Iterable[str]):
+        """Pack names (row i = i-th name)."""
+        lowered = [_clean(n) for n in names]
+        # One "\n<name>\t<row>" record per name: anchors are plain "\n" literals and every
+        # match captures its row id, so no per-match offset lookup is needed.
+        self._buffer = "".join(f"\n{name}\t{row}" for row, name in enumerate(lowered)) + "\n"
+        self._lengths = array("i", map(len, lowered))
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def rows_matching(self, term: str) -> list[int]:
+        """Rows matching one term, in ascending order."""
+        if not self._lengths or not term:
+            return []
+        regex = compile_term(term)
+        if regex is None:
+            return list(range(len(self._lengths)))
+        return list(map(int, regex.findall(self._buffer)))
+
+    def score(self, terms: list[str]) -> Counter[int]:
+        """Map row -> number of distinct terms it matches (rows with no match omitted)."""
+        unique_terms = dict.fromkeys(t.lower() for t in terms if t)
+        return Counter(chain.from_iterable(self.rows_matching(t) for t in unique_terms))
+
+    def top_k(
+        self,
+        terms: list[str],
+        k: int,
+        *,
+        accept: Callable[[int], bool] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Rank rows by term score and return the best k as (row, score).
+
+        Ties prefer shorter names, then lower rows (stable, deterministic).
+
+        Args:
+            terms: Query terms (wildcards or substrings)
+            k: Number of results
+            accept: Optional row filter (type/scope), applied before ranking
+        """
+        if k <= 0:
+            return []
+        # Scores are small integers: bucket rows by score and only order the buckets needed.
+        buckets: dict[int, list[int]] = {}
+        for row, score in self.score(terms).items():
+            buckets.setdefault(score, []).append(row)
+
+        lengths = self._lengths
+
+        def tie_key(row: int) -> tuple[int, int]:
+            return lengths[row], row
+
+        ranked: list[tuple[int, int]] = []
+        for score in sorted(buckets, reverse=True):
+            rows = buckets[score]
+            if accept is not None:
+                rows = [r for r in rows if accept(r)]
+            remaining = k - len(ranked)
+            best = heapq.nsmallest(remaining, rows, key=tie_key)
+            ranked.extend((row, score) for row in best)
+            if len(ranked) >= k:
+                break
+        return ranked
@@ -0,0 +1,591 @@
+"""
+Asset registry snapshot and offline query engine.
+
+The editor exports its asset list and dependency graph once (`/analysis/snapshot`); the
+result is stored in a compact packed binary file and loaded into flat arrays:
+
+- one interned string table (package paths, asset names, class names)
+- per-asset columns (`node`, `name`, `type`) as `array('i')`
+- the dependency graph in CSR form (offsets + targets); the reverse graph (referencers) is
+  derived on first use
+
+With UE_ASSET_SNAPSHOT pointing at a snapshot file, `UEPluginClient` answers asset search,
+references, referencers and metadata locally (see `AssetSnapshot.answer`), which also works
+without a running editor. Snapshots do not follow later edits; re-export after changes.
+
+File layout (little-endian):
+    header   "<8sIIIII": magic, version, string_count, node_count, asset_count, edge_count
+    u32      byte length of the string blob
+    bytes    UTF-8 strings joined with NUL
+    i32[]    nodes (string id per node), asset node/name/type columns,
+             edge offsets (node_count + 1), edge targets (edge_count)
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Set
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from ..config import get_config
+from .cache import normalize_asset_path
+from .name_table import NameTable
+
+if TYPE_CHECKING:
+    from .http_client import UEPluginClient
+
+SNAPSHOT_MAGIC = b"UCSNAP\x00\x01"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct("<8sIIIII")
+_U32 = struct.Struct("<I")
+
+ChainDirection = Literal["references", "referencers", "both"]
+
+# Asset classes returned by the editor's /blueprint/search: UBlueprint and its subclasses
+# (the handler filters with bRecursiveClasses). The snapshot only stores class names, so
+# the engine's Blueprint hierarchy is listed here.
+BLUEPRINT_TYPES = frozenset(
+    {
+        "Blueprint",
+        "WidgetBlueprint",
+        "AnimBlueprint",
+        "EditorUtilityBlueprint",
+        "EditorUtilityWidgetBlueprint",
+        "GameplayAbilityBlueprint",
+        "ControlRigBlueprint",
+        "RigVMBlueprint",
+    }
+)
+
+
+def _int_array(values=()) -> array:
+    return array("i", values)
+
+
+def _read_array(data: memoryview, offset: int, count: int) -> tuple[array, int]:
+    arr = array("i")
+    end = offset + count * arr.itemsize
+    arr.frombytes(data[offset:end])
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr, end
+
+
+def _in_range(arr: array, size: int) -> bool:
+    return not arr or (min(arr) >= 0 and max(arr) < size)
+
+
+def _write_array(f, arr: array) -> None:
+    if sys.byteorder != "little":
+        arr = array("i", arr)
+        arr.byteswap()
+    f.write(arr.tobytes())
+
+
+def _as_wildcard(pattern: str) -> str:
+    """Like the editor, a pattern without wildcards matches as a substring."""
+    return pattern if any(ch in pattern for ch in "*?") else f"*{pattern}*"
+
+
+def matches_scope(package_path: str, scope: str) -> bool:
+    """Python version of the plugin's MatchesScope (project/engine/plugin/all)."""
+    if not scope or scope == "all":
+        return True
+    is_engine = package_path.startswith(("/Engine/", "/Script/"))
+    if scope == "engine":
+        return is_engine
+    if scope == "plugin":
+        return not is_engine and not package_path.startswith("/Game/")
+    return not is_engine
+
+
+class AssetSnapshot:
+    """In-memory, array-backed asset registry snapshot."""
+
+    def __init__(
+        self,
+        strings: list[str],
+        nodes: array,
+        asset_node: array,
+        asset_name: array,
+        asset_type: array,
+        edge_offsets: array,
+        edge_targets: array,
+        *,
+        source: str = "",
+    ):
+        """Initialize from decoded columns (use `from_export` / `load`)."""
+        if len(edge_offsets) != len(nodes) + 1:
+            raise ValueError("Snapshot edge offsets do not match the node count")
+        if not (len(asset_node) == len(asset_name) == len(asset_type)):
+            raise ValueError("Snapshot asset columns have different lengths")
+        self.strings = strings
+        self.nodes = nodes
+        self.asset_node = asset_node
+        self.asset_name = asset_name
+        self.asset_type = asset_type
+        self.edge_offsets = edge_offsets
+        self.edge_targets = edge_targets
+        self.source = source
+
+        self._node_index: dict[str, int] = {strings[s]: i for i, s in enumerate(nodes)}
+        self._asset_by_node: dict[int, int] = {}
+        for row, node in enumerate(asset_node):
+            self._asset_by_node.setdefault(node, row)
+        self._reverse: tuple[array, array] | None = None
+        self._name_table: NameTable | None = None
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Construction / persistence
+    # -------------------------------------------------------------------------
+    @classmethod
+    def from_export(cls, payload: dict, *, source: str = "") -> AssetSnapshot:
+        """Build a snapshot from the plugin's `/analysis/snapshot` JSON."""
+        if int(payload.get("version", 0)) != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {payload.get('version')}")
+        assets = payload.get("assets", {})
+        edges = payload.get("edges", {})
+        return cls(
+            [str(s) for s in payload.get("strings", [])],
+            _int_array(payload.get("nodes", [])),
+            _int_array(assets.get("node", [])),
+            _int_array(assets.get("name", [])),
+            _int_array(assets.get("type", [])),
+            _int_array(edges.get("offsets", [0])),
+            _int_array(edges.get("targets", [])),
+            source=source,
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the snapshot to a packed binary file."""
+        blob = "\0".join(self.strings).encode("utf-8")
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(
+                _HEADER.pack(
+                    SNAPSHOT_MAGIC,
+                    SNAPSHOT_VERSION,
+                    len(self.strings),
+                    len(self.nodes),
+                    len(self.asset_name),
+                    len(self.edge_targets),
+                )
+            )
+            f.write(_U32.pack(len(blob)))
+            f.write(blob)
+            for arr in (
+                self.nodes,
+                self.asset_node,
+                self.asset_name,
+                self.asset_type,
+                self.edge_offsets,
+                self.edge_targets,
+            ):
+                _write_array(f, arr)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> AssetSnapshot:
+        """Load a snapshot written by `save`."""
+        data = memoryview(Path(path).read_bytes())
+        if len(data) < _HEADER.size + _U32.size:
+            raise ValueError(f"Not an asset snapshot: {path}")
+        magic, version, string_count, node_count, asset_count, edge_count = _HEADER.unpack_from(
+            data, 0
+        )
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Not an asset snapshot (or unsupported version): {path}")
+        offset = _HEADER.size
+        (blob_len,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        int_count = 2 * node_count + 3 * asset_count + 1 + edge_count
+        if len(data) != offset + blob_len + int_count * 4:
+            raise ValueError(f"Truncated or corrupt snapshot file: {path}")
+        try:
+            blob = bytes(data[offset : offset + blob_len]).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Corrupt snapshot string table: {path}") from e
+        offset += blob_len
+        strings = blob.split("\0") if string_count else []
+        if len(strings) != string_count:
+            raise ValueError(f"Corrupt snapshot string table: {path}")
+
+        nodes, offset = _read_array(data, offset, node_count)
+        asset_node, offset = _read_array(data, offset, asset_count)
+        asset_name, offset = _read_array(data, offset, asset_count)
+        asset_type, offset = _read_array(data, offset, asset_count)
+        edge_offsets, offset = _read_array(data, offset, node_count + 1)
+        edge_targets, offset = _read_array(data, offset, edge_count)
+        # Out-of-range ids would surface as IndexErrors in the middle of a query
+        if not (
+            _in_range(nodes, string_count)
+            and _in_range(asset_name, string_count)
+            and _in_range(asset_type, string_count)
+            and _in_range(asset_node, node_count)
+            and _in_range(edge_targets, node_count)
+            and _in_range(edge_offsets, edge_count + 1)
+            and edge_offsets[0] == 0
+            and edge_offsets[-1] == edge_count
+        ):
+            raise ValueError(f"Corrupt snapshot (ids out of range): {path}")
+        return cls(
+            strings,
+            nodes,
+            asset_node,
+            asset_name,
+            asset_type,
+            edge_offsets,
+            edge_targets,
+            source=str(path),
+        )
+
+    # -------------------------------------------------------------------------
+    # Graph access
+    # -------------------------------------------------------------------------
+    @property
+    def asset_count(self) -> int:
+        return len(self.asset_name)
+
+    def node_of(self, path: str) -> int | None:
+        """Resolve a package or object path to a node index."""
+        return self._node_index.get(normalize_asset_path(path))
+
+    def _reverse_edges(self) -> tuple[array, array]:
+        """Build the referencer CSR (counting sort over the dependency edges)."""
+        with self._lock:
+            if self._reverse is not None:
+                return self._reverse
+            node_count = len(self.nodes)
+            counts = [0] * (node_count + 1)
+            for target in self.edge_targets:
+                counts[target + 1] += 1
+            for i in range(node_count):
+                counts[i + 1] += counts[i]
+            offsets = _int_array(counts)
+            cursor = counts[:-1]
+            targets = _int_array(bytes(len(self.edge_targets) * 4))
+            edge_offsets = self.edge_offsets
+            edge_targets = self.edge_targets
+            for source in range(node_count):
+                for k in range(edge_offsets[source], edge_offsets[source + 1]):
+                    target = edge_targets[k]
+                    targets[cursor[target]] = source
+                    cursor[target] += 1
+            self._reverse = (offsets, targets)
+            return self._reverse
+
+    def _neighbour_nodes(self, node: int, kind: str) -> array:
+        if kind == "references":
+            offsets, targets = self.edge_offsets, self.edge_targets
+        else:
+            offsets, targets = self._reverse_edges()
+        return targets[offsets[node] : offsets[node + 1]]
+
+    def references(self, path: str) -> list[str] | None:
+        """Outgoing dependencies of a package (None if unknown)."""
+        node = self.node_of(path)
+        if node is None:
+            return None
+        return [self.strings[self.nodes[n]] for n in self._neighbour_nodes(node, "references")]
+
+    def referencers(self, path: str) -> list[str] | None:
+        """Incoming referencers of a package (None if unknown)."""
+        node = self.node_of(path)
+        if node is None:
+            return None
+        return [self.strings[self.nodes[n]] for n in self._neighbour_nodes(node, "referencers")]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def _asset_entry(self, row: int) -> dict:
+        return {
+            "name": self.strings[self.asset_name[row]],
+            "path": self.strings[self.nodes[self.asset_node[row]]],
+            "type": self.strings[self.asset_type[row]],
+        }
+
+    def search(
+        self,
+        pattern: str = "*",
+        asset_type: str | Set[str] = "",
+        *,
+        scope: str = "all",
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Search assets by UE wildcard name pattern, class filter and scope.
+
+        Args:
+            pattern: Name pattern (`*`/`?`; plain text matches as substring)
+            asset_type: Class filter (exact or substring, like the plugin), or a set of
+                exact class names (e.g. BLUEPRINT_TYPES)
+            scope: project | engine | plugin | all
+            limit: Maximum number of matches (None = all)
+
+        Returns:
+            List of {name, path, type}
+        """
+        accept = self._row_filter(asset_type, scope)
+        matches: list[dict] = []
+        for row in self.name_table.rows_matching(_as_wildcard(pattern or "*")):
+            if not accept(row):
+                continue
+            matches.append(self._asset_entry(row))
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+    def rank(
+        self,
+        terms: list[str],
+        asset_type: str | Set[str] = "",
+        *,
+        scope: str = "all",
+        k: int = 50,
+    ) -> list[dict]:
+        """Multi-term name search ranked by matched-term count (top-k in one pass).
+
+        Returns:
+            List of {name, path, type, relevance_score}, best first
+        """
+        accept = self._row_filter(asset_type, scope)
+        return [
+            {**self._asset_entry(row), "relevance_score": score}
+            for row, score in self.name_table.top_k(terms, k, accept=accept)
+        ]
+
+    @property
+    def name_table(self) -> NameTable:
+        """Packed table of asset names (row-aligned with the asset columns), built lazily."""
+        with self._lock:
+            if self._name_table is None:
+                self._name_table = NameTable(self.strings[n] for n in self.asset_name)
+            return self._name_table
+
+    def _row_filter(self, asset_type: str | Set[str], scope: str):
+        """Build a row predicate for a class filter and scope (tested per interned id)."""
+        strings = self.strings
+        type_ok: set[int] | None = None
+        if isinstance(asset_type, Set):
+            type_ok = {t for t in set(self.asset_type) if strings[t] in asset_type}
+        elif asset_type:
+            lowered = asset_type.lower()
+            type_ok = {t for t in set(self.asset_type) if lowered in strings[t].lower()}
+        check_scope = bool(scope) and scope != "all"
+
+        def accept(row: int) -> bool:
+            if type_ok is not None and self.asset_type[row] not in type_ok:
+                return False
+            if check_scope:
+                return matches_scope(strings[self.nodes[self.asset_node[row]]], scope)
+            return True
+
+        return accept
+
+    def metadata(self, path: str) -> dict | None:
+        """Name/type of the first asset in a package (None if not in the snapshot)."""
+        node = self.node_of(path)
+        row = self._asset_by_node.get(node) if node is not None else None
+        if row is None:
+            return None
+        return self._asset_entry(row)
+
+    def trace(
+        self, start: str, max_depth: int = 3, direction: ChainDirection = "both"
+    ) -> dict:
+        """Reference-chain BFS over the snapshot (same shape as the editor's result).
+
+        Only hard dependencies are in the snapshot: Blueprint CDO soft references need the
+        editor, so the result is marked `includes_soft_references: False`.
+        """
+        start_path = normalize_asset_path(start)
+        max_depth = max(0, min(10, int(max_depth)))
+        kinds = ["references", "referencers"] if direction == "both" else [direction]
+
+        start_node = self.node_of(start_path)
+        if start_node is None:
+            return {
+                "ok": True,
+                "start": start_path,
+                "direction": direction,
+                "max_depth": max_depth,
+                "chain": {"path": start_path, "depth": 0, "children": []},
+                "unique_nodes": 1,
+                "includes_soft_references": False,
+                "source": "snapshot",
+            }
+
+        root = self._chain_node(start_node, 0)
+        tree: dict[int, dict] = {start_node: root}
+        frontier = [start_node]
+        pruned_edges = 0
+        for depth in range(max_depth):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for kind in kinds:
+                    for neighbour in self._neighbour_nodes(node, kind):
+                        if neighbour in tree:
+                            pruned_edges += 1
+                            continue
+                        child = self._chain_node(neighbour, depth + 1)
+                        tree[node]["children"].append(child)
+                        tree[neighbour] = child
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        return {
+            "ok": True,
+            "start": start_path,
+            "direction": direction,
+            "max_depth": max_depth,
+            "chain": root,
+            "unique_nodes": len(tree),
+            "pruned_edges": pruned_edges,
+            "includes_soft_references": False,
+            "source": "snapshot",
+        }
+
+    def _chain_node(self, node: int, depth: int) -> dict:
+        """Chain node like the editor's: {path, depth, name, type, children}."""
+        entry: dict = {"path": self.strings[self.nodes[node]], "depth": depth}
+        row = self._asset_by_node.get(node)
+        if row is not None:
+            entry["name"] = self.strings[self.asset_name[row]]
+            entry["type"] = self.strings[self.asset_type[row]]
+        entry["children"] = []
+        return entry
+
+    def answer(self, path: str, params: dict | None) -> dict | None:
+        """Answer a plugin GET endpoint from the snapshot, mirroring its JSON.
+
+        Returns None for endpoints (or assets) the snapshot cannot answer, so the caller
+        falls back to the editor.
+        """
+        params = params or {}
+        if path in ("/asset/search", "/blueprint/search"):
+            if path == "/blueprint/search":
+                if params.get("class"):
+                    return None  # parent-class filtering needs the loaded Blueprint
+                asset_type: str | Set[str] = BLUEPRINT_TYPES
+            else:
+                asset_type = str(params.get("type", "") or "")
+            matches = self.search(
+                str(params.get("pattern", "*") or "*"),
+                asset_type,
+                scope=str(params.get("scope", "project") or "project"),
+            )
+            return {"ok": True, "matches": matches, "count": len(matches), "source": "snapshot"}
+
+        if path in ("/asset/references", "/asset/referencers", "/asset/metadata"):
+            owner_key, asset_path = "asset", str(params.get("asset_path", ""))
+        elif path in ("/blueprint/dependencies", "/blueprint/referencers"):
+            owner_key, asset_path = "blueprint", str(params.get("bp_path", ""))
+        else:
+            return None
+        if not asset_path:
+            return None
+
+        package = normalize_asset_path(asset_path)
+        if path == "/asset/metadata":
+            meta = self.metadata(package)
+            return {"ok": True, **meta, "source": "snapshot"} if meta is not None else None
+
+        if path.endswith("/referencers"):
+            field, items = "referencers", self.referencers(package)
+        else:
+            field = "references" if path == "/asset/references" else "dependencies"
+            items = self.references(package)
+        if items is None:
+            return None
+        return {
+            "ok": True,
+            owner_key: package,
+            field: items,
+            "count": len(items),
+            "source": "snapshot",
+        }
+
+    def stats(self) -> dict:
+        return {
+            "source": self.source,
+            "strings": len(self.strings),
+            "nodes": len(self.nodes),
+            "assets": self.asset_count,
+            "edges": len(self.edge_targets),
+        }
+
+
+async def export_snapshot(
+    client: UEPluginClient, path: str | Path, *, scope: str = "all", timeout_s: float = 600.0
+) -> AssetSnapshot:
+    """Export the editor's asset registry to a snapshot file.
+
+    Args:
+        client: Connected plugin client
+        path: Output file
+        scope: project | engine | plugin | all
+        timeout_s: Maximum time to wait for the export job
+
+    Returns:
+        The loaded snapshot
+    """
+    payload = await client.get_with_async(
+        "/analysis/snapshot", {"scope": scope}, timeout_s=timeout_s
+    )
+    if not payload.get("ok", False):
+        raise ValueError(f"Snapshot export failed: {payload.get('error', payload)}")
+    snapshot = AssetSnapshot.from_export(payload, source=str(path))
+    snapshot.save(path)
+    return snapshot
+
+
+# ============================================================================
+# Global Instance
+# ============================================================================
+
+_snapshot: AssetSnapshot | None = None
+_snapshot_key: tuple[str, float] | None = None
+_explicit_snapshot: AssetSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> AssetSnapshot | None:
+    """Get the active snapshot.
+
+    An explicitly set snapshot wins; otherwise the file named by UE_ASSET_SNAPSHOT is loaded
+    (and reloaded when it changes on disk). Returns None when snapshot mode is off.
+    """
+    global _snapshot, _snapshot_key
+    if _explicit_snapshot is not None:
+        return _explicit_snapshot
+    snapshot_path = get_config().ue_asset_snapshot
+    if not snapshot_path:
+        return None
+    try:
+        key = (snapshot_path, os.path.getmtime(snapshot_path))
+    except OSError:
+        return None
+    with _snapshot_lock:
+        if _snapshot_key != key:
+            try:
+                _snapshot = AssetSnapshot.load(snapshot_path)
+            except (OSError, ValueError) as e:
+                print(f"[UnrealCopilot] Warning: Failed to load asset snapshot: {e}")
+                _snapshot = None
+            _snapshot_key = key
+        return _snapshot
+
+
+def set_snapshot(snapshot: AssetSnapshot | None) -> None:
+    """Set the global snapshot explicitly (None returns to UE_ASSET_SNAPSHOT)."""
+    global _explicit_snapshot
+    _explicit_snapshot = snapshot
@@ -19,9 +19,11 @@
 #include "HttpServerResponse.h"
 #include "IHttpRouter.h"
 #include "Kismet2/BlueprintEditorUtils.h"
+#include "Serialization/JsonReader.h"
 #include "Serialization/JsonSerializer.h"
 #include "Serialization/JsonWriter.h"
 #include "Misc/PackageName.h"
+#include "Containers/StringConv.h"
 #include "HAL/FileManager.h"
 #include "UObject/UnrealType.h"
 #include "UObject/ObjectPtr.h"
@@ -386,6 +388,9 @@ namespace
 	static FCriticalSection GAsyncJobsMutex;
 	static TMap<FGuid, TSharedPtr<FAsyncJsonJob>> GAsyncJobs;
 
+	// Upper bound for a single /analysis/job/result chunk (advertised to clients via job status).
+	static constexpr int32 GMaxJobResultChunkChars = 262144;
+
 	static FString JobStatusToString(EAsyncJsonJobStatus Status)
 	{
 		switch (Status)
@@ -1187,6 +1192,7 @@ namespace
 		if (StatusSnapshot == EAsyncJsonJobStatus::Done)
 		{
 			Root->SetNumberField(TEXT("total_chars"), TotalCharsSnapshot);
+			Root->SetNumberField(TEXT("max_chunk_chars"), GMaxJobResultChunkChars);
 		}
 		if (StatusSnapshot == EAsyncJsonJobStatus::Error)
 		{
@@ -1214,7 +1220,7 @@ namespace
 		}
 
 		const int32 Offset = FMath::Max(0, FCString::Atoi(*FUnrealAnalyzerHttpUtils::GetOptionalQueryParam(Request, TEXT("offset"), TEXT("0"))));
-		const int32 Limit = FMath::Clamp(FCString::Atoi(*FUnrealAnalyzerHttpUtils::GetOptionalQueryParam(Request, TEXT("limit"), TEXT("65536"))), 1, 262144);
+		const int32 Limit = FMath::Clamp(FCString::Atoi(*FUnrealAnalyzerHttpUtils::GetOptionalQueryParam(Request, TEXT("limit"), TEXT("65536"))), 1, GMaxJobResultChunkChars);
 
 		TSharedPtr<FAsyncJsonJob> Job;
 		EAsyncJsonJobStatus StatusSnapshot = EAsyncJsonJobStatus::Pending;
@@ -1361,6 +1367,164 @@ namespace
 		return HandleReferenceChainAsync(Request, OnComplete);
 	}
 
+	// Asset registry snapshot (columnar JSON, consumed by the Python snapshot query engine).
+	//
+	// Layout:
+	//   strings: interned string table
+	//   nodes:   package path (string id) per graph node; asset packages come first
+	//   assets:  { node, name, type } columns (node index / string ids), one row per asset
+	//   edges:   CSR dependency lists per node: targets[offsets[i] .. offsets[i + 1])
+	static TSharedRef<FJsonObject> BuildAssetSnapshotJson(const FString& Scope)
+	{
+		TArray<FAssetData> Assets;
+		GetAssetRegistry().GetAllAssets(Assets, true);
+
+		TMap<FString, int32> StringIds;
+		TArray<TSharedPtr<FJsonValue>> Strings;
+		auto Intern = [&StringIds, &Strings](const FString& Value) -> int32
+		{
+			if (const int32* Existing = StringIds.Find(Value))
+			{
+				return *Existing;
+			}
+			const int32 Id = Strings.Num();
+			Strings.Add(MakeShared<FJsonValueString>(Value));
+			StringIds.Add(Value, Id);
+			return Id;
+		};
+
+		TMap<FName, int32> NodeIds;
+		TArray<FName> NodePackages;
+		auto GetNode = [&NodeIds, &NodePackages](const FName& Package) -> int32
+		{
+			if (const int32* Existing = NodeIds.Find(Package))
+			{
+				return *Existing;
+			}
+			const int32 Id = NodePackages.Num();
+			NodePackages.Add(Package);
+			NodeIds.Add(Package, Id);
+			return Id;
+		};
+
+		TArray<TSharedPtr<FJsonValue>> AssetNodes;
+		TArray<TSharedPtr<FJsonValue>> AssetNames;
+		TArray<TSharedPtr<FJsonValue>> AssetTypes;
+		for (const FAssetData& Asset : Assets)
+		{
+			if (!MatchesScope(Asset.PackageName.ToString(), Scope))
+			{
+				continue;
+			}
+			AssetNodes.Add(MakeShared<FJsonValueNumber>(GetNode(Asset.PackageName)));
+			AssetNames.Add(MakeShared<FJsonValueNumber>(Intern(Asset.AssetName.ToString())));
+			AssetTypes.Add(MakeShared<FJsonValueNumber>(Intern(Asset.AssetClassPath.GetAssetName().ToString())));
+		}
+
+		// Only asset packages are expanded; dependency targets outside the snapshot become leaf nodes.
+		const int32 AssetNodeCount = NodePackages.Num();
+		TArray<TSharedPtr<FJsonValue>> EdgeOffsets;
+		TArray<TSharedPtr<FJsonValue>> EdgeTargets;
+		EdgeOffsets.Add(MakeShared<FJsonValueNumber>(0));
+		for (int32 NodeIndex = 0; NodeIndex < AssetNodeCount; ++NodeIndex)
+		{
+			TArray<FName> Deps;
+			GetAssetRegistry().GetDependencies(NodePackages[NodeIndex], Deps, UE::AssetRegistry::EDependencyCategory::All);
+			for (const FName& Dep : Deps)
+			{
+				EdgeTargets.Add(MakeShared<FJsonValueNumber>(GetNode(Dep)));
+			}
+			EdgeOffsets.Add(MakeShared<FJsonValueNumber>(EdgeTargets.Num()));
+		}
+		for (int32 NodeIndex = AssetNodeCount; NodeIndex < NodePackages.Num(); ++NodeIndex)
+		{
+			EdgeOffsets.Add(MakeShared<FJsonValueNumber>(EdgeTargets.Num()));
+		}
+
+		TArray<TSharedPtr<FJsonValue>> Nodes;
+		Nodes.Reserve(NodePackages.Num());
+		for (const FName& Package : NodePackages)
+		{
+			Nodes.Add(MakeShared<FJsonValueNumber>(Intern(Package.ToString())));
+		}
+
+		TSharedRef<FJsonObject> AssetsObj = MakeShared<FJsonObject>();
+		AssetsObj->SetArrayField(TEXT("node"), AssetNodes);
+		AssetsObj->SetArrayField(TEXT("name"), AssetNames);
+		AssetsObj->SetArrayField(TEXT("type"), AssetTypes);
+
+		TSharedRef<FJsonObject> EdgesObj = MakeShared<FJsonObject>();
+		EdgesObj->SetArrayField(TEXT("offsets"), EdgeOffsets);
+		EdgesObj->SetArrayField(TEXT("targets"), EdgeTargets);
+
+		TSharedRef<FJsonObject> Root = MakeShared<FJsonObject>();
+		Root->SetBoolField(TEXT("ok"), true);
+		Root->SetNumberField(TEXT("version"), 1);
+		Root->SetStringField(TEXT("scope"), Scope);
+		Root->SetNumberField(TEXT("asset_count"), AssetNames.Num());
+		Root->SetNumberField(TEXT("node_count"), Nodes.Num());
+		Root->SetNumberField(TEXT("edge_count"), EdgeTargets.Num());
+		Root->SetArrayField(TEXT("strings"), Strings);
+		Root->SetArrayField(TEXT("nodes"), Nodes);
+		Root->SetObjectField(TEXT("assets"), AssetsObj);
+		Root->SetObjectField(TEXT("edges"), EdgesObj);
+		return Root;
+	}
+
+	static bool HandleAssetSnapshot(const FHttpServerRequest& Request, const FHttpResultCallback& OnComplete)
+	{
+		const FString Scope = FUnrealAnalyzerHttpUtils::GetOptionalQueryParam(Request, TEXT("scope"), TEXT("all"));
+
+		const FGuid JobId = FGuid::NewGuid();
+		const FString JobIdStr = JobId.ToString(EGuidFormats::Digits);
+
+		TSharedPtr<FAsyncJsonJob> Job = MakeShared<FAsyncJsonJob>();
+		Job->Status = EAsyncJsonJobStatus::Pending;
+		Job->CreatedAt = FDateTime::UtcNow();
+
+		{
+			FScopeLock Lock(&GAsyncJobsMutex);
+			CleanupOldJobs_Locked();
+			GAsyncJobs.Add(JobId, Job);
+		}
+
+		// AssetRegistry enumeration must run on the Game Thread (see HandleReferenceChainAsync).
+		AsyncTask(ENamedThreads::GameThread, [Job, Scope]()
+		{
+			{
+				FScopeLock Lock(&GAsyncJobsMutex);
+				if (Job.IsValid())
+				{
+					Job->Status = EAsyncJsonJobStatus::Running;
+					Job->CreatedAt = FDateTime::UtcNow();
+					Job->Error.Empty();
+					Job->ResultJson.Empty();
+				}
+			}
+
+			const FString Serialized = JsonString(BuildAssetSnapshotJson(Scope));
+
+			{
+				FScopeLock Lock(&GAsyncJobsMutex);
+				if (Job.IsValid())
+				{
+					Job->ResultJson = Serialized;
+					Job->Status = EAsyncJsonJobStatus::Done;
+				}
+			}
+		});
+
+		TSharedRef<FJsonObject> Ack = MakeShared<FJsonObject>();
+		Ack->SetBoolField(TEXT("ok"), true);
+		Ack->SetStringField(TEXT("mode"), TEXT("async"));
+		Ack->SetStringField(TEXT("job_id"), JobIdStr);
+		Ack->SetStringField(TEXT("status_url"), FString::Printf(TEXT("/analysis/job/status?id=%s"), *JobIdStr));
+		Ack->SetStringField(TEXT("result_url_template"), FString::Printf(TEXT("/analysis/job/result?id=%s&offset={offset}&limit={limit}"), *JobIdStr));
+
+		OnComplete(FUnrealAnalyzerHttpUtils::JsonResponse(JsonString(Ack)));
+		return true;
+	}
+
 	static bool HandleCppClassUsage(const FHttpServerRequest& Request, const FHttpResultCallback& OnComplete)
 	{
 		FString ClassName;
@@ -1421,6 +1585,166 @@ namespace
 		OnComplete(FUnrealAnalyzerHttpUtils::JsonResponse(JsonString(Root)));
 		return true;
 	}
+
+	// ============================================================================
+	// Batch endpoint (many GET queries in one round-trip)
+	// ============================================================================
+	using FRouteHandlerFn = bool (*)(const FHttpServerRequest&, const FHttpResultCallback&);
+
+	struct FBatchableRoute
+	{
+		const TCHAR* Path;
+		FRouteHandlerFn Handler;
+	};
+
+	// Read-only GET routes that complete synchronously and may be bundled into /batch.
+	static const FBatchableRoute GBatchableRoutes[] = {
+		{ TEXT("/health"), &HandleHealth },
+		{ TEXT("/blueprint/search"), &HandleBlueprintSearch },
+		{ TEXT("/blueprint/hierarchy"), &HandleBlueprintHierarchy },
+		{ TEXT("/blueprint/dependencies"), &HandleBlueprintDependencies },
+		{ TEXT("/blueprint/referencers"), &HandleBlueprintReferencers },
+		{ TEXT("/blueprint/graph"), &HandleBlueprintGraph },
+		{ TEXT("/blueprint/details"), &HandleBlueprintDetails },
+		{ TEXT("/blueprint/soft-references"), &HandleBlueprintSoftReferences },
+		{ TEXT("/asset/search"), &HandleAssetSearch },
+		{ TEXT("/asset/references"), &HandleAssetReferences },
+		{ TEXT("/asset/referencers"), &HandleAssetReferencers },
+		{ TEXT("/asset/metadata"), &HandleAssetMetadata },
+		{ TEXT("/analysis/job/status"), &HandleAnalysisJobStatus },
+		{ TEXT("/analysis/job/result"), &HandleAnalysisJobResult },
+	};
+
+	static constexpr int32 GMaxBatchRequests = 256;
+
+	static FRouteHandlerFn FindBatchableRoute(const FString& Path)
+	{
+		for (const FBatchableRoute& Route : GBatchableRoutes)
+		{
+			if (Path.Equals(Route.Path, ESearchCase::CaseSensitive))
+			{
+				return Route.Handler;
+			}
+		}
+		return nullptr;
+	}
+
+	static TSharedRef<FJsonObject> MakeBatchItem(int32 Status, const TSharedPtr<FJsonObject>& Body)
+	{
+		TSharedRef<FJsonObject> Item = MakeShared<FJsonObject>();
+		Item->SetNumberField(TEXT("status"), Status);
+		Item->SetObjectField(TEXT("body"), Body.IsValid() ? Body : MakeShared<FJsonObject>());
+		return Item;
+	}
+
+	static TSharedRef<FJsonObject> MakeBatchError(int32 Status, const FString& Message, const FString& Detail)
+	{
+		TSharedRef<FJsonObject> Body = MakeShared<FJsonObject>();
+		Body->SetBoolField(TEXT("ok"), false);
+		Body->SetStringField(TEXT("error"), Message);
+		if (!Detail.IsEmpty())
+		{
+			Body->SetStringField(TEXT("detail"), Detail);
+		}
+		return MakeBatchItem(Status, Body);
+	}
+
+	/**
+	 * POST /batch
+	 * Body: { "requests": [ { "path": "/asset/references", "params": { "asset_path": "/Game/A" } }, ... ] }
+	 * Response: { "ok": true, "results": [ { "status": 200, "body": { ... } }, ... ] } (same order)
+	 */
+	static bool HandleBatch(const FHttpServerRequest& Request, const FHttpResultCallback& OnComplete)
+	{
+		const FUTF8ToTCHAR BodyChars(reinterpret_cast<const ANSICHAR*>(Request.Body.GetData()), Request.Body.Num());
+		const FString BodyStr(BodyChars.Length(), BodyChars.Get());
+
+		TSharedPtr<FJsonObject> BodyJson;
+		const TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(BodyStr);
+		if (!FJsonSerializer::Deserialize(Reader, BodyJson) || !BodyJson.IsValid())
+		{
+			OnComplete(FUnrealAnalyzerHttpUtils::JsonError(TEXT("Invalid JSON body")));
+			return true;
+		}
+
+		const TArray<TSharedPtr<FJsonValue>>* Requests = nullptr;
+		if (!BodyJson->TryGetArrayField(TEXT("requests"), Requests) || Requests == nullptr)
+		{
+			OnComplete(FUnrealAnalyzerHttpUtils::JsonError(TEXT("Missing required field: requests")));
+			return true;
+		}
+		if (Requests->Num() > GMaxBatchRequests)
+		{
+			OnComplete(FUnrealAnalyzerHttpUtils::JsonError(
+				TEXT("Too many batch requests"),
+				EHttpServerResponseCodes::BadRequest,
+				FString::Printf(TEXT("max=%d"), GMaxBatchRequests)
+			));
+			return true;
+		}
+
+		TArray<TSharedPtr<FJsonValue>> Results;
+		Results.Reserve(Requests->Num());
+
+		for (const TSharedPtr<FJsonValue>& Value : *Requests)
+		{
+			const TSharedPtr<FJsonObject> Item = Value.IsValid() ? Value->AsObject() : nullptr;
+			FString Path;
+			if (!Item.IsValid() || !Item->TryGetStringField(TEXT("path"), Path))
+			{
+				Results.Add(MakeShared<FJsonValueObject>(MakeBatchError(400, TEXT("Missing batch item path"), TEXT(""))));
+				continue;
+			}
+
+			const FRouteHandlerFn Handler = FindBatchableRoute(Path);
+			if (Handler == nullptr)
+			{
+				Results.Add(MakeShared<FJsonValueObject>(MakeBatchError(404, TEXT("Route not batchable"), Path)));
+				continue;
+			}
+
+			FHttpServerRequest SubRequest;
+			SubRequest.Verb = EHttpServerRequestVerbs::VERB_GET;
+			SubRequest.RelativePath = FHttpPath(Path);
+			const TSharedPtr<FJsonObject>* Params = nullptr;
+			if (Item->TryGetObjectField(TEXT("params"), Params) && Params != nullptr && Params->IsValid())
+			{
+				for (const TPair<FString, TSharedPtr<FJsonValue>>& Param : (*Params)->Values)
+				{
+					SubRequest.QueryParams.Add(Param.Key, Param.Value.IsValid() ? Param.Value->AsString() : FString());
+				}
+			}
+
+			// Route handlers complete synchronously, so the response is captured before Handler returns.
+			int32 SubStatus = 500;
+			TSharedPtr<FJsonObject> SubBody;
+			Handler(SubRequest, [&SubStatus, &SubBody](TUniquePtr<FHttpServerResponse>&& Response)
+			{
+				if (!Response.IsValid())
+				{
+					return;
+				}
+				SubStatus = static_cast<int32>(Response->Code);
+				const FUTF8ToTCHAR ResponseChars(reinterpret_cast<const ANSICHAR*>(Response->Body.GetData()), Response->Body.Num());
+				const TSharedRef<TJsonReader<>> SubReader = TJsonReaderFactory<>::Create(FString(ResponseChars.Length(), ResponseChars.Get()));
+				FJsonSerializer::Deserialize(SubReader, SubBody);
+			});
+
+			if (!SubBody.IsValid())
+			{
+				Results.Add(MakeShared<FJsonValueObject>(MakeBatchError(SubStatus, TEXT("Empty batch item response"), Path)));
+				continue;
+			}
+			Results.Add(MakeShared<FJsonValueObject>(MakeBatchItem(SubStatus, SubBody)));
+		}
+
+		TSharedRef<FJsonObject> Root = MakeShared<FJsonObject>();
+		Root->SetBoolField(TEXT("ok"), true);
+		Root->SetArrayField(TEXT("results"), Results);
+		Root->SetNumberField(TEXT("count"), Results.Num());
+		OnComplete(FUnrealAnalyzerHttpUtils::JsonResponse(JsonString(Root)));
+		return true;
+	}
 }
 
 void UnrealAnalyzerHttpRoutes::Register(TSharedPtr<IHttpRouter> Router)
@@ -1507,6 +1831,11 @@ void UnrealAnalyzerHttpRoutes::Register(TSharedPtr<IHttpRouter> Router)
 		EHttpServerRequestVerbs::VERB_GET,
 		FHttpRequestHandler::CreateStatic(&HandleReferenceChainAsync)
 	);
+	Router->BindRoute(
+		FHttpPath(TEXT("/analysis/snapshot")),
+		EHttpServerRequestVerbs::VERB_GET,
+		FHttpRequestHandler::CreateStatic(&HandleAssetSnapshot)
+	);
 	Router->BindRoute(
 		FHttpPath(TEXT("/analysis/job/status")),
 		EHttpServerRequestVerbs::VERB_GET,
@@ -1522,6 +1851,13 @@ void UnrealAnalyzerHttpRoutes::Register(TSharedPtr<IHttpRouter> Router)
 		EHttpServerRequestVerbs::VERB_GET,
 		FHttpRequestHandler::CreateStatic(&HandleCppClassUsage)
 	);
+
+	// Batch endpoint (bundles read-only GET routes into one round-trip).
+	Router->BindRoute(
+		FHttpPath(TEXT("/batch")),
+		EHttpServerRequestVerbs::VERB_POST,
+		FHttpRequestHandler::CreateStatic(&HandleBatch)
+	);
 }
 
 